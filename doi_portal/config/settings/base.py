@@ -337,6 +337,11 @@ CELERY_BEAT_SCHEDULE = {
         "task": "doi_portal.core.tasks.gdpr_check_grace_periods_task",
         "schedule": crontab(hour=2, minute=0),  # Every day at 02:00
     },
+    # Pack queued Crossref deposits into combined doi_batch submissions
+    "crossref-flush-deposit-queue": {
+        "task": "doi_portal.crossref.tasks.crossref_flush_deposit_queue_task",
+        "schedule": crontab(minute="*/5"),  # Every 5 minutes
+    },
 }
 # django-allauth
 # ------------------------------------------------------------------------------
@@ -409,3 +414,44 @@ CONTACT_FORM_RECIPIENT_EMAIL = env(
 # ------------------------------------------------------------------------------
 # Protocol for resource URLs in Crossref XML. Override to "http" in local.py.
 CROSSREF_SITE_PROTOCOL = "https"
+# Seconds a rendered per-article Crossref XML fragment stays cached.
+# Fragments are keyed by content fingerprint, so stale entries are never served.
+CROSSREF_FRAGMENT_CACHE_TIMEOUT = env.int("CROSSREF_FRAGMENT_CACHE_TIMEOUT", default=7 * 24 * 60 * 60)
+# Compression codec for stored XML export snapshots: "gzip" or "zstd".
+# zstd requires the optional zstandard package; gzip is used as fallback.
+CROSSREF_XML_BLOB_CODEC = env("CROSSREF_XML_BLOB_CODEC", default="gzip")
+# Directory for persisted compiled Crossref Jinja2 templates (unset = in-memory only).
+CROSSREF_JINJA_BYTECODE_CACHE_DIR = env("CROSSREF_JINJA_BYTECODE_CACHE_DIR", default=None)
+# Compile all Crossref templates and the XSD schema at app start instead of on first use.
+CROSSREF_WARM_TEMPLATES = env.bool("CROSSREF_WARM_TEMPLATES", default=False)
+# Seconds a cached XSD validation outcome (keyed by XML SHA-256 + schema version) is kept.
+CROSSREF_XSD_CACHE_TIMEOUT = env.int("CROSSREF_XSD_CACHE_TIMEOUT", default=30 * 24 * 60 * 60)
+# Entities rendered and XSD-validated together by one bulk regeneration batch task.
+CROSSREF_BULK_REGENERATION_BATCH_SIZE = env.int("CROSSREF_BULK_REGENERATION_BATCH_SIZE", default=20)
+# Batch tasks a publisher-wide bulk regeneration run keeps in flight at once.
+CROSSREF_BULK_REGENERATION_CONCURRENCY = env.int("CROSSREF_BULK_REGENERATION_CONCURRENCY", default=4)
+# Live Crossref deposits: endpoint base URL (test.crossref.org is Crossref's sandbox).
+CROSSREF_DEPOSIT_BASE_URL = env("CROSSREF_DEPOSIT_BASE_URL", default="https://test.crossref.org")
+# HTTP timeout (seconds) and keep-alive connection pool size for deposit requests.
+CROSSREF_DEPOSIT_TIMEOUT = env.int("CROSSREF_DEPOSIT_TIMEOUT", default=30)
+CROSSREF_DEPOSIT_POOL_SIZE = env.int("CROSSREF_DEPOSIT_POOL_SIZE", default=10)
+# Submission status polling: first delay, backoff cap (seconds) and attempts before giving up.
+CROSSREF_DEPOSIT_POLL_INITIAL_DELAY = env.int("CROSSREF_DEPOSIT_POLL_INITIAL_DELAY", default=60)
+CROSSREF_DEPOSIT_POLL_MAX_DELAY = env.int("CROSSREF_DEPOSIT_POLL_MAX_DELAY", default=60 * 60)
+CROSSREF_DEPOSIT_MAX_POLLS = env.int("CROSSREF_DEPOSIT_MAX_POLLS", default=12)
+# Deposit queue: size cap (bytes) of a combined doi_batch and the longest an
+# entity waits in the queue (seconds) before a partially filled batch is sent.
+CROSSREF_DEPOSIT_BATCH_MAX_BYTES = env.int("CROSSREF_DEPOSIT_BATCH_MAX_BYTES", default=5 * 1024 * 1024)
+CROSSREF_DEPOSIT_BATCH_MAX_AGE = env.int("CROSSREF_DEPOSIT_BATCH_MAX_AGE", default=15 * 60)
+# Seconds a deposit-workflow status summary stays cached. Summaries are dropped
+# on relevant changes; the timeout bounds staleness from DOIs claimed elsewhere.
+CROSSREF_DEPOSIT_STATUS_CACHE_TIMEOUT = env.int("CROSSREF_DEPOSIT_STATUS_CACHE_TIMEOUT", default=10 * 60)
+# Lines per window served by the XML preview, and the largest window a
+# request may ask for.
+CROSSREF_XML_PREVIEW_WINDOW_LINES = env.int("CROSSREF_XML_PREVIEW_WINDOW_LINES", default=500)
+CROSSREF_XML_PREVIEW_MAX_WINDOW_LINES = env.int("CROSSREF_XML_PREVIEW_MAX_WINDOW_LINES", default=2000)
+# Portal search typeahead: suggestions per type (articles, authors, publications),
+# PostgreSQL statement timeout (ms) for the lookup and seconds results stay cached.
+PORTAL_SEARCH_SUGGEST_LIMIT = env.int("PORTAL_SEARCH_SUGGEST_LIMIT", default=5)
+PORTAL_SEARCH_SUGGEST_TIMEOUT_MS = env.int("PORTAL_SEARCH_SUGGEST_TIMEOUT_MS", default=300)
+PORTAL_SEARCH_SUGGEST_CACHE_TIMEOUT = env.int("PORTAL_SEARCH_SUGGEST_CACHE_TIMEOUT", default=5 * 60)
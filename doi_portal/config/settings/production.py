@@ -198,3 +198,12 @@ if HAS_SENTRY and SENTRY_DSN:
 
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Crossref: compile XML templates and the XSD schema before workers fork and
+# persist template bytecode
+CROSSREF_WARM_TEMPLATES = env.bool("CROSSREF_WARM_TEMPLATES", default=True)
+CROSSREF_JINJA_BYTECODE_CACHE_DIR = env(
+    "CROSSREF_JINJA_BYTECODE_CACHE_DIR",
+    default="/tmp/doi_portal_jinja",  # noqa: S108
+)
+# Crossref: deposit to the production registry
+CROSSREF_DEPOSIT_BASE_URL = env("CROSSREF_DEPOSIT_BASE_URL", default="https://doi.crossref.org")
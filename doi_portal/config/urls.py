@@ -12,11 +12,13 @@ from doi_portal.portal.views import AboutView
 from doi_portal.portal.views import ArticleSearchView
 from doi_portal.portal.views import ContactView
 from doi_portal.portal.views import PortalHomeView
+from doi_portal.portal.views import article_search_suggest
 
 urlpatterns = [
     path("", PortalHomeView.as_view(), name="home"),
     # Story 4.2: Article search (public)
     path("search/", ArticleSearchView.as_view(), name="article-search"),
+    path("search/suggest/", article_search_suggest, name="article-search-suggest"),
     # Story 4.8: About page (public)
     path("about/", AboutView.as_view(), name="about"),
     # Story 4.9: Contact form (public)
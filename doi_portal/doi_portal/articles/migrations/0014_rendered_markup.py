@@ -0,0 +1,18 @@
+# Generated by Django 5.2.10 on 2026-10-17 08:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0013_validation_state'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='rendered_markup',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Renderovan markup'),
+        ),
+    ]
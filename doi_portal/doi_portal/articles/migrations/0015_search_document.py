@@ -0,0 +1,64 @@
+# Generated by Django 5.2.10 on 2026-10-17 08:22
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import UnaccentExtension
+from django.db import migrations
+
+# Text search configuration used by doi_portal.portal.search: unaccent folds
+# diacritics (č, ć, š, ž, đ), then words are stemmed with the Serbian Snowball
+# stemmer where the server has it (PostgreSQL 15+), else kept as they are
+CREATE_SEARCH_CONFIG = """
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'doi_portal_sr') THEN
+        CREATE TEXT SEARCH CONFIGURATION doi_portal_sr (COPY = pg_catalog.simple);
+        IF EXISTS (SELECT 1 FROM pg_ts_dict WHERE dictname = 'serbian_stem') THEN
+            ALTER TEXT SEARCH CONFIGURATION doi_portal_sr
+                ALTER MAPPING FOR asciiword, asciihword, hword_asciipart, word, hword, hword_part
+                WITH unaccent, serbian_stem;
+        ELSE
+            ALTER TEXT SEARCH CONFIGURATION doi_portal_sr
+                ALTER MAPPING FOR asciiword, asciihword, hword_asciipart, word, hword, hword_part
+                WITH unaccent, simple;
+        END IF;
+    END IF;
+END $$;
+"""
+
+CREATE_SEARCH_INDEX = """
+CREATE INDEX IF NOT EXISTS articles_article_search_document_gin
+    ON articles_article USING gin (search_document);
+"""
+
+
+def create_search_config(apps, schema_editor):
+    """Create the text search configuration and GIN index (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(CREATE_SEARCH_CONFIG)
+    schema_editor.execute(CREATE_SEARCH_INDEX)
+
+
+def drop_search_config(apps, schema_editor):
+    """Drop the GIN index and text search configuration (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS articles_article_search_document_gin;")
+    schema_editor.execute("DROP TEXT SEARCH CONFIGURATION IF EXISTS doi_portal_sr;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0014_rendered_markup'),
+    ]
+
+    operations = [
+        UnaccentExtension(),
+        migrations.AddField(
+            model_name='article',
+            name='search_document',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Dokument za pretragu'),
+        ),
+        migrations.RunPython(create_search_config, drop_search_config),
+    ]
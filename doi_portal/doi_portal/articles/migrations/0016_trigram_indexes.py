@@ -0,0 +1,38 @@
+# Generated by Django 5.2.10 on 2026-10-17 08:40
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# Trigram indexes serving ILIKE '%...%' lookups of portal search suggestions
+TRIGRAM_INDEXES = {
+    "articles_article_title_trgm": ("articles_article", "title"),
+    "articles_author_surname_trgm": ("articles_author", "surname"),
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Create GIN trigram indexes (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, (table, column) in TRIGRAM_INDEXES.items():
+        schema_editor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({column} gin_trgm_ops);")
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    """Drop the GIN trigram indexes (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name};")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0015_search_document'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
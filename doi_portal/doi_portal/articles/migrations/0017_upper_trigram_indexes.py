@@ -0,0 +1,39 @@
+# Generated by Django 5.2.10 on 2026-10-17 14:05
+
+from django.db import migrations
+
+# __icontains compiles to UPPER("col"::text) LIKE UPPER(%s) on PostgreSQL,
+# so the trigram indexes must cover UPPER(col::text) to serve it
+TRIGRAM_INDEXES = {
+    "articles_article_title_trgm": ("articles_article", "title"),
+    "articles_author_surname_trgm": ("articles_author", "surname"),
+}
+
+
+def create_upper_trigram_indexes(apps, schema_editor):
+    """Recreate the GIN trigram indexes on UPPER(column) (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, (table, column) in TRIGRAM_INDEXES.items():
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name};")
+        schema_editor.execute(f"CREATE INDEX {name} ON {table} USING gin ((UPPER({column}::text)) gin_trgm_ops);")
+
+
+def create_column_trigram_indexes(apps, schema_editor):
+    """Restore the GIN trigram indexes on the bare columns (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, (table, column) in TRIGRAM_INDEXES.items():
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name};")
+        schema_editor.execute(f"CREATE INDEX {name} ON {table} USING gin ({column} gin_trgm_ops);")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0016_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_upper_trigram_indexes, create_column_trigram_indexes),
+    ]
@@ -11,10 +11,11 @@ Supports: Article tracking within Issues for Crossref DOI registration.
 
 from __future__ import annotations
 
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
-from doi_portal.core.mixins import SoftDeleteManager, SoftDeleteMixin
+from doi_portal.core.mixins import RenderedMarkupMixin, SoftDeleteManager, SoftDeleteMixin, ValidationStateMixin
 
 from .validators import validate_orcid
 
@@ -31,6 +32,7 @@ __all__ = [
     "IdentifierType",
     "LicenseAppliesTo",
     "PdfStatus",
+    "RecordDepositStatus",
     "RelationScope",
 ]
 
@@ -89,7 +91,15 @@ class PdfStatus(models.TextChoices):
     SCAN_FAILED = "scan_failed", _("Skeniranje neuspešno")
 
 
-class Article(SoftDeleteMixin, models.Model):
+class RecordDepositStatus(models.TextChoices):
+    """Per-DOI outcome reported in a Crossref submission log."""
+
+    SUCCESS = "success", _("Registrovan")
+    WARNING = "warning", _("Registrovan uz upozorenje")
+    FAILURE = "failure", _("Odbijen")
+
+
+class Article(SoftDeleteMixin, ValidationStateMixin, RenderedMarkupMixin, models.Model):
     """
     Article model for DOI Portal.
 
@@ -98,6 +108,14 @@ class Article(SoftDeleteMixin, models.Model):
     Central entity for DOI registration and Crossref XML generation.
     """
 
+    MARKUP_FIELDS = {
+        "title": ("html", "crossref", "plain"),
+        "subtitle": ("html", "crossref", "plain"),
+        "original_language_title": ("html", "crossref"),
+        "original_language_subtitle": ("html", "crossref"),
+        "abstract": ("html", "jats"),
+    }
+
     # === CORE FIELDS ===
     issue = models.ForeignKey(
         "issues.Issue",
@@ -322,6 +340,32 @@ class Article(SoftDeleteMixin, models.Model):
         null=True,
         blank=True,
     )
+
+    # === CROSSREF DEPOSIT RESULT (per-DOI submission log) ===
+    crossref_deposit_status = models.CharField(
+        _("Status Crossref depozita"),
+        max_length=10,
+        choices=RecordDepositStatus.choices,
+        blank=True,
+    )
+    crossref_deposit_errors = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name=_("Crossref greške"),
+        help_text=_("Poruke iz Crossref izveštaja o obradi depozita"),
+    )
+    crossref_deposit_checked_at = models.DateTimeField(
+        _("Crossref izveštaj obrađen"),
+        null=True,
+        blank=True,
+    )
+    # Weighted full-text document for portal search (doi_portal.portal.search);
+    # GIN-indexed on PostgreSQL
+    search_document = SearchVectorField(
+        _("Dokument za pretragu"),
+        null=True,
+        editable=False,
+    )
     created_at = models.DateTimeField(_("Kreirano"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Ažurirano"), auto_now=True)
 
@@ -16,6 +16,7 @@ from django.urls import reverse
 from doi_portal.articles.forms import AffiliationForm, AuthorForm
 from doi_portal.articles.models import (
     Affiliation,
+    Article,
     Author,
     AuthorSequence,
     ContributorRole,
@@ -817,6 +818,26 @@ class TestAuthorReorderView:
         assert a2.order == 3
         assert a2.sequence == AuthorSequence.ADDITIONAL
 
+    def test_reorder_marks_article_validation_dirty(self, client, bibliotekar_user, article_a):
+        """Reorder bypasses signals, so the article's stored validation is invalidated explicitly."""
+        a1 = AuthorFactory(article=article_a, order=1, sequence=AuthorSequence.FIRST)
+        a2 = AuthorFactory(article=article_a, order=2, sequence=AuthorSequence.ADDITIONAL)
+        Article.objects.filter(pk=article_a.pk).update(validation_dirty=False)
+
+        client.force_login(bibliotekar_user)
+        url = reverse("articles:author-reorder", kwargs={"article_pk": article_a.pk})
+        response = client.post(
+            url,
+            json.dumps({"order": [a2.pk, a1.pk]}),
+            content_type="application/json",
+        )
+        assert response.status_code == 200
+
+        article_a.refresh_from_db()
+        a2.refresh_from_db()
+        assert a2.sequence == AuthorSequence.FIRST
+        assert article_a.validation_dirty is True
+
     def test_reorder_blocked_for_other_publisher(
         self, client, bibliotekar_user, article_b
     ):
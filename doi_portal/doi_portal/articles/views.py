@@ -607,6 +607,8 @@ def author_update(request, pk):
 @require_POST
 def author_delete(request, pk):
     """Delete author via HTMX POST, re-order remaining authors."""
+    from doi_portal.crossref.signals import mark_validation_dirty
+
     author = get_object_or_404(
         Author.objects.select_related(
             "article", "article__issue",
@@ -627,6 +629,7 @@ def author_delete(request, pk):
             order=index,
             sequence=AuthorSequence.FIRST if index == 1 else AuthorSequence.ADDITIONAL,
         )
+    mark_validation_dirty(article)
 
     authors = article.authors.prefetch_related("affiliations").all()
     return render(request, "articles/partials/_author_list.html", {
@@ -640,6 +643,8 @@ def author_delete(request, pk):
 @require_POST
 def author_reorder(request, article_pk):
     """Reorder authors via HTMX POST (drag & drop)."""
+    from doi_portal.crossref.signals import mark_validation_dirty
+
     article = get_object_or_404(
         Article.objects.select_related(
             "issue", "issue__publication", "issue__publication__publisher"
@@ -667,6 +672,8 @@ def author_reorder(request, article_pk):
             order=index,
             sequence=AuthorSequence.FIRST if index == 1 else AuthorSequence.ADDITIONAL,
         )
+    # Queryset updates send no signals; sequence="first" feeds pre-validation
+    mark_validation_dirty(article)
 
     authors = article.authors.prefetch_related("affiliations").all()
     return render(request, "articles/partials/_author_list.html", {
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.10 on 2026-10-17 06:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('components', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='component',
+            name='crossref_deposit_checked_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Crossref izveštaj obrađen'),
+        ),
+        migrations.AddField(
+            model_name='component',
+            name='crossref_deposit_errors',
+            field=models.JSONField(blank=True, default=list, help_text='Poruke iz Crossref izveštaja o obradi depozita', verbose_name='Crossref greške'),
+        ),
+        migrations.AddField(
+            model_name='component',
+            name='crossref_deposit_status',
+            field=models.CharField(blank=True, choices=[('success', 'Registrovan'), ('warning', 'Registrovan uz upozorenje'), ('failure', 'Odbijen')], max_length=10, verbose_name='Status Crossref depozita'),
+        ),
+    ]
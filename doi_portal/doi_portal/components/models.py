@@ -12,9 +12,9 @@ from django.db import models
 from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
-from doi_portal.articles.models import AuthorSequence, ContributorRole
+from doi_portal.articles.models import AuthorSequence, ContributorRole, RecordDepositStatus
 from doi_portal.articles.validators import validate_orcid
-from doi_portal.core.mixins import SoftDeleteManager, SoftDeleteMixin
+from doi_portal.core.mixins import SoftDeleteManager, SoftDeleteMixin, ValidationStateMixin
 
 __all__ = [
     "Component",
@@ -53,6 +53,12 @@ class ComponentGroup(SoftDeleteMixin, models.Model):
         _("Crossref XML"),
         blank=True,
     )
+    crossref_xml_line_index = models.JSONField(
+        _("Indeks linija XML-a"),
+        default=dict,
+        blank=True,
+        help_text=_("Pozicije početaka linija za pregled XML-a po opsezima"),
+    )
     xml_generated_at = models.DateTimeField(
         _("XML generisan"),
         null=True,
@@ -142,7 +148,7 @@ class ComponentGroup(SoftDeleteMixin, models.Model):
         return self.title or f"Komponente za {self.parent_doi}"
 
 
-class Component(SoftDeleteMixin, models.Model):
+class Component(SoftDeleteMixin, ValidationStateMixin, models.Model):
     """
     Individual component within a ComponentGroup.
 
@@ -215,6 +221,25 @@ class Component(SoftDeleteMixin, models.Model):
         default=0,
     )
 
+    # Crossref deposit result (per-DOI submission log)
+    crossref_deposit_status = models.CharField(
+        _("Status Crossref depozita"),
+        max_length=10,
+        choices=RecordDepositStatus.choices,
+        blank=True,
+    )
+    crossref_deposit_errors = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name=_("Crossref greške"),
+        help_text=_("Poruke iz Crossref izveštaja o obradi depozita"),
+    )
+    crossref_deposit_checked_at = models.DateTimeField(
+        _("Crossref izveštaj obrađen"),
+        null=True,
+        blank=True,
+    )
+
     # Timestamps
     created_at = models.DateTimeField(_("Kreirano"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Ažurirano"), auto_now=True)
@@ -245,6 +245,22 @@ class TestContributorHTMX:
         assert ct2.order == 1
         assert ct1.order == 2
 
+    def test_contributor_reorder_marks_component_validation_dirty(self, client, admin_user):
+        client.force_login(admin_user)
+        comp = ComponentFactory()
+        ct1 = ComponentContributorFactory(component=comp, order=1)
+        ct2 = ComponentContributorFactory(component=comp, order=2)
+        Component.objects.filter(pk=comp.pk).update(validation_dirty=False)
+        url = reverse("components:contributor-reorder", args=[comp.pk])
+        response = client.post(
+            url,
+            json.dumps({"order": [ct2.pk, ct1.pk]}),
+            content_type="application/json",
+        )
+        assert response.status_code == 200
+        comp.refresh_from_db()
+        assert comp.validation_dirty is True
+
     def test_contributor_form_view(self, client, admin_user):
         client.force_login(admin_user)
         comp = ComponentFactory()
@@ -404,6 +404,8 @@ def contributor_update(request, contributor_pk):
 @require_POST
 def contributor_delete(request, contributor_pk):
     """Delete contributor via HTMX POST."""
+    from doi_portal.crossref.signals import mark_validation_dirty
+
     contributor = get_object_or_404(
         ComponentContributor.objects.select_related(
             "component", "component__component_group",
@@ -423,6 +425,7 @@ def contributor_delete(request, contributor_pk):
             order=index,
             sequence=AuthorSequence.FIRST if index == 1 else AuthorSequence.ADDITIONAL,
         )
+    mark_validation_dirty(component)
 
     contributors = component.contributors.filter(is_deleted=False).order_by("order")
     return render(request, "component_groups/partials/_contributor_list.html", {
@@ -436,6 +439,8 @@ def contributor_delete(request, contributor_pk):
 @require_POST
 def contributor_reorder(request, component_pk):
     """Reorder contributors via HTMX POST (drag & drop)."""
+    from doi_portal.crossref.signals import mark_validation_dirty
+
     component = get_object_or_404(
         Component.objects.select_related(
             "component_group", "component_group__publisher"
@@ -460,6 +465,8 @@ def contributor_reorder(request, component_pk):
             order=index,
             sequence=AuthorSequence.FIRST if index == 1 else AuthorSequence.ADDITIONAL,
         )
+    # Queryset updates send no signals; sequence="first" feeds pre-validation
+    mark_validation_dirty(component)
 
     contributors = component.contributors.filter(is_deleted=False).order_by("order")
     return render(request, "component_groups/partials/_contributor_list.html", {
@@ -0,0 +1,80 @@
+"""
+Store rendered markup of titles and abstracts for existing rows.
+
+Rows saved before rendered_markup existed, or whose markup fields were
+changed with QuerySet.update(), convert markup on every read until they
+are backfilled. Stale rows are found by comparing the source hash stored
+with each rendering.
+
+Examples:
+    manage.py backfill_rendered_markup
+    manage.py backfill_rendered_markup --all
+"""
+
+from __future__ import annotations
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from doi_portal.core.mixins import RenderedMarkupMixin
+
+
+def backfill_model(model, *, refresh_all: bool = False, batch_size: int = 500) -> int:
+    """
+    Render and store the markup fields of a model's rows.
+
+    Args:
+        model: Model using RenderedMarkupMixin
+        refresh_all: Re-render rows whose stored renderings match their source
+        batch_size: Rows updated per query
+
+    Returns:
+        Number of updated rows
+    """
+    queryset = model._base_manager.only("pk", "rendered_markup", *model.MARKUP_FIELDS).order_by("pk")
+
+    count = 0
+    batch = []
+    for obj in queryset.iterator(chunk_size=batch_size):
+        if not refresh_all and obj.has_current_rendered_markup():
+            continue
+        obj.refresh_rendered_markup()
+        batch.append(obj)
+        if len(batch) >= batch_size:
+            count += model._base_manager.bulk_update(batch, ["rendered_markup"])
+            batch = []
+    if batch:
+        count += model._base_manager.bulk_update(batch, ["rendered_markup"])
+    return count
+
+
+class Command(BaseCommand):
+    help = "Render markup of titles and abstracts into stored columns for existing rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            dest="refresh_all",
+            help="Re-render rows whose stored renderings match their source",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Rows updated per query (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        total = 0
+        for model in apps.get_models():
+            if not issubclass(model, RenderedMarkupMixin):
+                continue
+            count = backfill_model(
+                model,
+                refresh_all=options["refresh_all"],
+                batch_size=options["batch_size"],
+            )
+            total += count
+            self.stdout.write(f"{model._meta.verbose_name_plural}: {count}")
+        self.stdout.write(self.style.SUCCESS(f"Ukupno ažurirano: {total}"))
@@ -0,0 +1,116 @@
+"""
+Benchmark markup conversion.
+
+Compares the previous implementation (escape plus four sequential regex
+substitutions per output mode) with the single-pass parser, uncached
+and with the parse cache warm, converting every sample into all four
+output modes as XML generation, landing pages and citations do.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+import time
+
+from django.core.management.base import BaseCommand
+
+from doi_portal.core.markup import _xml_escape
+from doi_portal.core.markup import clear_markup_cache
+from doi_portal.core.markup import markup_to_crossref_xml
+from doi_portal.core.markup import markup_to_html
+from doi_portal.core.markup import markup_to_jats_xml
+from doi_portal.core.markup import strip_markup
+
+_BOLD_RE = re.compile(r"\*\*([^*]+)\*\*")
+_ITALIC_RE = re.compile(r"(?<!\w)_([^_]+)_(?!\w)")
+_SUP_RE = re.compile(r"\^([^^]+)\^")
+_SUB_RE = re.compile(r"~([^~]+)~")
+
+# (bold, italic, sup, sub) replacement templates per output mode
+_REGEX_MODES = {
+    "html": (html.escape, (r"<strong>\1</strong>", r"<em>\1</em>", r"<sup>\1</sup>", r"<sub>\1</sub>")),
+    "crossref": (_xml_escape, (r"<b>\1</b>", r"<i>\1</i>", r"<sup>\1</sup>", r"<sub>\1</sub>")),
+    "jats": (
+        _xml_escape,
+        (r"<jats:bold>\1</jats:bold>", r"<jats:italic>\1</jats:italic>", r"<jats:sup>\1</jats:sup>", r"<jats:sub>\1</jats:sub>"),
+    ),
+    "strip": (str, (r"\1", r"\1", r"\1", r"\1")),
+}
+
+SAMPLE_ABSTRACT = (
+    "We report the synthesis of **TiO~2~** nanoparticles in _Escherichia coli_ cultures "
+    "at 10^5^ CFU/mL & pH < 7. The yield of „H~2~O~2~\" increased by 35 % compared with "
+    "_in vitro_ controls; see **Table 1** for details. "
+)
+
+
+def regex_convert(text: str | None, mode: str) -> str:
+    """Convert markup the previous way: escape, then one regex pass per delimiter."""
+    if not text:
+        return ""
+    escape, (bold, italic, sup, sub) = _REGEX_MODES[mode]
+    t = escape(text)
+    t = _BOLD_RE.sub(bold, t)
+    t = _ITALIC_RE.sub(italic, t)
+    t = _SUP_RE.sub(sup, t)
+    return _SUB_RE.sub(sub, t)
+
+
+def _convert_all(text: str) -> None:
+    """Convert a text into all four output modes with the current implementation."""
+    markup_to_html(text)
+    markup_to_crossref_xml(text)
+    markup_to_jats_xml(text)
+    strip_markup(text)
+
+
+def _regex_convert_all(text: str) -> None:
+    """Convert a text into all four output modes with the previous implementation."""
+    for mode in _REGEX_MODES:
+        regex_convert(text, mode)
+
+
+class Command(BaseCommand):
+    help = "Compare regex-based and single-pass markup conversion."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=500,
+            help="Number of distinct abstracts, as in a large issue (default: 500)",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=5,
+            help="Conversions of every sample (default: 5)",
+        )
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        samples = [f"{n}. {SAMPLE_ABSTRACT * 8}" for n in range(options["samples"])]
+
+        regex = self._time(_regex_convert_all, samples, iterations)
+        clear_markup_cache()
+        uncached = self._time(_convert_all, samples, 1, clear_cache=True)
+        cached = self._time(_convert_all, samples, iterations)
+
+        self.stdout.write(f"Samples: {len(samples)} x {len(samples[0])} characters")
+        self.stdout.write(f"Regex passes:          {regex * 1000:.3f} ms/sample")
+        self.stdout.write(f"Single pass (cold):    {uncached * 1000:.3f} ms/sample")
+        self.stdout.write(f"Single pass (cached):  {cached * 1000:.3f} ms/sample")
+        if cached:
+            self.stdout.write(self.style.SUCCESS(f"Speedup (cached): {regex / cached:.1f}x"))
+
+    @staticmethod
+    def _time(convert, samples, iterations, *, clear_cache=False) -> float:
+        """Return average seconds to convert one sample into all output modes."""
+        start = time.perf_counter()
+        for _ in range(iterations):
+            if clear_cache:
+                clear_markup_cache()
+            for text in samples:
+                convert(text)
+        return (time.perf_counter() - start) / (iterations * len(samples))
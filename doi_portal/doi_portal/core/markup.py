@@ -12,30 +12,286 @@ Three output modes:
 - HTML: for landing page rendering
 - Crossref XML: face markup (<i>, <b>, <sub>, <sup>) for title/subtitle
 - JATS XML: JATS inline markup for abstract within <jats:abstract><jats:p>
+
+The text is scanned once for delimiters and the delimiters of formatted
+spans are replaced by open/close markers; every output mode is rendered
+from that token string by escaping it and substituting the markers with
+tags (parse_markup exposes it as a tree of text runs and spans). Parsed
+texts and their rendered outputs are kept in a bounded LRU cache keyed
+on the text, so the same title or abstract converted for XML, the
+landing page and citations is only parsed and rendered once.
+
+Delimiters pair up as follows, bold taking precedence over italic,
+italic over superscript and superscript over subscript:
+- ** pairs with the next ** when there is no * in between
+- _ pairs with the next _ when the opening one does not follow and the
+  closing one is not followed by a letter or digit
+- ^ and ~ pair with the next ^ or ~
+Empty spans are not formatted. A pair that would overlap a pair of
+higher precedence (e.g. "**a _b** c_") stays literal text.
 """
 
 import html
 import re
+from functools import lru_cache
+
+BOLD = "bold"
+ITALIC = "italic"
+SUP = "sup"
+SUB = "sub"
+
+# Texts whose parse tree and outputs are kept in memory (titles, subtitles, abstracts)
+MARKUP_CACHE_SIZE = 2048
+
+_HTML_TAGS = {
+    BOLD: ("<strong>", "</strong>"),
+    ITALIC: ("<em>", "</em>"),
+    SUP: ("<sup>", "</sup>"),
+    SUB: ("<sub>", "</sub>"),
+}
+_CROSSREF_TAGS = {
+    BOLD: ("<b>", "</b>"),
+    ITALIC: ("<i>", "</i>"),
+    SUP: ("<sup>", "</sup>"),
+    SUB: ("<sub>", "</sub>"),
+}
+_JATS_TAGS = {
+    BOLD: ("<jats:bold>", "</jats:bold>"),
+    ITALIC: ("<jats:italic>", "</jats:italic>"),
+    SUP: ("<jats:sup>", "</jats:sup>"),
+    SUB: ("<jats:sub>", "</jats:sub>"),
+}
+
+
+# Noncharacters standing for span boundaries in a parsed token string; they
+# are dropped from input text
+_OPEN_MARKERS = {BOLD: "\ufdd0", ITALIC: "\ufdd2", SUP: "\ufdd4", SUB: "\ufdd6"}
+_CLOSE_MARKERS = {BOLD: "\ufdd1", ITALIC: "\ufdd3", SUP: "\ufdd5", SUB: "\ufdd7"}
+_MARKERS = {
+    **{marker: (kind, True) for kind, marker in _OPEN_MARKERS.items()},
+    **{marker: (kind, False) for kind, marker in _CLOSE_MARKERS.items()},
+}
+_MARKER_RE = re.compile("[\ufdd0-\ufdd7]")
+_MARKER_SPLIT_RE = re.compile("([\ufdd0-\ufdd7])")
+
+
+def _marker_tags(tags: dict[str, tuple[str, str]] | None) -> dict[str, str]:
+    """Map every marker to its opening or closing tag ('' strips the span)."""
+    return {
+        marker: (tags[kind][0 if is_open else 1] if tags else "")
+        for marker, (kind, is_open) in _MARKERS.items()
+    }
+
+
+def _positions(text: str, char: str) -> list[int]:
+    """Indexes of every occurrence of char in text."""
+    positions = []
+    index = text.find(char)
+    while index != -1:
+        positions.append(index)
+        index = text.find(char, index + 1)
+    return positions
+
+
+def _is_word_char(text: str, index: int) -> bool:
+    """Whether text[index] exists and is a word character (as regex \\w)."""
+    if index < 0 or index >= len(text):
+        return False
+    char = text[index]
+    return char.isalnum() or char == "_"
+
 
-# Regex patterns — bold MUST be processed before italic
-_BOLD_RE = re.compile(r"\*\*([^*]+)\*\*")
-_ITALIC_RE = re.compile(r"(?<!\w)_([^_]+)_(?!\w)")
-_SUP_RE = re.compile(r"\^([^^]+)\^")
-_SUB_RE = re.compile(r"~([^~]+)~")
+def _bold_pairs(text: str, stars: list[int]) -> list[tuple[int, int]]:
+    """Pair ** delimiters (positions of the first * of each)."""
+    pairs = []
+    k = 0
+    while k + 3 < len(stars):
+        start = stars[k]
+        if stars[k + 1] == start + 1:
+            end = stars[k + 2]
+            if end > start + 2 and stars[k + 3] == end + 1:
+                pairs.append((start, end))
+                k += 4
+                continue
+        k += 1
+    return pairs
+
+
+def _italic_pairs(text: str, underscores: list[int]) -> list[tuple[int, int]]:
+    """Pair _ delimiters that are not part of a word."""
+    pairs = []
+    k = 0
+    while k + 1 < len(underscores):
+        start, end = underscores[k], underscores[k + 1]
+        if end > start + 1 and not _is_word_char(text, start - 1) and not _is_word_char(text, end + 1):
+            pairs.append((start, end))
+            k += 2
+        else:
+            k += 1
+    return pairs
+
+
+def _simple_pairs(positions: list[int]) -> list[tuple[int, int]]:
+    """Pair consecutive ^ or ~ delimiters around non-empty text."""
+    pairs = []
+    k = 0
+    while k + 1 < len(positions):
+        if positions[k + 1] > positions[k] + 1:
+            pairs.append((positions[k], positions[k + 1]))
+            k += 2
+        else:
+            k += 1
+    return pairs
+
+
+def _crosses(a: tuple[int, int], b: tuple[int, int]) -> bool:
+    """Whether two delimiter pairs overlap without nesting."""
+    return a[0] < b[0] < a[1] < b[1] or b[0] < a[0] < b[1] < a[1]
+
+
+def _all_nested(spans: list[tuple[int, int, str, int]]) -> bool:
+    """Whether no two spans overlap without nesting (one sweep over all delimiters)."""
+    events = sorted([(start, -1, end) for start, end, _, _ in spans] + [(end, 1, end) for _, end, _, _ in spans])
+    open_ends: list[int] = []
+    for _, is_close, end in events:
+        if is_close == -1:
+            open_ends.append(end)
+        elif open_ends.pop() != end:
+            return False
+    return True
+
+
+def _linearize(text: str, spans: list[tuple[int, int, str, int]]) -> str:
+    """Replace the delimiters of non-crossing (start, end, kind, width) spans by markers."""
+    events = []
+    for start, end, kind, width in spans:
+        events.append((start, _OPEN_MARKERS[kind], width))
+        events.append((end, _CLOSE_MARKERS[kind], width))
+    events.sort()
+
+    parts = []
+    position = 0
+    for index, marker, width in events:
+        parts.append(text[position:index])
+        parts.append(marker)
+        position = index + width
+    parts.append(text[position:])
+    return "".join(parts)
+
+
+def _parse(text: str) -> str:
+    """
+    Parse markup into a token string.
+
+    The token string is the text with the delimiters of every formatted
+    span replaced by an open and a close marker; the markers of different
+    spans nest properly.
+    """
+    if _MARKER_RE.search(text):
+        text = _MARKER_RE.sub("", text)
+    delimiters = {char: _positions(text, char) for char in "*_^~"}
+    if not any(delimiters.values()):
+        return text
+
+    candidates = [
+        (BOLD, 2, _bold_pairs(text, delimiters["*"])),
+        (ITALIC, 1, _italic_pairs(text, delimiters["_"])),
+        (SUP, 1, _simple_pairs(delimiters["^"])),
+        (SUB, 1, _simple_pairs(delimiters["~"])),
+    ]
+    spans = [(start, end, kind, width) for kind, width, pairs in candidates for start, end in pairs]
+    if _all_nested(spans):
+        return _linearize(text, spans)
+
+    # Rare: drop pairs overlapping a pair of higher precedence
+    accepted: list[tuple[int, int]] = []
+    spans = []
+    for kind, width, pairs in candidates:
+        for pair in pairs:
+            if not any(_crosses(pair, other) for other in accepted):
+                accepted.append(pair)
+                spans.append((pair[0], pair[1], kind, width))
+    return _linearize(text, spans)
+
+
+def _tree(tokens: str) -> tuple:
+    """Build nested nodes from a token string."""
+    stack: list[list] = [[]]
+    for part in _MARKER_SPLIT_RE.split(tokens):
+        marker = _MARKERS.get(part)
+        if marker is None:
+            if part:
+                stack[-1].append(part)
+        elif marker[1]:
+            stack.append([])
+        else:
+            children = stack.pop()
+            stack[-1].append((marker[0], tuple(children)))
+    return tuple(stack[0])
+
+
+class _ParsedMarkup:
+    """Token string of a text with its rendered outputs, filled in on first use per mode."""
+
+    __slots__ = ("_nodes", "formatted", "outputs", "tokens")
+
+    def __init__(self, tokens: str, formatted: bool):
+        self.tokens = tokens
+        self.formatted = formatted
+        self.outputs: dict[str, str] = {}
+        self._nodes = None
+
+    @property
+    def nodes(self) -> tuple:
+        if self._nodes is None:
+            self._nodes = _tree(self.tokens)
+        return self._nodes
+
+    def render(self, mode: str) -> str:
+        output = self.outputs.get(mode)
+        if output is None:
+            escape, marker_tags = _MODES[mode]
+            # Escaping leaves markers alone; each is then replaced by its tag
+            output = escape(self.tokens)
+            if self.formatted:
+                for marker, tag in marker_tags.items():
+                    output = output.replace(marker, tag)
+            self.outputs[mode] = output
+        return output
+
+
+@lru_cache(maxsize=MARKUP_CACHE_SIZE)
+def _parsed(text: str) -> _ParsedMarkup:
+    """Parse a text once; the LRU keeps its tokens and rendered outputs."""
+    tokens = _parse(text)
+    return _ParsedMarkup(tokens, tokens != text)
+
+
+def parse_markup(text: str) -> tuple:
+    """
+    Parse markup into a tree of nodes.
+
+    Args:
+        text: Markup text
+
+    Returns:
+        Tuple of nodes: plain strings, or (kind, children) tuples where kind
+        is BOLD, ITALIC, SUP or SUB
+    """
+    return _parsed(text).nodes
+
+
+def clear_markup_cache() -> None:
+    """Drop all cached parse trees and outputs."""
+    _parsed.cache_clear()
 
 
 def markup_to_html(text: str | None) -> str:
     """Convert markup to HTML (<em>, <strong>, <sub>, <sup>)."""
     if not text:
         return ""
-    # HTML escape first for XSS prevention
-    t = html.escape(text)
-    # Bold before italic
-    t = _BOLD_RE.sub(r"<strong>\1</strong>", t)
-    t = _ITALIC_RE.sub(r"<em>\1</em>", t)
-    t = _SUP_RE.sub(r"<sup>\1</sup>", t)
-    t = _SUB_RE.sub(r"<sub>\1</sub>", t)
-    return t
+    # Text runs are HTML-escaped for XSS prevention
+    return _parsed(text).render("html")
 
 
 def _xml_escape(text: str) -> str:
@@ -56,12 +312,7 @@ def markup_to_crossref_xml(text: str | None) -> str:
     """
     if not text:
         return ""
-    t = _xml_escape(text)
-    t = _BOLD_RE.sub(r"<b>\1</b>", t)
-    t = _ITALIC_RE.sub(r"<i>\1</i>", t)
-    t = _SUP_RE.sub(r"<sup>\1</sup>", t)
-    t = _SUB_RE.sub(r"<sub>\1</sub>", t)
-    return t
+    return _parsed(text).render("crossref")
 
 
 def markup_to_jats_xml(text: str | None) -> str:
@@ -73,20 +324,28 @@ def markup_to_jats_xml(text: str | None) -> str:
     """
     if not text:
         return ""
-    t = _xml_escape(text)
-    t = _BOLD_RE.sub(r"<jats:bold>\1</jats:bold>", t)
-    t = _ITALIC_RE.sub(r"<jats:italic>\1</jats:italic>", t)
-    t = _SUP_RE.sub(r"<jats:sup>\1</jats:sup>", t)
-    t = _SUB_RE.sub(r"<jats:sub>\1</jats:sub>", t)
-    return t
+    return _parsed(text).render("jats")
 
 
 def strip_markup(text: str | None) -> str:
     """Remove markup delimiters, return plain text for search/meta."""
     if not text:
         return ""
-    t = _BOLD_RE.sub(r"\1", text)
-    t = _ITALIC_RE.sub(r"\1", t)
-    t = _SUP_RE.sub(r"\1", t)
-    t = _SUB_RE.sub(r"\1", t)
-    return t
+    return _parsed(text).render("strip")
+
+
+# Rendering name -> converter, for renderings stored on models (RenderedMarkupMixin)
+MARKUP_RENDERERS = {
+    "html": markup_to_html,
+    "crossref": markup_to_crossref_xml,
+    "jats": markup_to_jats_xml,
+    "plain": strip_markup,
+}
+
+# Output mode -> (text escape, tag per marker)
+_MODES = {
+    "html": (html.escape, _marker_tags(_HTML_TAGS)),
+    "crossref": (_xml_escape, _marker_tags(_CROSSREF_TAGS)),
+    "jats": (_xml_escape, _marker_tags(_JATS_TAGS)),
+    "strip": (str, _marker_tags(None)),
+}
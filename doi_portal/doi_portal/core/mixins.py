@@ -2,22 +2,29 @@
 Core mixins for DOI Portal.
 
 Story 6.3: SoftDeleteMixin and SoftDeleteManager - centralized soft delete functionality.
+ValidationStateMixin - persisted Crossref pre-validation results per record.
+RenderedMarkupMixin - markup of title and abstract fields rendered on save.
 """
 
 from __future__ import annotations
 
+import hashlib
+from collections.abc import Mapping
 from typing import TYPE_CHECKING
 
 from django.db import models
 from django.utils import timezone
+from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 
 if TYPE_CHECKING:
     from doi_portal.users.models import User
 
 __all__ = [
+    "RenderedMarkupMixin",
     "SoftDeleteManager",
     "SoftDeleteMixin",
+    "ValidationStateMixin",
 ]
 
 
@@ -77,3 +84,208 @@ class SoftDeleteMixin(models.Model):
         self.deleted_at = None
         self.deleted_by = None
         self.save(update_fields=["is_deleted", "deleted_at", "deleted_by"])
+
+
+class ValidationStateMixin(models.Model):
+    """
+    Abstract mixin storing the Crossref pre-validation result of a record.
+
+    validation_issues holds serialized ValidationIssue dicts for the checks
+    that depend only on the record and its children. Saving the record or
+    one of its children sets validation_dirty (see
+    doi_portal.crossref.signals) and the next validation run recomputes
+    only dirty records.
+    """
+
+    validation_issues = models.JSONField(
+        _("Rezultat validacije"),
+        default=list,
+        blank=True,
+    )
+    validation_dirty = models.BooleanField(
+        _("Validacija zastarela"),
+        default=True,
+    )
+    validated_at = models.DateTimeField(
+        _("Vreme validacije"),
+        null=True,
+        blank=True,
+    )
+
+    class Meta:
+        abstract = True
+
+    @property
+    def validation_error_count(self) -> int:
+        """Number of stored blocking issues."""
+        return sum(1 for issue in self.validation_issues if issue.get("severity") == "error")
+
+    @property
+    def validation_warning_count(self) -> int:
+        """Number of stored non-blocking issues."""
+        return sum(1 for issue in self.validation_issues if issue.get("severity") == "warning")
+
+
+def _markup_source_hash(source: str) -> str:
+    """Digest identifying the source a stored rendering was made from."""
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+class RenderedMarkupMixin(models.Model):
+    """
+    Abstract mixin storing the rendered markup of title and abstract fields.
+
+    MARKUP_FIELDS maps each source field to the renderings it needs (keys
+    of doi_portal.core.markup.MARKUP_RENDERERS). save() renders them into
+    rendered_markup, so landing pages, search results and XML generation
+    read stored values instead of converting markup on every render.
+    Each entry records a hash of the source it was rendered from. Rows
+    saved before the field existed, or changed with QuerySet.update(),
+    are refreshed by the backfill_rendered_markup command; until then
+    rendered_value() sees the hash mismatch and converts on the fly.
+    """
+
+    MARKUP_FIELDS: dict[str, tuple[str, ...]] = {}
+
+    rendered_markup = models.JSONField(
+        _("Renderovan markup"),
+        default=dict,
+        blank=True,
+        editable=False,
+    )
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            self.refresh_rendered_markup()
+        elif set(update_fields) & self.MARKUP_FIELDS.keys():
+            self.refresh_rendered_markup()
+            kwargs["update_fields"] = {*update_fields, "rendered_markup"}
+        super().save(*args, **kwargs)
+
+    def build_rendered_markup(self) -> dict[str, dict]:
+        """
+        Render every markup field of the record.
+
+        Returns:
+            Dict of field name -> {"source_hash": source digest, rendering: text}
+        """
+        from doi_portal.core.markup import MARKUP_RENDERERS
+
+        rendered = {}
+        for field, renderings in self.MARKUP_FIELDS.items():
+            source = getattr(self, field) or ""
+            entry = {"source_hash": _markup_source_hash(source)}
+            for rendering in renderings:
+                entry[rendering] = MARKUP_RENDERERS[rendering](source)
+            rendered[field] = entry
+        return rendered
+
+    def refresh_rendered_markup(self) -> None:
+        """Re-render all markup fields into rendered_markup (without saving)."""
+        self.rendered_markup = self.build_rendered_markup()
+
+    def has_current_rendered_markup(self) -> bool:
+        """
+        Check whether every markup field has a rendering of its current source.
+
+        Returns:
+            False if an entry is missing or was rendered from other source text
+        """
+        stored = self.rendered_markup or {}
+        return all(
+            (stored.get(field) or {}).get("source_hash") == _markup_source_hash(getattr(self, field) or "")
+            for field in self.MARKUP_FIELDS
+        )
+
+    def _current_markup_entry(self, field: str, source: str) -> dict | None:
+        """
+        Return the stored entry of a field if it was rendered from source.
+
+        The hash comparison runs once per field and instance; it is redone
+        only when the source value or the stored entry is replaced.
+        """
+        # Deferred fields are missing from __dict__; reading one would query
+        entry = (self.__dict__.get("rendered_markup") or {}).get(field)
+        checked = self.__dict__.setdefault("_checked_markup", {})
+        previous = checked.get(field)
+        if previous is not None and previous[0] is source and previous[1] is entry:
+            return previous[2]
+        current = entry if entry and entry.get("source_hash") == _markup_source_hash(source) else None
+        checked[field] = (source, entry, current)
+        return current
+
+    def rendered_value(self, field: str, rendering: str) -> str:
+        """
+        Return a stored rendering of a markup field.
+
+        Falls back to converting the source when rendered_markup is
+        deferred, not yet backfilled or was rendered from other source text.
+
+        Args:
+            field: Source field name (key of MARKUP_FIELDS)
+            rendering: "html", "crossref", "jats" or "plain"
+
+        Returns:
+            Rendered text
+        """
+        source = getattr(self, field) or ""
+        entry = self._current_markup_entry(field, source)
+        if entry is not None and rendering in entry:
+            return entry[rendering]
+
+        from doi_portal.core.markup import MARKUP_RENDERERS
+
+        return MARKUP_RENDERERS[rendering](source)
+
+    @property
+    def rendered(self) -> Mapping[str, Mapping[str, str]]:
+        """
+        Stored renderings per field for templates, HTML marked safe.
+
+        Renderings are looked up only when accessed.
+
+        Usage: {{ article.rendered.title.html }}
+        """
+        return _RenderedFields(self)
+
+
+class _RenderedFields(Mapping):
+    """Lazy field -> renderings mapping behind RenderedMarkupMixin.rendered."""
+
+    def __init__(self, record: RenderedMarkupMixin):
+        self._record = record
+
+    def __getitem__(self, field: str) -> _RenderedField:
+        if field not in self._record.MARKUP_FIELDS:
+            raise KeyError(field)
+        return _RenderedField(self._record, field)
+
+    def __iter__(self):
+        return iter(self._record.MARKUP_FIELDS)
+
+    def __len__(self) -> int:
+        return len(self._record.MARKUP_FIELDS)
+
+
+class _RenderedField(Mapping):
+    """Lazy rendering -> text mapping of one markup field."""
+
+    def __init__(self, record: RenderedMarkupMixin, field: str):
+        self._record = record
+        self._field = field
+
+    def __getitem__(self, rendering: str) -> str:
+        if rendering not in self._record.MARKUP_FIELDS[self._field]:
+            raise KeyError(rendering)
+        value = self._record.rendered_value(self._field, rendering)
+        return mark_safe(value) if rendering == "html" else value
+
+    def __iter__(self):
+        return iter(self._record.MARKUP_FIELDS[self._field])
+
+    def __len__(self) -> int:
+        return len(self._record.MARKUP_FIELDS[self._field])
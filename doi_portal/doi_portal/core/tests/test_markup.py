@@ -0,0 +1,133 @@
+"""
+Tests for the single-pass markup parser.
+
+Covers output modes, escaping, delimiter pairing, parity with the
+previous regex conversion, the parse cache and the benchmark command.
+"""
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from doi_portal.core.management.commands.benchmark_markup import SAMPLE_ABSTRACT
+from doi_portal.core.management.commands.benchmark_markup import regex_convert
+from doi_portal.core.markup import BOLD
+from doi_portal.core.markup import ITALIC
+from doi_portal.core.markup import SUB
+from doi_portal.core.markup import clear_markup_cache
+from doi_portal.core.markup import markup_to_crossref_xml
+from doi_portal.core.markup import markup_to_html
+from doi_portal.core.markup import markup_to_jats_xml
+from doi_portal.core.markup import parse_markup
+from doi_portal.core.markup import strip_markup
+
+CONVERTERS = {
+    "html": markup_to_html,
+    "crossref": markup_to_crossref_xml,
+    "jats": markup_to_jats_xml,
+    "strip": strip_markup,
+}
+
+
+class TestOutputModes:
+    """Tests for the four conversion functions."""
+
+    def test_all_span_kinds(self):
+        text = "**B** _i_ x^2^ H~2~O"
+
+        assert markup_to_html(text) == "<strong>B</strong> <em>i</em> x<sup>2</sup> H<sub>2</sub>O"
+        assert markup_to_crossref_xml(text) == "<b>B</b> <i>i</i> x<sup>2</sup> H<sub>2</sub>O"
+        assert markup_to_jats_xml(text) == (
+            "<jats:bold>B</jats:bold> <jats:italic>i</jats:italic> "
+            "x<jats:sup>2</jats:sup> H<jats:sub>2</jats:sub>O"
+        )
+        assert strip_markup(text) == "B i x2 H2O"
+
+    def test_nested_spans(self):
+        assert markup_to_html("_a **b** c_") == "<em>a <strong>b</strong> c</em>"
+        assert markup_to_crossref_xml("**TiO~2~**") == "<b>TiO<sub>2</sub></b>"
+
+    def test_escaping(self):
+        text = '**a & b** < "c" \'d\''
+
+        assert markup_to_html(text) == "<strong>a &amp; b</strong> &lt; &quot;c&quot; &#x27;d&#x27;"
+        assert markup_to_crossref_xml(text) == "<b>a &amp; b</b> &lt; &quot;c&quot; &apos;d&apos;"
+        assert strip_markup(text) == 'a & b < "c" \'d\''
+
+    @pytest.mark.parametrize("text", [None, ""])
+    def test_empty_input(self, text):
+        for convert in CONVERTERS.values():
+            assert convert(text) == ""
+
+
+class TestDelimiterPairing:
+    """Tests for how delimiters pair up."""
+
+    def test_underscores_inside_words_stay_literal(self):
+        assert markup_to_html("snake_case_name and _italic_") == "snake_case_name and <em>italic</em>"
+
+    def test_empty_spans_stay_literal(self):
+        assert markup_to_html("^^ ~~ ****") == "^^ ~~ ****"
+
+    def test_extra_star_before_bold(self):
+        assert markup_to_html("***a**") == "*<strong>a</strong>"
+
+    def test_crossing_pairs_keep_higher_precedence(self):
+        assert markup_to_html("**a _b** c_") == "<strong>a _b</strong> c_"
+        assert markup_to_crossref_xml("^a ~b^ c~") == "<sup>a ~b</sup> c~"
+
+    def test_marker_characters_are_dropped(self):
+        assert strip_markup("a\ufdd0b **c**") == "ab c"
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            SAMPLE_ABSTRACT,
+            "Plain text without markup",
+            "_Escherichia coli_ & **E. coli** at 10^-3^ M",
+            "CO~2~ and H~2~O in _in vitro_ < 5 °C",
+            "_a **b** c_",
+            "snake_case_name",
+        ],
+    )
+    def test_matches_regex_conversion(self, text):
+        for mode, convert in CONVERTERS.items():
+            assert convert(text) == regex_convert(text, mode)
+
+
+class TestParseCache:
+    """Tests for parse_markup and the LRU cache."""
+
+    def test_parse_tree(self):
+        assert parse_markup("x _a **b**_ H~2~") == (
+            "x ",
+            (ITALIC, ("a ", (BOLD, ("b",)))),
+            " H",
+            (SUB, ("2",)),
+        )
+
+    def test_outputs_are_cached(self):
+        clear_markup_cache()
+        text = "Cached **title** 1"
+
+        first = markup_to_html(text)
+
+        assert markup_to_html(text) is first
+        assert parse_markup(text) is parse_markup(text)
+        clear_markup_cache()
+        assert markup_to_html(text) == first
+
+
+class TestBenchmarkCommand:
+    """Tests for the benchmark_markup management command."""
+
+    def test_reports_timings(self):
+        out = StringIO()
+
+        call_command("benchmark_markup", samples=5, iterations=1, stdout=out)
+
+        output = out.getvalue()
+        assert "Regex passes:" in output
+        assert "Single pass (cold):" in output
+        assert "Single pass (cached):" in output
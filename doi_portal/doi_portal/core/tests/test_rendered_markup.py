@@ -0,0 +1,194 @@
+"""
+Tests for stored markup renderings.
+
+Covers rendering on save, fallback for stale or deferred values, the
+read paths (landing page, Crossref XML) and the backfill command.
+"""
+
+import hashlib
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from doi_portal.articles.models import Article
+from doi_portal.articles.models import ArticleStatus
+from doi_portal.articles.tests.factories import ArticleFactory
+from doi_portal.crossref.services import CrossrefService
+from doi_portal.issues.models import IssueStatus
+from doi_portal.issues.tests.factories import IssueFactory
+from doi_portal.monographs.models import Monograph
+from doi_portal.monographs.models import MonographChapter
+from doi_portal.monographs.models import MonographStatus
+from doi_portal.monographs.tests.factories import MonographChapterFactory
+from doi_portal.monographs.tests.factories import MonographFactory
+from doi_portal.publications.tests.factories import PublicationFactory
+from doi_portal.publications.tests.factories import PublisherFactory
+
+
+@pytest.fixture
+def article(db):
+    return ArticleFactory(
+        title="Sinteza **TiO~2~** čestica",
+        subtitle="_in vitro_",
+        abstract="Prinos & pH < 7 za H~2~O",
+    )
+
+
+@pytest.mark.django_db
+class TestRenderOnSave:
+    """Tests for RenderedMarkupMixin.save and rendered_value."""
+
+    def test_save_stores_renderings(self, article):
+        stored = Article.objects.get(pk=article.pk).rendered_markup
+
+        assert stored["title"] == {
+            "source_hash": hashlib.sha256(article.title.encode("utf-8")).hexdigest(),
+            "html": "Sinteza <strong>TiO<sub>2</sub></strong> čestica",
+            "crossref": "Sinteza <b>TiO<sub>2</sub></b> čestica",
+            "plain": "Sinteza TiO2 čestica",
+        }
+        assert stored["abstract"]["jats"] == "Prinos &amp; pH &lt; 7 za H<jats:sub>2</jats:sub>O"
+        assert stored["original_language_title"]["html"] == ""
+
+    def test_update_fields_include_rendered_markup(self, article):
+        article.title = "Novi _naslov_"
+        article.save(update_fields=["title"])
+
+        article.refresh_from_db()
+        assert article.rendered_value("title", "html") == "Novi <em>naslov</em>"
+
+    def test_unrelated_update_fields_keep_renderings(self, article):
+        article.rendered_markup["title"]["html"] = "sačuvano"
+        article.save(update_fields=["first_page"])
+
+        assert Article.objects.get(pk=article.pk).rendered_markup["title"]["html"] != "sačuvano"
+        assert article.rendered_markup["title"]["html"] == "sačuvano"
+
+    def test_stored_value_is_read(self, article):
+        Article.objects.filter(pk=article.pk).update(
+            rendered_markup={"title": {**article.rendered_markup["title"], "html": "iz baze"}},
+        )
+
+        assert Article.objects.get(pk=article.pk).rendered_value("title", "html") == "iz baze"
+
+    def test_stale_value_falls_back_to_conversion(self, article):
+        Article.objects.filter(pk=article.pk).update(title="**Promenjen** naslov")
+
+        assert Article.objects.get(pk=article.pk).rendered_value("title", "html") == (
+            "<strong>Promenjen</strong> naslov"
+        )
+
+    def test_same_length_update_falls_back_to_conversion(self, article):
+        title = article.title.replace("čestica", "kapljic")
+        assert len(title) == len(article.title)
+        Article.objects.filter(pk=article.pk).update(title=title)
+
+        assert Article.objects.get(pk=article.pk).rendered_value("title", "plain") == "Sinteza TiO2 kapljic"
+
+    def test_entry_without_source_hash_is_stale(self, article):
+        Article.objects.filter(pk=article.pk).update(
+            rendered_markup={"title": {"length": len(article.title), "html": "staro"}},
+        )
+
+        assert Article.objects.get(pk=article.pk).rendered_value("title", "html") != "staro"
+
+    def test_deferred_renderings_do_not_query(self, article, django_assert_num_queries):
+        obj = Article.objects.defer("rendered_markup").get(pk=article.pk)
+
+        with django_assert_num_queries(0):
+            assert obj.rendered_value("subtitle", "plain") == "in vitro"
+
+    def test_source_is_hashed_once_per_field(self, article):
+        from unittest.mock import patch
+
+        from doi_portal.core import mixins
+
+        obj = Article.objects.get(pk=article.pk)
+        with patch.object(mixins, "_markup_source_hash", wraps=mixins._markup_source_hash) as source_hash:
+            for _ in range(3):
+                assert obj.rendered["title"]["html"] == "Sinteza <strong>TiO<sub>2</sub></strong> čestica"
+                assert obj.rendered["title"]["plain"] == "Sinteza TiO2 čestica"
+            assert source_hash.call_count == 1
+
+            obj.title = "Drugi _naslov_"
+            assert obj.rendered["title"]["html"] == "Drugi <em>naslov</em>"
+            assert source_hash.call_count == 2
+
+    def test_rendered_marks_html_safe(self, article):
+        rendered = article.rendered
+
+        assert hasattr(rendered["title"]["html"], "__html__")
+        assert not hasattr(rendered["title"]["plain"], "__html__")
+        assert set(rendered) == set(Article.MARKUP_FIELDS)
+
+
+@pytest.mark.django_db
+class TestReadPaths:
+    """Tests for pages and XML reading stored renderings."""
+
+    def test_landing_page_uses_stored_html(self, client):
+        issue = IssueFactory(
+            publication=PublicationFactory(publisher=PublisherFactory(doi_prefix="10.9999")),
+            status=IssueStatus.PUBLISHED,
+        )
+        article = ArticleFactory(
+            issue=issue,
+            title="Naslov sa **naglaskom**",
+            status=ArticleStatus.PUBLISHED,
+            published_at=timezone.now(),
+        )
+
+        content = client.get(reverse("portal-articles:article-detail", args=[article.pk])).content.decode()
+
+        assert "Naslov sa <strong>naglaskom</strong>" in content
+        assert "Naslov sa naglaskom - " in content
+
+    def test_monograph_xml_uses_stored_renderings(self):
+        monograph = MonographFactory(title="Knjiga _prva_", abstract="")
+        MonographChapterFactory(monograph=monograph, title="Glava ^1^", status=MonographStatus.PUBLISHED)
+        rendered_markup = monograph.rendered_markup
+        rendered_markup["title"]["crossref"] = "Knjiga <i>iz baze</i>"
+        Monograph.objects.filter(pk=monograph.pk).update(rendered_markup=rendered_markup)
+
+        context = CrossrefService()._build_monograph_context(Monograph.objects.get(pk=monograph.pk))
+
+        assert context["monograph"]["title"] == "Knjiga <i>iz baze</i>"
+        assert context["chapters"][0]["title"] == "Glava <sup>1</sup>"
+
+
+@pytest.mark.django_db
+class TestBackfillCommand:
+    """Tests for the backfill_rendered_markup management command."""
+
+    def test_fills_missing_renderings(self, article):
+        chapter = MonographChapterFactory(title="**Glava**")
+        Article.objects.filter(pk=article.pk).update(rendered_markup={})
+        MonographChapter.objects.filter(pk=chapter.pk).update(rendered_markup={})
+        out = StringIO()
+
+        call_command("backfill_rendered_markup", stdout=out)
+
+        assert Article.objects.get(pk=article.pk).rendered_markup["title"]["plain"] == "Sinteza TiO2 čestica"
+        assert MonographChapter.objects.get(pk=chapter.pk).rendered_markup["title"]["html"] == "<strong>Glava</strong>"
+        assert "Ukupno ažurirano: 2" in out.getvalue()
+
+    def test_refreshes_rows_changed_by_queryset_update(self, article):
+        Article.objects.filter(pk=article.pk).update(title="_Novo_")
+        out = StringIO()
+
+        call_command("backfill_rendered_markup", "--batch-size", "1", stdout=out)
+
+        assert Article.objects.get(pk=article.pk).rendered_markup["title"]["html"] == "<em>Novo</em>"
+        assert "Ukupno ažurirano: 1" in out.getvalue()
+
+    def test_all_refreshes_current_rows(self, article):
+        out = StringIO()
+        call_command("backfill_rendered_markup", stdout=out)
+        assert "Ukupno ažurirano: 0" in out.getvalue()
+
+        out = StringIO()
+        call_command("backfill_rendered_markup", "--all", stdout=out)
+        assert "Ukupno ažurirano: 0" not in out.getvalue()
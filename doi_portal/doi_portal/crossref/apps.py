@@ -13,3 +13,21 @@ class CrossrefConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "doi_portal.crossref"
     verbose_name = "Crossref"
+
+    def ready(self):
+        """
+        Connect signal handlers, precompile Crossref XML templates and the XSD.
+
+        Templates and the schema are warmed here so forked workers
+        (Celery prefork children, gunicorn workers) inherit them.
+        """
+        from django.conf import settings
+
+        import doi_portal.crossref.signals  # noqa: F401, PLC0415
+
+        if getattr(settings, "CROSSREF_WARM_TEMPLATES", False):
+            from .services import warm_crossref_templates
+            from .validators import preload_schema
+
+            warm_crossref_templates()
+            preload_schema()
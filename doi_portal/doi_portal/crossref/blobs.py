@@ -0,0 +1,150 @@
+"""
+Content-addressed storage for Crossref XML snapshots.
+
+XML documents are keyed by the SHA-256 of their UTF-8 bytes, compressed
+with zstd (when the optional ``zstandard`` package is installed) or gzip,
+and stored once in the XMLBlob table. Export history rows only reference
+the hash, so repeated downloads of unchanged XML cost no extra storage.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from doi_portal.crossref.models import XMLBlob
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "compress_xml",
+    "decompress_xml",
+    "store_xml_blob",
+    "xml_sha256",
+]
+
+GZIP_LEVEL = 9
+ZSTD_LEVEL = 19
+
+
+# Characters encoded per step when hashing, so no full UTF-8 copy is made
+_HASH_SLICE = 64 * 1024
+
+
+def _digest_and_size(xml: str) -> tuple[str, int]:
+    """Return the hex SHA-256 digest and UTF-8 size of an XML document."""
+    digest = hashlib.sha256()
+    size = 0
+    for start in range(0, len(xml), _HASH_SLICE):
+        data = xml[start:start + _HASH_SLICE].encode("utf-8")
+        digest.update(data)
+        size += len(data)
+    return digest.hexdigest(), size
+
+
+def xml_sha256(xml: str) -> str:
+    """
+    Return the hex SHA-256 digest of an XML document.
+
+    Args:
+        xml: XML string
+
+    Returns:
+        64-character hex digest of the UTF-8 encoded XML
+    """
+    return _digest_and_size(xml)[0]
+
+
+def _configured_codec() -> str:
+    """Return the codec to use for new blobs, falling back to gzip."""
+    from doi_portal.crossref.models import XMLBlobCodec
+
+    codec = getattr(settings, "CROSSREF_XML_BLOB_CODEC", XMLBlobCodec.GZIP)
+    if codec == XMLBlobCodec.ZSTD and zstandard is None:
+        logger.warning("CROSSREF_XML_BLOB_CODEC=zstd but zstandard is not installed; using gzip")
+        return XMLBlobCodec.GZIP
+    return codec
+
+
+def compress_xml(xml: str, codec: str) -> bytes:
+    """
+    Compress an XML document.
+
+    Args:
+        xml: XML string
+        codec: XMLBlobCodec value
+
+    Returns:
+        Compressed UTF-8 bytes
+    """
+    from doi_portal.crossref.models import XMLBlobCodec
+
+    raw = xml.encode("utf-8")
+    if codec == XMLBlobCodec.ZSTD:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+    # mtime=0 keeps output deterministic for identical input
+    return gzip.compress(raw, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def decompress_xml(data: bytes, codec: str) -> str:
+    """
+    Decompress a stored XML payload.
+
+    Args:
+        data: Compressed bytes
+        codec: XMLBlobCodec value the payload was written with
+
+    Returns:
+        Decoded XML string
+
+    Raises:
+        ImproperlyConfigured: If the payload is zstd and zstandard is missing
+    """
+    from doi_portal.crossref.models import XMLBlobCodec
+
+    if codec == XMLBlobCodec.ZSTD:
+        if zstandard is None:
+            msg = "zstandard paket je potreban za čitanje zstd XML snapshot-a."
+            raise ImproperlyConfigured(msg)
+        return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
+    return gzip.decompress(data).decode("utf-8")
+
+
+def store_xml_blob(xml: str) -> XMLBlob:
+    """
+    Store an XML document, reusing the existing blob if already present.
+
+    Args:
+        xml: XML string
+
+    Returns:
+        XMLBlob instance for the document's SHA-256
+    """
+    from doi_portal.crossref.models import XMLBlob
+
+    digest, size = _digest_and_size(xml)
+    blob = XMLBlob.objects.filter(pk=digest).only("sha256", "codec", "size").first()
+    if blob is not None:
+        return blob
+
+    codec = _configured_codec()
+    blob, _ = XMLBlob.objects.get_or_create(
+        sha256=digest,
+        defaults={
+            "codec": codec,
+            "data": compress_xml(xml, codec),
+            "size": size,
+        },
+    )
+    return blob
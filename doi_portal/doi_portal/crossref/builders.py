@@ -0,0 +1,372 @@
+"""
+lxml builder engine for Crossref issue XML.
+
+Alternative to the Jinja2 templates: builds the same doi_batch document
+for journal and conference issues directly as lxml elements, from the
+context produced by CrossrefService._build_context(). The document is
+written with etree.xmlfile, one article element at a time, so only the
+head/metadata and a single article subtree are held in memory at once.
+
+Selected per call with CrossrefService.generate_xml(issue, engine="lxml").
+"""
+
+from __future__ import annotations
+
+from typing import IO
+from typing import TYPE_CHECKING
+from typing import Any
+
+from lxml import etree
+
+if TYPE_CHECKING:
+    from lxml.etree import _Element
+
+__all__ = ["build_article_element", "write_issue_xml"]
+
+CROSSREF_NS = "http://www.crossref.org/schema/5.4.0"
+XSI_NS = "http://www.w3.org/2001/XMLSchema-instance"
+JATS_NS = "http://www.ncbi.nlm.nih.gov/JATS1"
+AI_NS = "http://www.crossref.org/AccessIndicators.xsd"
+FR_NS = "http://www.crossref.org/fundref.xsd"
+REL_NS = "http://www.crossref.org/relations.xsd"
+
+NSMAP = {
+    None: CROSSREF_NS,
+    "xsi": XSI_NS,
+    "jats": JATS_NS,
+    "ai": AI_NS,
+    "fr": FR_NS,
+    "rel": REL_NS,
+}
+
+SCHEMA_LOCATION = f"{CROSSREF_NS} https://www.crossref.org/schemas/crossref5.4.0.xsd"
+
+# Wrapper used to turn pre-rendered face/JATS markup into child elements
+_MARKUP_WRAPPER = f'<w xmlns="{CROSSREF_NS}" xmlns:jats="{JATS_NS}">{{}}</w>'
+
+
+def _q(tag: str, ns: str = CROSSREF_NS) -> str:
+    return f"{{{ns}}}{tag}"
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _sub(parent: _Element, tag: str, text: Any = None, ns: str = CROSSREF_NS, **attrib: str) -> _Element:
+    """Append a child element with optional text and attributes."""
+    element = etree.SubElement(parent, _q(tag, ns), attrib)
+    if text is not None:
+        element.text = _text(text)
+    return element
+
+
+def _sub_markup(parent: _Element, tag: str, markup: str, ns: str = CROSSREF_NS, **attrib: str) -> _Element:
+    """Append a child element whose content is escaped inline markup (face or JATS tags)."""
+    element = etree.SubElement(parent, _q(tag, ns), attrib)
+    wrapper = etree.fromstring(_MARKUP_WRAPPER.format(markup))
+    element.text = wrapper.text
+    element.extend(wrapper)
+    return element
+
+
+def _publication_date(parent: _Element, issue: dict) -> None:
+    from doi_portal.crossref.services import format_day
+    from doi_portal.crossref.services import format_month
+
+    date = _sub(parent, "publication_date", media_type="online")
+    if issue["publication_month"]:
+        _sub(date, "month", format_month(issue["publication_month"]))
+    if issue["publication_day"]:
+        _sub(date, "day", format_day(issue["publication_day"]))
+    _sub(date, "year", issue["year"])
+
+
+def _issue_doi_data(parent: _Element, context: dict) -> None:
+    issue = context["issue"]
+    if issue["doi_suffix"]:
+        doi_data = _sub(parent, "doi_data")
+        _sub(doi_data, "doi", f"{context['publisher']['doi_prefix']}/{issue['doi_suffix']}")
+        _sub(
+            doi_data,
+            "resource",
+            f"{context['site_url']}/publications/{context['publication']['slug']}/issues/{issue['pk']}/",
+        )
+
+
+def _head(head: dict) -> _Element:
+    element = etree.Element(_q("head"))
+    _sub(element, "doi_batch_id", head["doi_batch_id"])
+    _sub(element, "timestamp", head["timestamp"])
+    depositor = _sub(element, "depositor")
+    _sub(depositor, "depositor_name", head["depositor_name"])
+    _sub(depositor, "email_address", head["depositor_email"])
+    _sub(element, "registrant", head["registrant"])
+    return element
+
+
+def _journal_metadata(context: dict) -> list[_Element]:
+    publication = context["publication"]
+    issue = context["issue"]
+
+    metadata = etree.Element(_q("journal_metadata"), language=_text(publication["language"]))
+    _sub(metadata, "full_title", publication["title"])
+    if publication["abbreviation"]:
+        _sub(metadata, "abbrev_title", publication["abbreviation"])
+    if publication["issn_print"]:
+        _sub(metadata, "issn", publication["issn_print"], media_type="print")
+    if publication["issn_online"]:
+        _sub(metadata, "issn", publication["issn_online"], media_type="electronic")
+
+    journal_issue = etree.Element(_q("journal_issue"))
+    _publication_date(journal_issue, issue)
+    if issue["volume"]:
+        volume = _sub(journal_issue, "journal_volume")
+        _sub(volume, "volume", issue["volume"])
+    if issue["issue_number"]:
+        _sub(journal_issue, "issue", issue["issue_number"])
+    _issue_doi_data(journal_issue, context)
+    return [metadata, journal_issue]
+
+
+def _conference_metadata(context: dict) -> list[_Element]:
+    from doi_portal.crossref.services import format_date
+
+    publication = context["publication"]
+    issue = context["issue"]
+
+    event = etree.Element(_q("event_metadata"))
+    _sub(event, "conference_name", publication["conference_name"])
+    if publication["conference_acronym"]:
+        _sub(event, "conference_acronym", publication["conference_acronym"])
+    if publication["conference_number"]:
+        _sub(event, "conference_number", publication["conference_number"])
+    if publication["conference_location"]:
+        _sub(event, "conference_location", publication["conference_location"])
+    if publication["conference_date"]:
+        start, end = publication["conference_date"], publication["conference_date_end"]
+        attrib = {
+            "start_month": format_date(start, "%m"),
+            "start_year": format_date(start, "%Y"),
+            "start_day": format_date(start, "%d"),
+        }
+        if end:
+            attrib.update(
+                end_month=format_date(end, "%m"),
+                end_year=format_date(end, "%Y"),
+                end_day=format_date(end, "%d"),
+            )
+        _sub(event, "conference_date", **attrib)
+
+    proceedings = etree.Element(_q("proceedings_metadata"), language=_text(publication["language"]))
+    _sub(proceedings, "proceedings_title", issue["proceedings_title"] or publication["title"])
+    publisher = _sub(proceedings, "publisher")
+    _sub(publisher, "publisher_name", issue["proceedings_publisher_name"] or context["publisher"]["name"])
+    if issue["proceedings_publisher_place"]:
+        _sub(publisher, "publisher_place", issue["proceedings_publisher_place"])
+    _publication_date(proceedings, issue)
+    if publication["isbn_print"]:
+        _sub(proceedings, "isbn", publication["isbn_print"], media_type="print")
+    if publication["isbn_online"]:
+        _sub(proceedings, "isbn", publication["isbn_online"], media_type="electronic")
+    if not publication["isbn_print"] and not publication["isbn_online"]:
+        _sub(proceedings, "noisbn", reason="simple_series")
+    _issue_doi_data(proceedings, context)
+    return [event, proceedings]
+
+
+def _titles(parent: _Element, article: dict) -> None:
+    titles = _sub(parent, "titles")
+    _sub_markup(titles, "title", article["title"])
+    if article["subtitle"]:
+        _sub_markup(titles, "subtitle", article["subtitle"])
+    if article["original_language_title"]:
+        attrib = {}
+        if article["original_language_title_language"]:
+            attrib["language"] = article["original_language_title_language"]
+        _sub_markup(titles, "original_language_title", article["original_language_title"], **attrib)
+        if article["original_language_subtitle"]:
+            _sub_markup(titles, "subtitle", article["original_language_subtitle"])
+
+
+def _contributors(parent: _Element, article: dict) -> None:
+    from doi_portal.crossref.services import format_orcid_url
+
+    if not article["authors"]:
+        return
+    contributors = _sub(parent, "contributors")
+    for author in article["authors"]:
+        person = _sub(
+            contributors,
+            "person_name",
+            sequence=_text(author["sequence"]),
+            contributor_role=_text(author["contributor_role"]),
+        )
+        if author["given_name"]:
+            _sub(person, "given_name", author["given_name"])
+        _sub(person, "surname", author["surname"])
+        if author["suffix"]:
+            _sub(person, "suffix", author["suffix"])
+        if author["affiliations"]:
+            affiliations = _sub(person, "affiliations")
+            for aff in author["affiliations"]:
+                institution = _sub(affiliations, "institution")
+                _sub(institution, "institution_name", aff["institution_name"])
+                if aff["institution_ror_id"]:
+                    _sub(institution, "institution_id", aff["institution_ror_id"], type="ror")
+        if author["orcid"]:
+            attrib = {"authenticated": "true"} if author["orcid_authenticated"] else {}
+            _sub(person, "ORCID", format_orcid_url(author["orcid"]), **attrib)
+
+
+def _abstract(parent: _Element, article: dict) -> None:
+    if article["abstract"]:
+        abstract = _sub(parent, "abstract", ns=JATS_NS)
+        _sub_markup(abstract, "p", article["abstract"], ns=JATS_NS)
+
+
+def _pages(parent: _Element, article: dict) -> None:
+    if article["first_page"] and article["last_page"]:
+        pages = _sub(parent, "pages")
+        _sub(pages, "first_page", article["first_page"])
+        _sub(pages, "last_page", article["last_page"])
+    elif article["article_number"]:
+        item = _sub(parent, "publisher_item")
+        _sub(item, "item_number", article["article_number"], item_number_type="article_number")
+
+
+def _access_indicators(parent: _Element, article: dict) -> None:
+    from doi_portal.crossref.services import format_date
+
+    if not article["license_url"]:
+        return
+    program = _sub(parent, "program", ns=AI_NS, name="AccessIndicators")
+    if article["free_to_read"]:
+        attrib = {}
+        if article["free_to_read_start_date"]:
+            attrib["start_date"] = format_date(article["free_to_read_start_date"], "%Y-%m-%d")
+        _sub(program, "free_to_read", ns=AI_NS, **attrib)
+    attrib = {"applies_to": article["license_applies_to"]} if article["license_applies_to"] else {}
+    _sub(program, "license_ref", article["license_url"], ns=AI_NS, **attrib)
+
+
+def _fundings(parent: _Element, article: dict) -> None:
+    if not article["fundings"]:
+        return
+    program = _sub(parent, "program", ns=FR_NS, name="fundref")
+    for funding in article["fundings"]:
+        group = _sub(program, "assertion", ns=FR_NS, name="fundgroup")
+        _sub(group, "assertion", funding["funder_name"], ns=FR_NS, name="funder_name")
+        if funding["funder_doi"]:
+            _sub(group, "assertion", funding["funder_doi"], ns=FR_NS, name="funder_identifier")
+        if funding["award_number"]:
+            _sub(group, "assertion", funding["award_number"], ns=FR_NS, name="award_number")
+
+
+def _relations(parent: _Element, article: dict) -> None:
+    if not article["relations"]:
+        return
+    program = _sub(parent, "program", ns=REL_NS, name="relations")
+    for relation in article["relations"]:
+        item = _sub(program, "related_item", ns=REL_NS)
+        if relation["description"]:
+            _sub(item, "description", relation["description"], ns=REL_NS)
+        tag = "intra_work_relation" if relation["scope"] == "intra_work" else "inter_work_relation"
+        _sub(
+            item,
+            tag,
+            relation["identifier"],
+            ns=REL_NS,
+            **{
+                "relationship-type": _text(relation["relationship_type"]),
+                "identifier-type": _text(relation["identifier_type"]),
+            },
+        )
+
+
+def _article_doi_data(parent: _Element, article: dict, context: dict) -> None:
+    doi_data = _sub(parent, "doi_data")
+    _sub(doi_data, "doi", f"{context['publisher']['doi_prefix']}/{article['doi_suffix']}")
+    if article["use_external_resource"] and article["external_landing_url"]:
+        _sub(doi_data, "resource", article["external_landing_url"])
+    else:
+        _sub(doi_data, "resource", f"{context['site_url']}/articles/{article['pk']}/")
+
+
+def build_article_element(article: dict, context: dict, *, conference: bool = False) -> _Element:
+    """
+    Build one <journal_article> or <conference_paper> element.
+
+    Element order mirrors journal_article_item.xml.j2 and
+    conference_paper_item.xml.j2 respectively.
+
+    Args:
+        article: Article dict from the issue context
+        context: Full issue context from CrossrefService._build_context()
+        conference: Build a conference_paper instead of a journal_article
+
+    Returns:
+        Article element in the Crossref namespace
+    """
+    tag = "conference_paper" if conference else "journal_article"
+    element = etree.Element(_q(tag), publication_type=_text(article["publication_type"]))
+    if conference:
+        _contributors(element, article)
+        _titles(element, article)
+    else:
+        _titles(element, article)
+        _contributors(element, article)
+    _abstract(element, article)
+    _publication_date(element, context["issue"])
+    _pages(element, article)
+    if conference:
+        _fundings(element, article)
+        _access_indicators(element, article)
+    else:
+        _access_indicators(element, article)
+        _fundings(element, article)
+    _relations(element, article)
+    _article_doi_data(element, article, context)
+    return element
+
+
+def _write_element(xf: Any, element: _Element) -> None:
+    """
+    Stream an element through xmlfile's namespace-aware element contexts.
+
+    xf.write(element) would re-declare every namespace on each written
+    subtree; nested xf.element() contexts reuse the declarations already
+    in scope on <doi_batch>.
+    """
+    with xf.element(element.tag, element.attrib):
+        if element.text:
+            xf.write(element.text)
+        for child in element:
+            _write_element(xf, child)
+            if child.tail:
+                xf.write(child.tail)
+
+
+def write_issue_xml(context: dict, sink: IO[bytes], *, conference: bool = False) -> None:
+    """
+    Write a journal or conference doi_batch document incrementally.
+
+    Args:
+        context: Full issue context from CrossrefService._build_context()
+        sink: Binary file-like object
+        conference: Write a conference document instead of a journal one
+    """
+    container = "conference" if conference else "journal"
+    metadata = _conference_metadata(context) if conference else _journal_metadata(context)
+
+    with etree.xmlfile(sink, encoding="UTF-8") as xf:
+        xf.write_declaration()
+        root_attrib = {_q("schemaLocation", XSI_NS): SCHEMA_LOCATION, "version": "5.4.0"}
+        with xf.element(_q("doi_batch"), root_attrib, nsmap=NSMAP):
+            _write_element(xf, _head(context["head"]))
+            with xf.element(_q("body")), xf.element(_q(container)):
+                for element in metadata:
+                    _write_element(xf, element)
+                for article in context["articles"]:
+                    _write_element(xf, build_article_element(article, context, conference=conference))
+                    xf.flush()
@@ -0,0 +1,252 @@
+"""
+Publisher-wide bulk Crossref XML regeneration.
+
+Creates a BulkRegenerationRun with one BulkRegenerationItem per issue,
+component group and monograph of a publisher, then hands it to Celery
+(crossref_bulk_regeneration_task), which regenerates items in batches
+spread over a bounded number of concurrent batch tasks
+(CROSSREF_BULK_REGENERATION_CONCURRENCY). Each batch is rendered first
+and its documents are then XSD-validated together through
+XSDValidationService.validate_many(), so the validation cache is
+consulted for the whole batch at once. Progress lives in the database,
+so a run can be inspected at any time and resumed after a worker or
+broker interruption.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models import Count
+from django.db.models import Q
+from django.utils import timezone
+
+from doi_portal.crossref.models import BulkRegenerationItem
+from doi_portal.crossref.models import BulkRegenerationRun
+from doi_portal.crossref.models import BulkRegenerationStatus
+from doi_portal.crossref.models import ExportType
+
+if TYPE_CHECKING:
+    from doi_portal.publishers.models import Publisher
+    from doi_portal.users.models import User
+
+__all__ = [
+    "claim_next_batch",
+    "refresh_run_progress",
+    "regenerate_items",
+    "resume_bulk_regeneration",
+    "start_bulk_regeneration",
+]
+
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_CONCURRENCY = 4
+
+
+def _entity_querysets(publisher: Publisher) -> dict[str, object]:
+    """Return non-deleted entities of a publisher keyed by ExportType."""
+    from doi_portal.components.models import ComponentGroup
+    from doi_portal.issues.models import Issue
+    from doi_portal.monographs.models import Monograph
+
+    return {
+        ExportType.ISSUE: Issue.objects.filter(publication__publisher=publisher),
+        ExportType.COMPONENT_GROUP: ComponentGroup.objects.filter(publisher=publisher),
+        ExportType.MONOGRAPH: Monograph.objects.filter(publisher=publisher),
+    }
+
+
+def start_bulk_regeneration(
+    publisher: Publisher,
+    user: User | None = None,
+) -> BulkRegenerationRun:
+    """
+    Create a regeneration run for all Crossref entities of a publisher and start it.
+
+    Args:
+        publisher: Publisher whose issues, component groups and monographs are regenerated
+        user: User who started the run
+
+    Returns:
+        The created BulkRegenerationRun
+    """
+    from doi_portal.crossref.tasks import crossref_bulk_regeneration_task
+
+    with transaction.atomic():
+        run = BulkRegenerationRun.objects.create(
+            publisher=publisher,
+            started_by=user,
+            status=BulkRegenerationStatus.RUNNING,
+        )
+        items = [
+            BulkRegenerationItem(run=run, entity_type=entity_type, object_id=pk)
+            for entity_type, queryset in _entity_querysets(publisher).items()
+            for pk in queryset.order_by("pk").values_list("pk", flat=True)
+        ]
+        BulkRegenerationItem.objects.bulk_create(items, batch_size=500)
+        run.total = len(items)
+        run.save(update_fields=["total"])
+
+    transaction.on_commit(lambda: crossref_bulk_regeneration_task.delay(run.pk))
+    return run
+
+
+def resume_bulk_regeneration(run: BulkRegenerationRun) -> BulkRegenerationRun:
+    """
+    Resume an interrupted run.
+
+    Items left RUNNING by a lost worker are returned to PENDING; items
+    that already finished are not regenerated again.
+
+    Args:
+        run: Run to resume
+
+    Returns:
+        The resumed run
+    """
+    from doi_portal.crossref.tasks import crossref_bulk_regeneration_task
+
+    with transaction.atomic():
+        run.items.filter(status=BulkRegenerationStatus.RUNNING).update(
+            status=BulkRegenerationStatus.PENDING,
+        )
+        run.status = BulkRegenerationStatus.RUNNING
+        run.finished_at = None
+        run.save(update_fields=["status", "finished_at"])
+
+    transaction.on_commit(lambda: crossref_bulk_regeneration_task.delay(run.pk))
+    return run
+
+
+def claim_next_batch(run: BulkRegenerationRun, batch_size: int = DEFAULT_BATCH_SIZE) -> list[int]:
+    """
+    Mark the next pending items of a run as RUNNING and return their IDs.
+
+    Args:
+        run: Run to take items from
+        batch_size: Maximum number of items to claim
+
+    Returns:
+        Claimed BulkRegenerationItem primary keys (empty when nothing is pending)
+    """
+    with transaction.atomic():
+        # Concurrent batch tasks of the run claim disjoint items
+        item_ids = list(
+            run.items.filter(status=BulkRegenerationStatus.PENDING)
+            .select_for_update(skip_locked=True)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        BulkRegenerationItem.objects.filter(pk__in=item_ids).update(
+            status=BulkRegenerationStatus.RUNNING,
+        )
+    return item_ids
+
+
+def refresh_run_progress(run: BulkRegenerationRun) -> BulkRegenerationRun:
+    """
+    Recompute run counters from its items in a single aggregate query.
+
+    Marks the run SUCCEEDED once no item is pending or running.
+
+    Args:
+        run: Run to refresh
+
+    Returns:
+        The refreshed run
+    """
+    unfinished = Q(status__in=[BulkRegenerationStatus.PENDING, BulkRegenerationStatus.RUNNING])
+    counts = run.items.aggregate(
+        succeeded_count=Count("pk", filter=Q(status=BulkRegenerationStatus.SUCCEEDED)),
+        failed_count=Count("pk", filter=Q(status=BulkRegenerationStatus.FAILED)),
+        xsd_valid_count=Count("pk", filter=Q(xsd_valid=True)),
+        xsd_invalid_count=Count("pk", filter=Q(xsd_valid=False)),
+        remaining_count=Count("pk", filter=unfinished),
+    )
+    remaining = counts.pop("remaining_count")
+    counts = {name.removesuffix("_count"): value for name, value in counts.items()}
+    for field_name, value in counts.items():
+        setattr(run, field_name, value)
+    update_fields = list(counts)
+    if not remaining:
+        run.status = BulkRegenerationStatus.SUCCEEDED
+        run.finished_at = timezone.now()
+        update_fields += ["status", "finished_at"]
+    run.save(update_fields=update_fields)
+    return run
+
+
+def _finish_item(
+    item: BulkRegenerationItem,
+    *,
+    success: bool,
+    message: str = "",
+    xsd_valid: bool | None = None,
+) -> dict:
+    """Record the outcome of one item and return it as a task result."""
+    item.status = BulkRegenerationStatus.SUCCEEDED if success else BulkRegenerationStatus.FAILED
+    item.xsd_valid = xsd_valid
+    item.message = message
+    item.finished_at = timezone.now()
+    item.save(update_fields=["status", "xsd_valid", "message", "finished_at"])
+    return {"success": success, "xsd_valid": xsd_valid}
+
+
+def _fail_entity(item: BulkRegenerationItem, entity, message: str) -> dict:
+    """Mark an entity's generation and its item as failed."""
+    entity.xml_generation_status = "failed"
+    entity.save(update_fields=["xml_generation_status"])
+    return _finish_item(item, success=False, message=message)
+
+
+def regenerate_items(items: list[BulkRegenerationItem]) -> list[dict]:
+    """
+    Regenerate, validate and store XML for a batch of run items.
+
+    All documents of the batch are rendered first, then validated in one
+    XSDValidationService.validate_many() call and stored. A failing item
+    is recorded as FAILED without affecting the rest of the batch.
+
+    Args:
+        items: Items to regenerate (with run__publisher loaded)
+
+    Returns:
+        Dict with success flag and XSD validity per item, in input order
+    """
+    from doi_portal.crossref.services import CrossrefService
+    from doi_portal.crossref.validators import XSDValidationService
+
+    service = CrossrefService()
+    renderers = {
+        ExportType.ISSUE: service.stream_xml,
+        ExportType.COMPONENT_GROUP: service.stream_component_xml,
+        ExportType.MONOGRAPH: service.stream_monograph_xml,
+    }
+    results: list[dict | None] = [None] * len(items)
+    rendered: list[tuple[int, object, str]] = []
+
+    for index, item in enumerate(items):
+        queryset = _entity_querysets(item.run.publisher)[item.entity_type]
+        entity = queryset.filter(pk=item.object_id).first()
+        if entity is None:
+            results[index] = _finish_item(item, success=False, message=f"Entitet {item.object_id} nije pronađen")
+            continue
+        entity.xml_generation_status = "generating"
+        entity.save(update_fields=["xml_generation_status"])
+        try:
+            xml = "".join(renderers[item.entity_type](entity))
+        except Exception as e:  # noqa: BLE001
+            results[index] = _fail_entity(item, entity, str(e))
+            continue
+        rendered.append((index, entity, xml))
+
+    validation_results = XSDValidationService().validate_many([xml for _, _, xml in rendered])
+    for (index, entity, xml), validation_result in zip(rendered, validation_results, strict=True):
+        try:
+            service.store_generated_xml(entity, xml, validation_result)
+        except Exception as e:  # noqa: BLE001
+            results[index] = _fail_entity(items[index], entity, str(e))
+            continue
+        results[index] = _finish_item(items[index], success=True, xsd_valid=entity.xsd_valid)
+
+    return results
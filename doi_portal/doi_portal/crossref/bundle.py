@@ -0,0 +1,227 @@
+"""
+ZIP bundles of Crossref XML for many issues or monographs.
+
+Instead of one download (and one CrossrefExport snapshot) per entity, an
+editor can download a whole volume as a single ZIP archive. The archive
+is streamed: entity XML is read from the database one document at a
+time and every compressed entry is handed to the response as soon as
+ZipFile writes it, so neither the archive nor all documents are held in
+memory. Once the whole archive has been sent, the download is recorded
+as one CrossrefExportBundle with an item per file actually written.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import zipfile
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db import transaction
+from django.utils import timezone
+from slugify import slugify
+
+from doi_portal.crossref.models import CrossrefExportBundle
+from doi_portal.crossref.models import CrossrefExportBundleItem
+from doi_portal.crossref.models import ExportType
+
+__all__ = [
+    "BundleEntry",
+    "collect_bundle_entries",
+    "record_bundle_export",
+    "stream_xml_bundle",
+]
+
+# Characters of XML written to a ZIP entry at a time
+ZIP_WRITE_CHUNK_SIZE = 64 * 1024
+
+# Entity rows fetched per query while streaming
+FETCH_SIZE = 20
+
+
+@dataclass(frozen=True)
+class BundleEntry:
+    """
+    One XML file in a bundle.
+
+    Attributes:
+        object_id: Primary key of the issue or monograph
+        filename: Name of the file inside the archive
+        xml_generated_at: Time the included XML was generated (set when streamed)
+        xsd_valid: XSD outcome of the included XML (set when streamed)
+    """
+
+    object_id: int
+    filename: str
+    xml_generated_at: datetime | None = None
+    xsd_valid: bool | None = None
+
+
+class _ZipChunkWriter:
+    """Write-only file object collecting the bytes ZipFile produces."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        """Return and forget the bytes written so far."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _entry_filename(entity_type: str, entity) -> str:
+    """Name of an entity's XML file inside the archive."""
+    if entity_type == ExportType.ISSUE:
+        publication_slug = slugify(entity.publication.title)[:30] or "publication"
+        return f"{publication_slug}_{entity.volume or 'v0'}_{entity.issue_number or 'i0'}.xml"
+    return f"monograph_{slugify(entity.title)[:30] or 'monograph'}.xml"
+
+
+def collect_bundle_entries(entity_type: str, queryset) -> list[BundleEntry]:
+    """
+    List the entities of a queryset that have generated XML.
+
+    Only file names are resolved here; the XML and its generation
+    metadata are read together while streaming. Duplicate file names get
+    the entity id appended.
+
+    Args:
+        entity_type: ExportType.ISSUE or ExportType.MONOGRAPH
+        queryset: Issues (with publication) or monographs, in archive order
+
+    Returns:
+        BundleEntry per entity with XML
+    """
+    entries = []
+    used: set[str] = set()
+    for entity in queryset.exclude(crossref_xml="").defer("crossref_xml", "crossref_xml_line_index"):
+        filename = _entry_filename(entity_type, entity)
+        if filename in used:
+            filename = f"{filename.removesuffix('.xml')}_{entity.pk}.xml"
+        used.add(filename)
+        entries.append(BundleEntry(object_id=entity.pk, filename=filename))
+    return entries
+
+
+def record_bundle_export(
+    entity_type: str,
+    publisher,
+    entries: list[BundleEntry],
+    *,
+    user,
+    filename: str,
+) -> CrossrefExportBundle:
+    """
+    Record a bundle download as a single export-history entry.
+
+    Args:
+        entity_type: ExportType.ISSUE or ExportType.MONOGRAPH
+        publisher: Publisher owning the entities
+        entries: Files written to the archive (as passed to on_complete)
+        user: User downloading the archive
+        filename: Archive filename
+
+    Returns:
+        Created CrossrefExportBundle
+    """
+    from doi_portal.crossref.deposit_status import invalidate_deposit_summaries
+
+    with transaction.atomic():
+        bundle = CrossrefExportBundle.objects.create(
+            publisher=publisher,
+            export_type=entity_type,
+            filename=filename,
+            entity_count=len(entries),
+            exported_by=user,
+        )
+        CrossrefExportBundleItem.objects.bulk_create(
+            [
+                CrossrefExportBundleItem(
+                    bundle=bundle,
+                    entity_type=entity_type,
+                    object_id=entry.object_id,
+                    filename=entry.filename,
+                    xml_generated_at=entry.xml_generated_at,
+                    xsd_valid_at_export=entry.xsd_valid,
+                )
+                for entry in entries
+            ],
+        )
+        # bulk_create sends no signals; the workflow pages count bundle downloads
+        invalidate_deposit_summaries((entity_type, entry.object_id) for entry in entries)
+    return bundle
+
+
+def _iter_xml(entity_type: str, entries: list[BundleEntry]) -> Iterator[tuple[BundleEntry, str]]:
+    """
+    Yield (entry, XML) pairs, fetching a few documents per query.
+
+    Each entry is returned with the generation time and XSD outcome read in
+    the same query as its XML; entities whose XML is gone are skipped.
+    """
+    from doi_portal.crossref.deposit import get_entity_model
+
+    model = get_entity_model(entity_type)
+    for offset in range(0, len(entries), FETCH_SIZE):
+        batch = entries[offset:offset + FETCH_SIZE]
+        rows = model._base_manager.filter(pk__in=[entry.object_id for entry in batch]).values_list(
+            "pk",
+            "crossref_xml",
+            "xml_generated_at",
+            "xsd_valid",
+        )
+        documents = {pk: values for pk, *values in rows}
+        for entry in batch:
+            xml, generated_at, xsd_valid = documents.pop(entry.object_id, ("", None, None))
+            if xml:
+                yield dataclasses.replace(entry, xml_generated_at=generated_at, xsd_valid=xsd_valid), xml
+
+
+def stream_xml_bundle(
+    entity_type: str,
+    entries: Iterable[BundleEntry],
+    *,
+    on_complete: Callable[[list[BundleEntry]], object] | None = None,
+) -> Iterator[bytes]:
+    """
+    Stream a ZIP archive with the XML of the given entities.
+
+    Args:
+        entity_type: ExportType.ISSUE or ExportType.MONOGRAPH
+        entries: Files to include (see collect_bundle_entries)
+        on_complete: Called with the entries actually written once the last
+            byte of the archive has been consumed; not called if the
+            stream is abandoned
+
+    Yields:
+        Successive bytes of the archive
+    """
+    writer = _ZipChunkWriter()
+    date_time = timezone.localtime().timetuple()[:6]
+    written = []
+    with zipfile.ZipFile(writer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for entry, xml in _iter_xml(entity_type, list(entries)):
+            info = zipfile.ZipInfo(entry.filename, date_time=date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with archive.open(info, mode="w") as member:
+                for start in range(0, len(xml), ZIP_WRITE_CHUNK_SIZE):
+                    member.write(xml[start:start + ZIP_WRITE_CHUNK_SIZE].encode("utf-8"))
+                    chunk = writer.take()
+                    if chunk:
+                        yield chunk
+            written.append(entry)
+            yield writer.take()
+    yield writer.take()
+    if on_complete is not None and written:
+        on_complete(written)
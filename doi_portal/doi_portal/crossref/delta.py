@@ -0,0 +1,231 @@
+"""
+Delta Crossref exports: only records changed since the last export.
+
+A routine correction of one article should not re-send the whole issue.
+In delta mode the issue (or monograph) XML is regenerated, every
+journal_article, conference_paper and content_item record is fingerprinted
+(SHA-256 of its canonical XML, keyed by DOI) and compared with the
+fingerprints of the previous export snapshot; unchanged records are
+dropped from the doi_batch while the container metadata (journal,
+conference, book_metadata) is kept as Crossref requires it. The container
+itself is fingerprinted too (CONTAINER_KEY), so a change of issue or
+monograph metadata alone still yields a delta carrying the container.
+
+Since a delta snapshot only contains the records it changed, the
+previous state of a DOI is taken from the newest export containing it,
+walking back through delta exports to the last full one. Fingerprints of
+a snapshot are cached under its content-addressed blob hash.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+from dataclasses import dataclass
+from dataclasses import field
+
+from django.conf import settings
+from django.core.cache import cache
+from lxml import etree
+
+from doi_portal.crossref.models import CrossrefExport
+from doi_portal.crossref.models import ExportType
+
+__all__ = [
+    "DeltaXML",
+    "build_delta_xml",
+    "generate_delta_xml",
+    "previous_fingerprints",
+    "record_fingerprints",
+]
+
+# Crossref records that carry their own DOI and can be deposited on their own
+RECORD_TAGS = ("{*}journal_article", "{*}conference_paper", "{*}content_item")
+
+FINGERPRINT_CACHE_PREFIX = "crossref:record-fingerprints:v2"
+
+# Fingerprint key of the container metadata (everything in body but the records)
+CONTAINER_KEY = "#container"
+
+# CrossrefExport foreign key per supported entity type
+_EXPORT_FIELDS = {
+    ExportType.ISSUE: "issue",
+    ExportType.MONOGRAPH: "monograph",
+}
+
+
+@dataclass
+class DeltaXML:
+    """
+    Result of a delta generation.
+
+    Attributes:
+        xml: doi_batch with only new or modified records
+        changed_dois: DOIs of the records kept in xml
+        unchanged_count: Number of records dropped as unchanged
+        container_changed: Container metadata differs from the previous export
+        base_export: Newest export the delta was computed against (None: full export)
+    """
+
+    xml: str
+    changed_dois: list[str] = field(default_factory=list)
+    unchanged_count: int = 0
+    container_changed: bool = False
+    base_export: CrossrefExport | None = None
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether any record or the container metadata is new or modified."""
+        return bool(self.changed_dois) or self.container_changed
+
+
+def _record_doi(record) -> str:
+    """Return the DOI of a record element ('' if missing)."""
+    return (record.findtext("{*}doi_data/{*}doi") or "").strip()
+
+
+def _fingerprint(record) -> str:
+    """SHA-256 of the record's canonical XML, insensitive to indentation."""
+    # C14N 2.0 needs the namespace declarations in scope, so detach a copy
+    return hashlib.sha256(
+        etree.tostring(copy.deepcopy(record), method="c14n2", strip_text=True),
+    ).hexdigest()
+
+
+def _container_fingerprint(root) -> str:
+    """Fingerprint of the body without its records ('' if there is no body)."""
+    body = root.find("{*}body")
+    if body is None:
+        return ""
+    container = copy.deepcopy(body)
+    for record in list(container.iter(*RECORD_TAGS)):
+        record.getparent().remove(record)
+    return _fingerprint(container)
+
+
+def record_fingerprints(xml: str) -> dict[str, str]:
+    """
+    Fingerprint every DOI-bearing record of a doi_batch and its container.
+
+    Args:
+        xml: Crossref doi_batch XML
+
+    Returns:
+        Dict mapping DOI to record fingerprint, plus CONTAINER_KEY
+    """
+    root = etree.fromstring(xml.encode("utf-8"))
+    fingerprints = {
+        doi: _fingerprint(record)
+        for record in root.iter(*RECORD_TAGS)
+        if (doi := _record_doi(record))
+    }
+    fingerprints[CONTAINER_KEY] = _container_fingerprint(root)
+    return fingerprints
+
+
+def _snapshot_fingerprints(export: CrossrefExport) -> dict[str, str]:
+    """Record fingerprints of an export snapshot, cached per blob hash."""
+    key = f"{FINGERPRINT_CACHE_PREFIX}:{export.xml_blob_id}"
+    fingerprints = cache.get(key)
+    if fingerprints is None:
+        fingerprints = record_fingerprints(export.xml_content) if export.xml_content else {}
+        timeout = getattr(settings, "CROSSREF_FRAGMENT_CACHE_TIMEOUT", 7 * 24 * 60 * 60)
+        cache.set(key, fingerprints, timeout)
+    return fingerprints
+
+
+def previous_fingerprints(entity_type: str, entity) -> tuple[dict[str, str], CrossrefExport | None]:
+    """
+    Collect the last exported fingerprint of every record of an entity.
+
+    Exports that failed XSD validation are ignored. Delta exports are
+    merged newest first until the last full export.
+
+    Args:
+        entity_type: ExportType.ISSUE or ExportType.MONOGRAPH
+        entity: Issue or Monograph
+
+    Returns:
+        Tuple of (DOI -> fingerprint, newest export or None)
+
+    Raises:
+        ValueError: If entity_type does not support delta exports
+    """
+    if entity_type not in _EXPORT_FIELDS:
+        msg = f"Delta eksport nije podržan za tip: {entity_type}"
+        raise ValueError(msg)
+
+    exports = (
+        CrossrefExport.objects.filter(**{_EXPORT_FIELDS[entity_type]: entity})
+        .exclude(xsd_valid_at_export=False)
+        .select_related("xml_blob")
+        .order_by("-exported_at", "-pk")
+    )
+    fingerprints: dict[str, str] = {}
+    newest = None
+    for export in exports.iterator(chunk_size=10):
+        newest = newest or export
+        for doi, fingerprint in _snapshot_fingerprints(export).items():
+            fingerprints.setdefault(doi, fingerprint)
+        if not export.is_delta:
+            break
+    return fingerprints, newest
+
+
+def build_delta_xml(xml: str, previous: dict[str, str]) -> DeltaXML:
+    """
+    Drop records whose fingerprint matches the previous export.
+
+    The container is always kept; container_changed tells whether its
+    metadata differs from the previous export.
+
+    Args:
+        xml: Full doi_batch XML
+        previous: DOI (or CONTAINER_KEY) -> fingerprint of the previous export
+
+    Returns:
+        DeltaXML (base_export is left unset)
+    """
+    root = etree.fromstring(xml.encode("utf-8"))
+    delta = DeltaXML(xml="")
+    delta.container_changed = previous.get(CONTAINER_KEY) != _container_fingerprint(root)
+    for record in list(root.iter(*RECORD_TAGS)):
+        doi = _record_doi(record)
+        if doi and previous.get(doi) == _fingerprint(record):
+            record.getparent().remove(record)
+            delta.unchanged_count += 1
+        else:
+            delta.changed_dois.append(doi)
+    delta.xml = etree.tostring(root, xml_declaration=True, encoding="UTF-8").decode("utf-8")
+    return delta
+
+
+def generate_delta_xml(entity_type: str, entity) -> DeltaXML:
+    """
+    Regenerate an issue or monograph and keep only changed records.
+
+    Without a previous export every record counts as new and the full
+    document is returned.
+
+    Args:
+        entity_type: ExportType.ISSUE or ExportType.MONOGRAPH
+        entity: Issue or Monograph
+
+    Returns:
+        DeltaXML with a fresh doi_batch_id and timestamp
+
+    Raises:
+        ValueError: If entity_type does not support delta exports
+    """
+    from doi_portal.crossref.services import CrossrefService
+
+    previous, base_export = previous_fingerprints(entity_type, entity)
+    service = CrossrefService()
+    if entity_type == ExportType.ISSUE:
+        xml = service.generate_xml(entity)
+    else:
+        xml = service.generate_monograph_xml(entity)
+
+    delta = build_delta_xml(xml, previous)
+    delta.base_export = base_export
+    return delta
@@ -0,0 +1,595 @@
+"""
+Live Crossref deposits.
+
+Submits generated doi_batch XML to the Crossref deposit servlet with the
+publisher's own Crossref credentials and polls the submission log until
+Crossref has processed the batch. All requests go through one pooled
+keep-alive ``requests.Session`` per process.
+
+Entities can also be queued and packed into shared batches; see
+doi_portal.crossref.deposit_queue.
+
+Flow: start_deposit() snapshots the XML into a CrossrefDeposit row and
+queues crossref_deposit_submit_task, which calls submit_deposit() and
+schedules crossref_deposit_poll_task. The poll task calls poll_deposit()
+and reschedules itself with exponential backoff (poll_delay()) until the
+deposit is COMPLETED or FAILED.
+
+CROSSREF_DEPOSIT_BASE_URL selects the endpoint (test.crossref.org by
+default, doi.crossref.org in production, or a local stand-in server).
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from lxml import etree
+
+from doi_portal.articles.models import RecordDepositStatus
+from doi_portal.crossref.models import CrossrefDeposit
+from doi_portal.crossref.models import CrossrefDepositItem
+from doi_portal.crossref.models import DepositStatus
+from doi_portal.crossref.models import ExportType
+from doi_portal.crossref.submission_log import apply_submission_log
+from doi_portal.crossref.submission_log import iter_record_diagnostics
+
+if TYPE_CHECKING:
+    import requests
+
+    from doi_portal.publishers.models import Publisher
+    from doi_portal.users.models import User
+
+__all__ = [
+    "CrossrefDepositClient",
+    "CrossrefDepositError",
+    "SubmissionStatus",
+    "ensure_ready_for_deposit",
+    "fail_deposit",
+    "get_deposit_session",
+    "get_entity_model",
+    "get_entity_publisher",
+    "parse_submission_status",
+    "poll_delay",
+    "poll_deposit",
+    "start_deposit",
+    "submit_deposit",
+]
+
+DEFAULT_BASE_URL = "https://test.crossref.org"
+DEPOSIT_PATH = "/servlet/deposit"
+SUBMISSION_LOG_PATH = "/servlet/submissionDownload"
+
+# doi_batch_diagnostic/@status values meaning Crossref has not finished yet
+PENDING_SUBMISSION_STATES = frozenset({"queued", "in_process", "unknown_submission"})
+
+_DOI_BATCH_ID_RE = re.compile(r"<doi_batch_id>([^<]+)</doi_batch_id>")
+_TIMESTAMP_RE = re.compile(r"<timestamp>[^<]*</timestamp>")
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+class CrossrefDepositError(Exception):
+    """Raised when a deposit cannot be submitted or its status cannot be read."""
+
+
+@dataclass
+class SubmissionStatus:
+    """
+    Parsed Crossref submission log (doi_batch_diagnostic).
+
+    Attributes:
+        status: doi_batch_diagnostic/@status (queued, in_process, completed, ...)
+        record_count: Records in the batch
+        success_count: Records registered successfully
+        warning_count: Records registered with warnings
+        failure_count: Records rejected by Crossref
+        failures: Failure message per rejected DOI (record_diagnostic)
+    """
+
+    status: str
+    record_count: int = 0
+    success_count: int = 0
+    warning_count: int = 0
+    failure_count: int = 0
+    failures: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_pending(self) -> bool:
+        """True while Crossref has not finished processing the batch."""
+        return self.status in PENDING_SUBMISSION_STATES
+
+
+def get_deposit_session() -> requests.Session:
+    """
+    Return the process-wide pooled HTTP session for Crossref requests.
+
+    The session keeps connections to the deposit host alive between
+    submissions and status polls. Idempotent GETs are retried on
+    connection errors and 5xx gateway responses; POSTs are not, so a
+    batch is never uploaded twice by the transport layer.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _session  # noqa: PLW0603
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                pool_size = getattr(settings, "CROSSREF_DEPOSIT_POOL_SIZE", 10)
+                adapter = HTTPAdapter(
+                    pool_connections=pool_size,
+                    pool_maxsize=pool_size,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.5,
+                        status_forcelist=(502, 503, 504),
+                        allowed_methods=frozenset({"GET"}),
+                    ),
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers["User-Agent"] = "doi-portal-crossref-deposit"
+                _session = session
+    return _session
+
+
+def _transport_error(prefix: str, exc: Exception) -> CrossrefDepositError:
+    """
+    Build a CrossrefDepositError without echoing the request URL.
+
+    requests includes the full URL in its messages, and status polls
+    carry the Crossref password as a query parameter.
+    """
+    response = getattr(exc, "response", None)
+    detail = f"HTTP {response.status_code}" if response is not None else type(exc).__name__
+    return CrossrefDepositError(f"{prefix}: {detail}")
+
+
+class CrossrefDepositClient:
+    """
+    Thin client for the Crossref deposit and submission-log servlets.
+
+    Args:
+        username: Crossref login (Publisher.crossref_username)
+        password: Crossref password (Publisher.crossref_password)
+        base_url: Endpoint base URL (default: CROSSREF_DEPOSIT_BASE_URL)
+        session: HTTP session (default: get_deposit_session())
+    """
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        *,
+        base_url: str | None = None,
+        session: requests.Session | None = None,
+    ) -> None:
+        self.username = username
+        self.password = password
+        self.base_url = (
+            base_url or getattr(settings, "CROSSREF_DEPOSIT_BASE_URL", DEFAULT_BASE_URL)
+        ).rstrip("/")
+        self.session = session or get_deposit_session()
+        self.timeout = getattr(settings, "CROSSREF_DEPOSIT_TIMEOUT", 30)
+
+    @classmethod
+    def for_publisher(cls, publisher: Publisher) -> CrossrefDepositClient:
+        """
+        Build a client from a publisher's Crossref credentials.
+
+        Args:
+            publisher: Publisher with crossref_username/crossref_password
+
+        Returns:
+            Configured client
+
+        Raises:
+            CrossrefDepositError: If the publisher has no Crossref credentials
+        """
+        if not publisher.crossref_username or not publisher.crossref_password:
+            msg = f"Izdavač '{publisher}' nema podešene Crossref kredencijale."
+            raise CrossrefDepositError(msg)
+        return cls(publisher.crossref_username, publisher.crossref_password)
+
+    def submit(self, xml: str, filename: str) -> str:
+        """
+        Upload a doi_batch file (operation doMDUpload).
+
+        Args:
+            xml: doi_batch XML
+            filename: File name reported to Crossref
+
+        Returns:
+            Response body of the deposit servlet
+
+        Raises:
+            CrossrefDepositError: On transport errors or a non-2xx response
+        """
+        import requests
+
+        try:
+            response = self.session.post(
+                f"{self.base_url}{DEPOSIT_PATH}",
+                data={
+                    "operation": "doMDUpload",
+                    "login_id": self.username,
+                    "login_passwd": self.password,
+                },
+                files={"fname": (filename, xml.encode("utf-8"), "application/xml")},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise _transport_error("Slanje depozita nije uspelo", e) from e
+        return response.text
+
+    def fetch_submission_log(self, batch_id: str) -> str:
+        """
+        Download the submission log for a doi_batch_id.
+
+        Args:
+            batch_id: doi_batch_id of the submitted batch
+
+        Returns:
+            doi_batch_diagnostic XML
+
+        Raises:
+            CrossrefDepositError: On transport errors or a non-2xx response
+        """
+        import requests
+
+        try:
+            response = self.session.get(
+                f"{self.base_url}{SUBMISSION_LOG_PATH}",
+                params={
+                    "usr": self.username,
+                    "pwd": self.password,
+                    "doi_batch_id": batch_id,
+                    "type": "result",
+                },
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise _transport_error("Provera statusa depozita nije uspela", e) from e
+        return response.text
+
+
+def parse_submission_status(log_xml: str) -> SubmissionStatus:
+    """
+    Parse the batch-level counts of a Crossref submission log.
+
+    Args:
+        log_xml: doi_batch_diagnostic XML
+
+    Returns:
+        SubmissionStatus
+
+    Raises:
+        CrossrefDepositError: If the log is not a doi_batch_diagnostic document
+    """
+    try:
+        root = etree.fromstring(log_xml.encode("utf-8"))
+    except etree.XMLSyntaxError as e:
+        msg = f"Neispravan odgovor Crossref-a: {e}"
+        raise CrossrefDepositError(msg) from e
+    if etree.QName(root).localname != "doi_batch_diagnostic":
+        msg = f"Neočekivan odgovor Crossref-a: <{etree.QName(root).localname}>"
+        raise CrossrefDepositError(msg)
+
+    def count(name: str) -> int:
+        value = root.findtext(f"batch_data/{name}")
+        return int(value) if value and value.strip().isdigit() else 0
+
+    return SubmissionStatus(
+        status=root.get("status", "unknown_submission"),
+        record_count=count("record_count"),
+        success_count=count("success_count"),
+        warning_count=count("warning_count"),
+        failure_count=count("failure_count"),
+        failures={
+            record.doi: record.message
+            for record in iter_record_diagnostics(log_xml)
+            if record.status == RecordDepositStatus.FAILURE
+        },
+    )
+
+
+def poll_delay(attempt: int) -> int:
+    """
+    Seconds to wait before the given status poll (exponential backoff).
+
+    Args:
+        attempt: Number of polls already made
+
+    Returns:
+        Delay in seconds, capped at CROSSREF_DEPOSIT_POLL_MAX_DELAY
+    """
+    initial = getattr(settings, "CROSSREF_DEPOSIT_POLL_INITIAL_DELAY", 60)
+    maximum = getattr(settings, "CROSSREF_DEPOSIT_POLL_MAX_DELAY", 3600)
+    return min(initial * 2**attempt, maximum)
+
+
+def get_entity_model(entity_type: str):
+    """Return the model class for an ExportType value."""
+    from doi_portal.components.models import ComponentGroup
+    from doi_portal.issues.models import Issue
+    from doi_portal.monographs.models import Monograph
+
+    return {
+        ExportType.ISSUE: Issue,
+        ExportType.COMPONENT_GROUP: ComponentGroup,
+        ExportType.MONOGRAPH: Monograph,
+    }[entity_type]
+
+
+def get_entity_publisher(entity_type: str, entity) -> Publisher:
+    """Return the publisher owning an issue, component group or monograph."""
+    if entity_type == ExportType.ISSUE:
+        return entity.publication.publisher
+    return entity.publisher
+
+
+_RECORDS_RELATION = {
+    ExportType.ISSUE: "articles",
+    ExportType.COMPONENT_GROUP: "components",
+    ExportType.MONOGRAPH: "chapters",
+}
+
+
+def last_modified_at(entity_type: str, entity):
+    """
+    Return the latest modification time of an entity and its records.
+
+    Soft-deleted records count by their ``deleted_at``, since soft delete
+    does not touch ``updated_at`` but still changes the deposited XML.
+
+    Args:
+        entity_type: ExportType value of the entity
+        entity: Issue, ComponentGroup or Monograph
+
+    Returns:
+        Latest ``updated_at``/``deleted_at`` of the entity or its records
+    """
+    from django.db.models import Max
+
+    records = getattr(entity, _RECORDS_RELATION[entity_type])(manager="all_objects")
+    stamps = records.aggregate(updated=Max("updated_at"), deleted=Max("deleted_at"))
+    return max(stamp for stamp in (entity.updated_at, *stamps.values()) if stamp is not None)
+
+
+def ensure_ready_for_deposit(entity_type: str, entity) -> None:
+    """
+    Check that an entity's XML may be sent to Crossref.
+
+    The XML must be generated and XSD-valid, it must not be older than the
+    last change of the entity or its records, and pre-validation must pass.
+    Pre-validation runs fresh instead of reading the cached deposit summary,
+    because a deposit cannot be undone.
+
+    Args:
+        entity_type: ExportType value of the entity
+        entity: Issue, ComponentGroup or Monograph
+
+    Raises:
+        CrossrefDepositError: If any of the checks fails
+    """
+    from doi_portal.crossref.deposit_status import run_pre_validation
+
+    if not entity.crossref_xml:
+        msg = "XML nije generisan."
+        raise CrossrefDepositError(msg)
+    if entity.xsd_valid is not True:
+        msg = "XML nije prošao XSD validaciju."
+        raise CrossrefDepositError(msg)
+    if entity.xml_generated_at is None or entity.xml_generated_at < last_modified_at(entity_type, entity):
+        msg = "XML je zastareo - podaci su izmenjeni posle generisanja. Generišite XML ponovo."
+        raise CrossrefDepositError(msg)
+    validation = run_pre_validation(entity_type, entity)
+    if not validation.is_valid:
+        msg = f"Pre-validacija nije prošla (grešaka: {len(validation.errors)})."
+        raise CrossrefDepositError(msg)
+
+
+def _with_fresh_head(xml: str, batch_id: str) -> str:
+    """Replace the doi_batch_id and timestamp in the head of a doi_batch document."""
+    xml = _DOI_BATCH_ID_RE.sub(f"<doi_batch_id>{batch_id}</doi_batch_id>", xml, count=1)
+    timestamp = timezone.now().strftime("%Y%m%d%H%M%S")
+    return _TIMESTAMP_RE.sub(f"<timestamp>{timestamp}</timestamp>", xml, count=1)
+
+
+def start_deposit(entity_type: str, entity, user: User | None = None) -> CrossrefDeposit:
+    """
+    Snapshot an entity's generated XML and queue it for submission.
+
+    Every submission gets a fresh doi_batch_id and timestamp, since
+    Crossref rejects a resubmission whose timestamp is not newer than the
+    one it already processed.
+
+    Args:
+        entity_type: ExportType value of the entity
+        entity: Issue, ComponentGroup or Monograph with generated crossref_xml
+        user: User who requested the deposit
+
+    Returns:
+        The created CrossrefDeposit (PENDING)
+
+    Raises:
+        CrossrefDepositError: If the XML is missing, not XSD-valid or fails
+            pre-validation, or the publisher has no credentials
+    """
+    from doi_portal.crossref.blobs import store_xml_blob
+    from doi_portal.crossref.services import CrossrefService
+    from doi_portal.crossref.tasks import crossref_deposit_submit_task
+
+    publisher = get_entity_publisher(entity_type, entity)
+    CrossrefDepositClient.for_publisher(publisher)  # Fail fast without credentials
+    ensure_ready_for_deposit(entity_type, entity)
+
+    if _DOI_BATCH_ID_RE.search(entity.crossref_xml) is None:
+        msg = "XML ne sadrži doi_batch_id."
+        raise CrossrefDepositError(msg)
+    batch_id = CrossrefService().generate_doi_batch_id()
+    xml = _with_fresh_head(entity.crossref_xml, batch_id)
+
+    deposit = CrossrefDeposit.objects.create(
+        publisher=publisher,
+        entity_type=entity_type,
+        object_id=entity.pk,
+        xml_blob=store_xml_blob(xml),
+        batch_id=batch_id,
+        filename=f"{batch_id}.xml",
+        submitted_by=user,
+    )
+    transaction.on_commit(lambda: crossref_deposit_submit_task.delay(deposit.pk))
+    return deposit
+
+
+def submit_deposit(deposit: CrossrefDeposit) -> CrossrefDeposit:
+    """
+    Upload a pending deposit to Crossref.
+
+    Args:
+        deposit: PENDING deposit
+
+    Returns:
+        The deposit, now SUBMITTED
+
+    Raises:
+        CrossrefDepositError: If the upload fails
+    """
+    client = CrossrefDepositClient.for_publisher(deposit.publisher)
+    deposit.response_log = client.submit(deposit.xml_blob.get_xml(), deposit.filename)
+    deposit.status = DepositStatus.SUBMITTED
+    deposit.submitted_at = timezone.now()
+    deposit.save(update_fields=["response_log", "status", "submitted_at"])
+    return deposit
+
+
+def poll_deposit(deposit: CrossrefDeposit) -> bool:
+    """
+    Check a submitted deposit once and record the outcome.
+
+    A batch with no failed records marks the entity as deposited
+    (crossref_deposited_at/by); any failed record fails the deposit.
+    For packed deposits the per-DOI results are recorded on each
+    CrossrefDepositItem and only entities without failed DOIs are marked.
+    Per-DOI outcomes are also stored on the matching articles, chapters
+    and components (see doi_portal.crossref.submission_log).
+
+    Args:
+        deposit: SUBMITTED deposit
+
+    Returns:
+        True if the deposit is finished (COMPLETED or FAILED)
+
+    Raises:
+        CrossrefDepositError: If the submission log cannot be fetched or parsed
+    """
+    client = CrossrefDepositClient.for_publisher(deposit.publisher)
+    log_xml = client.fetch_submission_log(deposit.batch_id)
+    result = parse_submission_status(log_xml)
+
+    deposit.poll_attempts += 1
+    deposit.response_log = log_xml
+    update_fields = ["poll_attempts", "response_log"]
+    if result.is_pending:
+        deposit.save(update_fields=update_fields)
+        return False
+
+    deposit.record_count = result.record_count
+    deposit.success_count = result.success_count
+    deposit.warning_count = result.warning_count
+    deposit.failure_count = result.failure_count
+    deposit.status = DepositStatus.FAILED if result.failure_count else DepositStatus.COMPLETED
+    deposit.completed_at = timezone.now()
+    update_fields += [
+        "record_count",
+        "success_count",
+        "warning_count",
+        "failure_count",
+        "status",
+        "completed_at",
+    ]
+    with transaction.atomic():
+        deposit.save(update_fields=update_fields)
+        apply_submission_log(log_xml, checked_at=deposit.completed_at)
+        if deposit.entity_type:
+            if deposit.status == DepositStatus.COMPLETED:
+                get_entity_model(deposit.entity_type).objects.filter(pk=deposit.object_id).update(
+                    crossref_deposited_at=deposit.completed_at,
+                    crossref_deposited_by=deposit.submitted_by,
+                )
+        else:
+            _record_item_results(deposit, result)
+    return True
+
+
+def _record_item_results(deposit: CrossrefDeposit, result: SubmissionStatus) -> None:
+    """
+    Map per-DOI results of a packed deposit back to its queued items.
+
+    An item fails if any of its DOIs was rejected; entities of the other
+    items are marked deposited, one UPDATE per entity type.
+    """
+    items = list(deposit.items.all())
+    deposited: dict[str, list] = {}
+    for item in items:
+        messages = [f"{doi}: {result.failures[doi]}" for doi in item.dois if doi in result.failures]
+        item.status = DepositStatus.FAILED if messages else DepositStatus.COMPLETED
+        item.message = "\n".join(messages)
+        item.finished_at = deposit.completed_at
+        if not messages:
+            deposited.setdefault(item.entity_type, []).append(item)
+    CrossrefDepositItem.objects.bulk_update(
+        items, ["status", "message", "finished_at"]
+    )
+    for entity_type, done in deposited.items():
+        model = get_entity_model(entity_type)
+        for user_id in {item.queued_by_id for item in done}:
+            model.objects.filter(
+                pk__in=[item.object_id for item in done if item.queued_by_id == user_id],
+            ).update(
+                crossref_deposited_at=deposit.completed_at,
+                crossref_deposited_by_id=user_id,
+            )
+
+
+def fail_deposit(deposit: CrossrefDeposit, message: str) -> CrossrefDeposit:
+    """
+    Mark a deposit FAILED with an explanatory message.
+
+    Queued items packed into the deposit fail with it.
+
+    Args:
+        deposit: Deposit to fail
+        message: Reason (Serbian), stored in response_log
+
+    Returns:
+        The failed deposit
+    """
+    deposit.status = DepositStatus.FAILED
+    deposit.response_log = message
+    deposit.completed_at = timezone.now()
+    with transaction.atomic():
+        deposit.save(update_fields=["status", "response_log", "completed_at"])
+        deposit.items.update(
+            status=DepositStatus.FAILED,
+            message=message,
+            finished_at=deposit.completed_at,
+        )
+    return deposit
@@ -0,0 +1,264 @@
+"""
+Crossref deposit queue.
+
+Instead of depositing every small component group or monograph update as
+its own file, editors can queue entities. The queue is flushed
+periodically (crossref_flush_deposit_queue_task): pending items are
+grouped per publisher and doi_batch content type (Crossref does not allow
+mixing journal, book, sa_component ... records in one submission), packed
+in queue order into doi_batch documents of at most
+CROSSREF_DEPOSIT_BATCH_MAX_BYTES, and each batch is submitted as one
+CrossrefDeposit under a fresh doi_batch_id.
+
+A group is flushed once it fills a batch (only full batches are sent) or
+once its oldest item has waited CROSSREF_DEPOSIT_BATCH_MAX_AGE seconds
+(everything is sent). Per-DOI results are mapped back to the items by
+doi_portal.crossref.deposit.poll_deposit().
+"""
+
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from lxml import etree
+
+from doi_portal.crossref.deposit import CrossrefDepositClient
+from doi_portal.crossref.deposit import CrossrefDepositError
+from doi_portal.crossref.deposit import ensure_ready_for_deposit
+from doi_portal.crossref.deposit import get_entity_model
+from doi_portal.crossref.deposit import get_entity_publisher
+from doi_portal.crossref.models import CrossrefDeposit
+from doi_portal.crossref.models import CrossrefDepositItem
+from doi_portal.crossref.models import DepositStatus
+
+if TYPE_CHECKING:
+    from doi_portal.users.models import User
+
+__all__ = [
+    "enqueue_deposit",
+    "flush_deposit_queue",
+    "pack_batches",
+]
+
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_MAX_AGE = 15 * 60
+
+_BODY_CONTENT_RE = re.compile(r"<body>\s*<([A-Za-z_][\w.-]*)")
+
+
+def enqueue_deposit(entity_type: str, entity, user: User | None = None) -> CrossrefDepositItem:
+    """
+    Queue an entity for the next combined deposit of its publisher.
+
+    Queuing an entity that is already pending returns the existing item;
+    the XML is read when the queue is flushed, so later regenerations are
+    picked up.
+
+    Args:
+        entity_type: ExportType value of the entity
+        entity: Issue, ComponentGroup or Monograph with generated crossref_xml
+        user: User who queued the entity
+
+    Returns:
+        Pending CrossrefDepositItem
+
+    Raises:
+        CrossrefDepositError: If the XML is missing, not XSD-valid or fails
+            pre-validation, or the publisher has no credentials
+    """
+    publisher = get_entity_publisher(entity_type, entity)
+    CrossrefDepositClient.for_publisher(publisher)  # Fail fast without credentials
+    ensure_ready_for_deposit(entity_type, entity)
+
+    match = _BODY_CONTENT_RE.search(entity.crossref_xml or "")
+    if match is None:
+        msg = "XML nije generisan."
+        raise CrossrefDepositError(msg)
+
+    item, _ = CrossrefDepositItem.objects.get_or_create(
+        entity_type=entity_type,
+        object_id=entity.pk,
+        deposit__isnull=True,
+        defaults={
+            "publisher": publisher,
+            "content_type": match.group(1),
+            "queued_by": user,
+        },
+    )
+    return item
+
+
+def pack_batches(sized_items: list[tuple[object, int]], max_bytes: int) -> list[tuple[list, int]]:
+    """
+    Pack items in order into batches of at most max_bytes.
+
+    An item larger than max_bytes gets a batch of its own.
+
+    Args:
+        sized_items: (item, size in bytes) pairs in queue order
+        max_bytes: Size cap per batch
+
+    Returns:
+        List of (items, total size) batches
+    """
+    batches: list[tuple[list, int]] = []
+    current: list = []
+    current_size = 0
+    for item, size in sized_items:
+        if current and current_size + size > max_bytes:
+            batches.append((current, current_size))
+            current, current_size = [], 0
+        current.append(item)
+        current_size += size
+    if current:
+        batches.append((current, current_size))
+    return batches
+
+
+def flush_deposit_queue(*, force: bool = False) -> list[CrossrefDeposit]:
+    """
+    Pack pending queue items into combined deposits and submit them.
+
+    Runs in one transaction holding row locks on the pending items it
+    packs; items locked by a concurrent flush are left to that flush.
+
+    Args:
+        force: Send all pending items regardless of size and age thresholds
+
+    Returns:
+        Created CrossrefDeposit instances
+    """
+    max_bytes = getattr(settings, "CROSSREF_DEPOSIT_BATCH_MAX_BYTES", DEFAULT_MAX_BYTES)
+    max_age = getattr(settings, "CROSSREF_DEPOSIT_BATCH_MAX_AGE", DEFAULT_MAX_AGE)
+    cutoff = timezone.now() - timedelta(seconds=max_age)
+
+    deposits = []
+    with transaction.atomic():
+        groups: dict[tuple[int, str], list[CrossrefDepositItem]] = defaultdict(list)
+        for item in _lock_pending_items():
+            groups[(item.publisher_id, item.content_type)].append(item)
+
+        for items in groups.values():
+            expired = force or items[0].queued_at <= cutoff
+            deposits.extend(_flush_group(items, max_bytes=max_bytes, expired=expired))
+    return deposits
+
+
+def _lock_pending_items():
+    """
+    Pending queue items, row-locked until the surrounding transaction ends.
+
+    Rows locked by an overlapping flush are skipped, so two flushes (e.g.
+    the periodic task and a forced manual flush) never pack the same item
+    into two deposits.
+    """
+    return (
+        CrossrefDepositItem.objects.filter(deposit__isnull=True, status=DepositStatus.PENDING)
+        .select_related("publisher")
+        .select_for_update(skip_locked=True, of=("self",))
+        .order_by("queued_at", "pk")
+    )
+
+
+def _load_xml(items: list[CrossrefDepositItem]) -> dict[int, str]:
+    """Return current crossref_xml per item pk, one query per entity type."""
+    ids_by_type: dict[str, list[int]] = defaultdict(list)
+    for item in items:
+        ids_by_type[item.entity_type].append(item.object_id)
+
+    xml_by_entity = {}
+    for entity_type, ids in ids_by_type.items():
+        rows = get_entity_model(entity_type).objects.filter(pk__in=ids).values_list("pk", "crossref_xml")
+        xml_by_entity.update({(entity_type, pk): xml for pk, xml in rows})
+    return {item.pk: xml_by_entity.get((item.entity_type, item.object_id)) or "" for item in items}
+
+
+def _flush_group(
+    items: list[CrossrefDepositItem],
+    *,
+    max_bytes: int,
+    expired: bool,
+) -> list[CrossrefDeposit]:
+    """Pack one publisher/content-type group and create deposits for its batches."""
+    xml_by_item = _load_xml(items)
+    missing = [item for item in items if not xml_by_item[item.pk]]
+    if missing:
+        now = timezone.now()
+        for item in missing:
+            item.status = DepositStatus.FAILED
+            item.message = "XML nije generisan."
+            item.finished_at = now
+        CrossrefDepositItem.objects.bulk_update(missing, ["status", "message", "finished_at"])
+
+    batches = pack_batches(
+        [(item, len(xml_by_item[item.pk].encode("utf-8"))) for item in items if xml_by_item[item.pk]],
+        max_bytes,
+    )
+    if not expired and batches and batches[-1][1] < max_bytes:
+        batches.pop()  # Last batch still has room; wait for more items or the age limit
+    deposits = [_create_packed_deposit(batch, xml_by_item) for batch, _ in batches]
+    return [deposit for deposit in deposits if deposit is not None]
+
+
+def _create_packed_deposit(
+    items: list[CrossrefDepositItem],
+    xml_by_item: dict[int, str],
+) -> CrossrefDeposit | None:
+    """
+    Merge the bodies of several doi_batch documents into one deposit.
+
+    The merged document is validated against the XSD before it is stored;
+    if it fails, its items are marked failed and no deposit is created.
+    """
+    from doi_portal.crossref.blobs import store_xml_blob
+    from doi_portal.crossref.services import CrossrefService
+    from doi_portal.crossref.tasks import crossref_deposit_submit_task
+    from doi_portal.crossref.validators import validate_xml_tree
+
+    trees = [etree.fromstring(xml_by_item[item.pk].encode("utf-8")) for item in items]
+    bodies = [tree.find("{*}body") for tree in trees]
+    for item, body in zip(items, bodies, strict=True):
+        item.dois = [doi.text.strip() for doi in body.iterfind(".//{*}doi_data/{*}doi") if doi.text]
+
+    # The first document provides head (depositor, registrant) and body element
+    root, body = trees[0], bodies[0]
+    for other in bodies[1:]:
+        body.extend(list(other))
+    batch_id = CrossrefService().generate_doi_batch_id()
+    head = root.find("{*}head")
+    head.find("{*}doi_batch_id").text = batch_id
+    timestamp = head.find("{*}timestamp")
+    if timestamp is not None:
+        timestamp.text = timezone.now().strftime("%Y%m%d%H%M%S")
+
+    validation = validate_xml_tree(root)
+    if not validation.is_valid:
+        reason = validation.errors[0].message if validation.errors else ""
+        now = timezone.now()
+        for item in items:
+            item.status = DepositStatus.FAILED
+            item.message = f"Spojeni XML nije prošao XSD validaciju: {reason}"
+            item.finished_at = now
+        CrossrefDepositItem.objects.bulk_update(items, ["dois", "status", "message", "finished_at"])
+        return None
+    xml = etree.tostring(root, xml_declaration=True, encoding="UTF-8").decode("utf-8")
+
+    with transaction.atomic():
+        deposit = CrossrefDeposit.objects.create(
+            publisher=items[0].publisher,
+            xml_blob=store_xml_blob(xml),
+            batch_id=batch_id,
+            filename=f"{batch_id}.xml",
+        )
+        for item in items:
+            item.deposit = deposit
+            item.status = DepositStatus.SUBMITTED
+        CrossrefDepositItem.objects.bulk_update(items, ["deposit", "dois", "status"])
+        transaction.on_commit(lambda: crossref_deposit_submit_task.delay(deposit.pk))
+    return deposit
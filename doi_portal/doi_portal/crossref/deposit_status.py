@@ -0,0 +1,261 @@
+"""
+Cached deposit-workflow status per entity.
+
+The deposit workflow pages only need a handful of facts about an issue,
+component group or monograph: whether pre-validation passes, which XML
+is generated and whether it passed XSD validation, the last export and
+the state of live deposits. These are computed once into a
+DepositSummary and kept in the cache, so rendering a workflow page does
+not re-run pre-validation or query the export history.
+
+Signal handlers (doi_portal.crossref.signals) drop a summary when the
+entity, its records or their children, its publication or publisher,
+its exports or its deposits change; a change of depositor settings
+invalidates all summaries. DOI
+collisions with records of other entities are only picked up when the
+summary expires (CROSSREF_DEPOSIT_STATUS_CACHE_TIMEOUT).
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from doi_portal.crossref.models import CrossrefDeposit
+from doi_portal.crossref.models import CrossrefDepositItem
+from doi_portal.crossref.models import CrossrefExport
+from doi_portal.crossref.models import CrossrefExportBundleItem
+from doi_portal.crossref.models import ExportType
+
+__all__ = [
+    "DepositSummary",
+    "compute_deposit_summary",
+    "get_deposit_summary",
+    "invalidate_all_deposit_summaries",
+    "invalidate_deposit_summaries",
+]
+
+CACHE_PREFIX = "crossref:deposit-status"
+VERSION_KEY = f"{CACHE_PREFIX}:version"
+
+# CrossrefExport foreign key per entity type
+_EXPORT_FIELDS = {
+    ExportType.ISSUE: "issue",
+    ExportType.COMPONENT_GROUP: "component_group",
+    ExportType.MONOGRAPH: "monograph",
+}
+
+
+@dataclass(frozen=True)
+class DepositSummary:
+    """
+    Deposit-workflow state of one issue, component group or monograph.
+
+    Attributes:
+        is_valid: Pre-validation passed (no errors)
+        error_count: Pre-validation errors
+        warning_count: Pre-validation warnings
+        xml_hash: SHA-256 of the generated XML ('' if not generated)
+        xsd_valid: XSD outcome of the generated XML (None if not validated)
+        last_export_at: Time of the newest export (None if never exported)
+        export_count: Number of exports
+        is_deposited: Entity is marked deposited to Crossref
+        deposit_status: Status of the newest live deposit ('' if none)
+        is_queued: Entity waits in the combined deposit queue
+    """
+
+    is_valid: bool
+    error_count: int
+    warning_count: int
+    xml_hash: str
+    xsd_valid: bool | None
+    last_export_at: datetime | None
+    export_count: int
+    is_deposited: bool
+    deposit_status: str
+    is_queued: bool
+
+    @property
+    def has_xml(self) -> bool:
+        """Whether XML is generated."""
+        return bool(self.xml_hash)
+
+    @property
+    def has_exports(self) -> bool:
+        """Whether the XML was downloaded at least once."""
+        return self.export_count > 0
+
+    @property
+    def all_ready(self) -> bool:
+        """Whether generation, XSD validation and export are all done."""
+        return self.has_xml and self.xsd_valid is True and self.has_exports
+
+    def workflow_steps(self) -> list[dict]:
+        """
+        Build the five deposit workflow steps.
+
+        Returns:
+            List of step dicts (number, title, completed, active, icon)
+        """
+        return [
+            {
+                "number": 1,
+                "title": "Pre-validacija",
+                "completed": self.is_valid,
+                "active": not self.is_valid,
+                "icon": "clipboard-check",
+            },
+            {
+                "number": 2,
+                "title": "Generisanje XML",
+                "completed": self.has_xml,
+                "active": self.is_valid and not self.has_xml,
+                "icon": "file-code",
+            },
+            {
+                "number": 3,
+                "title": "XSD Validacija",
+                "completed": self.has_xml and self.xsd_valid is True,
+                "active": self.has_xml and self.xsd_valid is not True,
+                "icon": "shield-check",
+            },
+            {
+                "number": 4,
+                "title": "Pregled XML",
+                "completed": False,  # Always available, never "completed"
+                "active": self.has_xml,
+                "icon": "eye",
+            },
+            {
+                "number": 5,
+                "title": "Preuzimanje XML",
+                "completed": self.has_exports,
+                "active": self.has_xml,
+                "icon": "download",
+            },
+        ]
+
+
+def _cache_version() -> int:
+    """Current summary generation (bumped when all summaries go stale)."""
+    return cache.get_or_set(VERSION_KEY, 1, None)
+
+
+def _cache_key(entity_type: str, object_id: int) -> str:
+    """Cache key of one entity's summary."""
+    return f"{CACHE_PREFIX}:{entity_type}:{object_id}"
+
+
+def run_pre_validation(entity_type: str, entity):
+    """Run pre-validation for an entity."""
+    from doi_portal.crossref.services import PreValidationService
+
+    service = PreValidationService()
+    if entity_type == ExportType.ISSUE:
+        return service.validate_issue(entity)
+    if entity_type == ExportType.COMPONENT_GROUP:
+        return service.validate_component_group(entity)
+    return service.validate_monograph(entity)
+
+
+def compute_deposit_summary(entity_type: str, entity) -> DepositSummary:
+    """
+    Compute the deposit-workflow state of an entity.
+
+    Args:
+        entity_type: ExportType value
+        entity: Issue, ComponentGroup or Monograph
+
+    Returns:
+        Fresh DepositSummary
+    """
+    from django.db.models import Count
+    from django.db.models import Max
+
+    validation = run_pre_validation(entity_type, entity)
+    exports = CrossrefExport.objects.filter(**{_EXPORT_FIELDS[entity_type]: entity}).aggregate(
+        count=Count("pk"),
+        last=Max("exported_at"),
+    )
+    # Downloads as part of a ZIP bundle count as exports too
+    bundled = CrossrefExportBundleItem.objects.filter(entity_type=entity_type, object_id=entity.pk).aggregate(
+        count=Count("pk"),
+        last=Max("bundle__exported_at"),
+    )
+    export_times = [time for time in (exports["last"], bundled["last"]) if time is not None]
+    deposit_status = (
+        CrossrefDeposit.objects.filter(entity_type=entity_type, object_id=entity.pk)
+        .values_list("status", flat=True)
+        .first()
+    )
+    xml = entity.crossref_xml or ""
+    return DepositSummary(
+        is_valid=validation.is_valid,
+        error_count=len(validation.errors),
+        warning_count=len(validation.warnings),
+        xml_hash=hashlib.sha256(xml.encode("utf-8")).hexdigest() if xml else "",
+        xsd_valid=entity.xsd_valid,
+        last_export_at=max(export_times, default=None),
+        export_count=exports["count"] + bundled["count"],
+        is_deposited=entity.is_crossref_deposited,
+        deposit_status=deposit_status or "",
+        is_queued=CrossrefDepositItem.objects.filter(
+            entity_type=entity_type,
+            object_id=entity.pk,
+            deposit__isnull=True,
+        ).exists(),
+    )
+
+
+def get_deposit_summary(entity_type: str, entity) -> DepositSummary:
+    """
+    Return the cached deposit-workflow state of an entity, computing it on a miss.
+
+    Args:
+        entity_type: ExportType value
+        entity: Issue, ComponentGroup or Monograph
+
+    Returns:
+        DepositSummary
+    """
+    key = _cache_key(entity_type, entity.pk)
+    version = _cache_version()
+    summary = cache.get(key, version=version)
+    if summary is None:
+        summary = compute_deposit_summary(entity_type, entity)
+        timeout = getattr(settings, "CROSSREF_DEPOSIT_STATUS_CACHE_TIMEOUT", 10 * 60)
+        cache.set(key, summary, timeout, version=version)
+    return summary
+
+
+def invalidate_deposit_summaries(entities: Iterable[tuple[str, int | None]]) -> None:
+    """
+    Drop cached summaries of changed entities.
+
+    Summaries are dropped right away and again when the surrounding
+    transaction commits, so a page rendered between the change and the
+    commit cannot keep a stale summary cached.
+
+    Args:
+        entities: (ExportType value, object id) pairs; None ids are ignored
+    """
+    keys = [_cache_key(entity_type, object_id) for entity_type, object_id in entities if object_id is not None]
+    if not keys:
+        return
+    version = _cache_version()
+    cache.delete_many(keys, version=version)
+    transaction.on_commit(lambda: cache.delete_many(keys, version=version))
+
+
+def invalidate_all_deposit_summaries() -> None:
+    """Make every cached summary stale (e.g. after depositor settings change)."""
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 2, None)
@@ -0,0 +1,264 @@
+"""
+Global DOI registry.
+
+Every issue, article, monograph, chapter and component with a DOI suffix
+claims its full DOI (publisher prefix + "/" + suffix) in one RegisteredDOI
+row. Collision and existence checks then become indexed lookups on
+RegisteredDOI.doi instead of scans across the record tables: a whole
+issue with its articles is checked in a single query.
+
+Rows are written by signal handlers (doi_portal.crossref.signals) in the
+transaction that saves or deletes the record. The first claimant of a
+DOI is its primary owner; when it releases the DOI the oldest remaining
+claimant is promoted.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+from django.db import IntegrityError
+from django.db import transaction
+
+from doi_portal.crossref.models import DOIEntityType
+from doi_portal.crossref.models import RegisteredDOI
+
+__all__ = [
+    "ENTITY_MODELS",
+    "doi_exists",
+    "find_doi_collisions",
+    "full_doi",
+    "rebuild_doi_registry",
+    "register_entity",
+    "unregister_entity",
+]
+
+# Entity type -> (model label, lookup path to the owning publisher)
+ENTITY_MODELS = {
+    DOIEntityType.ISSUE: ("issues.Issue", "publication__publisher"),
+    DOIEntityType.ARTICLE: ("articles.Article", "issue__publication__publisher"),
+    DOIEntityType.MONOGRAPH: ("monographs.Monograph", "publisher"),
+    DOIEntityType.CHAPTER: ("monographs.MonographChapter", "monograph__publisher"),
+    DOIEntityType.COMPONENT: ("components.Component", "component_group__publisher"),
+}
+
+BULK_BATCH_SIZE = 1000
+
+
+def full_doi(prefix: str | None, suffix: str | None) -> str:
+    """
+    Build the normalized registry key of a DOI.
+
+    Args:
+        prefix: Publisher DOI prefix (e.g. "10.12345")
+        suffix: Record DOI suffix
+
+    Returns:
+        Lowercased "prefix/suffix", or "" if either part is missing
+    """
+    prefix = (prefix or "").strip()
+    suffix = (suffix or "").strip()
+    if not prefix or not suffix:
+        return ""
+    return f"{prefix}/{suffix}".lower()
+
+
+def _entity_model(entity_type: str, apps=None):
+    """Return the model class and publisher lookup of an entity type."""
+    if apps is None:
+        from django.apps import apps
+
+    label, publisher_lookup = ENTITY_MODELS[entity_type]
+    return apps.get_model(label), publisher_lookup
+
+
+def _claim_values(entity_type: str, object_ids=None, *, publisher_id: int | None = None, apps=None):
+    """Yield (object_id, publisher_id, full DOI) of live records with a DOI."""
+    model, publisher_lookup = _entity_model(entity_type, apps)
+    queryset = model._base_manager.filter(is_deleted=False).exclude(doi_suffix="")
+    if object_ids is not None:
+        queryset = queryset.filter(pk__in=object_ids)
+    if publisher_id is not None:
+        queryset = queryset.filter(**{f"{publisher_lookup}__id": publisher_id})
+    rows = queryset.order_by("pk").values_list(
+        "pk",
+        f"{publisher_lookup}__id",
+        f"{publisher_lookup}__doi_prefix",
+        "doi_suffix",
+    )
+    for pk, owner_id, prefix, suffix in rows:
+        doi = full_doi(prefix, suffix)
+        if owner_id is not None and doi:
+            yield pk, owner_id, doi
+
+
+def _release(entry: RegisteredDOI) -> None:
+    """Delete a registry row, promoting the oldest other claimant if it owned the DOI."""
+    entry.delete()
+    if entry.is_primary:
+        successor = (
+            RegisteredDOI.objects.filter(doi=entry.doi)
+            .order_by("created_at", "pk")
+            .values_list("pk", flat=True)
+            .first()
+        )
+        if successor is not None:
+            RegisteredDOI.objects.filter(pk=successor).update(is_primary=True)
+
+
+def register_entity(entity_type: str, object_id: int) -> RegisteredDOI | None:
+    """
+    Bring the registry row of one record in line with the database.
+
+    Soft-deleted records, records without a DOI suffix and records whose
+    publisher has no prefix release their DOI.
+
+    Args:
+        entity_type: DOIEntityType value
+        object_id: Primary key of the record
+
+    Returns:
+        The record's RegisteredDOI, or None if it claims no DOI
+    """
+    claim = next(_claim_values(entity_type, [object_id]), None)
+    with transaction.atomic():
+        current = (
+            RegisteredDOI.objects.select_for_update()
+            .filter(entity_type=entity_type, object_id=object_id)
+            .first()
+        )
+        if current is not None:
+            if claim is not None and (current.publisher_id, current.doi) == claim[1:]:
+                return current
+            _release(current)
+        if claim is None:
+            return None
+
+        _, publisher_id, doi = claim
+        entry = RegisteredDOI(
+            doi=doi,
+            publisher_id=publisher_id,
+            entity_type=entity_type,
+            object_id=object_id,
+            is_primary=not RegisteredDOI.objects.filter(doi=doi, is_primary=True).exists(),
+        )
+        try:
+            with transaction.atomic():
+                entry.save()
+        except IntegrityError:
+            # A concurrent claim became the owner first
+            entry.pk = None
+            entry.is_primary = False
+            entry.save()
+        return entry
+
+
+def unregister_entity(entity_type: str, object_id: int) -> None:
+    """
+    Release the DOI claimed by a deleted record.
+
+    Args:
+        entity_type: DOIEntityType value
+        object_id: Primary key of the record
+    """
+    with transaction.atomic():
+        entry = (
+            RegisteredDOI.objects.select_for_update()
+            .filter(entity_type=entity_type, object_id=object_id)
+            .first()
+        )
+        if entry is not None:
+            _release(entry)
+
+
+def rebuild_doi_registry(*, publisher_id: int | None = None, apps=None) -> int:
+    """
+    Recreate registry rows from the record tables.
+
+    Claims are collected per entity type in primary key order; the first
+    claimant of a DOI becomes its owner.
+
+    Args:
+        publisher_id: Limit the rebuild to one publisher (default: all)
+        apps: App registry to load models from (historical models in migrations)
+
+    Returns:
+        Number of registered claims
+    """
+    registry_model = apps.get_model("crossref", "RegisteredDOI") if apps else RegisteredDOI
+
+    entries = []
+    owned: set[str] = set()
+    for entity_type in ENTITY_MODELS:
+        for object_id, owner_id, doi in _claim_values(entity_type, publisher_id=publisher_id, apps=apps):
+            entries.append(
+                registry_model(
+                    doi=doi,
+                    publisher_id=owner_id,
+                    entity_type=entity_type,
+                    object_id=object_id,
+                    is_primary=doi not in owned,
+                ),
+            )
+            owned.add(doi)
+
+    with transaction.atomic():
+        stale = registry_model.objects.all()
+        if publisher_id is not None:
+            stale = stale.filter(publisher_id=publisher_id)
+        stale.delete()
+        if publisher_id is not None:
+            # DOIs owned by another publisher's records keep their owner
+            taken = set(
+                registry_model.objects.filter(doi__in=owned, is_primary=True).values_list("doi", flat=True),
+            )
+            for entry in entries:
+                entry.is_primary = entry.is_primary and entry.doi not in taken
+        registry_model.objects.bulk_create(entries, batch_size=BULK_BATCH_SIZE)
+    return len(entries)
+
+
+def find_doi_collisions(claims: Iterable[tuple[str, int, str]]) -> set[tuple[str, int]]:
+    """
+    Find claims whose DOI is also claimed by another record.
+
+    All DOIs are checked with one indexed query. Claims in the input are
+    compared with each other as well, so records missing from the
+    registry are still caught.
+
+    Args:
+        claims: (entity type, object id, full DOI) tuples; claims with an empty DOI are ignored
+
+    Returns:
+        Set of (entity type, object id) whose DOI has another claimant
+    """
+    claims = [(entity_type, object_id, doi.lower()) for entity_type, object_id, doi in claims if doi]
+    if not claims:
+        return set()
+
+    claimants: dict[str, set[tuple[str, int]]] = defaultdict(set)
+    for entity_type, object_id, doi in claims:
+        claimants[doi].add((entity_type, object_id))
+    registered = RegisteredDOI.objects.filter(doi__in=claimants).values_list("doi", "entity_type", "object_id")
+    for doi, entity_type, object_id in registered:
+        claimants[doi].add((entity_type, object_id))
+
+    return {
+        (entity_type, object_id)
+        for entity_type, object_id, doi in claims
+        if claimants[doi] - {(entity_type, object_id)}
+    }
+
+
+def doi_exists(doi: str) -> bool:
+    """
+    Check whether a full DOI is claimed by any record.
+
+    Args:
+        doi: Full DOI (prefix/suffix), case-insensitive
+
+    Returns:
+        True if the DOI is registered
+    """
+    return bool(doi) and RegisteredDOI.objects.filter(doi=doi.strip().lower()).exists()
@@ -0,0 +1,148 @@
+"""
+Crossref export loaders.
+
+Bulk loaders that fetch the full object graph needed for Crossref XML
+generation in a fixed number of queries, regardless of how many
+articles an issue, chapters a monograph or components a component
+group contains.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db.models import Prefetch
+from django.db.models import prefetch_related_objects
+
+if TYPE_CHECKING:
+    from doi_portal.articles.models import Article
+    from doi_portal.components.models import Component
+    from doi_portal.components.models import ComponentGroup
+    from doi_portal.issues.models import Issue
+    from doi_portal.monographs.models import Monograph
+    from doi_portal.monographs.models import MonographChapter
+
+__all__ = [
+    "load_component_group_export_graph",
+    "load_issue_export_graph",
+    "load_monograph_export_graph",
+]
+
+
+def load_issue_export_graph(issue: Issue) -> list[Article]:
+    """
+    Load all non-deleted articles of an issue with their export children.
+
+    Authors, affiliations, fundings and relations are fetched through
+    ordered Prefetch querysets, so consumers must iterate the prefetched
+    managers with ``.all()`` (never ``.order_by()`` or ``.filter()``,
+    which would bypass the prefetch cache and hit the database again).
+
+    Query budget: 1 (articles) + 1 (authors) + 1 (affiliations)
+    + 1 (fundings) + 1 (relations) = 5 queries.
+
+    Args:
+        issue: Issue model instance
+
+    Returns:
+        List of Article instances with prefetched export relations
+    """
+    from doi_portal.articles.models import Affiliation
+    from doi_portal.articles.models import Article
+    from doi_portal.articles.models import ArticleFunding
+    from doi_portal.articles.models import ArticleRelation
+    from doi_portal.articles.models import Author
+
+    authors_qs = Author.objects.order_by("order", "pk").prefetch_related(
+        Prefetch(
+            "affiliations",
+            queryset=Affiliation.objects.order_by("order", "pk"),
+        ),
+    )
+
+    return list(
+        Article.objects.filter(issue=issue).prefetch_related(
+            Prefetch("authors", queryset=authors_qs),
+            Prefetch("fundings", queryset=ArticleFunding.objects.order_by("order", "pk")),
+            Prefetch("relations", queryset=ArticleRelation.objects.order_by("order", "pk")),
+        )
+    )
+
+
+def load_monograph_export_graph(monograph: Monograph) -> list[MonographChapter]:
+    """
+    Load a monograph's export children and its published chapters.
+
+    Contributors (with affiliations), fundings and relations are prefetched
+    onto the monograph itself; the returned chapters carry the same
+    prefetched children. As with load_issue_export_graph, consumers must
+    iterate the prefetched managers with ``.all()``.
+
+    Query budget: 4 (monograph contributors, affiliations, fundings,
+    relations) + 1 (chapters) + 4 (chapter contributors, affiliations,
+    fundings, relations) = 9 queries.
+
+    Args:
+        monograph: Monograph model instance
+
+    Returns:
+        List of published, non-deleted MonographChapter instances in order
+    """
+    from doi_portal.monographs.models import ChapterAffiliation
+    from doi_portal.monographs.models import ChapterContributor
+    from doi_portal.monographs.models import ChapterFunding
+    from doi_portal.monographs.models import ChapterRelation
+    from doi_portal.monographs.models import MonographAffiliation
+    from doi_portal.monographs.models import MonographChapter
+    from doi_portal.monographs.models import MonographContributor
+    from doi_portal.monographs.models import MonographFunding
+    from doi_portal.monographs.models import MonographRelation
+    from doi_portal.monographs.models import MonographStatus
+
+    prefetch_related_objects(
+        [monograph],
+        Prefetch(
+            "contributors",
+            queryset=MonographContributor.objects.order_by("order", "pk").prefetch_related(
+                Prefetch("affiliations", queryset=MonographAffiliation.objects.order_by("order", "pk")),
+            ),
+        ),
+        Prefetch("fundings", queryset=MonographFunding.objects.order_by("order", "pk")),
+        Prefetch("relations", queryset=MonographRelation.objects.order_by("order", "pk")),
+    )
+
+    contributors_qs = ChapterContributor.objects.order_by("order", "pk").prefetch_related(
+        Prefetch("affiliations", queryset=ChapterAffiliation.objects.order_by("order", "pk")),
+    )
+    return list(
+        MonographChapter.objects.filter(
+            monograph=monograph,
+            status=MonographStatus.PUBLISHED,
+        ).order_by("order", "pk").prefetch_related(
+            Prefetch("contributors", queryset=contributors_qs),
+            Prefetch("fundings", queryset=ChapterFunding.objects.order_by("order", "pk")),
+            Prefetch("relations", queryset=ChapterRelation.objects.order_by("order", "pk")),
+        )
+    )
+
+
+def load_component_group_export_graph(component_group: ComponentGroup) -> list[Component]:
+    """
+    Load all non-deleted components of a group with their contributors.
+
+    Query budget: 1 (components) + 1 (contributors) = 2 queries.
+
+    Args:
+        component_group: ComponentGroup model instance
+
+    Returns:
+        List of Component instances in order with prefetched contributors
+    """
+    from doi_portal.components.models import Component
+    from doi_portal.components.models import ComponentContributor
+
+    return list(
+        Component.objects.filter(component_group=component_group).order_by("order", "pk").prefetch_related(
+            Prefetch("contributors", queryset=ComponentContributor.objects.order_by("order", "pk")),
+        )
+    )
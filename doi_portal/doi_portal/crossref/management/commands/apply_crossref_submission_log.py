@@ -0,0 +1,37 @@
+"""
+Reconcile Crossref submission logs downloaded or received by email.
+
+Examples:
+    manage.py apply_crossref_submission_log result_1430966180.xml
+    manage.py apply_crossref_submission_log logs/*.xml
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from doi_portal.crossref.submission_log import apply_submission_log
+
+
+class Command(BaseCommand):
+    help = "Store per-DOI results of Crossref submission logs on articles, chapters and components."
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="+", help="Submission log XML files")
+
+    def handle(self, *args, **options):
+        from lxml import etree
+
+        for path in options["paths"]:
+            try:
+                with open(path, "rb") as log_file:
+                    counts = apply_submission_log(log_file)
+            except OSError as e:
+                raise CommandError(f"Fajl {path} nije moguće pročitati: {e}") from e
+            except etree.XMLSyntaxError as e:
+                raise CommandError(f"Fajl {path} nije ispravan XML: {e}") from e
+            self.stdout.write(
+                f"{path}: uspešnih {counts['success']}, upozorenja {counts['warning']}, "
+                f"neuspešnih {counts['failure']}, ažurirano zapisa {counts['updated']}"
+            )
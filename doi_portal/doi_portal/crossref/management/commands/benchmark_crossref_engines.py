@@ -0,0 +1,81 @@
+"""
+Benchmark Crossref issue XML engines (Jinja2 templates vs lxml builder).
+
+Reports average wall time and peak traced memory per generation for an
+existing issue. The fragment cache is replaced by a dummy cache so the
+Jinja engine renders every article, as on a first generation.
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.test.utils import override_settings
+
+from doi_portal.crossref.services import CrossrefService
+
+DUMMY_CACHES = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+
+class _NullSink:
+    """Binary sink that discards output, so only the engine's own memory is measured."""
+
+    def write(self, data: bytes) -> int:
+        return len(data)
+
+
+class Command(BaseCommand):
+    help = "Compare throughput and peak memory of the jinja and lxml Crossref XML engines."
+
+    def add_arguments(self, parser):
+        parser.add_argument("issue_id", type=int, help="Issue to generate XML for")
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=5,
+            help="Generations per engine (default: 5)",
+        )
+
+    def handle(self, *args, **options):
+        from doi_portal.issues.models import Issue
+
+        issue = Issue.objects.select_related("publication__publisher").filter(pk=options["issue_id"]).first()
+        if issue is None:
+            raise CommandError(f"Izdanje {options['issue_id']} nije pronađeno")
+
+        service = CrossrefService()
+        article_count = issue.articles.count()
+        self.stdout.write(f"Izdanje #{issue.pk}: {article_count} članaka, {options['iterations']} iteracija")
+
+        with override_settings(CACHES=DUMMY_CACHES):
+            for engine in CrossrefService.ENGINES:
+                service.write_xml(issue, _NullSink(), engine=engine)  # Warm up templates/imports
+                seconds, size = self._time(service, issue, engine, options["iterations"])
+                peak = self._peak_memory(service, issue, engine)
+                self.stdout.write(
+                    f"{engine:>6}: {seconds * 1000:8.1f} ms/gen, "
+                    f"{size / 1024:8.1f} KiB output, peak {peak / 1024:8.1f} KiB"
+                )
+
+    @staticmethod
+    def _time(service, issue, engine, iterations) -> tuple[float, int]:
+        """Return average seconds per generation and output size in bytes."""
+        size = 0
+        start = time.perf_counter()
+        for _ in range(iterations):
+            size = service.write_xml(issue, _NullSink(), engine=engine)
+        return (time.perf_counter() - start) / iterations, size
+
+    @staticmethod
+    def _peak_memory(service, issue, engine) -> int:
+        """Return peak traced allocation (bytes) for one generation."""
+        tracemalloc.start()
+        try:
+            service.write_xml(issue, _NullSink(), engine=engine)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return peak
@@ -0,0 +1,51 @@
+"""
+Benchmark per-call Crossref template overhead.
+
+Compares building a fresh Jinja2 environment per CrossrefService call
+(the previous behaviour) with the shared process-wide environment.
+"""
+
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from doi_portal.crossref.services import CrossrefService
+from doi_portal.crossref.services import _build_environment
+from doi_portal.crossref.services import warm_crossref_templates
+
+
+class Command(BaseCommand):
+    help = "Measure Crossref template load/compile overhead per service call."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=50,
+            help="Number of simulated service calls (default: 50)",
+        )
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        names = warm_crossref_templates()
+
+        fresh = self._time_calls(iterations, names, _build_environment)
+        shared = self._time_calls(iterations, names, lambda: CrossrefService().env)
+
+        self.stdout.write(f"Templates: {', '.join(names)}")
+        self.stdout.write(f"Fresh environment per call:  {fresh * 1000:.3f} ms/call")
+        self.stdout.write(f"Shared environment per call: {shared * 1000:.3f} ms/call")
+        if shared:
+            self.stdout.write(self.style.SUCCESS(f"Speedup: {fresh / shared:.0f}x"))
+
+    @staticmethod
+    def _time_calls(iterations, names, get_env) -> float:
+        """Return average seconds to obtain an environment and load all templates."""
+        start = time.perf_counter()
+        for _ in range(iterations):
+            env = get_env()
+            for name in names:
+                env.get_template(name)
+        return (time.perf_counter() - start) / iterations
@@ -0,0 +1,30 @@
+"""
+Pack queued Crossref deposits into combined doi_batch submissions now.
+
+Examples:
+    manage.py flush_crossref_deposit_queue
+    manage.py flush_crossref_deposit_queue --force
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from doi_portal.crossref.deposit_queue import flush_deposit_queue
+
+
+class Command(BaseCommand):
+    help = "Flush the Crossref deposit queue (normally done every 5 minutes by Celery beat)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Send all queued entities, ignoring size and age thresholds",
+        )
+
+    def handle(self, *args, **options):
+        deposits = flush_deposit_queue(force=options["force"])
+        for deposit in deposits:
+            self.stdout.write(f"{deposit.batch_id}: {deposit.items.count()} stavki")
+        self.stdout.write(self.style.SUCCESS(f"Kreirano depozita: {len(deposits)}"))
@@ -0,0 +1,25 @@
+"""
+Rebuild the global DOI registry from issues, articles, monographs,
+chapters and components.
+
+Examples:
+    manage.py rebuild_doi_registry
+    manage.py rebuild_doi_registry --publisher 3
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from doi_portal.crossref.doi_registry import rebuild_doi_registry
+
+
+class Command(BaseCommand):
+    help = "Recreate RegisteredDOI rows from the record tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--publisher", type=int, help="Rebuild only this publisher's DOIs (ID)")
+
+    def handle(self, *args, **options):
+        count = rebuild_doi_registry(publisher_id=options["publisher"])
+        self.stdout.write(f"Registrovano DOI-jeva: {count}")
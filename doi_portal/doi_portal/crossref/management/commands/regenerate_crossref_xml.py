@@ -0,0 +1,56 @@
+"""
+Start, resume or inspect publisher-wide Crossref XML regeneration.
+
+Examples:
+    manage.py regenerate_crossref_xml --publisher 3
+    manage.py regenerate_crossref_xml --resume 12
+    manage.py regenerate_crossref_xml --status 12
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from doi_portal.crossref.bulk import resume_bulk_regeneration
+from doi_portal.crossref.bulk import start_bulk_regeneration
+from doi_portal.crossref.models import BulkRegenerationRun
+from doi_portal.crossref.models import BulkRegenerationStatus
+
+
+class Command(BaseCommand):
+    help = "Regenerate Crossref XML for every issue, component group and monograph of a publisher."
+
+    def add_arguments(self, parser):
+        group = parser.add_mutually_exclusive_group(required=True)
+        group.add_argument("--publisher", type=int, help="Publisher ID to regenerate")
+        group.add_argument("--resume", type=int, metavar="RUN_ID", help="Resume an interrupted run")
+        group.add_argument("--status", type=int, metavar="RUN_ID", help="Show progress of a run")
+
+    def handle(self, *args, **options):
+        if options["publisher"] is not None:
+            from doi_portal.publishers.models import Publisher
+
+            publisher = Publisher.objects.filter(pk=options["publisher"]).first()
+            if publisher is None:
+                raise CommandError(f"Izdavač {options['publisher']} nije pronađen")
+            run = start_bulk_regeneration(publisher)
+            self.stdout.write(self.style.SUCCESS(f"Pokrenuto regenerisanje #{run.pk} ({run.total} stavki)"))
+            return
+
+        run = BulkRegenerationRun.objects.filter(pk=options["resume"] or options["status"]).first()
+        if run is None:
+            raise CommandError("Regenerisanje nije pronađeno")
+
+        if options["resume"] is not None:
+            if run.status == BulkRegenerationStatus.SUCCEEDED:
+                raise CommandError(f"Regenerisanje #{run.pk} je već završeno")
+            resume_bulk_regeneration(run)
+            self.stdout.write(self.style.SUCCESS(f"Nastavljeno regenerisanje #{run.pk}"))
+            return
+
+        self.stdout.write(
+            f"#{run.pk} {run.get_status_display()}: {run.processed}/{run.total} "
+            f"({run.progress_percent}%), uspešno {run.succeeded}, neuspešno {run.failed}, "
+            f"XSD validnih {run.xsd_valid}, XSD nevalidnih {run.xsd_invalid}"
+        )
@@ -0,0 +1,95 @@
+"""
+Migration: Move CrossrefExport XML snapshots into content-addressed XMLBlob rows.
+
+Two-step migration (schema removal follows in 0005):
+1. Create XMLBlob and a nullable CrossrefExport.xml_blob FK
+2. Data migration: hash, gzip and deduplicate every xml_content snapshot
+"""
+
+import gzip
+import hashlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def move_xml_content_to_blobs(apps, schema_editor):
+    """Store each distinct export snapshot once and point exports at it."""
+    CrossrefExport = apps.get_model("crossref", "CrossrefExport")
+    XMLBlob = apps.get_model("crossref", "XMLBlob")
+    known = set(XMLBlob.objects.values_list("sha256", flat=True))
+    exports = CrossrefExport.objects.filter(xml_blob__isnull=True).only("pk", "xml_content")
+    for export in exports.iterator(chunk_size=200):
+        raw = (export.xml_content or "").encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        if digest not in known:
+            XMLBlob.objects.create(
+                sha256=digest,
+                codec="gzip",
+                data=gzip.compress(raw, compresslevel=9, mtime=0),
+                size=len(raw),
+            )
+            known.add(digest)
+        CrossrefExport.objects.filter(pk=export.pk).update(xml_blob_id=digest)
+
+
+def restore_xml_content_from_blobs(apps, schema_editor):
+    """Reverse: copy decompressed snapshots (gzip or zstd) back into xml_content."""
+    from doi_portal.crossref.blobs import decompress_xml
+
+    CrossrefExport = apps.get_model("crossref", "CrossrefExport")
+    for export in CrossrefExport.objects.filter(xml_blob__isnull=False).select_related("xml_blob"):
+        export.xml_content = decompress_xml(bytes(export.xml_blob.data), export.xml_blob.codec)
+        export.save(update_fields=["xml_content"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("crossref", "0003_crossrefexport_monograph_and_more"),
+    ]
+
+    operations = [
+        # Step 1: Blob table and nullable reference
+        migrations.CreateModel(
+            name="XMLBlob",
+            fields=[
+                ("sha256", models.CharField(max_length=64, primary_key=True, serialize=False, verbose_name="SHA-256")),
+                ("codec", models.CharField(choices=[("gzip", "gzip"), ("zstd", "zstd")], max_length=10, verbose_name="Kompresija")),
+                ("data", models.BinaryField(verbose_name="Kompresovani sadržaj")),
+                ("size", models.PositiveIntegerField(help_text="Veličina nekompresovanog XML-a u bajtovima", verbose_name="Veličina (bajtova)")),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="Kreirano")),
+            ],
+            options={
+                "verbose_name": "XML snapshot",
+                "verbose_name_plural": "XML snapshot-i",
+            },
+        ),
+        migrations.AddField(
+            model_name="crossrefexport",
+            name="xml_blob",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="exports",
+                to="crossref.xmlblob",
+                verbose_name="XML sadržaj",
+                help_text="Snapshot XML sadržaja u trenutku eksporta",
+            ),
+        ),
+        # Default lets 0005 be reversed on a populated table
+        migrations.AlterField(
+            model_name="crossrefexport",
+            name="xml_content",
+            field=models.TextField(
+                default="",
+                verbose_name="XML sadržaj",
+                help_text="Snapshot XML sadržaja u trenutku eksporta",
+            ),
+        ),
+        # Step 2: Data migration
+        migrations.RunPython(
+            move_xml_content_to_blobs,
+            restore_xml_content_from_blobs,
+        ),
+    ]
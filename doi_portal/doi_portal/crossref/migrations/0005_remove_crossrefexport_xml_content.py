@@ -0,0 +1,34 @@
+"""
+Migration: Drop inline CrossrefExport.xml_content and require xml_blob.
+
+Kept separate from 0004 so the data copy commits before the FK column
+is altered (PostgreSQL rejects ALTER TABLE with pending deferred triggers).
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("crossref", "0004_xmlblob_crossrefexport_xml_blob"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="crossrefexport",
+            name="xml_content",
+        ),
+        migrations.AlterField(
+            model_name="crossrefexport",
+            name="xml_blob",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="exports",
+                to="crossref.xmlblob",
+                verbose_name="XML sadržaj",
+                help_text="Snapshot XML sadržaja u trenutku eksporta",
+            ),
+        ),
+    ]
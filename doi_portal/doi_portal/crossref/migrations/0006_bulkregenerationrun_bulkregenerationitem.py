@@ -0,0 +1,58 @@
+# Generated by Django 5.2.10 on 2026-10-17 06:34
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crossref', '0005_remove_crossrefexport_xml_content'),
+        ('publishers', '0007_publisher_crossref_password_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BulkRegenerationRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('PENDING', 'Na čekanju'), ('RUNNING', 'U toku'), ('SUCCEEDED', 'Uspešno'), ('FAILED', 'Neuspešno')], default='PENDING', max_length=20, verbose_name='Status')),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='Ukupno')),
+                ('succeeded', models.PositiveIntegerField(default=0, verbose_name='Uspešno')),
+                ('failed', models.PositiveIntegerField(default=0, verbose_name='Neuspešno')),
+                ('xsd_valid', models.PositiveIntegerField(default=0, verbose_name='XSD validnih')),
+                ('xsd_invalid', models.PositiveIntegerField(default=0, verbose_name='XSD nevalidnih')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Kreirano')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Završeno')),
+                ('publisher', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bulk_regeneration_runs', to='publishers.publisher', verbose_name='Izdavač')),
+                ('started_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='bulk_regeneration_runs', to=settings.AUTH_USER_MODEL, verbose_name='Pokrenuo')),
+            ],
+            options={
+                'verbose_name': 'Masovno regenerisanje XML-a',
+                'verbose_name_plural': 'Masovna regenerisanja XML-a',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='BulkRegenerationItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity_type', models.CharField(choices=[('ISSUE', 'Izdanje'), ('COMPONENT_GROUP', 'Grupa komponenti'), ('MONOGRAPH', 'Monografija')], max_length=20, verbose_name='Tip entiteta')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='ID entiteta')),
+                ('status', models.CharField(choices=[('PENDING', 'Na čekanju'), ('RUNNING', 'U toku'), ('SUCCEEDED', 'Uspešno'), ('FAILED', 'Neuspešno')], default='PENDING', max_length=20, verbose_name='Status')),
+                ('xsd_valid', models.BooleanField(null=True, verbose_name='XSD validan')),
+                ('message', models.TextField(blank=True, verbose_name='Poruka')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Završeno')),
+                ('run', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='crossref.bulkregenerationrun', verbose_name='Regenerisanje')),
+            ],
+            options={
+                'verbose_name': 'Stavka regenerisanja',
+                'verbose_name_plural': 'Stavke regenerisanja',
+                'ordering': ['pk'],
+                'indexes': [models.Index(fields=['run', 'status'], name='crossref_bu_run_id_35b9fe_idx')],
+                'constraints': [models.UniqueConstraint(fields=('run', 'entity_type', 'object_id'), name='unique_bulk_regeneration_item')],
+            },
+        ),
+    ]
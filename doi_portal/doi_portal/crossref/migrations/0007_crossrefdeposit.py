@@ -0,0 +1,46 @@
+# Generated by Django 5.2.10 on 2026-10-17 06:43
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crossref', '0006_bulkregenerationrun_bulkregenerationitem'),
+        ('publishers', '0007_publisher_crossref_password_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CrossrefDeposit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity_type', models.CharField(choices=[('ISSUE', 'Izdanje'), ('COMPONENT_GROUP', 'Grupa komponenti'), ('MONOGRAPH', 'Monografija')], max_length=20, verbose_name='Tip entiteta')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='ID entiteta')),
+                ('batch_id', models.CharField(db_index=True, max_length=100, verbose_name='doi_batch_id')),
+                ('filename', models.CharField(max_length=255, verbose_name='Ime fajla')),
+                ('status', models.CharField(choices=[('PENDING', 'Na čekanju'), ('SUBMITTED', 'Poslato'), ('COMPLETED', 'Deponovano'), ('FAILED', 'Neuspešno')], default='PENDING', max_length=20, verbose_name='Status')),
+                ('poll_attempts', models.PositiveSmallIntegerField(default=0, verbose_name='Broj provera')),
+                ('record_count', models.PositiveIntegerField(default=0, verbose_name='Zapisa')),
+                ('success_count', models.PositiveIntegerField(default=0, verbose_name='Uspešnih')),
+                ('warning_count', models.PositiveIntegerField(default=0, verbose_name='Upozorenja')),
+                ('failure_count', models.PositiveIntegerField(default=0, verbose_name='Neuspešnih')),
+                ('response_log', models.TextField(blank=True, verbose_name='Odgovor Crossref-a')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Kreirano')),
+                ('submitted_at', models.DateTimeField(blank=True, null=True, verbose_name='Poslato')),
+                ('completed_at', models.DateTimeField(blank=True, null=True, verbose_name='Završeno')),
+                ('publisher', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='crossref_deposits', to='publishers.publisher', verbose_name='Izdavač')),
+                ('submitted_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='crossref_submissions', to=settings.AUTH_USER_MODEL, verbose_name='Poslao')),
+                ('xml_blob', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='deposits', to='crossref.xmlblob', verbose_name='XML sadržaj')),
+            ],
+            options={
+                'verbose_name': 'Crossref depozit',
+                'verbose_name_plural': 'Crossref depoziti',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['entity_type', 'object_id'], name='crossref_cr_entity__3c2d15_idx')],
+            },
+        ),
+    ]
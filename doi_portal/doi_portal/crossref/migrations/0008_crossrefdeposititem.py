@@ -0,0 +1,51 @@
+# Generated by Django 5.2.10 on 2026-10-17 06:49
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crossref', '0007_crossrefdeposit'),
+        ('publishers', '0007_publisher_crossref_password_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='crossrefdeposit',
+            name='entity_type',
+            field=models.CharField(blank=True, choices=[('ISSUE', 'Izdanje'), ('COMPONENT_GROUP', 'Grupa komponenti'), ('MONOGRAPH', 'Monografija')], max_length=20, verbose_name='Tip entiteta'),
+        ),
+        migrations.AlterField(
+            model_name='crossrefdeposit',
+            name='object_id',
+            field=models.PositiveBigIntegerField(blank=True, null=True, verbose_name='ID entiteta'),
+        ),
+        migrations.CreateModel(
+            name='CrossrefDepositItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity_type', models.CharField(choices=[('ISSUE', 'Izdanje'), ('COMPONENT_GROUP', 'Grupa komponenti'), ('MONOGRAPH', 'Monografija')], max_length=20, verbose_name='Tip entiteta')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='ID entiteta')),
+                ('content_type', models.CharField(help_text='Element u doi_batch body (journal, book, conference, sa_component)', max_length=30, verbose_name='Tip sadržaja')),
+                ('dois', models.JSONField(blank=True, default=list, verbose_name='DOI-jevi')),
+                ('status', models.CharField(choices=[('PENDING', 'Na čekanju'), ('SUBMITTED', 'Poslato'), ('COMPLETED', 'Deponovano'), ('FAILED', 'Neuspešno')], default='PENDING', max_length=20, verbose_name='Status')),
+                ('message', models.TextField(blank=True, verbose_name='Poruka')),
+                ('queued_at', models.DateTimeField(auto_now_add=True, verbose_name='Dodato u red')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Završeno')),
+                ('deposit', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='items', to='crossref.crossrefdeposit', verbose_name='Depozit')),
+                ('publisher', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='crossref_deposit_items', to='publishers.publisher', verbose_name='Izdavač')),
+                ('queued_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='crossref_deposit_items', to=settings.AUTH_USER_MODEL, verbose_name='Dodao')),
+            ],
+            options={
+                'verbose_name': 'Stavka depozita',
+                'verbose_name_plural': 'Stavke depozita',
+                'ordering': ['queued_at', 'pk'],
+                'indexes': [models.Index(fields=['entity_type', 'object_id'], name='crossref_cr_entity__8b5602_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('deposit__isnull', True)), fields=('entity_type', 'object_id'), name='unique_queued_deposit_item')],
+            },
+        ),
+    ]
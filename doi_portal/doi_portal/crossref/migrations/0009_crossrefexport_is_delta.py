@@ -0,0 +1,18 @@
+# Generated by Django 5.2.10 on 2026-10-17 06:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crossref', '0008_crossrefdeposititem'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='crossrefexport',
+            name='is_delta',
+            field=models.BooleanField(default=False, help_text='Eksport sadrži samo zapise izmenjene od prethodnog eksporta', verbose_name='Samo izmene'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+"""
+Migration: Global DOI registry.
+
+1. Create RegisteredDOI (one row per claimed full DOI)
+2. Data migration: register the DOIs of existing issues, articles,
+   monographs, chapters and components
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_doi_registry(apps, schema_editor):
+    """Register every existing DOI; the oldest claimant owns it."""
+    from doi_portal.crossref.doi_registry import rebuild_doi_registry
+
+    rebuild_doi_registry(apps=apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crossref', '0009_crossrefexport_is_delta'),
+        ('publishers', '0007_publisher_crossref_password_and_more'),
+        ('articles', '0013_validation_state'),
+        ('components', '0003_validation_state'),
+        ('issues', '0007_add_doi_suffix_pdf_to_issue'),
+        ('monographs', '0005_validation_state'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegisteredDOI',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('doi', models.CharField(max_length=300, verbose_name='DOI')),
+                ('entity_type', models.CharField(choices=[('ISSUE', 'Izdanje'), ('ARTICLE', 'Članak'), ('MONOGRAPH', 'Monografija'), ('CHAPTER', 'Poglavlje'), ('COMPONENT', 'Komponenta')], max_length=20, verbose_name='Tip entiteta')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='ID entiteta')),
+                ('is_primary', models.BooleanField(default=True, help_text='Prvi zapis koji je zauzeo DOI; ostali zapisi sa istim DOI-jem su duplikati', verbose_name='Vlasnik DOI-ja')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Registrovano')),
+                ('publisher', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='registered_dois', to='publishers.publisher', verbose_name='Izdavač')),
+            ],
+            options={
+                'verbose_name': 'Registrovani DOI',
+                'verbose_name_plural': 'Registrovani DOI-jevi',
+                'ordering': ['doi'],
+                'indexes': [models.Index(fields=['doi'], name='crossref_re_doi_cc2584_idx')],
+                'constraints': [models.UniqueConstraint(fields=('entity_type', 'object_id'), name='unique_registered_doi_entity'), models.UniqueConstraint(condition=models.Q(('is_primary', True)), fields=('doi',), name='unique_primary_registered_doi')],
+            },
+        ),
+        migrations.RunPython(
+            populate_doi_registry,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.10 on 2026-10-17 07:56
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crossref', '0010_doi_registry'),
+        ('publishers', '0007_publisher_crossref_password_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CrossrefExportBundle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('export_type', models.CharField(choices=[('ISSUE', 'Izdanje'), ('COMPONENT_GROUP', 'Grupa komponenti'), ('MONOGRAPH', 'Monografija')], max_length=20, verbose_name='Tip eksporta')),
+                ('filename', models.CharField(max_length=255, verbose_name='Ime fajla')),
+                ('entity_count', models.PositiveIntegerField(default=0, verbose_name='Broj XML fajlova')),
+                ('exported_at', models.DateTimeField(auto_now_add=True, verbose_name='Eksportovano')),
+                ('exported_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='crossref_export_bundles', to=settings.AUTH_USER_MODEL, verbose_name='Eksportovao')),
+                ('publisher', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='crossref_export_bundles', to='publishers.publisher', verbose_name='Izdavač')),
+            ],
+            options={
+                'verbose_name': 'Crossref ZIP eksport',
+                'verbose_name_plural': 'Crossref ZIP eksporti',
+                'ordering': ['-exported_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CrossrefExportBundleItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity_type', models.CharField(choices=[('ISSUE', 'Izdanje'), ('COMPONENT_GROUP', 'Grupa komponenti'), ('MONOGRAPH', 'Monografija')], max_length=20, verbose_name='Tip entiteta')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='ID entiteta')),
+                ('filename', models.CharField(max_length=255, verbose_name='Ime fajla')),
+                ('xml_generated_at', models.DateTimeField(null=True, verbose_name='XML generisan')),
+                ('xsd_valid_at_export', models.BooleanField(null=True, verbose_name='XSD validan pri eksportu')),
+                ('bundle', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='crossref.crossrefexportbundle', verbose_name='ZIP eksport')),
+            ],
+            options={
+                'verbose_name': 'Stavka ZIP eksporta',
+                'verbose_name_plural': 'Stavke ZIP eksporta',
+                'ordering': ['pk'],
+                'indexes': [models.Index(fields=['entity_type', 'object_id'], name='crossref_cr_entity__0b5158_idx')],
+            },
+        ),
+    ]
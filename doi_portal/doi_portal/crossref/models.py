@@ -3,6 +3,12 @@ Crossref models.
 
 Story 5.6: XML Download - Export History Tracking.
 Component support: export_type discriminator + component_group FK.
+XML snapshots are stored once per content hash in compressed XMLBlob rows.
+Bulk regeneration: BulkRegenerationRun + per-entity BulkRegenerationItem.
+Live deposits: CrossrefDeposit tracks one doi_batch submitted to Crossref;
+CrossrefDepositItem queues entities that are packed into shared batches.
+DOI registry: RegisteredDOI maps every full DOI to the record claiming it.
+ZIP bundles: CrossrefExportBundle records one download of many XML files.
 """
 
 from auditlog.registry import auditlog
@@ -10,8 +16,20 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 __all__ = [
+    "BulkRegenerationItem",
+    "BulkRegenerationRun",
+    "BulkRegenerationStatus",
+    "CrossrefDeposit",
+    "CrossrefDepositItem",
     "CrossrefExport",
+    "CrossrefExportBundle",
+    "CrossrefExportBundleItem",
+    "DOIEntityType",
+    "DepositStatus",
     "ExportType",
+    "RegisteredDOI",
+    "XMLBlob",
+    "XMLBlobCodec",
 ]
 
 
@@ -23,6 +41,58 @@ class ExportType(models.TextChoices):
     MONOGRAPH = "MONOGRAPH", _("Monografija")
 
 
+class XMLBlobCodec(models.TextChoices):
+    """Compression codec used for an XMLBlob payload."""
+
+    GZIP = "gzip", "gzip"
+    ZSTD = "zstd", "zstd"
+
+
+class XMLBlob(models.Model):
+    """
+    Content-addressed, compressed XML snapshot.
+
+    Keyed by the SHA-256 of the UTF-8 encoded XML, so identical documents
+    are stored exactly once no matter how many exports reference them.
+    Use doi_portal.crossref.blobs.store_xml_blob() to create rows.
+    """
+
+    sha256 = models.CharField(
+        _("SHA-256"),
+        max_length=64,
+        primary_key=True,
+    )
+    codec = models.CharField(
+        _("Kompresija"),
+        max_length=10,
+        choices=XMLBlobCodec.choices,
+    )
+    data = models.BinaryField(
+        verbose_name=_("Kompresovani sadržaj"),
+    )
+    size = models.PositiveIntegerField(
+        _("Veličina (bajtova)"),
+        help_text=_("Veličina nekompresovanog XML-a u bajtovima"),
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Kreirano"),
+    )
+
+    class Meta:
+        verbose_name = _("XML snapshot")
+        verbose_name_plural = _("XML snapshot-i")
+
+    def __str__(self):
+        return f"{self.sha256[:12]} ({self.codec}, {self.size} B)"
+
+    def get_xml(self) -> str:
+        """Return the decompressed XML document."""
+        from doi_portal.crossref.blobs import decompress_xml
+
+        return decompress_xml(bytes(self.data), self.codec)
+
+
 class CrossrefExport(models.Model):
     """
     Tracks XML export history for an issue or component group.
@@ -30,6 +100,10 @@ class CrossrefExport(models.Model):
     Story 5.6: XML Download - Export History Tracking.
     Each download creates a record preserving the XML state at export time.
     Supports both Issue and ComponentGroup exports via export_type discriminator.
+
+    The snapshot itself lives in a deduplicated XMLBlob; ``xml_content`` is a
+    read/write property that resolves the blob lazily and stores a new one
+    on save().
     """
 
     issue = models.ForeignKey(
@@ -62,7 +136,10 @@ class CrossrefExport(models.Model):
         choices=ExportType.choices,
         default=ExportType.ISSUE,
     )
-    xml_content = models.TextField(
+    xml_blob = models.ForeignKey(
+        XMLBlob,
+        on_delete=models.PROTECT,
+        related_name="exports",
         verbose_name=_("XML sadržaj"),
         help_text=_("Snapshot XML sadržaja u trenutku eksporta"),
     )
@@ -85,6 +162,11 @@ class CrossrefExport(models.Model):
         null=True,
         verbose_name=_("XSD validan pri eksportu"),
     )
+    is_delta = models.BooleanField(
+        default=False,
+        verbose_name=_("Samo izmene"),
+        help_text=_("Eksport sadrži samo zapise izmenjene od prethodnog eksporta"),
+    )
 
     class Meta:
         verbose_name = _("Crossref eksport")
@@ -101,9 +183,516 @@ class CrossrefExport(models.Model):
             ),
         ]
 
+    _xml_content = None
+    _xml_content_dirty = False
+
     def __str__(self):
         return f"{self.filename} ({self.exported_at:%Y-%m-%d %H:%M})"
 
+    @property
+    def xml_content(self) -> str:
+        """Exported XML, decompressed from the referenced blob on first access."""
+        if self._xml_content is None:
+            self._xml_content = self.xml_blob.get_xml() if self.xml_blob_id else ""
+        return self._xml_content
+
+    @xml_content.setter
+    def xml_content(self, value: str) -> None:
+        self._xml_content = value
+        self._xml_content_dirty = True
+
+    def save(self, *args, **kwargs):
+        """Store pending XML content as a blob before saving the export row."""
+        if self._xml_content_dirty:
+            from doi_portal.crossref.blobs import store_xml_blob
+
+            self.xml_blob = store_xml_blob(self._xml_content or "")
+            self._xml_content_dirty = False
+        super().save(*args, **kwargs)
+
+
+class CrossrefExportBundle(models.Model):
+    """
+    A ZIP download of the XML of many issues or monographs.
+
+    One history entry covers the whole archive; CrossrefExportBundleItem
+    rows list the entities it contained. Unlike CrossrefExport no XML
+    snapshot is kept, so bundles are not a base for delta exports.
+    """
+
+    publisher = models.ForeignKey(
+        "publishers.Publisher",
+        on_delete=models.CASCADE,
+        related_name="crossref_export_bundles",
+        verbose_name=_("Izdavač"),
+    )
+    export_type = models.CharField(
+        _("Tip eksporta"),
+        max_length=20,
+        choices=ExportType.choices,
+    )
+    filename = models.CharField(
+        max_length=255,
+        verbose_name=_("Ime fajla"),
+    )
+    entity_count = models.PositiveIntegerField(_("Broj XML fajlova"), default=0)
+    exported_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Eksportovano"),
+    )
+    exported_by = models.ForeignKey(
+        "users.User",
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="crossref_export_bundles",
+        verbose_name=_("Eksportovao"),
+    )
+
+    class Meta:
+        verbose_name = _("Crossref ZIP eksport")
+        verbose_name_plural = _("Crossref ZIP eksporti")
+        ordering = ["-exported_at"]
+
+    def __str__(self):
+        return f"{self.filename} ({self.entity_count})"
+
+
+class CrossrefExportBundleItem(models.Model):
+    """Issue or monograph whose XML was included in a CrossrefExportBundle."""
+
+    bundle = models.ForeignKey(
+        CrossrefExportBundle,
+        on_delete=models.CASCADE,
+        related_name="items",
+        verbose_name=_("ZIP eksport"),
+    )
+    entity_type = models.CharField(
+        _("Tip entiteta"),
+        max_length=20,
+        choices=ExportType.choices,
+    )
+    object_id = models.PositiveBigIntegerField(_("ID entiteta"))
+    filename = models.CharField(
+        max_length=255,
+        verbose_name=_("Ime fajla"),
+    )
+    xml_generated_at = models.DateTimeField(
+        null=True,
+        verbose_name=_("XML generisan"),
+    )
+    xsd_valid_at_export = models.BooleanField(
+        null=True,
+        verbose_name=_("XSD validan pri eksportu"),
+    )
+
+    class Meta:
+        verbose_name = _("Stavka ZIP eksporta")
+        verbose_name_plural = _("Stavke ZIP eksporta")
+        ordering = ["pk"]
+        indexes = [
+            models.Index(fields=["entity_type", "object_id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.entity_type} #{self.object_id} ({self.filename})"
+
+
+class BulkRegenerationStatus(models.TextChoices):
+    """Status of a bulk regeneration run or of a single item within it."""
+
+    PENDING = "PENDING", _("Na čekanju")
+    RUNNING = "RUNNING", _("U toku")
+    SUCCEEDED = "SUCCEEDED", _("Uspešno")
+    FAILED = "FAILED", _("Neuspešno")
+
+
+class BulkRegenerationRun(models.Model):
+    """
+    Publisher-wide Crossref XML regeneration.
+
+    One run fans out generation of every issue, component group and
+    monograph of a publisher. Progress counters are recomputed from the
+    run's items after each batch, so an interrupted run can be resumed
+    and only items still pending are regenerated.
+    """
+
+    publisher = models.ForeignKey(
+        "publishers.Publisher",
+        on_delete=models.CASCADE,
+        related_name="bulk_regeneration_runs",
+        verbose_name=_("Izdavač"),
+    )
+    status = models.CharField(
+        _("Status"),
+        max_length=20,
+        choices=BulkRegenerationStatus.choices,
+        default=BulkRegenerationStatus.PENDING,
+    )
+    total = models.PositiveIntegerField(_("Ukupno"), default=0)
+    succeeded = models.PositiveIntegerField(_("Uspešno"), default=0)
+    failed = models.PositiveIntegerField(_("Neuspešno"), default=0)
+    xsd_valid = models.PositiveIntegerField(_("XSD validnih"), default=0)
+    xsd_invalid = models.PositiveIntegerField(_("XSD nevalidnih"), default=0)
+    started_by = models.ForeignKey(
+        "users.User",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="bulk_regeneration_runs",
+        verbose_name=_("Pokrenuo"),
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Kreirano"),
+    )
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("Završeno"),
+    )
+
+    class Meta:
+        verbose_name = _("Masovno regenerisanje XML-a")
+        verbose_name_plural = _("Masovna regenerisanja XML-a")
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.publisher} ({self.processed}/{self.total})"
+
+    @property
+    def processed(self) -> int:
+        """Number of items that finished, successfully or not."""
+        return self.succeeded + self.failed
+
+    @property
+    def progress_percent(self) -> int:
+        """Completion percentage (0-100)."""
+        if not self.total:
+            return 100
+        return int(self.processed * 100 / self.total)
+
+
+class BulkRegenerationItem(models.Model):
+    """Single entity (issue, component group or monograph) in a bulk regeneration run."""
+
+    run = models.ForeignKey(
+        BulkRegenerationRun,
+        on_delete=models.CASCADE,
+        related_name="items",
+        verbose_name=_("Regenerisanje"),
+    )
+    entity_type = models.CharField(
+        _("Tip entiteta"),
+        max_length=20,
+        choices=ExportType.choices,
+    )
+    object_id = models.PositiveBigIntegerField(_("ID entiteta"))
+    status = models.CharField(
+        _("Status"),
+        max_length=20,
+        choices=BulkRegenerationStatus.choices,
+        default=BulkRegenerationStatus.PENDING,
+    )
+    xsd_valid = models.BooleanField(
+        null=True,
+        verbose_name=_("XSD validan"),
+    )
+    message = models.TextField(
+        blank=True,
+        verbose_name=_("Poruka"),
+    )
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("Završeno"),
+    )
+
+    class Meta:
+        verbose_name = _("Stavka regenerisanja")
+        verbose_name_plural = _("Stavke regenerisanja")
+        ordering = ["pk"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["run", "entity_type", "object_id"],
+                name="unique_bulk_regeneration_item",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["run", "status"]),
+        ]
+
+    def __str__(self):
+        return f"{self.entity_type} #{self.object_id} ({self.status})"
+
+
+class DepositStatus(models.TextChoices):
+    """Lifecycle of a Crossref deposit submission."""
+
+    PENDING = "PENDING", _("Na čekanju")
+    SUBMITTED = "SUBMITTED", _("Poslato")
+    COMPLETED = "COMPLETED", _("Deponovano")
+    FAILED = "FAILED", _("Neuspešno")
+
+
+class CrossrefDeposit(models.Model):
+    """
+    A doi_batch submitted to the Crossref deposit endpoint.
+
+    Created when an editor deposits an issue, component group or monograph
+    directly (entity_type/object_id set), or when the deposit queue packs
+    several queued entities into one batch (entity_type empty, see
+    CrossrefDepositItem). The XML sent is kept as an XMLBlob snapshot; the
+    submission log Crossref returns while polling is stored in ``response_log``.
+    """
+
+    publisher = models.ForeignKey(
+        "publishers.Publisher",
+        on_delete=models.CASCADE,
+        related_name="crossref_deposits",
+        verbose_name=_("Izdavač"),
+    )
+    entity_type = models.CharField(
+        _("Tip entiteta"),
+        max_length=20,
+        choices=ExportType.choices,
+        blank=True,
+    )
+    object_id = models.PositiveBigIntegerField(
+        _("ID entiteta"),
+        null=True,
+        blank=True,
+    )
+    xml_blob = models.ForeignKey(
+        XMLBlob,
+        on_delete=models.PROTECT,
+        related_name="deposits",
+        verbose_name=_("XML sadržaj"),
+    )
+    batch_id = models.CharField(
+        _("doi_batch_id"),
+        max_length=100,
+        db_index=True,
+    )
+    filename = models.CharField(
+        max_length=255,
+        verbose_name=_("Ime fajla"),
+    )
+    status = models.CharField(
+        _("Status"),
+        max_length=20,
+        choices=DepositStatus.choices,
+        default=DepositStatus.PENDING,
+    )
+    poll_attempts = models.PositiveSmallIntegerField(_("Broj provera"), default=0)
+    record_count = models.PositiveIntegerField(_("Zapisa"), default=0)
+    success_count = models.PositiveIntegerField(_("Uspešnih"), default=0)
+    warning_count = models.PositiveIntegerField(_("Upozorenja"), default=0)
+    failure_count = models.PositiveIntegerField(_("Neuspešnih"), default=0)
+    response_log = models.TextField(
+        blank=True,
+        verbose_name=_("Odgovor Crossref-a"),
+    )
+    submitted_by = models.ForeignKey(
+        "users.User",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="crossref_submissions",
+        verbose_name=_("Poslao"),
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Kreirano"),
+    )
+    submitted_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("Poslato"),
+    )
+    completed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("Završeno"),
+    )
+
+    class Meta:
+        verbose_name = _("Crossref depozit")
+        verbose_name_plural = _("Crossref depoziti")
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["entity_type", "object_id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.batch_id} ({self.status})"
+
+    @property
+    def is_finished(self) -> bool:
+        """True once Crossref processed the batch or the deposit failed."""
+        return self.status in (DepositStatus.COMPLETED, DepositStatus.FAILED)
+
+
+class CrossrefDepositItem(models.Model):
+    """
+    Entity queued for a combined Crossref deposit.
+
+    Pending items (no deposit yet) are packed per publisher and content
+    type into size-capped doi_batch documents by the deposit queue
+    (doi_portal.crossref.deposit_queue). ``dois`` lists the DOIs the item
+    contributed, so per-DOI results in the submission log can be mapped
+    back to the source entity.
+    """
+
+    publisher = models.ForeignKey(
+        "publishers.Publisher",
+        on_delete=models.CASCADE,
+        related_name="crossref_deposit_items",
+        verbose_name=_("Izdavač"),
+    )
+    deposit = models.ForeignKey(
+        CrossrefDeposit,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="items",
+        verbose_name=_("Depozit"),
+    )
+    entity_type = models.CharField(
+        _("Tip entiteta"),
+        max_length=20,
+        choices=ExportType.choices,
+    )
+    object_id = models.PositiveBigIntegerField(_("ID entiteta"))
+    content_type = models.CharField(
+        _("Tip sadržaja"),
+        max_length=30,
+        help_text=_("Element u doi_batch body (journal, book, conference, sa_component)"),
+    )
+    dois = models.JSONField(
+        _("DOI-jevi"),
+        default=list,
+        blank=True,
+    )
+    status = models.CharField(
+        _("Status"),
+        max_length=20,
+        choices=DepositStatus.choices,
+        default=DepositStatus.PENDING,
+    )
+    message = models.TextField(
+        blank=True,
+        verbose_name=_("Poruka"),
+    )
+    queued_by = models.ForeignKey(
+        "users.User",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="crossref_deposit_items",
+        verbose_name=_("Dodao"),
+    )
+    queued_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Dodato u red"),
+    )
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("Završeno"),
+    )
+
+    class Meta:
+        verbose_name = _("Stavka depozita")
+        verbose_name_plural = _("Stavke depozita")
+        ordering = ["queued_at", "pk"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["entity_type", "object_id"],
+                condition=models.Q(deposit__isnull=True),
+                name="unique_queued_deposit_item",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["entity_type", "object_id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.entity_type} #{self.object_id} ({self.status})"
+
+
+class DOIEntityType(models.TextChoices):
+    """Record types that own a DOI."""
+
+    ISSUE = "ISSUE", _("Izdanje")
+    ARTICLE = "ARTICLE", _("Članak")
+    MONOGRAPH = "MONOGRAPH", _("Monografija")
+    CHAPTER = "CHAPTER", _("Poglavlje")
+    COMPONENT = "COMPONENT", _("Komponenta")
+
+
+class RegisteredDOI(models.Model):
+    """
+    Full DOI (prefix/suffix) claimed by one issue, article, monograph,
+    chapter or component.
+
+    Rows are kept in sync by signal handlers (doi_portal.crossref.doi_registry)
+    inside the transaction that saves or deletes the record. DOIs are
+    stored lowercased as Crossref treats them case-insensitively. Every
+    claim gets a row so duplicates can be reported on both sides; the
+    first claimant is the primary owner, and a partial unique index
+    guarantees a single owner per DOI.
+    """
+
+    doi = models.CharField(
+        _("DOI"),
+        max_length=300,
+    )
+    publisher = models.ForeignKey(
+        "publishers.Publisher",
+        on_delete=models.CASCADE,
+        related_name="registered_dois",
+        verbose_name=_("Izdavač"),
+    )
+    entity_type = models.CharField(
+        _("Tip entiteta"),
+        max_length=20,
+        choices=DOIEntityType.choices,
+    )
+    object_id = models.PositiveBigIntegerField(_("ID entiteta"))
+    is_primary = models.BooleanField(
+        _("Vlasnik DOI-ja"),
+        default=True,
+        help_text=_("Prvi zapis koji je zauzeo DOI; ostali zapisi sa istim DOI-jem su duplikati"),
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_("Registrovano"),
+    )
+
+    class Meta:
+        verbose_name = _("Registrovani DOI")
+        verbose_name_plural = _("Registrovani DOI-jevi")
+        ordering = ["doi"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["entity_type", "object_id"],
+                name="unique_registered_doi_entity",
+            ),
+            models.UniqueConstraint(
+                fields=["doi"],
+                condition=models.Q(is_primary=True),
+                name="unique_primary_registered_doi",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["doi"]),
+        ]
+
+    def __str__(self):
+        return f"{self.doi} ({self.entity_type} #{self.object_id})"
+
 
 # Register with auditlog for tracking changes (Story 5.6 requirement)
 auditlog.register(CrossrefExport)
+auditlog.register(CrossrefExportBundle)
+auditlog.register(CrossrefDeposit, exclude_fields=["response_log"])
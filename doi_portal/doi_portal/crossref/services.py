@@ -7,31 +7,60 @@ Provides the CrossrefService class for generating Crossref XML.
 
 from __future__ import annotations
 
+import hashlib
+import io
+import json
+import threading
 import uuid
 from pathlib import Path
+from typing import IO
 from typing import TYPE_CHECKING
 from typing import Any
 
 from django.utils import timezone
 from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
 from jinja2 import FileSystemLoader
 from jinja2 import select_autoescape
 from markupsafe import Markup
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
     from datetime import datetime
 
+    from django.db.models import QuerySet
+
     from doi_portal.articles.models import Article
     from doi_portal.articles.models import Author
     from doi_portal.components.models import Component as ComponentModel
     from doi_portal.components.models import ComponentGroup
+    from doi_portal.crossref.validators import XSDValidationResult
     from doi_portal.issues.models import Issue
     from doi_portal.monographs.models import Monograph
 
-from doi_portal.core.markup import markup_to_crossref_xml, markup_to_jats_xml
+from doi_portal.core.markup import markup_to_crossref_xml
+from doi_portal.crossref.loaders import load_component_group_export_graph
+from doi_portal.crossref.loaders import load_issue_export_graph
+from doi_portal.crossref.loaders import load_monograph_export_graph
 from doi_portal.crossref.validation import ValidationResult
 
-__all__ = ["CrossrefService", "PreValidationService"]
+__all__ = [
+    "CrossrefService",
+    "PreValidationService",
+    "get_crossref_environment",
+    "warm_crossref_templates",
+    "write_xml_stream",
+]
+
+TEMPLATE_DIR = Path(__file__).parent / "templates" / "crossref"
+
+# Process-wide Jinja2 environment shared by all CrossrefService instances
+_environment: Environment | None = None
+_environment_lock = threading.Lock()
+# SHA-256 of template sources, used to version fragment cache keys
+_template_digests: dict[str, str] = {}
 
 
 def xml_escape(value: str | None) -> str:
@@ -107,6 +136,138 @@ def format_orcid_url(orcid: str | None) -> str:
     return f"https://orcid.org/{orcid_clean}"
 
 
+def content_fingerprint(*parts: Any) -> str:
+    """
+    Compute a stable SHA-256 fingerprint of JSON-serializable parts.
+
+    Dates and other non-JSON values are serialized with str(), and
+    dictionary keys are sorted, so equal content always yields the
+    same fingerprint.
+
+    Args:
+        *parts: Values to fingerprint (dicts, lists, strings, ...)
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _CountingWriter:
+    """Binary file-like wrapper that counts bytes written to the underlying sink."""
+
+    def __init__(self, sink: IO[bytes]) -> None:
+        self.sink = sink
+        self.written = 0
+
+    def write(self, data: bytes) -> int:
+        self.sink.write(data)
+        self.written += len(data)
+        return len(data)
+
+
+def write_xml_stream(chunks: Iterable[str], sink: IO[bytes]) -> int:
+    """
+    Write streamed XML chunks to a binary file-like sink as UTF-8.
+
+    Only one chunk is held in memory at a time, so arbitrarily large
+    documents can be written to files or storage backends.
+
+    Args:
+        chunks: Iterable of XML text chunks (e.g. from stream_xml())
+        sink: Binary file-like object with a write() method
+
+    Returns:
+        Number of bytes written
+    """
+    written = 0
+    for chunk in chunks:
+        data = chunk.encode("utf-8")
+        sink.write(data)
+        written += len(data)
+    return written
+
+
+def _build_environment() -> Environment:
+    """Create the Jinja2 environment used for Crossref XML templates."""
+    from django.conf import settings
+
+    bytecode_dir = getattr(settings, "CROSSREF_JINJA_BYTECODE_CACHE_DIR", None)
+    bytecode_cache = None
+    if bytecode_dir:
+        Path(bytecode_dir).mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(bytecode_dir))
+
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)),
+        autoescape=select_autoescape(
+            enabled_extensions=("xml", "j2"),
+            default_for_string=True,
+        ),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=bytecode_cache,
+        # Skip per-render mtime checks outside development
+        auto_reload=getattr(settings, "DEBUG", False),
+        cache_size=-1,
+    )
+
+    # Add custom filters
+    env.filters["xml_escape"] = xml_escape
+    env.filters["format_date"] = format_date
+    env.filters["format_orcid_url"] = format_orcid_url
+    env.filters["format_month"] = format_month
+    env.filters["format_day"] = format_day
+    return env
+
+
+def get_crossref_environment() -> Environment:
+    """
+    Return the process-wide Jinja2 environment for Crossref templates.
+
+    Built once per process; compiled templates are kept in the
+    environment's template cache and, when CROSSREF_JINJA_BYTECODE_CACHE_DIR
+    is set, persisted as bytecode so new worker processes skip compilation.
+
+    Returns:
+        Shared Jinja2 Environment
+    """
+    global _environment  # noqa: PLW0603
+    if _environment is None:
+        with _environment_lock:
+            if _environment is None:
+                _environment = _build_environment()
+    return _environment
+
+
+def warm_crossref_templates() -> list[str]:
+    """
+    Load and compile every Crossref template into the shared environment.
+
+    Called from CrossrefConfig.ready() so web and Celery workers forked
+    afterwards inherit compiled templates.
+
+    Returns:
+        Names of the templates that were loaded
+    """
+    env = get_crossref_environment()
+    names = env.list_templates(extensions=["j2"])
+    for name in names:
+        env.get_template(name)
+    return names
+
+
+def _template_digest(env: Environment, name: str) -> str:
+    """Return the SHA-256 of a template's source, memoized unless auto_reload is on."""
+    digest = None if env.auto_reload else _template_digests.get(name)
+    if digest is None:
+        source, _, _ = env.loader.get_source(env, name)
+        digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        _template_digests[name] = digest
+    return digest
+
+
 class CrossrefService:
     """
     Service class for generating Crossref XML.
@@ -123,6 +284,20 @@ class CrossrefService:
         "OTHER": "journal_article.xml.j2",  # Default to journal format
     }
 
+    # Per-article fragment template for each issue-level template
+    ITEM_TEMPLATE_MAP = {
+        "journal_article.xml.j2": "journal_article_item.xml.j2",
+        "conference_paper.xml.j2": "conference_paper_item.xml.j2",
+    }
+
+    # Cache key prefix for rendered per-article XML fragments
+    FRAGMENT_CACHE_PREFIX = "crossref:fragment"
+
+    # Issue XML generation engines: Jinja2 templates or the lxml builder
+    ENGINE_JINJA = "jinja"
+    ENGINE_LXML = "lxml"
+    ENGINES = (ENGINE_JINJA, ENGINE_LXML)
+
     # Required fields by publication type
     REQUIRED_FIELDS = {
         "JOURNAL": {
@@ -140,27 +315,8 @@ class CrossrefService:
     }
 
     def __init__(self) -> None:
-        """Initialize the CrossrefService with Jinja2 environment."""
-        # Template directory
-        template_dir = Path(__file__).parent / "templates" / "crossref"
-
-        # Configure Jinja2 environment for XML
-        self.env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=select_autoescape(
-                enabled_extensions=("xml", "j2"),
-                default_for_string=True,
-            ),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-
-        # Add custom filters
-        self.env.filters["xml_escape"] = xml_escape
-        self.env.filters["format_date"] = format_date
-        self.env.filters["format_orcid_url"] = format_orcid_url
-        self.env.filters["format_month"] = format_month
-        self.env.filters["format_day"] = format_day
+        """Initialize the CrossrefService with the shared Jinja2 environment."""
+        self.env = get_crossref_environment()
 
     def generate_doi_batch_id(self) -> str:
         """
@@ -299,20 +455,19 @@ class CrossrefService:
         publication = issue.publication
         publisher = publication.publisher
 
-        # Build articles context with authors and affiliations
+        # Build articles context with authors and affiliations.
+        # The loader prefetches ordered children, so only .all() is used below.
         articles_data = []
-        for article in issue.articles.filter(is_deleted=False).prefetch_related(
-            "authors__affiliations", "fundings", "relations"
-        ):
+        for article in load_issue_export_graph(issue):
             authors_data = []
-            for author in article.authors.all().order_by("order"):
+            for author in article.authors.all():
                 affiliations_data = [
                     {
                         "institution_name": aff.institution_name,
                         "institution_ror_id": aff.institution_ror_id,
                         "department": aff.department,
                     }
-                    for aff in author.affiliations.all().order_by("order")
+                    for aff in author.affiliations.all()
                 ]
                 authors_data.append({
                     "given_name": author.given_name,
@@ -327,12 +482,12 @@ class CrossrefService:
             # Markup() prevents Jinja2 autoescape from double-escaping face markup tags
             articles_data.append({
                 "pk": article.pk,
-                "title": Markup(markup_to_crossref_xml(article.title)),
-                "subtitle": Markup(markup_to_crossref_xml(article.subtitle)),
-                "original_language_title": Markup(markup_to_crossref_xml(article.original_language_title)),
-                "original_language_subtitle": Markup(markup_to_crossref_xml(article.original_language_subtitle)),
+                "title": Markup(article.rendered_value("title", "crossref")),
+                "subtitle": Markup(article.rendered_value("subtitle", "crossref")),
+                "original_language_title": Markup(article.rendered_value("original_language_title", "crossref")),
+                "original_language_subtitle": Markup(article.rendered_value("original_language_subtitle", "crossref")),
                 "original_language_title_language": article.original_language_title_language,
-                "abstract": Markup(markup_to_jats_xml(article.abstract)),
+                "abstract": Markup(article.rendered_value("abstract", "jats")),
                 "doi_suffix": article.doi_suffix,
                 "first_page": article.first_page,
                 "last_page": article.last_page,
@@ -353,7 +508,7 @@ class CrossrefService:
                         "funder_doi": self._normalize_funder_doi(f.funder_doi),
                         "award_number": f.award_number,
                     }
-                    for f in article.fundings.order_by("order")
+                    for f in article.fundings.all()
                 ],
                 "relations": [
                     {
@@ -363,7 +518,7 @@ class CrossrefService:
                         "description": r.description,
                         "scope": r.relation_scope,
                     }
-                    for r in article.relations.order_by("order")
+                    for r in article.relations.all()
                 ],
             })
 
@@ -413,26 +568,177 @@ class CrossrefService:
         }
 
 
-    def generate_xml(self, issue: Issue) -> str:
+    def _render_article_fragments(
+        self,
+        template_name: str,
+        context: dict[str, Any],
+    ) -> list[Markup]:
         """
-        Generate Crossref XML for all articles in an issue.
+        Render per-article XML fragments, reusing cached ones.
+
+        Each fragment is cached under a fingerprint of the article context
+        (article, authors, affiliations, fundings, relations) combined with
+        the shared issue-level inputs and the fragment template source.
+        Only articles whose fingerprint is not cached are re-rendered.
+
+        Args:
+            template_name: Issue-level template name
+            context: Full template context from _build_context()
+
+        Returns:
+            Rendered fragments in article order
+        """
+        from django.conf import settings
+        from django.core.cache import cache
+
+        item_template_name = self.ITEM_TEMPLATE_MAP[template_name]
+        item_template = self.env.get_template(item_template_name)
+        shared_fingerprint = content_fingerprint(
+            _template_digest(self.env, item_template_name),
+            context["site_url"],
+            context["publisher"],
+            context["publication"],
+            context["issue"],
+        )
+
+        articles = context["articles"]
+        keys = [
+            f"{self.FRAGMENT_CACHE_PREFIX}:{content_fingerprint(shared_fingerprint, article)}"
+            for article in articles
+        ]
+        cached = cache.get_many(keys)
+
+        fragments = []
+        rendered = {}
+        for key, article in zip(keys, articles, strict=True):
+            fragment = cached.get(key)
+            if fragment is None:
+                fragment = item_template.render(**context, article=article)
+                rendered[key] = fragment
+            # Markup() prevents autoescape from escaping the pre-rendered XML
+            fragments.append(Markup(fragment))
+
+        if rendered:
+            timeout = getattr(settings, "CROSSREF_FRAGMENT_CACHE_TIMEOUT", 7 * 24 * 60 * 60)
+            cache.set_many(rendered, timeout)
+
+        return fragments
+
+    def stream_xml(self, issue: Issue) -> Iterator[str]:
+        """
+        Stream Crossref XML for all articles in an issue.
+
+        The context and per-article fragments are built eagerly (so
+        database errors surface here), while the issue-level template is
+        rendered lazily chunk by chunk via Jinja2's generate().
 
         Args:
             issue: Issue model instance with related articles
 
         Returns:
-            XML string ready for Crossref deposit
+            Iterator of XML text chunks
         """
         # Determine template based on publication type
         publication_type = issue.publication.publication_type
         template_name = self._get_template_name(publication_type)
 
-        # Build context
+        # Build context and stitch cached per-article fragments
         context = self._build_context(issue)
+        context["article_fragments"] = self._render_article_fragments(template_name, context)
 
-        # Render template
+        # Render template lazily
         template = self.env.get_template(template_name)
-        return template.render(**context)
+        return template.generate(**context)
+
+    def generate_xml(self, issue: Issue, engine: str = ENGINE_JINJA) -> str:
+        """
+        Generate Crossref XML for all articles in an issue.
+
+        Args:
+            issue: Issue model instance with related articles
+            engine: "jinja" (templates) or "lxml" (element builder)
+
+        Returns:
+            XML string ready for Crossref deposit
+        """
+        if engine == self.ENGINE_JINJA:
+            return "".join(self.stream_xml(issue))
+        buffer = io.BytesIO()
+        self.write_xml(issue, buffer, engine=engine)
+        return buffer.getvalue().decode("utf-8")
+
+    def write_xml(self, issue: Issue, sink: IO[bytes], engine: str = ENGINE_JINJA) -> int:
+        """
+        Render Crossref XML for an issue directly into a binary sink.
+
+        The lxml engine writes one article subtree at a time with
+        etree.xmlfile, so the full document is never held in memory.
+
+        Args:
+            issue: Issue model instance with related articles
+            sink: Binary file-like object (file, storage file, BytesIO)
+            engine: "jinja" (templates) or "lxml" (element builder)
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            ValueError: If engine is not one of ENGINES
+        """
+        if engine == self.ENGINE_JINJA:
+            return write_xml_stream(self.stream_xml(issue), sink)
+        if engine != self.ENGINE_LXML:
+            msg = f"Nepoznat XML engine: {engine}"
+            raise ValueError(msg)
+
+        from doi_portal.crossref.builders import write_issue_xml
+
+        counting_sink = _CountingWriter(sink)
+        write_issue_xml(
+            self._build_context(issue),
+            counting_sink,
+            conference=self._get_template_name(issue.publication.publication_type) == self.TEMPLATE_MAP["CONFERENCE"],
+        )
+        return counting_sink.written
+
+    def store_generated_xml(
+        self,
+        entity: Issue | ComponentGroup | Monograph,
+        xml: str,
+        validation_result: XSDValidationResult,
+    ) -> None:
+        """
+        Store generated XML and its XSD validation outcome on an entity.
+
+        Args:
+            entity: Issue, ComponentGroup or Monograph instance
+            xml: Generated XML string
+            validation_result: XSD validation outcome for xml
+        """
+        from django.db import transaction
+
+        from doi_portal.crossref.xml_preview import build_line_index
+
+        with transaction.atomic():
+            entity.crossref_xml = xml
+            entity.xml_generated_at = timezone.now()
+            entity.crossref_xml_line_index = build_line_index(xml, generated_at=entity.xml_generated_at)
+            entity.xml_generation_status = "completed"
+
+            # Store XSD validation results (Story 5.4)
+            entity.xsd_valid = validation_result.is_valid
+            entity.xsd_errors = [e.to_dict() for e in validation_result.errors]
+            entity.xsd_validated_at = validation_result.validated_at
+
+            entity.save(update_fields=[
+                "crossref_xml",
+                "crossref_xml_line_index",
+                "xml_generated_at",
+                "xml_generation_status",
+                "xsd_valid",
+                "xsd_errors",
+                "xsd_validated_at",
+            ])
 
     def generate_and_store_xml(self, issue: Issue) -> tuple[bool, str]:
         """
@@ -441,9 +747,10 @@ class CrossrefService:
         Story 5.3: XML Generation for All Publication Types.
         Story 5.4: XSD Validation.
 
-        Generates XML using the existing generate_xml() method,
-        stores result in Issue model fields, records timestamp,
-        and runs XSD validation.
+        Writes XML via write_xml() into an XMLValidationSink, which feeds
+        each chunk to the XSD validator's incremental parser so the
+        document is parsed once and assembled in a single buffer, then
+        stores result and validation outcome in Issue model fields.
 
         Uses transaction.atomic to ensure database consistency.
 
@@ -455,32 +762,14 @@ class CrossrefService:
         """
         from django.db import transaction
 
-        from doi_portal.crossref.validators import validate_xml
+        from doi_portal.crossref.validators import XMLValidationSink
 
         try:
-            xml = self.generate_xml(issue)
-
-            # Run XSD validation (Story 5.4)
-            validation_result = validate_xml(xml)
-
-            with transaction.atomic():
-                issue.crossref_xml = xml
-                issue.xml_generated_at = timezone.now()
-                issue.xml_generation_status = "completed"
-
-                # Store XSD validation results (Story 5.4)
-                issue.xsd_valid = validation_result.is_valid
-                issue.xsd_errors = [e.to_dict() for e in validation_result.errors]
-                issue.xsd_validated_at = validation_result.validated_at
-
-                issue.save(update_fields=[
-                    "crossref_xml",
-                    "xml_generated_at",
-                    "xml_generation_status",
-                    "xsd_valid",
-                    "xsd_errors",
-                    "xsd_validated_at",
-                ])
+            # Render into the storage sink, running XSD validation (Story 5.4) in a single parse
+            sink = XMLValidationSink()
+            self.write_xml(issue, sink)
+            xml, validation_result = sink.finish()
+            self.store_generated_xml(issue, xml, validation_result)
             return (True, xml)
         except Exception as e:
             # Use separate transaction for failure status update
@@ -526,8 +815,9 @@ class CrossrefService:
         Returns:
             Context dictionary for sa_component template rendering
         """
+        # The loader prefetches ordered children, so only .all() is used below
         components_data = []
-        for c in component_group.components.filter(is_deleted=False).prefetch_related("contributors").order_by("order"):
+        for c in load_component_group_export_graph(component_group):
             contributors_data = [
                 {
                     "given_name": ct.given_name,
@@ -537,7 +827,7 @@ class CrossrefService:
                     "sequence": ct.sequence,
                     "contributor_role": ct.contributor_role,
                 }
-                for ct in c.contributors.filter(is_deleted=False).order_by("order")
+                for ct in c.contributors.all()
             ]
             components_data.append({
                 "parent_relation": c.parent_relation,
@@ -558,6 +848,20 @@ class CrossrefService:
             "components": components_data,
         }
 
+    def stream_component_xml(self, component_group: "ComponentGroup") -> Iterator[str]:
+        """
+        Stream Crossref XML for a component group.
+
+        Args:
+            component_group: ComponentGroup model instance
+
+        Returns:
+            Iterator of XML text chunks
+        """
+        context = self._build_component_context(component_group)
+        template = self.env.get_template(self.SA_COMPONENT_TEMPLATE)
+        return template.generate(**context)
+
     def generate_component_xml(self, component_group: "ComponentGroup") -> str:
         """
         Generate Crossref XML for a component group.
@@ -568,9 +872,20 @@ class CrossrefService:
         Returns:
             XML string ready for Crossref deposit
         """
-        context = self._build_component_context(component_group)
-        template = self.env.get_template(self.SA_COMPONENT_TEMPLATE)
-        return template.render(**context)
+        return "".join(self.stream_component_xml(component_group))
+
+    def write_component_xml(self, component_group: "ComponentGroup", sink: IO[bytes]) -> int:
+        """
+        Render component group XML directly into a binary sink.
+
+        Args:
+            component_group: ComponentGroup model instance
+            sink: Binary file-like object
+
+        Returns:
+            Number of bytes written
+        """
+        return write_xml_stream(self.stream_component_xml(component_group), sink)
 
     def generate_and_store_component_xml(self, component_group: "ComponentGroup") -> tuple[bool, str]:
         """
@@ -584,31 +899,14 @@ class CrossrefService:
         """
         from django.db import transaction
 
-        from doi_portal.crossref.validators import validate_xml
+        from doi_portal.crossref.validators import XMLValidationSink
 
         try:
-            xml = self.generate_component_xml(component_group)
-
-            # Run XSD validation
-            validation_result = validate_xml(xml)
-
-            with transaction.atomic():
-                component_group.crossref_xml = xml
-                component_group.xml_generated_at = timezone.now()
-                component_group.xml_generation_status = "completed"
-
-                component_group.xsd_valid = validation_result.is_valid
-                component_group.xsd_errors = [e.to_dict() for e in validation_result.errors]
-                component_group.xsd_validated_at = validation_result.validated_at
-
-                component_group.save(update_fields=[
-                    "crossref_xml",
-                    "xml_generated_at",
-                    "xml_generation_status",
-                    "xsd_valid",
-                    "xsd_errors",
-                    "xsd_validated_at",
-                ])
+            # Render into the storage sink, running XSD validation in a single parse
+            sink = XMLValidationSink()
+            self.write_component_xml(component_group, sink)
+            xml, validation_result = sink.finish()
+            self.store_generated_xml(component_group, xml, validation_result)
             return (True, xml)
         except Exception as e:
             with transaction.atomic():
@@ -653,23 +951,23 @@ class CrossrefService:
         Returns:
             Context dictionary for book_monograph template rendering
         """
-        from doi_portal.monographs.models import MonographStatus
-
         site_url = self._get_site_url()
         publisher = monograph.publisher
 
+        # The loader prefetches ordered children of the monograph and its
+        # published chapters, so only .all() is used below
+        chapters = load_monograph_export_graph(monograph)
+
         # Build monograph-level contributors
         contributors_data = []
-        for contributor in monograph.contributors.filter(
-            is_deleted=False,
-        ).prefetch_related("affiliations").order_by("order"):
+        for contributor in monograph.contributors.all():
             affiliations_data = [
                 {
                     "institution_name": aff.institution_name,
                     "institution_ror_id": aff.institution_ror_id,
                     "department": aff.department,
                 }
-                for aff in contributor.affiliations.all().order_by("order")
+                for aff in contributor.affiliations.all()
             ]
             contributors_data.append({
                 "given_name": contributor.given_name,
@@ -689,7 +987,7 @@ class CrossrefService:
                 "funder_doi": self._normalize_funder_doi(f.funder_doi),
                 "award_number": f.award_number,
             }
-            for f in monograph.fundings.order_by("order")
+            for f in monograph.fundings.all()
         ]
 
         # Build monograph-level relations
@@ -701,7 +999,7 @@ class CrossrefService:
                 "description": r.description,
                 "scope": r.relation_scope,
             }
-            for r in monograph.relations.order_by("order")
+            for r in monograph.relations.all()
         ]
 
         # Build resource URL for monograph
@@ -712,22 +1010,17 @@ class CrossrefService:
 
         # Build chapters (PUBLISHED only)
         chapters_data = []
-        for chapter in monograph.chapters.filter(
-            status=MonographStatus.PUBLISHED,
-            is_deleted=False,
-        ).prefetch_related(
-            "contributors__affiliations", "fundings", "relations",
-        ).order_by("order"):
+        for chapter in chapters:
             # Chapter contributors
             chapter_contributors = []
-            for cc in chapter.contributors.filter(is_deleted=False).order_by("order"):
+            for cc in chapter.contributors.all():
                 cc_affiliations = [
                     {
                         "institution_name": aff.institution_name,
                         "institution_ror_id": aff.institution_ror_id,
                         "department": aff.department,
                     }
-                    for aff in cc.affiliations.all().order_by("order")
+                    for aff in cc.affiliations.all()
                 ]
                 chapter_contributors.append({
                     "given_name": cc.given_name,
@@ -747,7 +1040,7 @@ class CrossrefService:
                     "funder_doi": self._normalize_funder_doi(f.funder_doi),
                     "award_number": f.award_number,
                 }
-                for f in chapter.fundings.order_by("order")
+                for f in chapter.fundings.all()
             ]
 
             # Chapter relations
@@ -759,16 +1052,16 @@ class CrossrefService:
                     "description": r.description,
                     "scope": r.relation_scope,
                 }
-                for r in chapter.relations.order_by("order")
+                for r in chapter.relations.all()
             ]
 
             # Chapter resource URL
             chapter_resource_url = f"{site_url}/monographs/{monograph.pk}/chapters/{chapter.pk}/"
 
             chapters_data.append({
-                "title": Markup(markup_to_crossref_xml(chapter.title)),
-                "subtitle": Markup(markup_to_crossref_xml(chapter.subtitle)),
-                "abstract": Markup(markup_to_jats_xml(chapter.abstract)),
+                "title": Markup(chapter.rendered_value("title", "crossref")),
+                "subtitle": Markup(chapter.rendered_value("subtitle", "crossref")),
+                "abstract": Markup(chapter.rendered_value("abstract", "jats")),
                 "language": chapter.language,
                 "first_page": chapter.first_page,
                 "last_page": chapter.last_page,
@@ -790,9 +1083,9 @@ class CrossrefService:
                 "doi_prefix": publisher.doi_prefix,
             },
             "monograph": {
-                "title": Markup(markup_to_crossref_xml(monograph.title)),
-                "subtitle": Markup(markup_to_crossref_xml(monograph.subtitle)),
-                "abstract": Markup(markup_to_jats_xml(monograph.abstract)),
+                "title": Markup(monograph.rendered_value("title", "crossref")),
+                "subtitle": Markup(monograph.rendered_value("subtitle", "crossref")),
+                "abstract": Markup(monograph.rendered_value("abstract", "jats")),
                 "language": monograph.language or "en",
                 "edition_number": monograph.edition_number,
                 "year": monograph.year,
@@ -811,6 +1104,20 @@ class CrossrefService:
             "chapters": chapters_data,
         }
 
+    def stream_monograph_xml(self, monograph: "Monograph") -> Iterator[str]:
+        """
+        Stream Crossref XML for a monograph.
+
+        Args:
+            monograph: Monograph model instance
+
+        Returns:
+            Iterator of XML text chunks
+        """
+        context = self._build_monograph_context(monograph)
+        template = self.env.get_template(self.MONOGRAPH_TEMPLATE)
+        return template.generate(**context)
+
     def generate_monograph_xml(self, monograph: "Monograph") -> str:
         """
         Generate Crossref XML string for a monograph.
@@ -821,9 +1128,20 @@ class CrossrefService:
         Returns:
             XML string ready for Crossref deposit
         """
-        context = self._build_monograph_context(monograph)
-        template = self.env.get_template(self.MONOGRAPH_TEMPLATE)
-        return template.render(**context)
+        return "".join(self.stream_monograph_xml(monograph))
+
+    def write_monograph_xml(self, monograph: "Monograph", sink: IO[bytes]) -> int:
+        """
+        Render monograph XML directly into a binary sink.
+
+        Args:
+            monograph: Monograph model instance
+            sink: Binary file-like object
+
+        Returns:
+            Number of bytes written
+        """
+        return write_xml_stream(self.stream_monograph_xml(monograph), sink)
 
     def generate_and_store_monograph_xml(self, monograph: "Monograph") -> tuple[bool, str]:
         """
@@ -837,31 +1155,14 @@ class CrossrefService:
         """
         from django.db import transaction
 
-        from doi_portal.crossref.validators import validate_xml
+        from doi_portal.crossref.validators import XMLValidationSink
 
         try:
-            xml = self.generate_monograph_xml(monograph)
-
-            # Run XSD validation
-            validation_result = validate_xml(xml)
-
-            with transaction.atomic():
-                monograph.crossref_xml = xml
-                monograph.xml_generated_at = timezone.now()
-                monograph.xml_generation_status = "completed"
-
-                monograph.xsd_valid = validation_result.is_valid
-                monograph.xsd_errors = [e.to_dict() for e in validation_result.errors]
-                monograph.xsd_validated_at = validation_result.validated_at
-
-                monograph.save(update_fields=[
-                    "crossref_xml",
-                    "xml_generated_at",
-                    "xml_generation_status",
-                    "xsd_valid",
-                    "xsd_errors",
-                    "xsd_validated_at",
-                ])
+            # Render into the storage sink, running XSD validation in a single parse
+            sink = XMLValidationSink()
+            self.write_monograph_xml(monograph, sink)
+            xml, validation_result = sink.finish()
+            self.store_generated_xml(monograph, xml, validation_result)
             return (True, xml)
         except Exception as e:
             with transaction.atomic():
@@ -877,8 +1178,24 @@ class PreValidationService:
     Story 5.2: Pre-Generation Validation & Warnings.
     Validates all required fields before XML generation to ensure
     valid Crossref submissions.
+
+    Each validate_* entry point loads its records once and runs every
+    check against that snapshot, so the number of queries does not grow
+    with the number of articles, components or chapters.
+
+    Record-level checks (an article with its authors and relations, a
+    component or chapter with its contributors) are persisted on the
+    record (ValidationStateMixin) and recomputed only for records marked
+    dirty by doi_portal.crossref.signals; checks spanning several records
+    (DOI suffix collisions, chapter numbering, free-to-read consistency)
+    are evaluated on every run.
     """
 
+    # Stands in for the chapter position in stored chapter messages
+    CHAPTER_NUM_PLACEHOLDER = "#"
+
+    STATE_FIELDS = ["validation_issues", "validation_dirty", "validated_at"]
+
     def validate_issue(self, issue: Issue) -> ValidationResult:
         """
         Run all pre-generation validations for an issue.
@@ -890,9 +1207,15 @@ class PreValidationService:
             ValidationResult with all errors and warnings
         """
         from doi_portal.articles.models import ArticleStatus
+        from doi_portal.issues.models import Issue as IssueModel
+        from doi_portal.publications.models import Publication
 
         result = ValidationResult()
 
+        # Publication and publisher (DOI prefix for registry lookups) in one query
+        if not IssueModel.publication.is_cached(issue):
+            issue.publication = Publication._base_manager.select_related("publisher").get(pk=issue.publication_id)
+
         # Check depositor settings first (blocking)
         result.merge(self._validate_depositor_settings())
 
@@ -905,16 +1228,13 @@ class PreValidationService:
             result.merge(self._validate_journal_fields(issue))
         elif pub_type == "CONFERENCE":
             result.merge(self._validate_conference_fields(issue))
-        # Validate issue DOI suffix
-        result.merge(self._validate_issue_doi_suffix(issue))
 
-        # Validate all PUBLISHED articles only
-        published_articles = issue.articles.filter(
-            status=ArticleStatus.PUBLISHED,
-            is_deleted=False,
-        ).prefetch_related("relations")
-        for article in published_articles:
-            result.merge(self._validate_article(article))
+        # Validate issue DOI suffix and PUBLISHED articles only
+        articles_result, published_articles = self.validate_articles(
+            issue,
+            issue.articles.filter(status=ArticleStatus.PUBLISHED, is_deleted=False),
+        )
+        result.merge(articles_result)
 
         # Validate free_to_read consistency
         result.merge(self._validate_free_to_read_consistency(issue, published_articles))
@@ -949,33 +1269,156 @@ class PreValidationService:
 
         return result
 
-    def _validate_issue_doi_suffix(self, issue: Issue) -> ValidationResult:
+    def validate_articles(
+        self,
+        issue: Issue,
+        articles: "QuerySet[Article]",
+    ) -> tuple[ValidationResult, list[Article]]:
+        """
+        Validate the issue DOI suffix and a set of its articles.
+
+        Stored article results are refreshed for dirty articles only.
+
+        Query budget: 1 (articles) + 1 (suffix collisions), plus
+        3 (dirty articles, authors, relations) + bulk update when any
+        article is dirty.
+
+        Args:
+            issue: Issue the articles belong to
+            articles: Article queryset to validate
+
+        Returns:
+            Tuple of (ValidationResult, loaded articles)
+        """
+        from doi_portal.articles.models import Article as ArticleModel
+
+        result = ValidationResult()
+        articles = list(articles)
+        self.refresh_validation_states(
+            articles,
+            ArticleModel.objects.prefetch_related("authors", "relations"),
+            self._validate_article,
+        )
+        collisions = self.find_doi_collisions(issue, articles)
+
+        result.merge(self._validate_issue_doi_suffix(issue, collisions))
+        for article in articles:
+            result.merge(self.stored_validation_result(article))
+            result.merge(self._validate_article_doi_suffix_unique(article, collisions))
+        return result, articles
+
+    def refresh_validation_states(
+        self,
+        records: list,
+        queryset: "QuerySet",
+        validate: "Callable[[Any], ValidationResult]",
+    ) -> None:
+        """
+        Recompute and store the validation result of dirty records.
+
+        Dirty records are reloaded in one query through queryset (which
+        prefetches the children the checks need) and written back with a
+        single bulk_update.
+
+        Args:
+            records: Loaded records; only those with validation_dirty are recomputed
+            queryset: Queryset of the record model with the required prefetches
+            validate: Record-level check returning a ValidationResult
+        """
+        dirty = {record.pk: record for record in records if record.validation_dirty}
+        if not dirty:
+            return
+
+        validated_at = timezone.now()
+        updated = []
+        for loaded in queryset.filter(pk__in=dirty):
+            record = dirty[loaded.pk]
+            record.validation_issues = [issue.to_dict() for issue in validate(loaded).issues]
+            record.validation_dirty = False
+            record.validated_at = validated_at
+            updated.append(record)
+        queryset.model._base_manager.bulk_update(updated, self.STATE_FIELDS)
+
+    def stored_validation_result(self, record, chapter_num: int | None = None) -> ValidationResult:
+        """
+        Rebuild a ValidationResult from a record's stored issues.
+
+        Args:
+            record: Model instance with ValidationStateMixin fields
+            chapter_num: Chapter position replacing CHAPTER_NUM_PLACEHOLDER in chapter messages
+
+        Returns:
+            ValidationResult with the stored issues
+        """
+        from doi_portal.crossref.validation import ValidationIssue
+
+        result = ValidationResult()
+        for data in record.validation_issues:
+            issue = ValidationIssue.from_dict(data)
+            if chapter_num is not None:
+                issue.message = issue.message.replace(
+                    f"Poglavlje {self.CHAPTER_NUM_PLACEHOLDER}",
+                    f"Poglavlje {chapter_num}",
+                    1,
+                )
+            result.issues.append(issue)
+        return result
+
+    def find_doi_collisions(self, issue: Issue, articles: list[Article]) -> set[tuple[str, int]]:
+        """
+        Find the issue and articles whose DOI is claimed by another record.
+
+        The full DOIs are checked against the DOI registry in one indexed
+        query, so any issue, article, monograph, chapter or component
+        using the same DOI counts as a collision.
+
+        Args:
+            issue: Issue being validated
+            articles: Articles of the issue being validated
+
+        Returns:
+            Set of (DOIEntityType, pk) with a duplicate DOI
+        """
+        from doi_portal.crossref.doi_registry import find_doi_collisions
+        from doi_portal.crossref.doi_registry import full_doi
+        from doi_portal.crossref.models import DOIEntityType
+
+        prefix = issue.publication.publisher.doi_prefix
+        claims = [(DOIEntityType.ISSUE, issue.pk, full_doi(prefix, issue.doi_suffix))]
+        claims.extend(
+            (DOIEntityType.ARTICLE, article.pk, full_doi(prefix, article.doi_suffix)) for article in articles
+        )
+        return find_doi_collisions(claims)
+
+    def _validate_issue_doi_suffix(
+        self,
+        issue: Issue,
+        collisions: set[tuple[str, int]] | None = None,
+    ) -> ValidationResult:
         """
         Validate issue-level DOI suffix: check for duplicates and resource URL.
 
         Args:
             issue: Issue to validate
+            collisions: Result of find_doi_collisions() (queried if None)
 
         Returns:
             ValidationResult with issue DOI suffix errors/warnings
         """
-        from doi_portal.issues.models import Issue as IssueModel
-
         result = ValidationResult()
 
         if not issue.doi_suffix:
             return result
 
-        # Check for duplicate DOI suffix within same publisher
-        publisher = issue.publication.publisher
-        duplicates = IssueModel.objects.filter(
-            doi_suffix=issue.doi_suffix,
-            publication__publisher=publisher,
-        ).exclude(pk=issue.pk)
+        from doi_portal.crossref.models import DOIEntityType
+
+        # Check for duplicate DOI in the registry
+        if collisions is None:
+            collisions = self.find_doi_collisions(issue, [])
 
-        if duplicates.exists():
+        if (DOIEntityType.ISSUE, issue.pk) in collisions:
             result.add_error(
-                message=f"DOI sufiks '{issue.doi_suffix}' se već koristi u drugom izdanju istog izdavača",
+                message=f"DOI sufiks '{issue.doi_suffix}' se već koristi u drugom zapisu istog izdavača",
                 field_name="doi_suffix",
                 fix_url=f"/dashboard/issues/{issue.pk}/edit/",
             )
@@ -1071,12 +1514,42 @@ class PreValidationService:
 
         return result
 
+    def _validate_article_doi_suffix_unique(
+        self,
+        article: Article,
+        collisions: set[tuple[str, int]],
+    ) -> ValidationResult:
+        """
+        Check that an article DOI is not used by another record.
+
+        Args:
+            article: Article to validate
+            collisions: Result of find_doi_collisions()
+
+        Returns:
+            ValidationResult with a duplicate suffix error
+        """
+        from doi_portal.crossref.models import DOIEntityType
+
+        result = ValidationResult()
+        if (DOIEntityType.ARTICLE, article.pk) in collisions:
+            result.add_error(
+                message=(
+                    f"DOI sufiks '{article.doi_suffix}' se već koristi u drugom zapisu "
+                    f"istog izdavača (članak: {article.title or article.pk})"
+                ),
+                field_name="doi_suffix",
+                article_id=article.pk,
+                fix_url=f"/dashboard/articles/{article.pk}/edit/",
+            )
+        return result
+
     def _validate_article(self, article: Article) -> ValidationResult:
         """
         Validate article-level fields.
 
         Args:
-            article: Article to validate
+            article: Article to validate, with authors and relations prefetched
 
         Returns:
             ValidationResult with article errors
@@ -1101,8 +1574,8 @@ class PreValidationService:
                 fix_url=f"/dashboard/articles/{article.pk}/edit/",
             )
 
-        # At least one author is required
-        authors = list(article.authors.all().order_by("order"))
+        # At least one author is required (Author.Meta orders by "order")
+        authors = list(article.authors.all())
         if not authors:
             result.add_error(
                 message=f"Članak nema autore ({article.title or article.pk})",
@@ -1245,12 +1718,12 @@ class PreValidationService:
         indicating potential inconsistency.
         """
         result = ValidationResult()
-        total = published_articles.count()
+        total = len(published_articles)
 
         if total <= 1:
             return result
 
-        free_count = published_articles.filter(free_to_read=True).count()
+        free_count = sum(1 for article in published_articles if article.free_to_read)
 
         if 0 < free_count < total:
             result.add_warning(
@@ -1279,24 +1752,86 @@ class PreValidationService:
         # Check depositor settings first (blocking)
         result.merge(self._validate_depositor_settings())
 
+        from doi_portal.components.models import Component
+        from doi_portal.crossref.models import DOIEntityType
+
+        # Snapshot of non-deleted components; stored results refreshed for dirty ones
+        components = list(component_group.components.filter(is_deleted=False))
+        self.refresh_validation_states(
+            components,
+            Component.objects.select_related("component_group").prefetch_related("contributors"),
+            self._validate_component,
+        )
+
         # Check component group fields
-        result.merge(self._validate_component_group_fields(component_group))
+        result.merge(self._validate_component_group_fields(component_group, components))
 
         # Check parent DOI exists
         result.merge(self._validate_component_parent_doi_exists(component_group))
 
         # Validate each non-deleted component
-        for component in component_group.components.filter(is_deleted=False):
-            result.merge(self._validate_component(component))
+        for component in components:
+            result.merge(self.stored_validation_result(component))
+
+        # Check component DOIs against the DOI registry
+        result.merge(
+            self._validate_doi_collisions(
+                component_group.publisher.doi_prefix,
+                [
+                    (
+                        DOIEntityType.COMPONENT,
+                        component,
+                        f"komponenta {component.title or component.pk}",
+                        f"/dashboard/components/groups/{component_group.pk}/components/{component.pk}/edit/",
+                    )
+                    for component in components
+                ],
+            ),
+        )
 
         return result
 
-    def _validate_component_group_fields(self, cg: "ComponentGroup") -> ValidationResult:
+    def _validate_doi_collisions(self, prefix: str, records: list[tuple[str, Any, str, str]]) -> ValidationResult:
+        """
+        Report records whose DOI is claimed by another record.
+
+        All DOIs are checked against the DOI registry in one query.
+
+        Args:
+            prefix: Publisher DOI prefix
+            records: (DOIEntityType, record, label, fix_url) tuples
+
+        Returns:
+            ValidationResult with one error per duplicate DOI
+        """
+        from doi_portal.crossref.doi_registry import find_doi_collisions
+        from doi_portal.crossref.doi_registry import full_doi
+
+        result = ValidationResult()
+        collisions = find_doi_collisions(
+            (entity_type, record.pk, full_doi(prefix, record.doi_suffix))
+            for entity_type, record, _, _ in records
+        )
+        for entity_type, record, label, fix_url in records:
+            if (entity_type, record.pk) in collisions:
+                result.add_error(
+                    message=f"DOI sufiks '{record.doi_suffix}' se već koristi u drugom zapisu ({label})",
+                    field_name="doi_suffix",
+                    fix_url=fix_url,
+                )
+        return result
+
+    def _validate_component_group_fields(
+        self,
+        cg: "ComponentGroup",
+        components: list["ComponentModel"] | None = None,
+    ) -> ValidationResult:
         """
         Validate ComponentGroup-level fields.
 
         Args:
             cg: ComponentGroup to validate
+            components: Loaded non-deleted components (queried if None)
 
         Returns:
             ValidationResult with component group errors/warnings
@@ -1320,7 +1855,11 @@ class PreValidationService:
             )
 
         # At least one component is required
-        if not cg.components.filter(is_deleted=False).exists():
+        if components is None:
+            has_components = cg.components.filter(is_deleted=False).exists()
+        else:
+            has_components = bool(components)
+        if not has_components:
             result.add_error(
                 message="Grupa mora sadržati bar jednu komponentu",
                 field_name="components",
@@ -1347,36 +1886,12 @@ class PreValidationService:
         Returns:
             ValidationResult with warning if parent DOI not found
         """
-        import re
-
-        from doi_portal.articles.models import Article
-        from doi_portal.issues.models import Issue
+        from doi_portal.crossref.doi_registry import doi_exists
 
         result = ValidationResult()
 
-        if not cg.parent_doi:
-            return result
-
-        # Extract suffix from parent_doi (format: "10.XXXX/suffix")
-        match = re.match(r"^10\.\d+/(.+)$", cg.parent_doi)
-        if not match:
-            return result
-
-        doi_suffix = match.group(1)
-        publisher = cg.publisher
-
-        # Check if any article or issue has this DOI suffix under same publisher
-        article_exists = Article.objects.filter(
-            doi_suffix=doi_suffix,
-            issue__publication__publisher=publisher,
-        ).exists()
-
-        issue_exists = Issue.objects.filter(
-            doi_suffix=doi_suffix,
-            publication__publisher=publisher,
-        ).exists()
-
-        if not article_exists and not issue_exists:
+        # Single indexed lookup in the DOI registry
+        if cg.parent_doi and not doi_exists(cg.parent_doi):
             result.add_warning(
                 message=f"Parent DOI '{cg.parent_doi}' nije pronađen u sistemu — proverite da li je ispravan",
                 field_name="parent_doi",
@@ -1429,8 +1944,9 @@ class PreValidationService:
                 fix_url=f"/dashboard/components/groups/{cg.pk}/components/{component.pk}/edit/",
             )
 
-        # Contributors are optional but recommended
-        contributors = list(component.contributors.filter(is_deleted=False))
+        # Contributors are optional but recommended (soft-deleted ones are
+        # excluded by the default manager, so prefetched ones can be used)
+        contributors = list(component.contributors.all())
         if not contributors:
             result.add_warning(
                 message=f"Komponenta nema kontributore (komponenta: {component.title or component.pk})",
@@ -1489,6 +2005,8 @@ class PreValidationService:
         Returns:
             ValidationResult with all errors and warnings
         """
+        from doi_portal.crossref.models import DOIEntityType
+        from doi_portal.monographs.models import MonographChapter
         from doi_portal.monographs.models import MonographStatus
 
         result = ValidationResult()
@@ -1499,10 +2017,9 @@ class PreValidationService:
         # Check monograph-level fields
         result.merge(self._validate_monograph_fields(monograph))
 
-        # Validate monograph-level contributors
-        contributors = list(
-            monograph.contributors.filter(is_deleted=False).order_by("order")
-        )
+        # Validate monograph-level contributors (default manager excludes
+        # soft-deleted rows and Meta orders by "order")
+        contributors = list(monograph.contributors.all())
         if not contributors:
             result.add_warning(
                 message="Monografija nema kontributore — preporučeno je dodati bar jednog",
@@ -1516,13 +2033,34 @@ class PreValidationService:
                 )
 
         # Validate PUBLISHED chapters
-        published_chapters = monograph.chapters.filter(
-            status=MonographStatus.PUBLISHED,
-            is_deleted=False,
-        ).prefetch_related("contributors", "relations")
+        published_chapters = list(
+            monograph.chapters.filter(status=MonographStatus.PUBLISHED, is_deleted=False),
+        )
+        # Chapter numbers depend on the other chapters, so they are stored as
+        # a placeholder and filled in here
+        self.refresh_validation_states(
+            published_chapters,
+            MonographChapter.objects.select_related("monograph").prefetch_related("contributors"),
+            lambda chapter: self._validate_chapter(chapter, self.CHAPTER_NUM_PLACEHOLDER),
+        )
 
         for idx, chapter in enumerate(published_chapters, 1):
-            result.merge(self._validate_chapter(chapter, idx))
+            result.merge(self.stored_validation_result(chapter, chapter_num=idx))
+
+        # Check monograph and chapter DOIs against the DOI registry
+        records = [
+            (DOIEntityType.MONOGRAPH, monograph, "monografija", f"/dashboard/monographs/{monograph.pk}/edit/"),
+        ]
+        records.extend(
+            (
+                DOIEntityType.CHAPTER,
+                chapter,
+                f"poglavlje {idx}",
+                f"/dashboard/monographs/{monograph.pk}/chapters/{chapter.pk}/edit/",
+            )
+            for idx, chapter in enumerate(published_chapters, 1)
+        )
+        result.merge(self._validate_doi_collisions(monograph.publisher.doi_prefix, records))
 
         return result
 
@@ -1588,7 +2126,7 @@ class PreValidationService:
 
         return result
 
-    def _validate_chapter(self, chapter, chapter_num: int) -> ValidationResult:
+    def _validate_chapter(self, chapter, chapter_num: int | str) -> ValidationResult:
         """
         Validate a single chapter.
 
@@ -1619,9 +2157,7 @@ class PreValidationService:
             )
 
         # At least one contributor is required
-        chapter_contributors = list(
-            chapter.contributors.filter(is_deleted=False).order_by("order")
-        )
+        chapter_contributors = list(chapter.contributors.all())
         if not chapter_contributors:
             result.add_error(
                 message=f"Poglavlje {chapter_num} ({chapter.title or chapter.pk}): nema kontributore",
@@ -0,0 +1,301 @@
+"""
+Signal handlers keeping stored pre-validation results, the DOI registry
+and cached deposit-workflow summaries current.
+
+Saving or deleting an article, component or chapter, or one of the child
+records its validation depends on, marks the record's stored result
+dirty (ValidationStateMixin.validation_dirty) so the next validation run
+recomputes it. Flags are set with queryset updates, which neither send
+signals nor create audit log entries.
+
+Saving or deleting a record with a DOI updates its RegisteredDOI row in
+the same transaction; a changed publisher prefix re-registers all of the
+publisher's DOIs, and moving a publication to another publisher
+re-registers the DOIs of its issues and articles.
+
+Cached deposit summaries (doi_portal.crossref.deposit_status) are dropped
+when the issue, component group or monograph, one of its records, its
+exports or its deposits change, and when its publication (ISSN,
+conference metadata) or publisher changes.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.db.models import Q
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from doi_portal.articles.models import Article
+from doi_portal.articles.models import ArticleRelation
+from doi_portal.articles.models import Author
+from doi_portal.components.models import Component
+from doi_portal.components.models import ComponentContributor
+from doi_portal.components.models import ComponentGroup
+from doi_portal.core.models import SiteSettings
+from doi_portal.crossref.deposit_status import invalidate_all_deposit_summaries
+from doi_portal.crossref.deposit_status import invalidate_deposit_summaries
+from doi_portal.crossref.doi_registry import rebuild_doi_registry
+from doi_portal.crossref.doi_registry import register_entity
+from doi_portal.crossref.doi_registry import unregister_entity
+from doi_portal.crossref.models import CrossrefDeposit
+from doi_portal.crossref.models import CrossrefDepositItem
+from doi_portal.crossref.models import CrossrefExport
+from doi_portal.crossref.models import DOIEntityType
+from doi_portal.crossref.models import ExportType
+from doi_portal.crossref.models import RegisteredDOI
+from doi_portal.issues.models import Issue
+from doi_portal.monographs.models import ChapterContributor
+from doi_portal.monographs.models import Monograph
+from doi_portal.monographs.models import MonographChapter
+from doi_portal.monographs.models import MonographContributor
+from doi_portal.publications.models import Publication
+from doi_portal.publishers.models import Publisher
+
+# Child model -> (validated parent model, foreign key attribute)
+_DEPENDENT_CHILDREN = {
+    Author: (Article, "article_id"),
+    ArticleRelation: (Article, "article_id"),
+    ComponentContributor: (Component, "component_id"),
+    ChapterContributor: (MonographChapter, "chapter_id"),
+}
+
+# Model with a DOI -> (registry entity type, fields its registered DOI depends on)
+_DOI_OWNERS = {
+    Issue: (DOIEntityType.ISSUE, {"doi_suffix", "is_deleted", "publication"}),
+    Article: (DOIEntityType.ARTICLE, {"doi_suffix", "is_deleted", "issue"}),
+    Monograph: (DOIEntityType.MONOGRAPH, {"doi_suffix", "is_deleted", "publisher"}),
+    MonographChapter: (DOIEntityType.CHAPTER, {"doi_suffix", "is_deleted", "monograph"}),
+    Component: (DOIEntityType.COMPONENT, {"doi_suffix", "is_deleted", "component_group"}),
+}
+
+# Deposited entity model -> ExportType
+_DEPOSIT_ENTITIES = {
+    Issue: ExportType.ISSUE,
+    ComponentGroup: ExportType.COMPONENT_GROUP,
+    Monograph: ExportType.MONOGRAPH,
+}
+
+# Record feeding an entity's pre-validation -> (entity ExportType, foreign key attribute)
+_SUMMARY_RECORDS = {
+    Article: (ExportType.ISSUE, "issue_id"),
+    Component: (ExportType.COMPONENT_GROUP, "component_group_id"),
+    MonographChapter: (ExportType.MONOGRAPH, "monograph_id"),
+    MonographContributor: (ExportType.MONOGRAPH, "monograph_id"),
+}
+
+
+def _mark_dirty(model, pk: int | None) -> bool:
+    """Flag the stored validation result of one record as stale; True if it was clean."""
+    if pk is None:
+        return False
+    return bool(model._base_manager.filter(pk=pk, validation_dirty=False).update(validation_dirty=True))
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_save, sender=Component)
+@receiver(post_save, sender=MonographChapter)
+def mark_record_dirty(sender: type, instance: Any, **kwargs: Any) -> None:
+    """Invalidate the stored result of a saved record."""
+    _mark_dirty(sender, instance.pk)
+
+
+@receiver(post_save, sender=Author)
+@receiver(post_delete, sender=Author)
+@receiver(post_save, sender=ArticleRelation)
+@receiver(post_delete, sender=ArticleRelation)
+@receiver(post_save, sender=ComponentContributor)
+@receiver(post_delete, sender=ComponentContributor)
+@receiver(post_save, sender=ChapterContributor)
+@receiver(post_delete, sender=ChapterContributor)
+def mark_parent_dirty(sender: type, instance: Any, **kwargs: Any) -> None:
+    """Invalidate the stored result of the record owning a saved or deleted child."""
+    parent_model, fk_attr = _DEPENDENT_CHILDREN[sender]
+    _mark_dirty_and_invalidate(parent_model, getattr(instance, fk_attr))
+
+
+def _mark_dirty_and_invalidate(model, pk: int | None) -> None:
+    """Flag a record dirty and drop its owner's deposit summary if it was clean."""
+    # A summary is only cached while all records are clean, so it needs
+    # dropping only when this change turned the record dirty
+    if _mark_dirty(model, pk):
+        entity_type, owner_attr = _SUMMARY_RECORDS[model]
+        owner_pk = model._base_manager.filter(pk=pk).values_list(owner_attr, flat=True).first()
+        invalidate_deposit_summaries([(entity_type, owner_pk)])
+
+
+def mark_validation_dirty(record: Article | Component | MonographChapter) -> None:
+    """
+    Invalidate the stored result of a record whose children changed without signals.
+
+    For views that update children with QuerySet.update() (e.g. author
+    reordering, which changes sequence="first").
+
+    Args:
+        record: Article, Component or MonographChapter
+    """
+    _mark_dirty_and_invalidate(record._meta.concrete_model, record.pk)
+
+
+@receiver(post_save, sender=Issue)
+@receiver(post_save, sender=Article)
+@receiver(post_save, sender=Monograph)
+@receiver(post_save, sender=MonographChapter)
+@receiver(post_save, sender=Component)
+def register_doi(sender: type, instance: Any, update_fields=None, **kwargs: Any) -> None:
+    """Claim or release the DOI of a saved record."""
+    entity_type, doi_fields = _DOI_OWNERS[sender]
+    if update_fields is None or doi_fields & set(update_fields):
+        register_entity(entity_type, instance.pk)
+
+
+@receiver(post_delete, sender=Issue)
+@receiver(post_delete, sender=Article)
+@receiver(post_delete, sender=Monograph)
+@receiver(post_delete, sender=MonographChapter)
+@receiver(post_delete, sender=Component)
+def unregister_doi(sender: type, instance: Any, **kwargs: Any) -> None:
+    """Release the DOI of a deleted record."""
+    unregister_entity(_DOI_OWNERS[sender][0], instance.pk)
+
+
+@receiver(post_save, sender=Publisher)
+def reregister_publisher_dois(
+    sender: type,
+    instance: Publisher,
+    created: bool = False,
+    update_fields=None,
+    **kwargs: Any,
+) -> None:
+    """Re-register a publisher's DOIs when its DOI prefix changed."""
+    if created or (update_fields is not None and "doi_prefix" not in update_fields):
+        return
+    prefix = (instance.doi_prefix or "").strip().lower()
+    registered = RegisteredDOI.objects.filter(publisher_id=instance.pk)
+    # A changed prefix leaves rows under the old one; a newly set prefix has no rows yet
+    stale = registered.exclude(doi__startswith=f"{prefix}/").exists()
+    if stale or (prefix and not registered.exists()):
+        rebuild_doi_registry(publisher_id=instance.pk)
+
+
+@receiver(post_save, sender=Publication)
+def reregister_publication_dois(
+    sender: type,
+    instance: Publication,
+    created: bool = False,
+    update_fields=None,
+    **kwargs: Any,
+) -> None:
+    """Re-register the DOIs of a publication's issues and articles when its publisher changed."""
+    if created or (update_fields is not None and not {"publisher", "publisher_id"} & set(update_fields)):
+        return
+    issue_ids = list(Issue._base_manager.filter(publication_id=instance.pk).values_list("pk", flat=True))
+    article_ids = list(
+        Article._base_manager.filter(issue__publication_id=instance.pk).values_list("pk", flat=True),
+    )
+    registered = RegisteredDOI.objects.filter(
+        Q(entity_type=DOIEntityType.ISSUE, object_id__in=issue_ids)
+        | Q(entity_type=DOIEntityType.ARTICLE, object_id__in=article_ids),
+    )
+    # Rows left under the old publisher; a prefixless old publisher left no rows
+    stale = registered.exclude(publisher_id=instance.publisher_id).exists()
+    if stale or (instance.publisher.doi_prefix and not registered.exists()):
+        for pk in issue_ids:
+            register_entity(DOIEntityType.ISSUE, pk)
+        for pk in article_ids:
+            register_entity(DOIEntityType.ARTICLE, pk)
+
+
+@receiver(post_save, sender=Issue)
+@receiver(post_save, sender=ComponentGroup)
+@receiver(post_save, sender=Monograph)
+def invalidate_entity_summary(sender: type, instance: Any, **kwargs: Any) -> None:
+    """Drop the deposit summary of a saved issue, component group or monograph."""
+    invalidate_deposit_summaries([(_DEPOSIT_ENTITIES[sender], instance.pk)])
+
+
+@receiver(post_save, sender=Publication)
+def invalidate_publication_summaries(
+    sender: type,
+    instance: Publication,
+    created: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Drop the deposit summaries of a saved publication's issues."""
+    if created:
+        return
+    issue_ids = Issue.all_objects.filter(publication_id=instance.pk).values_list("pk", flat=True)
+    invalidate_deposit_summaries((ExportType.ISSUE, pk) for pk in issue_ids)
+
+
+@receiver(post_save, sender=Publisher)
+def invalidate_publisher_summaries(
+    sender: type,
+    instance: Publisher,
+    created: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Drop the deposit summaries of a saved publisher's issues, component groups and monographs."""
+    if created:
+        return
+    entities = {
+        ExportType.ISSUE: Issue.all_objects.filter(publication__publisher_id=instance.pk),
+        ExportType.COMPONENT_GROUP: ComponentGroup.all_objects.filter(publisher_id=instance.pk),
+        ExportType.MONOGRAPH: Monograph.all_objects.filter(publisher_id=instance.pk),
+    }
+    invalidate_deposit_summaries(
+        (entity_type, pk)
+        for entity_type, queryset in entities.items()
+        for pk in queryset.values_list("pk", flat=True)
+    )
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+@receiver(post_save, sender=Component)
+@receiver(post_delete, sender=Component)
+@receiver(post_save, sender=MonographChapter)
+@receiver(post_delete, sender=MonographChapter)
+@receiver(post_save, sender=MonographContributor)
+@receiver(post_delete, sender=MonographContributor)
+def invalidate_owner_summary(sender: type, instance: Any, **kwargs: Any) -> None:
+    """Drop the deposit summary of the entity owning a saved or deleted record."""
+    entity_type, fk_attr = _SUMMARY_RECORDS[sender]
+    invalidate_deposit_summaries([(entity_type, getattr(instance, fk_attr))])
+
+
+@receiver(post_save, sender=CrossrefExport)
+@receiver(post_delete, sender=CrossrefExport)
+def invalidate_export_summary(sender: type, instance: CrossrefExport, **kwargs: Any) -> None:
+    """Drop the deposit summary of an exported entity."""
+    invalidate_deposit_summaries(
+        [
+            (ExportType.ISSUE, instance.issue_id),
+            (ExportType.COMPONENT_GROUP, instance.component_group_id),
+            (ExportType.MONOGRAPH, instance.monograph_id),
+        ],
+    )
+
+
+@receiver(post_save, sender=CrossrefDeposit)
+def invalidate_deposit_summary(sender: type, instance: CrossrefDeposit, **kwargs: Any) -> None:
+    """Drop the deposit summaries of the entities in a saved deposit."""
+    if instance.entity_type:
+        invalidate_deposit_summaries([(instance.entity_type, instance.object_id)])
+    else:
+        invalidate_deposit_summaries(instance.items.values_list("entity_type", "object_id"))
+
+
+@receiver(post_save, sender=CrossrefDepositItem)
+@receiver(post_delete, sender=CrossrefDepositItem)
+def invalidate_queued_summary(sender: type, instance: CrossrefDepositItem, **kwargs: Any) -> None:
+    """Drop the deposit summary of a queued entity."""
+    invalidate_deposit_summaries([(instance.entity_type, instance.object_id)])
+
+
+@receiver(post_save, sender=SiteSettings)
+def invalidate_all_summaries(sender: type, instance: SiteSettings, **kwargs: Any) -> None:
+    """Depositor settings affect every pre-validation result."""
+    invalidate_all_deposit_summaries()
@@ -0,0 +1,181 @@
+"""
+Crossref submission log reconciliation.
+
+A submission log (doi_batch_diagnostic) lists one record_diagnostic per
+DOI with status Success, Warning or Failure and a message. Logs are read
+with lxml.etree.iterparse, so only one record is held in memory at a
+time, and results are written back to articles, monograph chapters and
+components with set-based UPDATEs: records are collected in chunks and
+each chunk issues one UPDATE per (model, DOI prefix, status, message)
+group instead of one save() per DOI.
+"""
+
+from __future__ import annotations
+
+import io
+from collections import defaultdict
+from collections.abc import Iterable
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from typing import IO
+
+from django.utils import timezone
+from lxml import etree
+
+from doi_portal.articles.models import RecordDepositStatus
+
+__all__ = [
+    "RecordDiagnostic",
+    "apply_record_diagnostics",
+    "apply_submission_log",
+    "iter_record_diagnostics",
+]
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Models carrying per-DOI deposit results and the lookup of their DOI prefix
+_RECORD_MODELS = (
+    ("articles.Article", "issue__publication__publisher__doi_prefix"),
+    ("monographs.MonographChapter", "monograph__publisher__doi_prefix"),
+    ("components.Component", "component_group__publisher__doi_prefix"),
+)
+
+_STATUS_MAP = {
+    "Success": RecordDepositStatus.SUCCESS,
+    "Warning": RecordDepositStatus.WARNING,
+    "Failure": RecordDepositStatus.FAILURE,
+}
+
+
+@dataclass(frozen=True)
+class RecordDiagnostic:
+    """
+    Outcome of one DOI in a Crossref submission log.
+
+    Attributes:
+        doi: Registered DOI (prefix/suffix)
+        status: RecordDepositStatus value
+        message: Crossref message (may be empty)
+    """
+
+    doi: str
+    status: str
+    message: str
+
+
+def iter_record_diagnostics(source: bytes | str | IO[bytes]) -> Iterator[RecordDiagnostic]:
+    """
+    Stream record_diagnostic entries from a submission log.
+
+    Args:
+        source: Log XML as bytes/str, or a binary file object
+
+    Yields:
+        RecordDiagnostic per record (unknown statuses and records without a DOI are skipped)
+    """
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+
+    for _, element in etree.iterparse(
+        source,
+        events=("end",),
+        tag="record_diagnostic",
+        resolve_entities=False,
+    ):
+        status = _STATUS_MAP.get(element.get("status", ""))
+        doi = (element.findtext("doi") or "").strip()
+        message = (element.findtext("msg") or "").strip()
+        # Drop the processed record and its already-seen siblings
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+        if status and doi:
+            yield RecordDiagnostic(doi=doi, status=status, message=message)
+
+
+def _record_models():
+    """Return (model class, prefix lookup) pairs."""
+    from django.apps import apps
+
+    return [(apps.get_model(label), lookup) for label, lookup in _RECORD_MODELS]
+
+
+def _apply_chunk(records: list[RecordDiagnostic], checked_at: datetime, models) -> int:
+    """Write one chunk of results, one UPDATE per model/prefix/outcome group."""
+    groups: dict[tuple[str, str, str], list[str]] = defaultdict(list)
+    for record in records:
+        prefix, _, suffix = record.doi.partition("/")
+        if suffix:
+            message = "" if record.status == RecordDepositStatus.SUCCESS else record.message
+            groups[(prefix, record.status, message)].append(suffix)
+
+    updated = 0
+    for (prefix, status, message), suffixes in groups.items():
+        errors = [{"message": message}] if message else []
+        for model, prefix_lookup in models:
+            updated += model.objects.filter(
+                **{prefix_lookup: prefix, "doi_suffix__in": suffixes},
+            ).update(
+                crossref_deposit_status=status,
+                crossref_deposit_errors=errors,
+                crossref_deposit_checked_at=checked_at,
+            )
+    return updated
+
+
+def apply_record_diagnostics(
+    records: Iterable[RecordDiagnostic],
+    *,
+    checked_at: datetime | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> dict[str, int]:
+    """
+    Store per-DOI results on matching articles, chapters and components.
+
+    Args:
+        records: RecordDiagnostic iterable (consumed lazily)
+        checked_at: Timestamp stored as crossref_deposit_checked_at (default: now)
+        chunk_size: Records per batch of UPDATE statements
+
+    Returns:
+        Dict with record counts per status and the number of updated rows
+    """
+    checked_at = checked_at or timezone.now()
+    models = _record_models()
+    counts = dict.fromkeys(RecordDepositStatus.values, 0)
+    counts["updated"] = 0
+
+    records = iter(records)
+    while chunk := list(islice(records, chunk_size)):
+        for record in chunk:
+            counts[record.status] += 1
+        counts["updated"] += _apply_chunk(chunk, checked_at, models)
+    return counts
+
+
+def apply_submission_log(
+    source: bytes | str | IO[bytes],
+    *,
+    checked_at: datetime | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> dict[str, int]:
+    """
+    Stream a submission log and store its per-DOI results.
+
+    Args:
+        source: Log XML as bytes/str, or a binary file object
+        checked_at: Timestamp stored as crossref_deposit_checked_at (default: now)
+        chunk_size: Records per batch of UPDATE statements
+
+    Returns:
+        Dict with record counts per status and the number of updated rows
+    """
+    return apply_record_diagnostics(
+        iter_record_diagnostics(source),
+        checked_at=checked_at,
+        chunk_size=chunk_size,
+    )
@@ -4,13 +4,25 @@ Crossref Celery tasks.
 Story 5.1: Crossref Service Infrastructure.
 Story 5.3: XML Generation for All Publication Types.
 Celery tasks for background XML generation.
+Publisher-wide bulk regeneration fans batches of entities out as a group
+of concurrent batch tasks.
+Live deposits: submit a doi_batch, then poll its submission log with backoff.
+Deposit queue: periodically pack queued entities into combined deposits.
 """
 
 from __future__ import annotations
 
 from celery import shared_task
 
-__all__ = ["crossref_generate_xml_task", "crossref_generate_component_xml_task"]
+__all__ = [
+    "crossref_bulk_regenerate_batch_task",
+    "crossref_bulk_regeneration_task",
+    "crossref_deposit_poll_task",
+    "crossref_deposit_submit_task",
+    "crossref_flush_deposit_queue_task",
+    "crossref_generate_component_xml_task",
+    "crossref_generate_xml_task",
+]
 
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
@@ -145,3 +157,220 @@ def crossref_generate_component_xml_task(self, component_group_id: int) -> dict:
                 "success": False,
                 "message": f"Generisanje neuspešno: {e!s}",
             }
+
+
+def _batch_size() -> int:
+    """Items per bulk regeneration batch task."""
+    from django.conf import settings
+
+    from doi_portal.crossref.bulk import DEFAULT_BATCH_SIZE
+
+    return getattr(settings, "CROSSREF_BULK_REGENERATION_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+
+
+@shared_task
+def crossref_bulk_regeneration_task(run_id: int) -> dict:
+    """
+    Fan a bulk regeneration run out over concurrent batch tasks.
+
+    Claims up to CROSSREF_BULK_REGENERATION_CONCURRENCY batches of
+    CROSSREF_BULK_REGENERATION_BATCH_SIZE pending items and starts them
+    as a group. Each batch task claims the next batch when it finishes,
+    so the run keeps at most that many batches in flight until nothing
+    is pending. Finalizes the run when nothing is left.
+
+    Args:
+        run_id: ID of BulkRegenerationRun
+
+    Returns:
+        Dict with number of dispatched items
+    """
+    from celery import group
+    from django.conf import settings
+
+    from doi_portal.crossref.bulk import DEFAULT_CONCURRENCY
+    from doi_portal.crossref.bulk import claim_next_batch
+    from doi_portal.crossref.bulk import refresh_run_progress
+    from doi_portal.crossref.models import BulkRegenerationRun
+
+    run = BulkRegenerationRun.objects.filter(pk=run_id).select_related("publisher").first()
+    if run is None:
+        return {"dispatched": 0}
+
+    concurrency = getattr(settings, "CROSSREF_BULK_REGENERATION_CONCURRENCY", DEFAULT_CONCURRENCY)
+    batches = []
+    for _ in range(max(1, concurrency)):
+        item_ids = claim_next_batch(run, _batch_size())
+        if not item_ids:
+            break
+        batches.append(item_ids)
+    if not batches:
+        refresh_run_progress(run)
+        return {"dispatched": 0}
+
+    group(crossref_bulk_regenerate_batch_task.s(run_id, item_ids) for item_ids in batches).apply_async()
+    return {"dispatched": sum(len(item_ids) for item_ids in batches)}
+
+
+@shared_task
+def crossref_bulk_regenerate_batch_task(run_id: int, item_ids: list[int]) -> dict:
+    """
+    Regenerate one batch of a bulk regeneration run, then claim the next.
+
+    The batch's documents are XSD-validated together (see
+    doi_portal.crossref.bulk.regenerate_items). Failures are recorded on
+    the items rather than raised, so one broken entity never stops the
+    run. Progress counters are aggregated from the items after every batch.
+
+    Args:
+        run_id: ID of BulkRegenerationRun
+        item_ids: IDs of the claimed BulkRegenerationItems
+
+    Returns:
+        Dict with run progress counters
+    """
+    from doi_portal.crossref.bulk import claim_next_batch
+    from doi_portal.crossref.bulk import refresh_run_progress
+    from doi_portal.crossref.bulk import regenerate_items
+    from doi_portal.crossref.models import BulkRegenerationItem
+    from doi_portal.crossref.models import BulkRegenerationRun
+    from doi_portal.crossref.models import BulkRegenerationStatus
+
+    items = list(
+        BulkRegenerationItem.objects.select_related("run__publisher").filter(pk__in=item_ids).order_by("pk"),
+    )
+    try:
+        regenerate_items(items)
+    except Exception as e:  # noqa: BLE001
+        BulkRegenerationItem.objects.filter(pk__in=item_ids, status=BulkRegenerationStatus.RUNNING).update(
+            status=BulkRegenerationStatus.FAILED,
+            message=f"Generisanje neuspešno: {e!s}",
+        )
+
+    run = BulkRegenerationRun.objects.filter(pk=run_id).first()
+    if run is None:
+        return {}
+    # This lane continues with the next pending batch; the last lane to
+    # find nothing left sees no running items and finalizes the run
+    next_item_ids = claim_next_batch(run, _batch_size())
+    refresh_run_progress(run)
+    if next_item_ids:
+        crossref_bulk_regenerate_batch_task.delay(run_id, next_item_ids)
+    return {
+        "total": run.total,
+        "succeeded": run.succeeded,
+        "failed": run.failed,
+        "xsd_valid": run.xsd_valid,
+        "xsd_invalid": run.xsd_invalid,
+    }
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def crossref_deposit_submit_task(self, deposit_id: int) -> dict:
+    """
+    Upload a pending deposit to Crossref and schedule the first status poll.
+
+    Upload errors are retried; once retries are exhausted the deposit is
+    marked FAILED.
+
+    Args:
+        deposit_id: ID of CrossrefDeposit
+
+    Returns:
+        Dict with success flag and deposit status
+    """
+    from doi_portal.crossref.deposit import CrossrefDepositError
+    from doi_portal.crossref.deposit import fail_deposit
+    from doi_portal.crossref.deposit import poll_delay
+    from doi_portal.crossref.deposit import submit_deposit
+    from doi_portal.crossref.models import CrossrefDeposit
+    from doi_portal.crossref.models import DepositStatus
+
+    deposit = (
+        CrossrefDeposit.objects.select_related("publisher", "xml_blob")
+        .filter(pk=deposit_id)
+        .first()
+    )
+    if deposit is None:
+        return {"success": False, "status": None}
+    if deposit.status != DepositStatus.PENDING:
+        return {"success": True, "status": deposit.status}
+
+    try:
+        submit_deposit(deposit)
+    except CrossrefDepositError as e:
+        # retry(exc=e) re-raises e itself once retries run out, so check first
+        if self.request.retries >= self.max_retries:
+            fail_deposit(deposit, str(e))
+            return {"success": False, "status": deposit.status}
+        raise self.retry(exc=e) from e
+
+    crossref_deposit_poll_task.apply_async((deposit_id,), countdown=poll_delay(0))
+    return {"success": True, "status": deposit.status}
+
+
+@shared_task
+def crossref_deposit_poll_task(deposit_id: int) -> dict:
+    """
+    Poll the Crossref submission log of a submitted deposit.
+
+    Reschedules itself with exponential backoff while Crossref is still
+    processing the batch (or the log could not be read), and fails the
+    deposit after CROSSREF_DEPOSIT_MAX_POLLS attempts.
+
+    Args:
+        deposit_id: ID of CrossrefDeposit
+
+    Returns:
+        Dict with deposit status and poll attempts
+    """
+    from django.conf import settings
+
+    from doi_portal.crossref.deposit import CrossrefDepositError
+    from doi_portal.crossref.deposit import fail_deposit
+    from doi_portal.crossref.deposit import poll_delay
+    from doi_portal.crossref.deposit import poll_deposit
+    from doi_portal.crossref.models import CrossrefDeposit
+
+    deposit = CrossrefDeposit.objects.select_related("publisher").filter(pk=deposit_id).first()
+    if deposit is None:
+        return {"status": None, "poll_attempts": 0}
+    if deposit.is_finished:
+        return {"status": deposit.status, "poll_attempts": deposit.poll_attempts}
+
+    try:
+        poll_deposit(deposit)
+    except CrossrefDepositError as e:
+        deposit.poll_attempts += 1
+        deposit.response_log = str(e)
+        deposit.save(update_fields=["poll_attempts", "response_log"])
+
+    if not deposit.is_finished:
+        if deposit.poll_attempts >= getattr(settings, "CROSSREF_DEPOSIT_MAX_POLLS", 12):
+            fail_deposit(
+                deposit,
+                f"Crossref nije obradio depozit nakon {deposit.poll_attempts} provera.",
+            )
+        else:
+            crossref_deposit_poll_task.apply_async(
+                (deposit_id,),
+                countdown=poll_delay(deposit.poll_attempts),
+            )
+    return {"status": deposit.status, "poll_attempts": deposit.poll_attempts}
+
+
+@shared_task
+def crossref_flush_deposit_queue_task(force: bool = False) -> dict:
+    """
+    Pack queued entities into combined deposits (run periodically by beat).
+
+    Args:
+        force: Send all pending items regardless of size and age thresholds
+
+    Returns:
+        Dict with created deposit IDs
+    """
+    from doi_portal.crossref.deposit_queue import flush_deposit_queue
+
+    deposits = flush_deposit_queue(force=force)
+    return {"deposits": [deposit.pk for deposit in deposits]}
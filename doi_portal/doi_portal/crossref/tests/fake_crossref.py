@@ -0,0 +1,91 @@
+"""
+Local stand-in for the Crossref deposit and submission-log servlets.
+
+Used by deposit tests instead of the live Crossref service.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+
+def diagnostic(status, success=0, warning=0, failure=0, records=()):
+    """
+    Build a doi_batch_diagnostic submission log.
+
+    Args:
+        status: doi_batch_diagnostic/@status
+        success: success_count
+        warning: warning_count
+        failure: failure_count
+        records: (doi, status, msg) tuples rendered as record_diagnostic elements
+    """
+    record_xml = "".join(
+        f'<record_diagnostic status="{record_status}"><doi>{doi}</doi><msg>{msg}</msg></record_diagnostic>'
+        for doi, record_status, msg in records
+    )
+    return (
+        f'<doi_batch_diagnostic status="{status}" sp="test">'
+        "<submission_id>1</submission_id><batch_id>batch-0001</batch_id>"
+        f"{record_xml}"
+        f"<batch_data><record_count>{success + warning + failure}</record_count>"
+        f"<success_count>{success}</success_count>"
+        f"<warning_count>{warning}</warning_count>"
+        f"<failure_count>{failure}</failure_count></batch_data>"
+        "</doi_batch_diagnostic>"
+    )
+
+
+class FakeCrossref:
+    """Local stand-in for the Crossref deposit endpoints."""
+
+    def __init__(self):
+        self.uploads = []
+        self.polls = []
+        self.client_ports = set()
+        self.deposit_status = 200
+        self.log_status = 200
+        # Submission logs returned by successive polls; the last one repeats
+        self.logs = [diagnostic("completed", success=1)]
+
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/xml; charset=UTF-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                fake.client_ports.add(self.client_address[1])
+                length = int(self.headers["Content-Length"])
+                fake.uploads.append(self.rfile.read(length))
+                self._reply(fake.deposit_status, "<html><h2>SUCCESS</h2></html>")
+
+            def do_GET(self):
+                fake.client_ports.add(self.client_address[1])
+                fake.polls.append(parse_qs(urlparse(self.path).query))
+                log = fake.logs.pop(0) if len(fake.logs) > 1 else fake.logs[0]
+                self._reply(fake.log_status, log)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,120 @@
+"""
+Tests for content-addressed XML snapshot storage.
+
+Covers doi_portal.crossref.blobs helpers, XMLBlob deduplication and the
+CrossrefExport.xml_content property backed by XMLBlob.
+"""
+
+import gzip
+import hashlib
+
+import pytest
+from django.test import override_settings
+
+from doi_portal.crossref.blobs import compress_xml
+from doi_portal.crossref.blobs import decompress_xml
+from doi_portal.crossref.blobs import store_xml_blob
+from doi_portal.crossref.blobs import xml_sha256
+from doi_portal.crossref.models import CrossrefExport
+from doi_portal.crossref.models import XMLBlob
+from doi_portal.crossref.models import XMLBlobCodec
+from doi_portal.issues.tests.factories import IssueFactory
+
+SAMPLE_XML = '<?xml version="1.0" encoding="UTF-8"?>\n<doi_batch>' + "<title>Čćžšđ</title>" * 500 + "</doi_batch>"
+
+
+class TestCompression:
+    """Tests for compress_xml / decompress_xml."""
+
+    def test_gzip_round_trip(self):
+        data = compress_xml(SAMPLE_XML, XMLBlobCodec.GZIP)
+
+        assert gzip.decompress(data).decode() == SAMPLE_XML
+        assert decompress_xml(data, XMLBlobCodec.GZIP) == SAMPLE_XML
+        assert len(data) < len(SAMPLE_XML.encode())
+
+    def test_gzip_output_is_deterministic(self):
+        assert compress_xml(SAMPLE_XML, XMLBlobCodec.GZIP) == compress_xml(SAMPLE_XML, XMLBlobCodec.GZIP)
+
+    def test_zstd_round_trip(self):
+        pytest.importorskip("zstandard")
+
+        data = compress_xml(SAMPLE_XML, XMLBlobCodec.ZSTD)
+
+        assert decompress_xml(data, XMLBlobCodec.ZSTD) == SAMPLE_XML
+
+
+@pytest.mark.django_db
+class TestStoreXmlBlob:
+    """Tests for store_xml_blob."""
+
+    def test_blob_is_keyed_by_sha256(self):
+        blob = store_xml_blob(SAMPLE_XML)
+
+        assert blob.sha256 == xml_sha256(SAMPLE_XML)
+        assert blob.size == len(SAMPLE_XML.encode("utf-8"))
+        assert XMLBlob.objects.get(pk=blob.pk).get_xml() == SAMPLE_XML
+
+    def test_large_document_is_hashed_in_slices(self):
+        xml = SAMPLE_XML.replace("</doi_batch>", "<!-- " + "čćž" * 50_000 + " --></doi_batch>")
+        blob = store_xml_blob(xml)
+
+        assert blob.sha256 == hashlib.sha256(xml.encode("utf-8")).hexdigest()
+        assert blob.size == len(xml.encode("utf-8"))
+
+    def test_identical_xml_is_stored_once(self):
+        first = store_xml_blob(SAMPLE_XML)
+        second = store_xml_blob(SAMPLE_XML)
+
+        assert first.pk == second.pk
+        assert XMLBlob.objects.count() == 1
+
+    def test_different_xml_gets_new_blob(self):
+        store_xml_blob(SAMPLE_XML)
+        store_xml_blob(SAMPLE_XML + " ")
+
+        assert XMLBlob.objects.count() == 2
+
+    @override_settings(CROSSREF_XML_BLOB_CODEC="zstd")
+    def test_zstd_codec_falls_back_to_gzip_when_unavailable(self):
+        from doi_portal.crossref import blobs
+
+        blob = store_xml_blob(SAMPLE_XML)
+
+        expected = XMLBlobCodec.ZSTD if blobs.zstandard is not None else XMLBlobCodec.GZIP
+        assert blob.codec == expected
+        assert XMLBlob.objects.get(pk=blob.pk).get_xml() == SAMPLE_XML
+
+
+@pytest.mark.django_db
+class TestCrossrefExportBlobReference:
+    """CrossrefExport stores only a reference to the deduplicated snapshot."""
+
+    def test_xml_content_round_trip(self):
+        issue = IssueFactory()
+
+        export = CrossrefExport.objects.create(issue=issue, xml_content=SAMPLE_XML, filename="a.xml")
+
+        assert export.xml_blob_id == xml_sha256(SAMPLE_XML)
+        assert CrossrefExport.objects.get(pk=export.pk).xml_content == SAMPLE_XML
+
+    def test_repeated_exports_share_one_blob(self):
+        issue = IssueFactory()
+
+        for i in range(3):
+            CrossrefExport.objects.create(issue=issue, xml_content=SAMPLE_XML, filename=f"{i}.xml")
+
+        assert CrossrefExport.objects.filter(issue=issue).count() == 3
+        assert XMLBlob.objects.count() == 1
+        assert XMLBlob.objects.get().exports.count() == 3
+
+    def test_reassigning_xml_content_stores_new_blob(self):
+        issue = IssueFactory()
+        export = CrossrefExport.objects.create(issue=issue, xml_content="<a/>", filename="a.xml")
+
+        export.xml_content = "<b/>"
+        export.save()
+
+        export.refresh_from_db()
+        assert export.xml_blob_id == xml_sha256("<b/>")
+        assert CrossrefExport.objects.get(pk=export.pk).xml_content == "<b/>"
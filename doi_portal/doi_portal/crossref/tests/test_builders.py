@@ -0,0 +1,162 @@
+"""
+Tests for the lxml builder engine.
+
+The lxml engine must produce a document equivalent to the Jinja2
+templates (compared after C14N with whitespace-only text stripped).
+"""
+
+import datetime
+import io
+
+import pytest
+from lxml import etree
+
+from doi_portal.articles.models import ArticleFunding
+from doi_portal.articles.models import ArticleStatus
+from doi_portal.articles.models import AuthorSequence
+from doi_portal.articles.tests.factories import AffiliationFactory
+from doi_portal.articles.tests.factories import ArticleFactory
+from doi_portal.articles.tests.factories import ArticleRelationFactory
+from doi_portal.articles.tests.factories import AuthorFactory
+from doi_portal.core.models import SiteSettings
+from doi_portal.crossref.services import CrossrefService
+from doi_portal.crossref.validators import validate_xml
+from doi_portal.issues.tests.factories import IssueFactory
+from doi_portal.publications.tests.factories import ConferenceFactory
+from doi_portal.publications.tests.factories import JournalFactory
+from doi_portal.publications.tests.factories import PublisherFactory
+
+
+@pytest.fixture
+def site(db):
+    """Set explicit Site domain for reproducible tests."""
+    from django.contrib.sites.models import Site
+
+    site = Site.objects.get_current()
+    site.domain = "testserver.example.com"
+    site.save()
+    return site
+
+
+@pytest.fixture
+def site_settings(db):
+    """Create SiteSettings with test depositor data."""
+    return SiteSettings.objects.create(
+        depositor_name="Test Depositor",
+        depositor_email="test@example.com",
+    )
+
+
+def _populate(issue):
+    """Add articles exercising markup, contributors, fundings, relations and licenses."""
+    article = ArticleFactory(
+        issue=issue,
+        title="Uticaj _in vitro_ uslova na H~2~O & **CO^2^**",
+        subtitle="Podnaslov <test>",
+        original_language_title="Influence of _in vitro_ conditions",
+        original_language_title_language="en",
+        abstract="Sažetak sa **bold** i _italic_ tekstom.",
+        status=ArticleStatus.PUBLISHED,
+        first_page="1",
+        last_page="10",
+        license_url="https://creativecommons.org/licenses/by/4.0/",
+        license_applies_to="vor",
+        free_to_read=True,
+        free_to_read_start_date=datetime.date(2026, 1, 15),
+    )
+    author = AuthorFactory(
+        article=article,
+        surname="Petrović",
+        sequence=AuthorSequence.FIRST,
+        orcid="0000-0002-1825-0097",
+        order=1,
+    )
+    AffiliationFactory(
+        author=author,
+        institution_name="Univerzitet u Beogradu",
+        institution_ror_id="https://ror.org/02qsmb048",
+    )
+    ArticleFunding.objects.create(
+        article=article,
+        funder_name="Fond za nauku",
+        funder_doi="10.13039/501100004564",
+        award_number="7739",
+        order=1,
+    )
+    ArticleRelationFactory(article=article, target_identifier="10.5555/related")
+    ArticleFactory(issue=issue, status=ArticleStatus.PUBLISHED, article_number="e123", abstract="")
+
+
+def _canonical_body(xml: str) -> str:
+    """C14N form of everything after <head>, ignoring indentation whitespace."""
+    canonical = etree.canonicalize(from_file=io.BytesIO(xml.encode("utf-8")), strip_text=True)
+    return canonical.split("</head>", 1)[1]
+
+
+@pytest.mark.django_db
+class TestLxmlEngine:
+    """Tests for CrossrefService engine selection and builders.write_issue_xml."""
+
+    def test_journal_output_matches_jinja(self, site, site_settings):
+        publisher = PublisherFactory(doi_prefix="10.12345")
+        issue = IssueFactory(publication=JournalFactory(publisher=publisher), doi_suffix="issue.1")
+        _populate(issue)
+        service = CrossrefService()
+
+        jinja_xml = service.generate_xml(issue)
+        lxml_xml = service.generate_xml(issue, engine="lxml")
+
+        assert _canonical_body(lxml_xml) == _canonical_body(jinja_xml)
+
+    def test_conference_output_matches_jinja(self, site, site_settings):
+        publication = ConferenceFactory(
+            publisher=PublisherFactory(doi_prefix="10.54321"),
+            conference_date=datetime.date(2026, 5, 10),
+            conference_date_end=datetime.date(2026, 5, 12),
+        )
+        issue = IssueFactory(publication=publication)
+        _populate(issue)
+        service = CrossrefService()
+
+        jinja_xml = service.generate_xml(issue)
+        lxml_xml = service.generate_xml(issue, engine="lxml")
+
+        assert "<conference_paper" in lxml_xml
+        assert _canonical_body(lxml_xml) == _canonical_body(jinja_xml)
+
+    def test_xsd_outcome_matches_jinja(self, site, site_settings):
+        issue = IssueFactory(publication=JournalFactory())
+        _populate(issue)
+        service = CrossrefService()
+
+        jinja_result = validate_xml(service.generate_xml(issue))
+        lxml_result = validate_xml(service.generate_xml(issue, engine="lxml"))
+
+        assert lxml_result.is_valid == jinja_result.is_valid
+        assert len(lxml_result.errors) == len(jinja_result.errors)
+
+    def test_namespaces_declared_once(self, site, site_settings):
+        """Articles inherit namespace declarations from <doi_batch>."""
+        issue = IssueFactory(publication=JournalFactory())
+        _populate(issue)
+
+        xml = CrossrefService().generate_xml(issue, engine="lxml")
+
+        assert xml.count('xmlns:jats="http://www.ncbi.nlm.nih.gov/JATS1"') == 1
+        assert "ns0:" not in xml
+
+    def test_write_xml_reports_bytes_written(self, site, site_settings):
+        issue = IssueFactory(publication=JournalFactory())
+        _populate(issue)
+        sink = io.BytesIO()
+
+        written = CrossrefService().write_xml(issue, sink, engine="lxml")
+
+        assert written == len(sink.getvalue())
+        assert sink.getvalue().startswith(b"<?xml")
+
+    def test_unknown_engine_raises(self, site, site_settings):
+        issue = IssueFactory(publication=JournalFactory())
+
+        with pytest.raises(ValueError, match="engine"):
+            CrossrefService().generate_xml(issue, engine="xslt")
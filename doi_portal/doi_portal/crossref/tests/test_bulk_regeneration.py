@@ -0,0 +1,233 @@
+"""
+Tests for publisher-wide bulk Crossref XML regeneration.
+
+Covers run/item creation, batch fan-out and processing (eager Celery), batched XSD validation,
+progress aggregation, resuming interrupted runs and the management command.
+"""
+
+import pytest
+from django.core.management import call_command
+
+from doi_portal.articles.models import ArticleStatus
+from doi_portal.articles.models import AuthorSequence
+from doi_portal.articles.tests.factories import ArticleFactory
+from doi_portal.articles.tests.factories import AuthorFactory
+from doi_portal.components.tests.factories import ComponentFactory
+from doi_portal.components.tests.factories import ComponentGroupFactory
+from doi_portal.core.models import SiteSettings
+from doi_portal.crossref.bulk import refresh_run_progress
+from doi_portal.crossref.bulk import resume_bulk_regeneration
+from doi_portal.crossref.bulk import start_bulk_regeneration
+from doi_portal.crossref.models import BulkRegenerationItem
+from doi_portal.crossref.models import BulkRegenerationRun
+from doi_portal.crossref.models import BulkRegenerationStatus
+from doi_portal.crossref.models import ExportType
+from doi_portal.issues.tests.factories import IssueFactory
+from doi_portal.monographs.tests.factories import MonographContributorFactory
+from doi_portal.monographs.tests.factories import MonographFactory
+from doi_portal.publications.tests.factories import JournalFactory
+from doi_portal.publications.tests.factories import PublisherFactory
+
+
+@pytest.fixture
+def site(db):
+    """Set explicit Site domain for reproducible tests."""
+    from django.contrib.sites.models import Site
+
+    site = Site.objects.get_current()
+    site.domain = "testserver.example.com"
+    site.save()
+    return site
+
+
+@pytest.fixture
+def site_settings(db):
+    """Create SiteSettings with test depositor data."""
+    return SiteSettings.objects.create(
+        depositor_name="Test Depositor",
+        depositor_email="test@example.com",
+    )
+
+
+@pytest.fixture
+def publisher(site, site_settings, settings):
+    """Publisher with two issues, one component group and one monograph."""
+    settings.CROSSREF_BULK_REGENERATION_BATCH_SIZE = 2
+    publisher = PublisherFactory()
+    journal = JournalFactory(publisher=publisher)
+    for number in ("1", "2"):
+        issue = IssueFactory(publication=journal, volume="1", issue_number=number)
+        article = ArticleFactory(issue=issue, status=ArticleStatus.PUBLISHED)
+        AuthorFactory(article=article, sequence=AuthorSequence.FIRST, order=1)
+    cg = ComponentGroupFactory(publisher=publisher, parent_doi=f"{publisher.doi_prefix}/parent")
+    ComponentFactory(component_group=cg)
+    monograph = MonographFactory(publisher=publisher)
+    MonographContributorFactory(monograph=monograph, sequence=AuthorSequence.FIRST)
+
+    # Entities of another publisher must not be included
+    IssueFactory(publication=JournalFactory())
+    return publisher
+
+
+@pytest.mark.django_db
+class TestBulkRegeneration:
+    """Tests for start_bulk_regeneration and the Celery pipeline."""
+
+    def test_start_creates_one_item_per_entity(self, publisher, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=False):
+            run = start_bulk_regeneration(publisher)
+
+        types = list(run.items.values_list("entity_type", flat=True))
+        assert run.total == 4
+        assert sorted(types) == sorted(
+            [ExportType.ISSUE, ExportType.ISSUE, ExportType.COMPONENT_GROUP, ExportType.MONOGRAPH]
+        )
+        assert set(run.items.values_list("status", flat=True)) == {BulkRegenerationStatus.PENDING}
+
+    def test_run_regenerates_all_entities_in_batches(self, publisher, django_capture_on_commit_callbacks):
+        from doi_portal.issues.models import Issue
+
+        with django_capture_on_commit_callbacks(execute=True):
+            run = start_bulk_regeneration(publisher)
+
+        run.refresh_from_db()
+        assert run.status == BulkRegenerationStatus.SUCCEEDED
+        assert run.succeeded == 4
+        assert run.failed == 0
+        assert run.xsd_valid + run.xsd_invalid == 4
+        assert run.progress_percent == 100
+        assert run.finished_at is not None
+        for issue in Issue.objects.filter(publication__publisher=publisher):
+            assert issue.crossref_xml
+            assert issue.xml_generation_status == "completed"
+
+    def test_batch_is_validated_in_one_call(self, publisher, django_capture_on_commit_callbacks):
+        from unittest.mock import patch
+
+        from doi_portal.crossref.validators import XSDValidationService
+
+        with (
+            patch.object(XSDValidationService, "validate_many", autospec=True,
+                         side_effect=XSDValidationService.validate_many) as validate_many,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            run = start_bulk_regeneration(publisher)
+
+        run.refresh_from_db()
+        assert run.succeeded == 4
+        # Batch size 2: two batches of two documents each
+        assert [len(call.args[1]) for call in validate_many.call_args_list] == [2, 2]
+
+    def test_batches_fan_out_as_bounded_group(self, publisher, settings, django_capture_on_commit_callbacks):
+        from unittest.mock import patch
+
+        from doi_portal.crossref.tasks import crossref_bulk_regeneration_task
+
+        settings.CROSSREF_BULK_REGENERATION_BATCH_SIZE = 1
+        settings.CROSSREF_BULK_REGENERATION_CONCURRENCY = 3
+        with django_capture_on_commit_callbacks(execute=False):
+            run = start_bulk_regeneration(publisher)
+
+        with patch("celery.group") as group:
+            result = crossref_bulk_regeneration_task(run.pk)
+
+        signatures = list(group.call_args.args[0])
+        assert result == {"dispatched": 3}
+        assert [len(signature.args[1]) for signature in signatures] == [1, 1, 1]
+        assert len({signature.args[1][0] for signature in signatures}) == 3
+        group.return_value.apply_async.assert_called_once_with()
+        assert run.items.filter(status=BulkRegenerationStatus.RUNNING).count() == 3
+        assert run.items.filter(status=BulkRegenerationStatus.PENDING).count() == 1
+
+    def test_each_batch_task_claims_the_next_batch(self, publisher, settings, django_capture_on_commit_callbacks):
+        from unittest.mock import patch
+
+        from doi_portal.crossref.bulk import claim_next_batch
+        from doi_portal.crossref.tasks import crossref_bulk_regenerate_batch_task
+
+        with django_capture_on_commit_callbacks(execute=False):
+            run = start_bulk_regeneration(publisher)
+        first = claim_next_batch(run, 2)
+
+        with patch.object(crossref_bulk_regenerate_batch_task, "delay") as delay:
+            crossref_bulk_regenerate_batch_task(run.pk, first)
+
+        (_, next_ids), _ = delay.call_args
+        assert set(next_ids).isdisjoint(first)
+        assert len(next_ids) == 2
+        run.refresh_from_db()
+        assert run.succeeded == 2
+        assert run.status == BulkRegenerationStatus.RUNNING
+
+    def test_missing_entity_is_recorded_as_failure(self, publisher, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=False):
+            run = start_bulk_regeneration(publisher)
+        item = run.items.filter(entity_type=ExportType.MONOGRAPH).get()
+        item.object_id = 999_999
+        item.save()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            resume_bulk_regeneration(run)
+
+        run.refresh_from_db()
+        item.refresh_from_db()
+        assert run.status == BulkRegenerationStatus.SUCCEEDED
+        assert run.succeeded == 3
+        assert run.failed == 1
+        assert item.status == BulkRegenerationStatus.FAILED
+        assert "nije pronađen" in item.message
+
+    def test_resume_skips_finished_items(self, publisher, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=False):
+            run = start_bulk_regeneration(publisher)
+        done, stale, *_ = run.items.order_by("pk")
+        BulkRegenerationItem.objects.filter(pk=done.pk).update(status=BulkRegenerationStatus.SUCCEEDED, xsd_valid=True)
+        BulkRegenerationItem.objects.filter(pk=stale.pk).update(status=BulkRegenerationStatus.RUNNING)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            resume_bulk_regeneration(run)
+
+        done.refresh_from_db()
+        stale.refresh_from_db()
+        run.refresh_from_db()
+        assert done.finished_at is None  # Not regenerated again
+        assert stale.status == BulkRegenerationStatus.SUCCEEDED
+        assert run.status == BulkRegenerationStatus.SUCCEEDED
+        assert run.succeeded == 4
+
+    def test_refresh_progress_keeps_run_open_while_items_pending(self, publisher, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=False):
+            run = start_bulk_regeneration(publisher)
+        first = run.items.order_by("pk").first()
+        BulkRegenerationItem.objects.filter(pk=first.pk).update(status=BulkRegenerationStatus.FAILED)
+
+        refresh_run_progress(run)
+
+        run.refresh_from_db()
+        assert run.status == BulkRegenerationStatus.RUNNING
+        assert run.failed == 1
+        assert run.progress_percent == 25
+
+
+@pytest.mark.django_db
+class TestRegenerateCommand:
+    """Tests for the regenerate_crossref_xml management command."""
+
+    def test_command_starts_run_and_reports_status(self, publisher, capsys, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            call_command("regenerate_crossref_xml", publisher=publisher.pk)
+        run = BulkRegenerationRun.objects.get(publisher=publisher)
+
+        call_command("regenerate_crossref_xml", status=run.pk)
+
+        out = capsys.readouterr().out
+        assert f"#{run.pk}" in out
+        assert "4/4" in out
+
+    def test_command_refuses_to_resume_finished_run(self, publisher):
+        from django.core.management.base import CommandError
+
+        run = BulkRegenerationRun.objects.create(publisher=publisher, status=BulkRegenerationStatus.SUCCEEDED)
+
+        with pytest.raises(CommandError):
+            call_command("regenerate_crossref_xml", resume=run.pk)
@@ -204,6 +204,27 @@ class TestCrossrefServiceComponentXML:
         assert cg.xml_generation_status == "completed"
         assert cg.xsd_validated_at is not None
 
+    def test_generate_and_store_writes_through_sink(self):
+        """Storage renders through write_component_xml() instead of joining the stream."""
+        from unittest.mock import patch
+
+        cg = ComponentGroupFactory()
+        ComponentFactory(component_group=cg, doi_suffix="comp.sink")
+        service = CrossrefService()
+
+        with (
+            patch.object(service, "write_component_xml", wraps=service.write_component_xml) as write,
+            patch.object(service, "generate_component_xml") as generate,
+        ):
+            success, xml = service.generate_and_store_component_xml(cg)
+
+        assert success is True
+        write.assert_called_once()
+        generate.assert_not_called()
+        cg.refresh_from_db()
+        assert cg.crossref_xml == xml
+        assert cg.crossref_xml.startswith("<?xml")
+
     def test_generate_component_xml_excludes_deleted(self):
         """Deleted components are excluded from XML."""
         cg = ComponentGroupFactory()
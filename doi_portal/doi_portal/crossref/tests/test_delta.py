@@ -0,0 +1,250 @@
+"""
+Tests for delta Crossref exports.
+
+Only records whose canonical XML changed since the last export snapshot
+are emitted; container metadata is always kept.
+"""
+
+import pytest
+from django.contrib.auth.models import Group
+from django.urls import reverse
+from lxml import etree
+
+from doi_portal.articles.models import AuthorSequence
+from doi_portal.articles.tests.factories import ArticleFactory
+from doi_portal.articles.tests.factories import AuthorFactory
+from doi_portal.core.models import SiteSettings
+from doi_portal.crossref.delta import CONTAINER_KEY
+from doi_portal.crossref.delta import build_delta_xml
+from doi_portal.crossref.delta import generate_delta_xml
+from doi_portal.crossref.delta import record_fingerprints
+from doi_portal.crossref.models import CrossrefExport
+from doi_portal.crossref.models import ExportType
+from doi_portal.crossref.services import CrossrefService
+from doi_portal.crossref.validators import validate_xml_chunks
+from doi_portal.issues.tests.factories import IssueFactory
+from doi_portal.monographs.models import MonographStatus
+from doi_portal.monographs.tests.factories import MonographChapterFactory
+from doi_portal.monographs.tests.factories import MonographContributorFactory
+from doi_portal.monographs.tests.factories import MonographFactory
+from doi_portal.publications.tests.factories import JournalFactory
+from doi_portal.publications.tests.factories import PublisherFactory
+from doi_portal.users.tests.factories import UserFactory
+
+
+@pytest.fixture
+def site(db):
+    """Set explicit Site domain for reproducible tests."""
+    from django.contrib.sites.models import Site
+
+    site = Site.objects.get_current()
+    site.domain = "testserver.example.com"
+    site.save()
+    return site
+
+
+@pytest.fixture
+def site_settings(db):
+    """Create SiteSettings with test depositor data."""
+    return SiteSettings.objects.create(
+        depositor_name="Test Depositor",
+        depositor_email="test@example.com",
+    )
+
+
+@pytest.fixture
+def issue(site, site_settings):
+    """Journal issue with three articles."""
+    publisher = PublisherFactory(doi_prefix="10.12345")
+    issue = IssueFactory(publication=JournalFactory(publisher=publisher, issn_print="1234-5678"))
+    for n in range(3):
+        article = ArticleFactory(issue=issue, doi_suffix=f"delta.{n}", first_page=str(n * 10 + 1))
+        AuthorFactory(article=article, sequence=AuthorSequence.FIRST, order=1)
+    return issue
+
+
+def _export(entity, xml, *, is_delta=False, valid=True):
+    """Record an export snapshot of an issue."""
+    return CrossrefExport.objects.create(
+        issue=entity,
+        xml_content=xml,
+        filename="export.xml",
+        xsd_valid_at_export=valid,
+        is_delta=is_delta,
+    )
+
+
+def _article_dois(xml):
+    """DOIs of journal_article records in a doi_batch."""
+    root = etree.fromstring(xml.encode("utf-8"))
+    return [el.findtext("{*}doi_data/{*}doi") for el in root.iter("{*}journal_article")]
+
+
+@pytest.mark.django_db
+class TestRecordFingerprints:
+    """Tests for record_fingerprints and build_delta_xml."""
+
+    def test_fingerprints_ignore_indentation(self, issue):
+        xml = CrossrefService().generate_xml(issue)
+        compact = etree.tostring(
+            etree.fromstring(xml.encode("utf-8"), etree.XMLParser(remove_blank_text=True)),
+        ).decode("utf-8")
+
+        fingerprints = record_fingerprints(xml)
+
+        assert sorted(fingerprints) == [CONTAINER_KEY, "10.12345/delta.0", "10.12345/delta.1", "10.12345/delta.2"]
+        assert record_fingerprints(compact) == fingerprints
+
+    def test_build_delta_drops_unchanged_records(self, issue):
+        xml = CrossrefService().generate_xml(issue)
+        previous = record_fingerprints(xml)
+        previous["10.12345/delta.1"] = "stale"
+
+        delta = build_delta_xml(xml, previous)
+
+        assert delta.changed_dois == ["10.12345/delta.1"]
+        assert delta.unchanged_count == 2
+        assert delta.container_changed is False
+        assert _article_dois(delta.xml) == ["10.12345/delta.1"]
+
+
+@pytest.mark.django_db
+class TestGenerateDeltaXML:
+    """Tests for generate_delta_xml."""
+
+    def test_without_previous_export_returns_all_records(self, issue):
+        delta = generate_delta_xml(ExportType.ISSUE, issue)
+
+        assert delta.base_export is None
+        assert len(delta.changed_dois) == 3
+
+    def test_only_modified_article_is_emitted(self, issue):
+        base = _export(issue, CrossrefService().generate_xml(issue))
+        article = issue.articles.get(doi_suffix="delta.2")
+        article.title = "Ispravljen naslov"
+        article.save()
+
+        delta = generate_delta_xml(ExportType.ISSUE, issue)
+
+        assert delta.base_export == base
+        assert delta.changed_dois == ["10.12345/delta.2"]
+        assert delta.unchanged_count == 2
+        assert "Ispravljen naslov" in delta.xml
+        assert "<journal_metadata" in delta.xml
+        assert "<journal_issue" in delta.xml
+        _, result = validate_xml_chunks([delta.xml])
+        assert result.is_valid, result.errors
+
+    def test_new_article_is_emitted(self, issue):
+        _export(issue, CrossrefService().generate_xml(issue))
+        AuthorFactory(
+            article=ArticleFactory(issue=issue, doi_suffix="delta.new"),
+            sequence=AuthorSequence.FIRST,
+        )
+
+        delta = generate_delta_xml(ExportType.ISSUE, issue)
+
+        assert delta.changed_dois == ["10.12345/delta.new"]
+
+    def test_unchanged_issue_has_no_changes(self, issue):
+        _export(issue, CrossrefService().generate_xml(issue))
+
+        assert generate_delta_xml(ExportType.ISSUE, issue).has_changes is False
+
+    def test_container_change_alone_emits_container(self, issue):
+        _export(issue, CrossrefService().generate_xml(issue))
+        issue.volume = "Posebno izdanje"
+        issue.save()
+
+        delta = generate_delta_xml(ExportType.ISSUE, issue)
+
+        assert delta.has_changes is True
+        assert delta.container_changed is True
+        assert delta.changed_dois == []
+        assert _article_dois(delta.xml) == []
+        assert "<volume>Posebno izdanje</volume>" in delta.xml
+        _, result = validate_xml_chunks([delta.xml])
+        assert result.is_valid, result.errors
+
+    def test_delta_exports_are_merged_back_to_last_full_export(self, issue):
+        _export(issue, CrossrefService().generate_xml(issue))
+        article = issue.articles.get(doi_suffix="delta.0")
+        article.title = "Prva ispravka"
+        article.save()
+        _export(issue, generate_delta_xml(ExportType.ISSUE, issue).xml, is_delta=True)
+
+        delta = generate_delta_xml(ExportType.ISSUE, issue)
+
+        assert delta.has_changes is False
+        assert delta.unchanged_count == 3
+
+    def test_invalid_exports_are_ignored(self, issue):
+        xml = CrossrefService().generate_xml(issue)
+        _export(issue, xml, valid=False)
+
+        assert len(generate_delta_xml(ExportType.ISSUE, issue).changed_dois) == 3
+
+    def test_monograph_emits_only_changed_chapters(self, site, site_settings):
+        monograph = MonographFactory(publisher=PublisherFactory(doi_prefix="10.12345"), doi_suffix="mono.delta")
+        MonographContributorFactory(monograph=monograph, sequence=AuthorSequence.FIRST)
+        chapters = [
+            MonographChapterFactory(monograph=monograph, status=MonographStatus.PUBLISHED, order=n)
+            for n in range(3)
+        ]
+        CrossrefExport.objects.create(
+            monograph=monograph,
+            export_type=ExportType.MONOGRAPH,
+            xml_content=CrossrefService().generate_monograph_xml(monograph),
+            filename="mono.xml",
+        )
+        chapters[1].title = "Novo poglavlje"
+        chapters[1].save()
+
+        delta = generate_delta_xml(ExportType.MONOGRAPH, monograph)
+
+        assert delta.changed_dois == [f"10.12345/{chapters[1].doi_suffix}"]
+        assert delta.xml.count("<content_item ") == 1
+        assert "<book_metadata" in delta.xml
+
+    def test_component_groups_are_not_supported(self, issue):
+        with pytest.raises(ValueError, match="Delta eksport"):
+            generate_delta_xml(ExportType.COMPONENT_GROUP, issue)
+
+
+@pytest.mark.django_db
+class TestDeltaDownloadView:
+    """Tests for the delta download endpoint."""
+
+    @pytest.fixture
+    def admin_client(self, client):
+        admin_group, _ = Group.objects.get_or_create(name="Administrator")
+        user = UserFactory()
+        user.groups.add(admin_group)
+        client.force_login(user)
+        return client
+
+    def test_download_records_delta_export(self, admin_client, issue):
+        _export(issue, CrossrefService().generate_xml(issue))
+        article = issue.articles.get(doi_suffix="delta.1")
+        article.last_page = "99"
+        article.save()
+
+        response = admin_client.get(reverse("crossref:xml-download-delta", args=[issue.pk]))
+
+        assert response.status_code == 200
+        body = b"".join(response.streaming_content).decode("utf-8")
+        assert _article_dois(body) == ["10.12345/delta.1"]
+        export = CrossrefExport.objects.order_by("-pk").first()
+        assert export.is_delta is True
+        assert export.filename.endswith("_delta.xml")
+        assert export.xsd_valid_at_export is True
+        assert export.xml_content == body
+
+    def test_nothing_changed_redirects_to_workflow_with_message(self, admin_client, issue):
+        _export(issue, CrossrefService().generate_xml(issue))
+
+        response = admin_client.get(reverse("crossref:xml-download-delta", args=[issue.pk]), follow=True)
+
+        assert response.redirect_chain == [(reverse("crossref:issue-deposit", args=[issue.pk]), 302)]
+        assert "Nema izmena od poslednjeg eksporta" in response.content.decode()
+        assert CrossrefExport.objects.count() == 1
@@ -0,0 +1,302 @@
+"""
+Tests for live Crossref deposits.
+
+Runs the deposit client, Celery tasks (eager) and submit views against a
+local stand-in for the Crossref deposit and submission-log servlets.
+"""
+
+import re
+
+import pytest
+from django.urls import reverse
+
+from doi_portal.articles.models import ArticleStatus
+from doi_portal.articles.models import AuthorSequence
+from doi_portal.articles.tests.factories import ArticleFactory
+from doi_portal.articles.tests.factories import AuthorFactory
+from doi_portal.core.models import SiteSettings
+from doi_portal.crossref.deposit import CrossrefDepositClient
+from doi_portal.crossref.deposit import CrossrefDepositError
+from doi_portal.crossref.deposit import parse_submission_status
+from doi_portal.crossref.deposit import poll_delay
+from doi_portal.crossref.deposit import start_deposit
+from doi_portal.crossref.models import CrossrefDeposit
+from doi_portal.crossref.models import DepositStatus
+from doi_portal.crossref.models import ExportType
+from doi_portal.crossref.services import CrossrefService
+from doi_portal.crossref.tests.fake_crossref import FakeCrossref
+from doi_portal.crossref.tests.fake_crossref import diagnostic
+from doi_portal.issues.tests.factories import IssueFactory
+from doi_portal.publications.tests.factories import JournalFactory
+from doi_portal.publications.tests.factories import PublisherFactory
+from doi_portal.users.tests.factories import UserFactory
+
+@pytest.fixture
+def crossref_server(settings):
+    """Point the deposit client at a local fake Crossref with no poll delays."""
+    with FakeCrossref() as fake:
+        settings.CROSSREF_DEPOSIT_BASE_URL = fake.url
+        settings.CROSSREF_DEPOSIT_POLL_INITIAL_DELAY = 0
+        settings.CROSSREF_DEPOSIT_MAX_POLLS = 3
+        yield fake
+
+
+@pytest.fixture
+def issue(db):
+    """Issue with generated, XSD-valid XML whose publisher has Crossref credentials."""
+    from django.contrib.sites.models import Site
+
+    Site.objects.filter(pk=Site.objects.get_current().pk).update(domain="testserver.example.com")
+    SiteSettings.objects.create(depositor_name="Test Depositor", depositor_email="test@example.com")
+    publisher = PublisherFactory(crossref_username="depositor", crossref_password="s3cret")
+    issue = IssueFactory(publication=JournalFactory(publisher=publisher))
+    article = ArticleFactory(issue=issue, status=ArticleStatus.PUBLISHED)
+    AuthorFactory(article=article, sequence=AuthorSequence.FIRST, order=1)
+    success, _ = CrossrefService().generate_and_store_xml(issue)
+    assert success
+    issue.refresh_from_db()
+    assert issue.xsd_valid is True
+    return issue
+
+
+def _head_value(xml, tag):
+    """Text of a head element of a doi_batch document."""
+    return re.search(f"<{tag}>([^<]*)</{tag}>", xml).group(1)
+
+
+def _deposit(issue, user, django_capture_on_commit_callbacks):
+    """Start a deposit and run the submit/poll task chain eagerly."""
+    with django_capture_on_commit_callbacks(execute=True):
+        deposit = start_deposit(ExportType.ISSUE, issue, user)
+    deposit.refresh_from_db()
+    issue.refresh_from_db()
+    return deposit
+
+
+class TestParseSubmissionStatus:
+    """Tests for parse_submission_status and poll_delay."""
+
+    def test_completed_counts(self):
+        result = parse_submission_status(diagnostic("completed", success=3, warning=1, failure=2))
+
+        assert result.status == "completed"
+        assert result.is_pending is False
+        assert (result.record_count, result.success_count) == (6, 3)
+        assert (result.warning_count, result.failure_count) == (1, 2)
+
+    @pytest.mark.parametrize("status", ["queued", "in_process", "unknown_submission"])
+    def test_pending_states(self, status):
+        assert parse_submission_status(diagnostic(status)).is_pending is True
+
+    def test_rejects_non_diagnostic_response(self):
+        with pytest.raises(CrossrefDepositError):
+            parse_submission_status("<html><body>Login failed</body></html>")
+
+    def test_poll_delay_backs_off_exponentially_with_cap(self, settings):
+        settings.CROSSREF_DEPOSIT_POLL_INITIAL_DELAY = 60
+        settings.CROSSREF_DEPOSIT_POLL_MAX_DELAY = 600
+
+        assert [poll_delay(n) for n in range(5)] == [60, 120, 240, 480, 600]
+
+
+@pytest.mark.django_db
+class TestLiveDeposit:
+    """End-to-end deposits against the local stand-in server."""
+
+    def test_deposit_completes_and_marks_issue(self, crossref_server, issue, django_capture_on_commit_callbacks):
+        crossref_server.logs = [diagnostic("queued"), diagnostic("completed", success=2)]
+        user = UserFactory()
+
+        deposit = _deposit(issue, user, django_capture_on_commit_callbacks)
+
+        assert deposit.status == DepositStatus.COMPLETED
+        submitted = deposit.xml_blob.get_xml()
+        assert deposit.batch_id == _head_value(submitted, "doi_batch_id")
+        assert deposit.poll_attempts == 2
+        assert deposit.success_count == 2
+        assert issue.crossref_deposited_at == deposit.completed_at
+        assert issue.crossref_deposited_by == user
+
+        upload = crossref_server.uploads[0]
+        assert b"doMDUpload" in upload
+        assert b"depositor" in upload
+        assert b's3cret' in upload
+        assert f'filename="{deposit.batch_id}.xml"'.encode() in upload
+        assert submitted.encode() in upload
+        assert crossref_server.polls[0]["doi_batch_id"] == [deposit.batch_id]
+        assert crossref_server.polls[0]["usr"] == ["depositor"]
+
+    def test_requests_reuse_one_pooled_connection(self, crossref_server, issue, django_capture_on_commit_callbacks):
+        crossref_server.logs = [diagnostic("queued"), diagnostic("completed", success=1)]
+
+        _deposit(issue, None, django_capture_on_commit_callbacks)
+
+        assert len(crossref_server.uploads) + len(crossref_server.polls) == 3
+        assert len(crossref_server.client_ports) == 1
+
+    def test_failed_records_fail_deposit(self, crossref_server, issue, django_capture_on_commit_callbacks):
+        crossref_server.logs = [diagnostic("completed", success=1, failure=1)]
+
+        deposit = _deposit(issue, None, django_capture_on_commit_callbacks)
+
+        assert deposit.status == DepositStatus.FAILED
+        assert deposit.failure_count == 1
+        assert "doi_batch_diagnostic" in deposit.response_log
+        assert issue.crossref_deposited_at is None
+
+    def test_gives_up_after_max_polls(self, crossref_server, issue, django_capture_on_commit_callbacks):
+        crossref_server.logs = [diagnostic("in_process")]
+
+        deposit = _deposit(issue, None, django_capture_on_commit_callbacks)
+
+        assert deposit.status == DepositStatus.FAILED
+        assert deposit.poll_attempts == 3
+        assert len(crossref_server.polls) == 3
+        assert issue.crossref_deposited_at is None
+
+    def test_upload_errors_fail_deposit_after_retries(
+        self, crossref_server, issue, django_capture_on_commit_callbacks
+    ):
+        crossref_server.deposit_status = 503
+
+        deposit = _deposit(issue, None, django_capture_on_commit_callbacks)
+
+        assert deposit.status == DepositStatus.FAILED
+        assert deposit.response_log == "Slanje depozita nije uspelo: HTTP 503"
+        assert crossref_server.polls == []
+
+    def test_missing_credentials_raise(self, crossref_server, issue):
+        publisher = issue.publication.publisher
+        publisher.crossref_password = ""
+        publisher.save()
+        issue.refresh_from_db()
+
+        with pytest.raises(CrossrefDepositError):
+            start_deposit(ExportType.ISSUE, issue)
+        assert not CrossrefDeposit.objects.exists()
+
+    def test_missing_xml_raises(self, crossref_server, issue):
+        issue.crossref_xml = ""
+
+        with pytest.raises(CrossrefDepositError):
+            start_deposit(ExportType.ISSUE, issue)
+
+    def test_resubmission_gets_fresh_batch_id_and_timestamp(self, crossref_server, issue):
+        from unittest.mock import patch
+
+        from django.utils import timezone
+
+        stored = issue.crossref_xml
+        later = timezone.now() + timezone.timedelta(minutes=5)
+
+        first = start_deposit(ExportType.ISSUE, issue)
+        with patch("doi_portal.crossref.deposit.timezone.now", return_value=later):
+            second = start_deposit(ExportType.ISSUE, issue)
+
+        first_xml, second_xml = first.xml_blob.get_xml(), second.xml_blob.get_xml()
+        assert len({_head_value(stored, "doi_batch_id"), first.batch_id, second.batch_id}) == 3
+        assert _head_value(second_xml, "doi_batch_id") == second.batch_id
+        assert _head_value(second_xml, "timestamp") > _head_value(first_xml, "timestamp")
+        assert second_xml.replace(second.batch_id, "").replace(_head_value(second_xml, "timestamp"), "") == (
+            stored.replace(_head_value(stored, "doi_batch_id"), "").replace(_head_value(stored, "timestamp"), "")
+        )
+
+    def test_xsd_invalid_xml_is_rejected(self, crossref_server, issue):
+        issue.xsd_valid = False
+
+        with pytest.raises(CrossrefDepositError, match="XSD"):
+            start_deposit(ExportType.ISSUE, issue)
+        assert not CrossrefDeposit.objects.exists()
+
+    def test_failing_pre_validation_is_rejected(self, crossref_server, issue):
+        settings = SiteSettings.get_settings()
+        settings.depositor_email = ""
+        settings.save()
+
+        with pytest.raises(CrossrefDepositError, match="Pre-validacija"):
+            start_deposit(ExportType.ISSUE, issue)
+        assert not CrossrefDeposit.objects.exists()
+
+    def test_pre_validation_does_not_trust_cached_summary(self, crossref_server, issue):
+        from doi_portal.crossref.deposit_status import get_deposit_summary
+
+        assert get_deposit_summary(ExportType.ISSUE, issue).is_valid
+        # Bypasses the signals, so the cached summary stays valid
+        SiteSettings.objects.update(depositor_email="")
+
+        with pytest.raises(CrossrefDepositError, match="Pre-validacija"):
+            start_deposit(ExportType.ISSUE, issue)
+        assert not CrossrefDeposit.objects.exists()
+
+    def test_stale_xml_is_rejected(self, crossref_server, issue):
+        article = issue.articles.get()
+        article.title = "Izmenjen naslov"
+        article.save()
+
+        with pytest.raises(CrossrefDepositError, match="zastareo"):
+            start_deposit(ExportType.ISSUE, issue)
+        assert not CrossrefDeposit.objects.exists()
+
+    def test_soft_deleted_record_makes_xml_stale(self, crossref_server, issue):
+        issue.articles.get().soft_delete()
+
+        with pytest.raises(CrossrefDepositError, match="zastareo"):
+            start_deposit(ExportType.ISSUE, issue)
+
+    def test_transport_errors_do_not_leak_password(self, crossref_server):
+        crossref_server.log_status = 500
+        client = CrossrefDepositClient("depositor", "s3cret")
+
+        with pytest.raises(CrossrefDepositError) as excinfo:
+            client.fetch_submission_log("batch-0001")
+
+        assert "HTTP 500" in str(excinfo.value)
+        assert "s3cret" not in str(excinfo.value)
+
+
+@pytest.mark.django_db
+class TestDepositSubmitView:
+    """Tests for the deposit-submit HTMX endpoints."""
+
+    def test_post_starts_deposit(self, client, crossref_server, issue, django_capture_on_commit_callbacks):
+        user = UserFactory(is_superuser=True, is_staff=True)
+        client.force_login(user)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.post(reverse("crossref:deposit-submit", args=[issue.pk]))
+
+        assert response.status_code == 200
+        deposit = CrossrefDeposit.objects.get()
+        assert deposit.submitted_by == user
+        assert deposit.object_id == issue.pk
+        assert len(crossref_server.uploads) == 1
+
+    def test_get_not_allowed(self, client, issue):
+        client.force_login(UserFactory(is_superuser=True, is_staff=True))
+
+        response = client.get(reverse("crossref:deposit-submit", args=[issue.pk]))
+
+        assert response.status_code == 405
+
+    def test_error_is_rendered(self, client, issue):
+        client.force_login(UserFactory(is_superuser=True, is_staff=True))
+        issue.crossref_xml = ""
+        issue.save(update_fields=["crossref_xml"])
+
+        response = client.post(reverse("crossref:deposit-submit", args=[issue.pk]))
+
+        assert response.status_code == 200
+        assert "XML nije generisan." in response.content.decode()
+        assert not CrossrefDeposit.objects.exists()
+
+    def test_xsd_invalid_issue_is_not_uploaded(self, client, crossref_server, issue):
+        client.force_login(UserFactory(is_superuser=True, is_staff=True))
+        issue.xsd_valid = False
+        issue.save(update_fields=["xsd_valid"])
+
+        response = client.post(reverse("crossref:deposit-submit", args=[issue.pk]))
+
+        assert response.status_code == 200
+        assert "XML nije prošao XSD validaciju." in response.content.decode()
+        assert not CrossrefDeposit.objects.exists()
+        assert crossref_server.uploads == []
@@ -0,0 +1,332 @@
+"""
+Tests for the Crossref deposit queue.
+
+Covers batch packing, size/age flush thresholds, per-DOI result mapping
+(against the local Crossref stand-in) and the flush management command.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.db import transaction
+from django.urls import reverse
+from django.utils import timezone
+
+from doi_portal.articles.models import AuthorSequence
+from doi_portal.components.tests.factories import ComponentFactory
+from doi_portal.components.tests.factories import ComponentGroupFactory
+from doi_portal.core.models import SiteSettings
+from doi_portal.crossref.deposit import CrossrefDepositError
+from doi_portal.crossref.deposit_queue import enqueue_deposit
+from doi_portal.crossref.deposit_queue import flush_deposit_queue
+from doi_portal.crossref.deposit_queue import pack_batches
+from doi_portal.crossref.models import CrossrefDeposit
+from doi_portal.crossref.models import CrossrefDepositItem
+from doi_portal.crossref.models import DepositStatus
+from doi_portal.crossref.models import ExportType
+from doi_portal.crossref.services import CrossrefService
+from doi_portal.crossref.tests.fake_crossref import FakeCrossref
+from doi_portal.crossref.tests.fake_crossref import diagnostic
+from doi_portal.crossref.validators import validate_xml_chunks
+from doi_portal.monographs.tests.factories import MonographContributorFactory
+from doi_portal.monographs.tests.factories import MonographFactory
+from doi_portal.publications.tests.factories import PublisherFactory
+from doi_portal.users.tests.factories import UserFactory
+
+
+@pytest.fixture
+def site(db):
+    """Set explicit Site domain for reproducible tests."""
+    from django.contrib.sites.models import Site
+
+    site = Site.objects.get_current()
+    site.domain = "testserver.example.com"
+    site.save()
+    return site
+
+
+@pytest.fixture
+def site_settings(db):
+    """Create SiteSettings with test depositor data."""
+    return SiteSettings.objects.create(
+        depositor_name="Test Depositor",
+        depositor_email="test@example.com",
+    )
+
+
+@pytest.fixture
+def crossref_server(settings):
+    """Point the deposit client at a local fake Crossref with no poll delays."""
+    with FakeCrossref() as fake:
+        settings.CROSSREF_DEPOSIT_BASE_URL = fake.url
+        settings.CROSSREF_DEPOSIT_POLL_INITIAL_DELAY = 0
+        settings.CROSSREF_DEPOSIT_MAX_POLLS = 3
+        yield fake
+
+
+@pytest.fixture
+def publisher(site, site_settings):
+    """Publisher with Crossref credentials."""
+    return PublisherFactory(doi_prefix="10.55555", crossref_username="depositor", crossref_password="s3cret")
+
+
+def _component_group(publisher, suffix):
+    """Component group with one component and generated XML."""
+    cg = ComponentGroupFactory(publisher=publisher, parent_doi=f"10.55555/parent.{suffix}")
+    ComponentFactory(component_group=cg, doi_suffix=suffix)
+    success, _ = CrossrefService().generate_and_store_component_xml(cg)
+    assert success
+    cg.refresh_from_db()
+    return cg
+
+
+def _monograph(publisher, suffix):
+    """Monograph with generated XML."""
+    monograph = MonographFactory(publisher=publisher, doi_suffix=suffix)
+    MonographContributorFactory(monograph=monograph, sequence=AuthorSequence.FIRST)
+    success, _ = CrossrefService().generate_and_store_monograph_xml(monograph)
+    assert success
+    monograph.refresh_from_db()
+    return monograph
+
+
+class TestPackBatches:
+    """Tests for pack_batches."""
+
+    def test_packs_in_order_under_cap(self):
+        batches = pack_batches([("a", 3), ("b", 3), ("c", 3), ("d", 5), ("e", 12)], 8)
+
+        assert batches == [(["a", "b"], 6), (["c", "d"], 8), (["e"], 12)]
+
+    def test_empty(self):
+        assert pack_batches([], 8) == []
+
+
+@pytest.mark.django_db
+class TestEnqueueDeposit:
+    """Tests for enqueue_deposit."""
+
+    def test_enqueue_is_idempotent(self, publisher):
+        cg = _component_group(publisher, "q.1")
+        user = UserFactory()
+
+        first = enqueue_deposit(ExportType.COMPONENT_GROUP, cg, user)
+        second = enqueue_deposit(ExportType.COMPONENT_GROUP, cg, user)
+
+        assert first.pk == second.pk
+        assert first.content_type == "sa_component"
+        assert first.queued_by == user
+        assert CrossrefDepositItem.objects.count() == 1
+
+    def test_requires_credentials(self, site, site_settings):
+        cg = _component_group(PublisherFactory(), "q.2")
+
+        with pytest.raises(CrossrefDepositError):
+            enqueue_deposit(ExportType.COMPONENT_GROUP, cg)
+
+
+@pytest.mark.django_db
+class TestFlushDepositQueue:
+    """Tests for flush_deposit_queue."""
+
+    def test_force_packs_one_valid_batch(self, publisher, django_capture_on_commit_callbacks):
+        groups = [_component_group(publisher, f"q.{i}") for i in range(3)]
+        for cg in groups:
+            enqueue_deposit(ExportType.COMPONENT_GROUP, cg)
+
+        with django_capture_on_commit_callbacks(execute=False):
+            deposits = flush_deposit_queue(force=True)
+
+        assert len(deposits) == 1
+        deposit = deposits[0]
+        xml = deposit.xml_blob.get_xml()
+        assert xml.count("<sa_component ") == 3
+        assert xml.count("<doi_batch_id>") == 1
+        assert f"<doi_batch_id>{deposit.batch_id}</doi_batch_id>" in xml
+        _, result = validate_xml_chunks([xml])
+        assert result.is_valid, result.errors
+        items = list(deposit.items.order_by("object_id"))
+        assert [item.dois for item in items] == [["10.55555/q.0"], ["10.55555/q.1"], ["10.55555/q.2"]]
+        assert {item.status for item in items} == {DepositStatus.SUBMITTED}
+
+    def test_waits_until_batch_full_or_expired(self, publisher, settings, django_capture_on_commit_callbacks):
+        enqueue_deposit(ExportType.COMPONENT_GROUP, _component_group(publisher, "q.wait"))
+
+        with django_capture_on_commit_callbacks(execute=False):
+            assert flush_deposit_queue() == []
+
+            CrossrefDepositItem.objects.update(queued_at=timezone.now() - timedelta(hours=1))
+            deposits = flush_deposit_queue()
+
+        assert len(deposits) == 1
+
+    def test_size_cap_sends_only_full_batches(self, publisher, settings, django_capture_on_commit_callbacks):
+        groups = [_component_group(publisher, f"q.cap{i}") for i in range(3)]
+        sizes = [len(cg.crossref_xml.encode()) for cg in groups]
+        settings.CROSSREF_DEPOSIT_BATCH_MAX_BYTES = sizes[0] + sizes[1]
+        for cg in groups:
+            enqueue_deposit(ExportType.COMPONENT_GROUP, cg)
+
+        with django_capture_on_commit_callbacks(execute=False):
+            deposits = flush_deposit_queue()
+
+        assert len(deposits) == 1
+        assert deposits[0].items.count() == 2
+        assert CrossrefDepositItem.objects.filter(deposit__isnull=True).count() == 1
+
+    def test_content_types_are_not_mixed(self, publisher, django_capture_on_commit_callbacks):
+        enqueue_deposit(ExportType.COMPONENT_GROUP, _component_group(publisher, "q.mix"))
+        enqueue_deposit(ExportType.MONOGRAPH, _monograph(publisher, "mono.mix"))
+
+        with django_capture_on_commit_callbacks(execute=False):
+            deposits = flush_deposit_queue(force=True)
+
+        assert len(deposits) == 2
+        assert sorted(deposit.items.get().content_type for deposit in deposits) == ["book", "sa_component"]
+
+    def test_per_doi_results_map_back_to_items(
+        self, publisher, crossref_server, django_capture_on_commit_callbacks
+    ):
+        user = UserFactory()
+        ok, bad = _component_group(publisher, "q.ok"), _component_group(publisher, "q.bad")
+        enqueue_deposit(ExportType.COMPONENT_GROUP, ok, user)
+        enqueue_deposit(ExportType.COMPONENT_GROUP, bad, user)
+        crossref_server.logs = [
+            diagnostic(
+                "completed",
+                success=1,
+                failure=1,
+                records=[
+                    ("10.55555/q.ok", "Success", "Successfully added"),
+                    ("10.55555/q.bad", "Failure", "Invalid parent DOI"),
+                ],
+            ),
+        ]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            deposit = flush_deposit_queue(force=True)[0]
+
+        deposit.refresh_from_db()
+        assert len(crossref_server.uploads) == 1
+        assert deposit.status == DepositStatus.FAILED
+        ok_item = CrossrefDepositItem.objects.get(object_id=ok.pk)
+        bad_item = CrossrefDepositItem.objects.get(object_id=bad.pk)
+        assert ok_item.status == DepositStatus.COMPLETED
+        assert bad_item.status == DepositStatus.FAILED
+        assert bad_item.message == "10.55555/q.bad: Invalid parent DOI"
+        ok.refresh_from_db()
+        bad.refresh_from_db()
+        assert ok.crossref_deposited_at is not None
+        assert ok.crossref_deposited_by == user
+        assert bad.crossref_deposited_at is None
+
+    def test_upload_failure_fails_items(self, publisher, crossref_server, django_capture_on_commit_callbacks):
+        crossref_server.deposit_status = 500
+        enqueue_deposit(ExportType.COMPONENT_GROUP, _component_group(publisher, "q.down"))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            flush_deposit_queue(force=True)
+
+        item = CrossrefDepositItem.objects.get()
+        assert item.status == DepositStatus.FAILED
+        assert "HTTP 500" in item.message
+
+    def test_missing_xml_fails_item(self, publisher, django_capture_on_commit_callbacks):
+        cg = _component_group(publisher, "q.gone")
+        enqueue_deposit(ExportType.COMPONENT_GROUP, cg)
+        cg.crossref_xml = ""
+        cg.save(update_fields=["crossref_xml"])
+
+        with django_capture_on_commit_callbacks(execute=False):
+            assert flush_deposit_queue(force=True) == []
+
+        assert CrossrefDepositItem.objects.get().status == DepositStatus.FAILED
+
+    def test_xsd_invalid_packed_document_fails_items(self, publisher, django_capture_on_commit_callbacks):
+        groups = [_component_group(publisher, f"q.bad.{i}") for i in range(2)]
+        for cg in groups:
+            enqueue_deposit(ExportType.COMPONENT_GROUP, cg)
+        broken = groups[1].crossref_xml.replace("<sa_component ", "<unknown_element/><sa_component ", 1)
+        type(groups[1]).objects.filter(pk=groups[1].pk).update(crossref_xml=broken)
+
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            assert flush_deposit_queue(force=True) == []
+
+        assert callbacks == []
+        assert not CrossrefDeposit.objects.exists()
+        items = CrossrefDepositItem.objects.all()
+        assert {item.status for item in items} == {DepositStatus.FAILED}
+        assert all("XSD" in item.message for item in items)
+
+    def test_pending_items_are_locked_skipping_locked_rows(self):
+        from doi_portal.crossref.deposit_queue import _lock_pending_items
+
+        query = _lock_pending_items().query
+
+        assert query.select_for_update is True
+        assert query.select_for_update_skip_locked is True
+        assert query.select_for_update_of == ("self",)
+
+    def test_management_command(self, publisher, django_capture_on_commit_callbacks, capsys):
+        enqueue_deposit(ExportType.COMPONENT_GROUP, _component_group(publisher, "q.cmd"))
+
+        with django_capture_on_commit_callbacks(execute=False):
+            call_command("flush_crossref_deposit_queue", "--force")
+
+        assert CrossrefDeposit.objects.count() == 1
+        assert "Kreirano depozita: 1" in capsys.readouterr().out
+
+
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="Row locks need PostgreSQL")
+@pytest.mark.django_db(transaction=True)
+class TestConcurrentFlush:
+    """Overlapping flushes against a database with row locks."""
+
+    def test_overlapping_flush_skips_locked_items(self, publisher):
+        import threading
+
+        from doi_portal.crossref.deposit_queue import _lock_pending_items
+
+        enqueue_deposit(ExportType.COMPONENT_GROUP, _component_group(publisher, "q.lock"))
+        locked = threading.Event()
+        release = threading.Event()
+
+        def hold_locks():
+            try:
+                with transaction.atomic():
+                    list(_lock_pending_items())
+                    locked.set()
+                    release.wait(10)
+            finally:
+                connection.close()
+
+        holder = threading.Thread(target=hold_locks)
+        holder.start()
+        try:
+            assert locked.wait(10)
+            assert flush_deposit_queue(force=True) == []
+        finally:
+            release.set()
+            holder.join()
+
+        assert len(flush_deposit_queue(force=True)) == 1
+        assert CrossrefDeposit.objects.count() == 1
+
+
+@pytest.mark.django_db
+class TestDepositEnqueueView:
+    """Tests for the deposit-enqueue HTMX endpoints."""
+
+    def test_post_queues_component_group(self, client, publisher):
+        cg = _component_group(publisher, "q.view")
+        user = UserFactory(is_superuser=True, is_staff=True)
+        client.force_login(user)
+
+        response = client.post(reverse("crossref:component-deposit-enqueue", args=[cg.pk]))
+
+        assert response.status_code == 200
+        assert "U redu za zajednički depozit" in response.content.decode()
+        item = CrossrefDepositItem.objects.get()
+        assert (item.object_id, item.queued_by) == (cg.pk, user)
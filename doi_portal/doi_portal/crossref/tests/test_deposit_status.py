@@ -0,0 +1,210 @@
+"""
+Tests for cached deposit-workflow summaries.
+
+Covers computing and caching DepositSummary, invalidation by the
+entity, its records and their children, its publication and publisher,
+exports, queued deposits and depositor settings, and the workflow pages
+served from the cache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth.models import Group
+from django.urls import reverse
+
+from doi_portal.articles.models import ArticleStatus
+from doi_portal.articles.tests.factories import ArticleFactory
+from doi_portal.articles.tests.factories import AuthorFactory
+from doi_portal.components.tests.factories import ComponentFactory
+from doi_portal.components.tests.factories import ComponentGroupFactory
+from doi_portal.core.models import SiteSettings
+from doi_portal.crossref.deposit_status import compute_deposit_summary
+from doi_portal.crossref.deposit_status import get_deposit_summary
+from doi_portal.crossref.models import CrossrefDepositItem
+from doi_portal.crossref.models import CrossrefExport
+from doi_portal.crossref.models import ExportType
+from doi_portal.crossref.services import PreValidationService
+from doi_portal.issues.tests.factories import IssueFactory
+from doi_portal.monographs.tests.factories import MonographFactory
+from doi_portal.publications.tests.factories import JournalFactory
+from doi_portal.publications.tests.factories import PublisherFactory
+from doi_portal.users.tests.factories import UserFactory
+
+
+@pytest.fixture
+def site_settings(db):
+    """Create SiteSettings with test depositor data."""
+    return SiteSettings.objects.create(
+        depositor_name="Test Depositor",
+        depositor_email="test@example.com",
+    )
+
+
+@pytest.fixture
+def publisher(site_settings):
+    return PublisherFactory(doi_prefix="10.54321", crossref_username="depositor", crossref_password="s3cret")
+
+
+@pytest.fixture
+def issue(publisher):
+    return IssueFactory(
+        publication=JournalFactory(publisher=publisher, issn_print="1234-5678"),
+        crossref_xml="<doi_batch/>",
+        xsd_valid=True,
+    )
+
+
+@pytest.fixture
+def article(issue):
+    article = ArticleFactory(issue=issue, doi_suffix="status.001", status=ArticleStatus.PUBLISHED)
+    AuthorFactory(article=article, order=1)
+    return article
+
+
+@pytest.fixture
+def admin_user(db):
+    admin_group, _ = Group.objects.get_or_create(name="Administrator")
+    user = UserFactory()
+    user.groups.add(admin_group)
+    return user
+
+
+def _summary(issue):
+    return get_deposit_summary(ExportType.ISSUE, issue)
+
+
+@pytest.mark.django_db
+class TestDepositSummary:
+    """Tests for get_deposit_summary and its invalidation."""
+
+    def test_computes_summary(self, issue, article):
+        summary = _summary(issue)
+
+        assert summary.has_xml is True
+        assert summary.xsd_valid is True
+        assert summary.has_exports is False
+        assert summary.all_ready is False
+        assert summary.deposit_status == ""
+        assert summary.error_count == len(PreValidationService().validate_issue(issue).errors)
+        assert [step["number"] for step in summary.workflow_steps()] == [1, 2, 3, 4, 5]
+
+    def test_cached_summary_runs_no_queries(self, issue, article, django_assert_num_queries):
+        first = _summary(issue)
+
+        with django_assert_num_queries(0):
+            assert _summary(issue) == first
+
+    def test_export_invalidates(self, issue, admin_user):
+        assert _summary(issue).has_exports is False
+
+        CrossrefExport.objects.create(
+            issue=issue,
+            xml_content=issue.crossref_xml,
+            exported_by=admin_user,
+            filename="test.xml",
+            xsd_valid_at_export=True,
+        )
+
+        summary = _summary(issue)
+        assert summary.export_count == 1
+        assert summary.all_ready is True
+
+    def test_entity_save_invalidates(self, issue):
+        assert _summary(issue).has_xml is True
+
+        issue.crossref_xml = ""
+        issue.save(update_fields=["crossref_xml"])
+
+        assert _summary(issue).has_xml is False
+
+    def test_record_and_child_changes_invalidate(self, issue, article):
+        clean = _summary(issue)
+
+        article.title = ""
+        article.save()
+        untitled = _summary(issue)
+        assert untitled.error_count > clean.error_count
+
+        author = article.authors.get()
+        author.surname = ""
+        author.save()
+        assert _summary(issue).error_count > untitled.error_count
+
+    def test_site_settings_invalidate_all(self, issue, site_settings):
+        before = _summary(issue)
+
+        site_settings.depositor_email = ""
+        site_settings.save()
+
+        assert _summary(issue).error_count > before.error_count
+
+    def test_publication_save_invalidates(self, issue, article):
+        before = _summary(issue)
+
+        publication = issue.publication
+        publication.issn_print = ""
+        publication.issn_online = ""
+        publication.save()
+
+        assert _summary(issue).error_count > before.error_count
+
+    def test_publisher_save_invalidates(self, publisher, issue, article):
+        group = ComponentGroupFactory(publisher=publisher)
+        monograph = MonographFactory(publisher=publisher)
+        other_issue = IssueFactory()
+        entities = [
+            (ExportType.ISSUE, issue),
+            (ExportType.COMPONENT_GROUP, group),
+            (ExportType.MONOGRAPH, monograph),
+            (ExportType.ISSUE, other_issue),
+        ]
+        for entity_type, entity in entities:
+            get_deposit_summary(entity_type, entity)
+
+        publisher.name = "Preimenovani izdavač"
+        publisher.save()
+
+        with patch(
+            "doi_portal.crossref.deposit_status.compute_deposit_summary",
+            wraps=compute_deposit_summary,
+        ) as compute:
+            for entity_type, entity in entities:
+                get_deposit_summary(entity_type, entity)
+
+        assert [call.args[1] for call in compute.call_args_list] == [issue, group, monograph]
+
+    def test_queued_deposit_invalidates(self, publisher):
+        group = ComponentGroupFactory(publisher=publisher)
+        ComponentFactory(component_group=group)
+        assert get_deposit_summary(ExportType.COMPONENT_GROUP, group).is_queued is False
+
+        CrossrefDepositItem.objects.create(
+            publisher=publisher,
+            entity_type=ExportType.COMPONENT_GROUP,
+            object_id=group.pk,
+            content_type="sa_component",
+        )
+
+        assert get_deposit_summary(ExportType.COMPONENT_GROUP, group).is_queued is True
+
+
+@pytest.mark.django_db
+class TestWorkflowPageFromCache:
+    """Workflow pages render from the cached summary."""
+
+    def test_second_get_skips_validation(self, client, admin_user, issue, article, monkeypatch):
+        client.force_login(admin_user)
+        url = reverse("crossref:issue-deposit", args=[issue.pk])
+        first = client.get(url)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("pre-validation should not run")
+
+        monkeypatch.setattr(PreValidationService, "validate_issue", fail)
+        second = client.get(url)
+
+        assert second.status_code == 200
+        assert second.context["steps"] == first.context["steps"]
+        assert second.context["deposit_summary"] == first.context["deposit_summary"]
+        assert second.context["live_deposit"] is None
@@ -0,0 +1,241 @@
+"""
+Tests for the global DOI registry.
+
+Covers signal-driven registration and release, ownership of duplicate
+DOIs, single-query collision checks, parent DOI lookups in component
+validation and the rebuild management command.
+"""
+
+import pytest
+from django.core.management import call_command
+
+from doi_portal.articles.tests.factories import ArticleFactory
+from doi_portal.components.tests.factories import ComponentFactory
+from doi_portal.components.tests.factories import ComponentGroupFactory
+from doi_portal.crossref.doi_registry import doi_exists
+from doi_portal.crossref.doi_registry import find_doi_collisions
+from doi_portal.crossref.doi_registry import full_doi
+from doi_portal.crossref.doi_registry import rebuild_doi_registry
+from doi_portal.crossref.models import DOIEntityType
+from doi_portal.crossref.models import RegisteredDOI
+from doi_portal.crossref.services import PreValidationService
+from doi_portal.issues.tests.factories import IssueFactory
+from doi_portal.monographs.tests.factories import MonographChapterFactory
+from doi_portal.monographs.tests.factories import MonographFactory
+from doi_portal.publications.tests.factories import JournalFactory
+from doi_portal.publications.tests.factories import PublisherFactory
+
+
+@pytest.fixture
+def publisher(db):
+    return PublisherFactory(doi_prefix="10.55555")
+
+
+@pytest.fixture
+def issue(publisher):
+    return IssueFactory(publication=JournalFactory(publisher=publisher), doi_suffix="reg.issue")
+
+
+def _entry(entity_type, obj):
+    return RegisteredDOI.objects.filter(entity_type=entity_type, object_id=obj.pk).first()
+
+
+class TestFullDOI:
+    """Tests for full_doi."""
+
+    def test_normalizes_case_and_whitespace(self):
+        assert full_doi(" 10.55555 ", "Art.ABC ") == "10.55555/art.abc"
+
+    @pytest.mark.parametrize(("prefix", "suffix"), [("", "x"), ("10.1", ""), (None, None)])
+    def test_missing_part(self, prefix, suffix):
+        assert full_doi(prefix, suffix) == ""
+
+
+@pytest.mark.django_db
+class TestRegistration:
+    """Registry rows follow saves and deletes of DOI-bearing records."""
+
+    def test_records_are_registered_on_save(self, issue, publisher):
+        article = ArticleFactory(issue=issue, doi_suffix="Reg.001")
+        monograph = MonographFactory(publisher=publisher, doi_suffix="reg.mono")
+        chapter = MonographChapterFactory(monograph=monograph, doi_suffix="reg.ch")
+        component = ComponentFactory(component_group=ComponentGroupFactory(publisher=publisher), doi_suffix="reg.c")
+
+        assert _entry(DOIEntityType.ISSUE, issue).doi == "10.55555/reg.issue"
+        assert _entry(DOIEntityType.ARTICLE, article).doi == "10.55555/reg.001"
+        assert _entry(DOIEntityType.MONOGRAPH, monograph).doi == "10.55555/reg.mono"
+        assert _entry(DOIEntityType.CHAPTER, chapter).doi == "10.55555/reg.ch"
+        assert _entry(DOIEntityType.COMPONENT, component).publisher == publisher
+
+    def test_suffix_change_moves_entry(self, issue):
+        article = ArticleFactory(issue=issue, doi_suffix="reg.old")
+
+        article.doi_suffix = "reg.new"
+        article.save()
+
+        assert not doi_exists("10.55555/reg.old")
+        assert _entry(DOIEntityType.ARTICLE, article).doi == "10.55555/reg.new"
+
+    def test_unrelated_update_fields_skip_registry(self, issue):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        article = ArticleFactory(issue=issue, doi_suffix="reg.skip")
+
+        with CaptureQueriesContext(connection) as queries:
+            article.save(update_fields=["title"])
+
+        assert not any("crossref_registereddoi" in query["sql"] for query in queries)
+
+    def test_soft_and_hard_delete_release(self, issue):
+        article = ArticleFactory(issue=issue, doi_suffix="reg.del")
+
+        article.soft_delete()
+        assert not doi_exists("10.55555/reg.del")
+
+        article.restore()
+        assert doi_exists("10.55555/reg.del")
+
+        article.delete()
+        assert not doi_exists("10.55555/reg.del")
+
+    def test_monograph_soft_delete_and_restore_cascade_to_chapters(self, publisher):
+        monograph = MonographFactory(publisher=publisher, doi_suffix="reg.mono.del")
+        chapter = MonographChapterFactory(monograph=monograph, doi_suffix="reg.ch.del")
+
+        monograph.soft_delete()
+        assert not doi_exists("10.55555/reg.mono.del")
+        assert not doi_exists("10.55555/reg.ch.del")
+        assert _entry(DOIEntityType.CHAPTER, chapter) is None
+
+        monograph.restore()
+        assert doi_exists("10.55555/reg.mono.del")
+        assert _entry(DOIEntityType.CHAPTER, chapter).doi == "10.55555/reg.ch.del"
+
+    def test_issue_without_suffix_is_not_registered(self, publisher):
+        issue = IssueFactory(publication=JournalFactory(publisher=publisher))
+
+        assert _entry(DOIEntityType.ISSUE, issue) is None
+
+    def test_duplicate_claim_and_owner_promotion(self, issue, publisher):
+        article = ArticleFactory(issue=issue, doi_suffix="reg.dup")
+        monograph = MonographFactory(publisher=publisher, doi_suffix="REG.DUP")
+
+        assert _entry(DOIEntityType.ARTICLE, article).is_primary is True
+        assert _entry(DOIEntityType.MONOGRAPH, monograph).is_primary is False
+
+        article.delete()
+
+        assert _entry(DOIEntityType.MONOGRAPH, monograph).is_primary is True
+
+    def test_prefix_change_reregisters_publisher(self, issue, publisher):
+        article = ArticleFactory(issue=issue, doi_suffix="reg.prefix")
+
+        publisher.doi_prefix = "10.66666"
+        publisher.save()
+
+        assert _entry(DOIEntityType.ARTICLE, article).doi == "10.66666/reg.prefix"
+        assert _entry(DOIEntityType.ISSUE, issue).doi == "10.66666/reg.issue"
+
+
+    def test_moving_publication_reregisters_issues_and_articles(self, issue, publisher):
+        article = ArticleFactory(issue=issue, doi_suffix="reg.moved")
+        other = PublisherFactory(doi_prefix="10.77777")
+        publication = issue.publication
+
+        publication.publisher = other
+        publication.save()
+
+        assert _entry(DOIEntityType.ISSUE, issue).doi == "10.77777/reg.issue"
+        assert _entry(DOIEntityType.ARTICLE, article).publisher_id == other.pk
+        assert not RegisteredDOI.objects.filter(publisher_id=publisher.pk).exists()
+        cg = ComponentGroupFactory(publisher=other, parent_doi="10.77777/reg.moved")
+        assert PreValidationService()._validate_component_parent_doi_exists(cg).warnings == []
+
+@pytest.mark.django_db
+class TestLookups:
+    """Collision and existence checks are single indexed queries."""
+
+    def test_bulk_collision_check_is_one_query(self, issue, publisher, django_assert_num_queries):
+        articles = [ArticleFactory(issue=issue, doi_suffix=f"reg.bulk{n}") for n in range(25)]
+        other_issue = IssueFactory(publication=issue.publication, doi_suffix="reg.other")
+        ArticleFactory(issue=other_issue, doi_suffix="reg.bulk3")
+
+        claims = [(DOIEntityType.ISSUE, issue.pk, full_doi(publisher.doi_prefix, issue.doi_suffix))]
+        claims += [
+            (DOIEntityType.ARTICLE, article.pk, full_doi(publisher.doi_prefix, article.doi_suffix))
+            for article in articles
+        ]
+        with django_assert_num_queries(1):
+            collisions = find_doi_collisions(claims)
+
+        assert collisions == {(DOIEntityType.ARTICLE, articles[3].pk)}
+
+    def test_unregistered_claims_collide_with_each_other(self, db):
+        claims = [(DOIEntityType.ARTICLE, 1, "10.1/x"), (DOIEntityType.ARTICLE, 2, "10.1/X")]
+
+        assert find_doi_collisions(claims) == {(DOIEntityType.ARTICLE, 1), (DOIEntityType.ARTICLE, 2)}
+
+    def test_issue_suffix_used_by_monograph_is_error(self, issue, publisher):
+        MonographFactory(publisher=publisher, doi_suffix="reg.issue")
+
+        result = PreValidationService().validate_issue(issue)
+
+        assert any("reg.issue" in e.message for e in result.errors if e.field_name == "doi_suffix")
+
+    def test_chapter_suffix_used_by_article_is_error(self, issue, publisher):
+        ArticleFactory(issue=issue, doi_suffix="reg.shared")
+        monograph = MonographFactory(publisher=publisher)
+        MonographChapterFactory(monograph=monograph, doi_suffix="reg.shared", status="PUBLISHED")
+
+        result = PreValidationService().validate_monograph(monograph)
+
+        errors = [e.message for e in result.errors if e.field_name == "doi_suffix"]
+        assert errors == ["DOI sufiks 'reg.shared' se već koristi u drugom zapisu (poglavlje 1)"]
+
+    def test_parent_doi_is_found_in_registry(self, issue, publisher, django_assert_num_queries):
+        article = ArticleFactory(issue=issue, doi_suffix="reg.parent")
+        cg = ComponentGroupFactory(publisher=publisher, parent_doi="10.55555/REG.PARENT")
+        service = PreValidationService()
+
+        with django_assert_num_queries(1):
+            result = service._validate_component_parent_doi_exists(cg)
+        assert result.warnings == []
+
+        article.soft_delete()
+        result = service._validate_component_parent_doi_exists(cg)
+        assert "nije pronađen u sistemu" in result.warnings[0].message
+
+
+@pytest.mark.django_db
+class TestRebuild:
+    """Tests for rebuild_doi_registry and its management command."""
+
+    def test_rebuild_restores_missing_rows(self, issue):
+        ArticleFactory(issue=issue, doi_suffix="reg.r1")
+        ArticleFactory(issue=issue, doi_suffix="reg.r1b")
+        RegisteredDOI.objects.all().delete()
+
+        assert rebuild_doi_registry() == 3
+        assert set(RegisteredDOI.objects.values_list("doi", flat=True)) == {
+            "10.55555/reg.issue",
+            "10.55555/reg.r1",
+            "10.55555/reg.r1b",
+        }
+
+    def test_publisher_rebuild_leaves_other_publishers(self, issue):
+        foreign = MonographFactory(publisher=PublisherFactory(doi_prefix="10.77777"), doi_suffix="reg.f")
+        foreign_entry = _entry(DOIEntityType.MONOGRAPH, foreign)
+
+        assert rebuild_doi_registry(publisher_id=issue.publication.publisher_id) == 1
+
+        assert _entry(DOIEntityType.MONOGRAPH, foreign).pk == foreign_entry.pk
+        assert _entry(DOIEntityType.ISSUE, issue).is_primary is True
+
+    def test_management_command(self, issue, capsys):
+        RegisteredDOI.objects.all().delete()
+
+        call_command("rebuild_doi_registry")
+
+        assert "Registrovano DOI-jeva: 1" in capsys.readouterr().out
+        assert doi_exists("10.55555/reg.issue")
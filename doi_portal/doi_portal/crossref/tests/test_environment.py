@@ -0,0 +1,73 @@
+"""
+Tests for the shared Crossref Jinja2 environment.
+
+Verifies that CrossrefService instances reuse one compiled environment,
+that templates can be warmed up front, and that bytecode is persisted
+when CROSSREF_JINJA_BYTECODE_CACHE_DIR is configured.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+
+from doi_portal.crossref import services
+from doi_portal.crossref.services import CrossrefService
+from doi_portal.crossref.services import get_crossref_environment
+from doi_portal.crossref.services import warm_crossref_templates
+
+
+@pytest.fixture
+def fresh_environment():
+    """Drop the process-wide environment so settings changes take effect."""
+    previous = services._environment
+    services._environment = None
+    yield
+    services._environment = previous
+
+
+class TestSharedEnvironment:
+    """Tests for get_crossref_environment / warm_crossref_templates."""
+
+    def test_services_share_one_environment(self):
+        assert CrossrefService().env is CrossrefService().env
+        assert CrossrefService().env is get_crossref_environment()
+
+    def test_templates_are_compiled_once(self):
+        warm_crossref_templates()
+        env = get_crossref_environment()
+
+        with patch.object(env, "compile", wraps=env.compile) as compile_spy:
+            for _ in range(3):
+                CrossrefService().env.get_template("journal_article.xml.j2")
+
+        compile_spy.assert_not_called()
+
+    def test_warm_loads_all_xml_templates(self):
+        names = warm_crossref_templates()
+
+        assert "journal_article.xml.j2" in names
+        assert "conference_paper.xml.j2" in names
+        assert "sa_component.xml.j2" in names
+        assert "book_monograph.xml.j2" in names
+
+    def test_custom_filters_registered(self):
+        env = get_crossref_environment()
+
+        assert {"xml_escape", "format_date", "format_orcid_url", "format_month", "format_day"} <= set(env.filters)
+
+    def test_bytecode_cache_persists_compiled_templates(self, tmp_path, fresh_environment):
+        with override_settings(CROSSREF_JINJA_BYTECODE_CACHE_DIR=str(tmp_path / "jinja")):
+            names = warm_crossref_templates()
+
+        assert len(list((tmp_path / "jinja").iterdir())) == len(names)
+
+
+@pytest.mark.django_db
+def test_benchmark_command_reports_both_modes(capsys):
+    call_command("benchmark_crossref_templates", iterations=1)
+
+    out = capsys.readouterr().out
+    assert "Fresh environment per call" in out
+    assert "Shared environment per call" in out
@@ -0,0 +1,151 @@
+"""
+Tests for per-article Crossref XML fragment caching.
+
+Verifies that generate_xml stitches cached article fragments and
+re-renders only articles whose content fingerprint changed.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from jinja2 import Template
+
+from doi_portal.articles.models import Affiliation
+from doi_portal.articles.models import Article
+from doi_portal.articles.models import Author
+from doi_portal.core.models import SiteSettings
+from doi_portal.crossref.services import CrossrefService
+from doi_portal.crossref.services import content_fingerprint
+from doi_portal.crossref.tests.test_loaders import _create_issue_with_articles
+
+ITEM_TEMPLATE = "journal_article_item.xml.j2"
+
+
+@pytest.fixture
+def site(db):
+    """Set explicit Site domain for reproducible tests."""
+    from django.contrib.sites.models import Site
+
+    site = Site.objects.get_current()
+    site.domain = "testserver.example.com"
+    site.save()
+    return site
+
+
+@pytest.fixture
+def site_settings(db):
+    """Create SiteSettings with test depositor data."""
+    return SiteSettings.objects.create(
+        depositor_name="Test Depositor",
+        depositor_email="test@example.com",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _generate_counting_renders(issue):
+    """Generate issue XML and return (xml, number of article fragments rendered)."""
+    original_render = Template.render
+    rendered = []
+
+    def spy(self, *args, **kwargs):
+        if self.name == ITEM_TEMPLATE:
+            rendered.append(kwargs["article"]["pk"])
+        return original_render(self, *args, **kwargs)
+
+    with patch.object(Template, "render", autospec=True, side_effect=spy):
+        xml = CrossrefService().generate_xml(issue)
+    return xml, rendered
+
+
+def _body(xml):
+    """Strip per-call head data (batch id, timestamp)."""
+    return xml.split("</head>")[1]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("site", "site_settings")
+class TestArticleFragmentCache:
+    """Tests for CrossrefService._render_article_fragments."""
+
+    def test_first_generation_renders_every_article(self):
+        """Cold cache renders one fragment per article."""
+        issue = _create_issue_with_articles(5)
+
+        _, rendered = _generate_counting_renders(issue)
+
+        assert len(rendered) == 5
+
+    def test_unchanged_issue_reuses_all_fragments(self):
+        """Regenerating an unchanged issue renders no article fragments."""
+        issue = _create_issue_with_articles(5)
+        first, _ = _generate_counting_renders(issue)
+
+        second, rendered = _generate_counting_renders(issue)
+
+        assert rendered == []
+        assert _body(first) == _body(second)
+
+    def test_author_edit_rerenders_only_that_article(self):
+        """Editing one author invalidates only the owning article's fragment."""
+        issue = _create_issue_with_articles(5)
+        _generate_counting_renders(issue)
+        author = Author.objects.filter(article__issue=issue).first()
+        author.surname = "Izmenjeno"
+        author.save()
+
+        xml, rendered = _generate_counting_renders(issue)
+
+        assert rendered == [author.article_id]
+        assert "<surname>Izmenjeno</surname>" in xml
+
+    def test_affiliation_edit_rerenders_only_that_article(self):
+        """Affiliations are part of the article fingerprint."""
+        issue = _create_issue_with_articles(3)
+        _generate_counting_renders(issue)
+        affiliation = Affiliation.objects.filter(author__article__issue=issue).first()
+        affiliation.institution_name = "Novi Institut"
+        affiliation.save()
+
+        xml, rendered = _generate_counting_renders(issue)
+
+        assert rendered == [affiliation.author.article_id]
+        assert "Novi Institut" in xml
+
+    def test_issue_level_change_invalidates_all_fragments(self):
+        """Shared inputs used inside fragments (issue date) invalidate every fragment."""
+        issue = _create_issue_with_articles(3)
+        _generate_counting_renders(issue)
+        issue.year = 2030
+        issue.save()
+
+        _, rendered = _generate_counting_renders(issue)
+
+        assert len(rendered) == 3
+
+    def test_stitched_output_matches_uncached_render(self):
+        """Output assembled from cached fragments equals a cold render."""
+        issue = _create_issue_with_articles(4)
+        Article.objects.filter(issue=issue).update(first_page="1", last_page="9")
+        warm_first, _ = _generate_counting_renders(issue)
+        warm, _ = _generate_counting_renders(issue)
+        cache.clear()
+        cold, _ = _generate_counting_renders(issue)
+
+        assert _body(warm) == _body(cold) == _body(warm_first)
+
+
+class TestContentFingerprint:
+    """Tests for content_fingerprint helper."""
+
+    def test_fingerprint_is_stable_for_key_order(self):
+        assert content_fingerprint({"a": 1, "b": 2}) == content_fingerprint({"b": 2, "a": 1})
+
+    def test_fingerprint_changes_with_content(self):
+        assert content_fingerprint({"a": 1}) != content_fingerprint({"a": 2})
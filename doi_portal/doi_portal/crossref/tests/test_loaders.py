@@ -0,0 +1,406 @@
+"""
+Tests for Crossref export loaders.
+
+Verifies that the issue, monograph and component group export graphs
+are loaded in a fixed number of queries, independent of how many
+articles, chapters or components they contain.
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from doi_portal.articles.models import Affiliation
+from doi_portal.articles.models import Article
+from doi_portal.articles.models import ArticleFunding
+from doi_portal.articles.models import ArticleRelation
+from doi_portal.articles.models import ArticleStatus
+from doi_portal.articles.models import Author
+from doi_portal.articles.models import AuthorSequence
+from doi_portal.articles.models import ContributorRole
+from doi_portal.articles.models import RelationScope
+from doi_portal.core.models import SiteSettings
+from doi_portal.components.models import Component
+from doi_portal.components.models import ComponentContributor
+from doi_portal.components.models import ComponentGroup
+from doi_portal.components.tests.factories import ComponentGroupFactory
+from doi_portal.crossref.loaders import load_component_group_export_graph
+from doi_portal.crossref.loaders import load_issue_export_graph
+from doi_portal.crossref.loaders import load_monograph_export_graph
+from doi_portal.crossref.services import CrossrefService
+from doi_portal.issues.models import Issue
+from doi_portal.issues.tests.factories import IssueFactory
+from doi_portal.monographs.models import ChapterAffiliation
+from doi_portal.monographs.models import ChapterContributor
+from doi_portal.monographs.models import ChapterFunding
+from doi_portal.monographs.models import ChapterRelation
+from doi_portal.monographs.models import Monograph
+from doi_portal.monographs.models import MonographAffiliation
+from doi_portal.monographs.models import MonographChapter
+from doi_portal.monographs.models import MonographContributor
+from doi_portal.monographs.models import MonographFunding
+from doi_portal.monographs.models import MonographStatus
+from doi_portal.monographs.tests.factories import MonographFactory
+from doi_portal.publications.tests.factories import JournalFactory
+from doi_portal.publications.tests.factories import PublisherFactory
+
+# Queries issued by load_issue_export_graph: articles, authors,
+# affiliations, fundings, relations.
+LOADER_QUERY_BUDGET = 5
+
+# load_monograph_export_graph: monograph contributors, affiliations,
+# fundings, relations; chapters; chapter contributors, affiliations,
+# fundings, relations.
+MONOGRAPH_LOADER_QUERY_BUDGET = 9
+
+# load_component_group_export_graph: components, contributors.
+COMPONENT_LOADER_QUERY_BUDGET = 2
+
+# Chapters in the edited volume used for monograph tests
+EDITED_VOLUME_CHAPTERS = 60
+
+
+@pytest.fixture
+def site(db):
+    """Set explicit Site domain for reproducible tests."""
+    from django.contrib.sites.models import Site
+
+    site = Site.objects.get_current()
+    site.domain = "testserver.example.com"
+    site.name = "Test Server"
+    site.save()
+    return site
+
+
+@pytest.fixture
+def site_settings(db):
+    """Create SiteSettings with test depositor data."""
+    return SiteSettings.objects.create(
+        depositor_name="Test Depositor",
+        depositor_email="test@example.com",
+    )
+
+
+def _create_issue_with_articles(article_count: int):
+    """Create a journal issue with fully populated articles using bulk inserts."""
+    publisher = PublisherFactory()
+    publication = JournalFactory(publisher=publisher)
+    issue = IssueFactory(publication=publication, volume="1", issue_number="1")
+
+    articles = Article.objects.bulk_create(
+        Article(
+            issue=issue,
+            title=f"Article {i}",
+            abstract=f"Abstract {i}",
+            doi_suffix=f"loader.{i:04d}",
+            status=ArticleStatus.PUBLISHED,
+        )
+        for i in range(article_count)
+    )
+    authors = Author.objects.bulk_create(
+        Author(
+            article=article,
+            given_name="Given",
+            surname=f"Surname {order}",
+            sequence=AuthorSequence.FIRST if order == 1 else AuthorSequence.ADDITIONAL,
+            order=order,
+        )
+        for article in articles
+        for order in (2, 1)
+    )
+    Affiliation.objects.bulk_create(
+        Affiliation(author=author, institution_name=f"Institution {order}", order=order)
+        for author in authors
+        for order in (2, 1)
+    )
+    ArticleFunding.objects.bulk_create(
+        ArticleFunding(article=article, funder_name="Funder", award_number="A-1", order=1)
+        for article in articles
+    )
+    ArticleRelation.objects.bulk_create(
+        ArticleRelation(
+            article=article,
+            relationship_type="isSupplementTo",
+            relation_scope=RelationScope.INTER_WORK,
+            target_identifier="10.5555/target",
+            order=1,
+        )
+        for article in articles
+    )
+    return issue
+
+
+def _create_edited_volume(chapter_count: int):
+    """Create an edited monograph with editors and fully populated published chapters."""
+    monograph = MonographFactory(title="Zbornik radova", status=MonographStatus.PUBLISHED)
+    editors = MonographContributor.objects.bulk_create(
+        MonographContributor(
+            monograph=monograph,
+            given_name="Urednik",
+            surname=f"Surname {order}",
+            contributor_role=ContributorRole.EDITOR,
+            order=order,
+        )
+        for order in (2, 1)
+    )
+    MonographAffiliation.objects.bulk_create(
+        MonographAffiliation(contributor=editor, institution_name="Institut", order=1) for editor in editors
+    )
+    MonographFunding.objects.create(monograph=monograph, funder_name="Fond", order=1)
+
+    chapters = MonographChapter.objects.bulk_create(
+        MonographChapter(
+            monograph=monograph,
+            title=f"Chapter {i}",
+            doi_suffix=f"vol.{monograph.pk}.{i:03d}",
+            status=MonographStatus.PUBLISHED,
+            order=chapter_count - i,
+        )
+        for i in range(chapter_count)
+    )
+    contributors = ChapterContributor.objects.bulk_create(
+        ChapterContributor(
+            chapter=chapter,
+            given_name="Given",
+            surname=f"Surname {order}",
+            sequence=AuthorSequence.FIRST if order == 1 else AuthorSequence.ADDITIONAL,
+            order=order,
+        )
+        for chapter in chapters
+        for order in (2, 1)
+    )
+    ChapterAffiliation.objects.bulk_create(
+        ChapterAffiliation(contributor=contributor, institution_name=f"Institution {order}", order=order)
+        for contributor in contributors
+        for order in (2, 1)
+    )
+    ChapterFunding.objects.bulk_create(
+        ChapterFunding(chapter=chapter, funder_name="Funder", award_number="A-1", order=1) for chapter in chapters
+    )
+    ChapterRelation.objects.bulk_create(
+        ChapterRelation(
+            chapter=chapter,
+            relationship_type="isSupplementTo",
+            relation_scope=RelationScope.INTER_WORK,
+            target_identifier="10.5555/target",
+            order=1,
+        )
+        for chapter in chapters
+    )
+    return monograph
+
+
+def _create_component_group(component_count: int):
+    """Create a component group with components and two contributors each."""
+    group = ComponentGroupFactory()
+    components = Component.objects.bulk_create(
+        Component(
+            component_group=group,
+            title=f"Component {i}",
+            doi_suffix=f"comp.{group.pk}.{i}",
+            format_mime_type="audio/mpeg",
+            order=i,
+        )
+        for i in range(component_count)
+    )
+    ComponentContributor.objects.bulk_create(
+        ComponentContributor(
+            component=component,
+            given_name="Given",
+            surname=f"Surname {order}",
+            sequence=AuthorSequence.FIRST if order == 1 else AuthorSequence.ADDITIONAL,
+            order=order,
+        )
+        for component in components
+        for order in (2, 1)
+    )
+    return group
+
+
+def _reload(issue):
+    """Return a fresh Issue instance so cached relations do not skew query counts."""
+    return Issue.objects.get(pk=issue.pk)
+
+
+@pytest.mark.django_db
+class TestLoadIssueExportGraph:
+    """Tests for load_issue_export_graph."""
+
+    @pytest.mark.parametrize("article_count", [1, 50, 500])
+    def test_query_count_is_constant(self, article_count, django_assert_num_queries):
+        """Loading the export graph never exceeds the fixed query budget."""
+        issue = _create_issue_with_articles(article_count)
+
+        with django_assert_num_queries(LOADER_QUERY_BUDGET):
+            articles = load_issue_export_graph(issue)
+            for article in articles:
+                for author in article.authors.all():
+                    list(author.affiliations.all())
+                list(article.fundings.all())
+                list(article.relations.all())
+
+        assert len(articles) == article_count
+
+    def test_children_are_ordered(self):
+        """Prefetched authors and affiliations are returned in 'order' sequence."""
+        issue = _create_issue_with_articles(1)
+
+        article = load_issue_export_graph(issue)[0]
+        authors = list(article.authors.all())
+
+        assert [a.order for a in authors] == [1, 2]
+        assert [aff.order for aff in authors[0].affiliations.all()] == [1, 2]
+
+    def test_excludes_soft_deleted_records(self):
+        """Soft-deleted articles and authors are not loaded."""
+        issue = _create_issue_with_articles(2)
+        deleted_article = Article.objects.filter(issue=issue).first()
+        deleted_article.soft_delete()
+        remaining = Article.objects.filter(issue=issue).first()
+        remaining.authors.filter(order=2).update(is_deleted=True)
+
+        articles = load_issue_export_graph(issue)
+
+        assert [a.pk for a in articles] == [remaining.pk]
+        assert [a.order for a in articles[0].authors.all()] == [1]
+
+
+@pytest.mark.django_db
+class TestBuildContextQueryCount:
+    """CrossrefService._build_context uses a bounded number of queries."""
+
+    @pytest.mark.parametrize("article_count", [1, 50, 500])
+    def test_build_context_query_count_is_constant(self, article_count, site, site_settings):
+        """Query count for _build_context does not grow with article count."""
+        baseline_issue = _create_issue_with_articles(1)
+        issue = _create_issue_with_articles(article_count)
+        service = CrossrefService()
+        service._get_site_url()  # Warm the per-instance site URL cache
+
+        with CaptureQueriesContext(connection) as baseline:
+            service._build_context(_reload(baseline_issue))
+        with CaptureQueriesContext(connection) as measured:
+            context = service._build_context(_reload(issue))
+
+        assert len(context["articles"]) == article_count
+        assert len(measured.captured_queries) == len(baseline.captured_queries)
+
+    def test_build_context_preserves_author_order(self, site, site_settings):
+        """Authors and affiliations in the context follow their 'order' field."""
+        issue = _create_issue_with_articles(1)
+
+        context = CrossrefService()._build_context(issue)
+        authors = context["articles"][0]["authors"]
+
+        assert [a["surname"] for a in authors] == ["Surname 1", "Surname 2"]
+        assert [aff["institution_name"] for aff in authors[0]["affiliations"]] == [
+            "Institution 1",
+            "Institution 2",
+        ]
+
+
+
+@pytest.mark.django_db
+class TestLoadMonographExportGraph:
+    """Tests for load_monograph_export_graph on an edited volume."""
+
+    @pytest.mark.parametrize("chapter_count", [1, EDITED_VOLUME_CHAPTERS])
+    def test_query_count_is_constant(self, chapter_count, django_assert_num_queries):
+        """Loading the volume never exceeds the fixed query budget."""
+        monograph = Monograph.objects.get(pk=_create_edited_volume(chapter_count).pk)
+
+        with django_assert_num_queries(MONOGRAPH_LOADER_QUERY_BUDGET):
+            chapters = load_monograph_export_graph(monograph)
+            for contributor in monograph.contributors.all():
+                list(contributor.affiliations.all())
+            list(monograph.fundings.all())
+            list(monograph.relations.all())
+            for chapter in chapters:
+                for contributor in chapter.contributors.all():
+                    list(contributor.affiliations.all())
+                list(chapter.fundings.all())
+                list(chapter.relations.all())
+
+        assert len(chapters) == chapter_count
+
+    def test_children_are_ordered_and_filtered(self):
+        """Chapters and contributors follow 'order'; unpublished and deleted records are skipped."""
+        monograph = _create_edited_volume(3)
+        chapters = list(MonographChapter.objects.filter(monograph=monograph).order_by("order"))
+        MonographChapter.objects.filter(pk=chapters[0].pk).update(status=MonographStatus.DRAFT)
+        chapters[1].contributors.filter(order=2).update(is_deleted=True)
+
+        loaded = load_monograph_export_graph(monograph)
+
+        assert [c.pk for c in loaded] == [chapters[1].pk, chapters[2].pk]
+        assert [c.order for c in loaded[0].contributors.all()] == [1]
+        assert [a.order for a in loaded[1].contributors.all()[1].affiliations.all()] == [1, 2]
+        assert [c.order for c in monograph.contributors.all()] == [1, 2]
+
+
+@pytest.mark.django_db
+class TestBuildMonographContextQueryCount:
+    """CrossrefService._build_monograph_context uses a bounded number of queries."""
+
+    def test_query_count_is_constant(self, site, site_settings):
+        """A 60-chapter edited volume needs as many queries as a single chapter."""
+        baseline_monograph = _create_edited_volume(1)
+        monograph = _create_edited_volume(EDITED_VOLUME_CHAPTERS)
+        service = CrossrefService()
+        service._get_site_url()
+
+        with CaptureQueriesContext(connection) as baseline:
+            service._build_monograph_context(Monograph.objects.get(pk=baseline_monograph.pk))
+        with CaptureQueriesContext(connection) as measured:
+            context = service._build_monograph_context(Monograph.objects.get(pk=monograph.pk))
+
+        assert len(context["chapters"]) == EDITED_VOLUME_CHAPTERS
+        assert len(measured.captured_queries) == len(baseline.captured_queries)
+
+    def test_context_preserves_order(self, site, site_settings):
+        """Editors, chapters and chapter contributors follow their 'order' field."""
+        monograph = _create_edited_volume(2)
+
+        context = CrossrefService()._build_monograph_context(monograph)
+
+        assert [c["surname"] for c in context["contributors"]] == ["Surname 1", "Surname 2"]
+        assert [c["title"] for c in context["chapters"]] == ["Chapter 1", "Chapter 0"]
+        chapter_contributors = context["chapters"][0]["contributors"]
+        assert [c["surname"] for c in chapter_contributors] == ["Surname 1", "Surname 2"]
+        assert [a["institution_name"] for a in chapter_contributors[0]["affiliations"]] == [
+            "Institution 1",
+            "Institution 2",
+        ]
+
+
+@pytest.mark.django_db
+class TestLoadComponentGroupExportGraph:
+    """Tests for load_component_group_export_graph."""
+
+    @pytest.mark.parametrize("component_count", [1, 60])
+    def test_query_count_is_constant(self, component_count, django_assert_num_queries):
+        """Loading components and contributors never exceeds the fixed query budget."""
+        group = _create_component_group(component_count)
+
+        with django_assert_num_queries(COMPONENT_LOADER_QUERY_BUDGET):
+            components = load_component_group_export_graph(group)
+            for component in components:
+                list(component.contributors.all())
+
+        assert len(components) == component_count
+
+    def test_build_component_context_query_count_is_constant(self, site, site_settings):
+        """Query count for _build_component_context does not grow with component count."""
+        baseline_group = _create_component_group(1)
+        group = _create_component_group(60)
+        service = CrossrefService()
+        service._get_site_url()
+
+        with CaptureQueriesContext(connection) as baseline:
+            service._build_component_context(ComponentGroup.objects.get(pk=baseline_group.pk))
+        with CaptureQueriesContext(connection) as measured:
+            context = service._build_component_context(ComponentGroup.objects.get(pk=group.pk))
+
+        assert len(context["components"]) == 60
+        assert len(measured.captured_queries) == len(baseline.captured_queries)
+        assert [c["surname"] for c in context["components"][0]["contributors"]] == ["Surname 1", "Surname 2"]
@@ -0,0 +1,162 @@
+"""
+Tests for streaming Crossref XML generation.
+
+Covers CrossrefService.stream_* / write_* methods, the write_xml_stream
+helper, and streamed XML download responses.
+"""
+
+import io
+
+import pytest
+from django.http import StreamingHttpResponse
+from django.urls import reverse
+
+from doi_portal.articles.models import ArticleStatus
+from doi_portal.articles.models import AuthorSequence
+from doi_portal.articles.tests.factories import ArticleFactory
+from doi_portal.articles.tests.factories import AuthorFactory
+from doi_portal.components.tests.factories import ComponentFactory
+from doi_portal.components.tests.factories import ComponentGroupFactory
+from doi_portal.core.models import SiteSettings
+from doi_portal.crossref.models import CrossrefExport
+from doi_portal.crossref.services import CrossrefService
+from doi_portal.crossref.services import write_xml_stream
+from doi_portal.issues.tests.factories import IssueFactory
+from doi_portal.monographs.tests.factories import MonographContributorFactory
+from doi_portal.monographs.tests.factories import MonographFactory
+from doi_portal.publications.tests.factories import JournalFactory
+from doi_portal.publications.tests.factories import PublisherFactory
+from doi_portal.users.tests.factories import UserFactory
+
+
+@pytest.fixture
+def site(db):
+    """Set explicit Site domain for reproducible tests."""
+    from django.contrib.sites.models import Site
+
+    site = Site.objects.get_current()
+    site.domain = "testserver.example.com"
+    site.save()
+    return site
+
+
+@pytest.fixture
+def site_settings(db):
+    """Create SiteSettings with test depositor data."""
+    return SiteSettings.objects.create(
+        depositor_name="Test Depositor",
+        depositor_email="test@example.com",
+    )
+
+
+@pytest.fixture
+def journal_issue(site, site_settings):
+    """Create a journal issue with one published article and author."""
+    publisher = PublisherFactory(doi_prefix="10.12345")
+    publication = JournalFactory(publisher=publisher, issn_print="1234-5678")
+    issue = IssueFactory(publication=publication, volume="3", issue_number="1")
+    article = ArticleFactory(
+        issue=issue,
+        title="Streaming Ćirilica & Latinica",
+        doi_suffix="stream.001",
+        status=ArticleStatus.PUBLISHED,
+    )
+    AuthorFactory(article=article, surname="Petrović", sequence=AuthorSequence.FIRST, order=1)
+    return issue
+
+
+@pytest.mark.django_db
+class TestStreamingGeneration:
+    """Tests for CrossrefService streaming API."""
+
+    def test_stream_xml_yields_multiple_chunks(self, journal_issue):
+        """stream_xml returns a lazy iterator of text chunks."""
+        chunks = list(CrossrefService().stream_xml(journal_issue))
+
+        assert len(chunks) > 1
+        assert all(isinstance(chunk, str) for chunk in chunks)
+
+    def test_generate_xml_equals_joined_stream(self, journal_issue):
+        """generate_xml is a thin wrapper over stream_xml."""
+        service = CrossrefService()
+        xml = service.generate_xml(journal_issue)
+        streamed = "".join(service.stream_xml(journal_issue))
+
+        # doi_batch_id and timestamp differ per call; compare the body
+        assert xml.split("</head>")[1] == streamed.split("</head>")[1]
+        assert "<doi>10.12345/stream.001</doi>" in streamed
+
+    def test_write_xml_to_binary_sink(self, journal_issue):
+        """write_xml writes UTF-8 bytes and reports the byte count."""
+        sink = io.BytesIO()
+
+        written = CrossrefService().write_xml(journal_issue, sink)
+
+        data = sink.getvalue()
+        assert written == len(data)
+        assert data.startswith(b'<?xml version="1.0" encoding="UTF-8"?>')
+        assert "Petrović".encode() in data
+
+    def test_write_component_xml_to_binary_sink(self, db):
+        """write_component_xml streams component group XML into a sink."""
+        cg = ComponentGroupFactory(parent_doi="10.12345/parent")
+        ComponentFactory(component_group=cg, doi_suffix="comp.stream")
+        sink = io.BytesIO()
+
+        CrossrefService().write_component_xml(cg, sink)
+
+        assert b"<doi>" in sink.getvalue()
+        assert b"comp.stream" in sink.getvalue()
+
+    def test_write_monograph_xml_to_binary_sink(self, site, site_settings):
+        """write_monograph_xml streams monograph XML into a sink."""
+        monograph = MonographFactory(doi_suffix="mono.stream")
+        MonographContributorFactory(monograph=monograph, sequence=AuthorSequence.FIRST)
+        sink = io.BytesIO()
+
+        CrossrefService().write_monograph_xml(monograph, sink)
+
+        assert b"mono.stream" in sink.getvalue()
+
+    def test_generate_and_store_validates_without_reparsing(self, journal_issue):
+        """generate_and_store_xml parses the streamed XML once for XSD validation."""
+        from unittest.mock import patch
+
+        with patch("doi_portal.crossref.validators.etree.fromstring") as fromstring:
+            success, xml = CrossrefService().generate_and_store_xml(journal_issue)
+
+        fromstring.assert_not_called()
+        journal_issue.refresh_from_db()
+        assert success is True
+        assert journal_issue.crossref_xml == xml
+        assert journal_issue.xsd_validated_at is not None
+        assert journal_issue.xsd_valid is not None
+
+    def test_write_xml_stream_encodes_chunks(self):
+        """write_xml_stream counts encoded bytes, not characters."""
+        sink = io.BytesIO()
+
+        written = write_xml_stream(["<a>", "š", "</a>"], sink)
+
+        assert sink.getvalue() == "<a>š</a>".encode()
+        assert written == len("<a>š</a>".encode())
+
+
+@pytest.mark.django_db
+class TestStreamedDownload:
+    """XML downloads are served as streamed responses."""
+
+    def test_download_returns_streaming_response(self, client, journal_issue):
+        """xml_download streams stored XML and still records the export."""
+        xml = "<?xml version='1.0'?>" + "<x>" + "a" * 200_000 + "</x>"
+        journal_issue.crossref_xml = xml
+        journal_issue.save(update_fields=["crossref_xml"])
+        user = UserFactory(is_superuser=True, is_staff=True)
+        client.force_login(user)
+
+        response = client.get(reverse("crossref:xml-download", args=[journal_issue.pk]))
+
+        assert response.status_code == 200
+        assert isinstance(response, StreamingHttpResponse)
+        assert response.getvalue().decode() == xml
+        assert CrossrefExport.objects.filter(issue=journal_issue).count() == 1
@@ -0,0 +1,150 @@
+"""
+Tests for Crossref submission log reconciliation.
+
+Uses recorded sample logs from tests/data; no live Crossref service.
+"""
+
+from datetime import UTC
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from doi_portal.articles.models import RecordDepositStatus
+from doi_portal.articles.tests.factories import ArticleFactory
+from doi_portal.components.tests.factories import ComponentFactory
+from doi_portal.components.tests.factories import ComponentGroupFactory
+from doi_portal.crossref.submission_log import RecordDiagnostic
+from doi_portal.crossref.submission_log import apply_submission_log
+from doi_portal.crossref.submission_log import iter_record_diagnostics
+from doi_portal.crossref.tests.fake_crossref import diagnostic
+from doi_portal.issues.tests.factories import IssueFactory
+from doi_portal.monographs.tests.factories import MonographChapterFactory
+from doi_portal.monographs.tests.factories import MonographFactory
+from doi_portal.publications.tests.factories import JournalFactory
+from doi_portal.publications.tests.factories import PublisherFactory
+
+DATA_DIR = Path(__file__).parent / "data"
+CHECKED_AT = datetime(2026, 10, 17, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def publisher(db):
+    """Publisher owning the DOIs in the sample logs."""
+    return PublisherFactory(doi_prefix="10.55555")
+
+
+@pytest.fixture
+def issue(publisher):
+    """Issue of a journal of the sample-log publisher."""
+    return IssueFactory(publication=JournalFactory(publisher=publisher))
+
+
+class TestIterRecordDiagnostics:
+    """Tests for iter_record_diagnostics."""
+
+    def test_parses_recorded_log(self):
+        with (DATA_DIR / "submission_log_journal.xml").open("rb") as log_file:
+            records = list(iter_record_diagnostics(log_file))
+
+        assert records[:4] == [
+            RecordDiagnostic("10.55555/article.log.001", RecordDepositStatus.SUCCESS, "Successfully added"),
+            RecordDiagnostic("10.55555/article.log.002", RecordDepositStatus.SUCCESS, "Successfully updated"),
+            RecordDiagnostic("10.55555/article.log.003", RecordDepositStatus.WARNING, "Added with conflict"),
+            RecordDiagnostic(
+                "10.55555/article.log.004",
+                RecordDepositStatus.FAILURE,
+                "Record not processed because submitted version: 202610171200 is less or equal "
+                "to previously submitted version (DOI match)",
+            ),
+        ]
+        assert len(records) == 5
+
+    def test_accepts_text_and_skips_records_without_doi(self):
+        log = diagnostic("completed", records=[("", "Failure", "No DOI"), ("10.1/a", "Success", "")])
+
+        assert list(iter_record_diagnostics(log)) == [
+            RecordDiagnostic("10.1/a", RecordDepositStatus.SUCCESS, ""),
+        ]
+
+
+@pytest.mark.django_db
+class TestApplySubmissionLog:
+    """Tests for apply_submission_log."""
+
+    def test_updates_articles_from_recorded_log(self, issue):
+        articles = [ArticleFactory(issue=issue, doi_suffix=f"article.log.00{n}") for n in range(1, 5)]
+
+        counts = apply_submission_log(
+            (DATA_DIR / "submission_log_journal.xml").read_bytes(),
+            checked_at=CHECKED_AT,
+        )
+
+        assert counts == {"success": 3, "warning": 1, "failure": 1, "updated": 4}
+        for article in articles:
+            article.refresh_from_db()
+        assert [a.crossref_deposit_status for a in articles] == ["success", "success", "warning", "failure"]
+        assert articles[0].crossref_deposit_errors == []
+        assert articles[2].crossref_deposit_errors == [{"message": "Added with conflict"}]
+        assert "previously submitted version" in articles[3].crossref_deposit_errors[0]["message"]
+        assert {a.crossref_deposit_checked_at for a in articles} == {CHECKED_AT}
+
+    def test_updates_chapters_and_components(self, publisher):
+        monograph = MonographFactory(publisher=publisher)
+        ok_chapter = MonographChapterFactory(monograph=monograph, doi_suffix="ch.log.001")
+        bad_chapter = MonographChapterFactory(monograph=monograph, doi_suffix="ch.log.002")
+        group = ComponentGroupFactory(publisher=publisher)
+        ok_component = ComponentFactory(component_group=group, doi_suffix="comp.log.001")
+        bad_component = ComponentFactory(component_group=group, doi_suffix="comp.log.002")
+
+        apply_submission_log((DATA_DIR / "submission_log_mixed.xml").read_bytes())
+
+        for record in (ok_chapter, bad_chapter, ok_component, bad_component):
+            record.refresh_from_db()
+        assert ok_chapter.crossref_deposit_status == RecordDepositStatus.SUCCESS
+        assert bad_chapter.crossref_deposit_status == RecordDepositStatus.FAILURE
+        assert bad_chapter.crossref_deposit_errors == [{"message": "Deposit contains an invalid ISBN"}]
+        assert ok_component.crossref_deposit_status == RecordDepositStatus.SUCCESS
+        assert bad_component.crossref_deposit_errors == [
+            {"message": "Parent DOI 10.55555/parent.log does not exist"},
+        ]
+
+    def test_other_prefix_and_deleted_records_untouched(self, issue):
+        other = ArticleFactory(
+            issue=IssueFactory(publication=JournalFactory(publisher=PublisherFactory(doi_prefix="10.99999"))),
+            doi_suffix="article.log.001",
+        )
+        deleted = ArticleFactory(issue=issue, doi_suffix="article.log.002", is_deleted=True)
+
+        counts = apply_submission_log((DATA_DIR / "submission_log_journal.xml").read_bytes())
+
+        assert counts["updated"] == 0
+        other.refresh_from_db()
+        deleted.refresh_from_db()
+        assert other.crossref_deposit_status == ""
+        assert deleted.crossref_deposit_status == ""
+
+    def test_large_log_uses_set_based_updates(self, issue):
+        ArticleFactory.create_batch(20, issue=issue)
+        records = [(f"10.55555/bulk.{n:04d}", "Success", "Successfully added") for n in range(1500)]
+        records += [(f"10.55555/bulk.f{n:04d}", "Failure", "Invalid ISSN") for n in range(500)]
+        log = diagnostic("completed", success=1500, failure=500, records=records)
+
+        with CaptureQueriesContext(connection) as queries:
+            counts = apply_submission_log(log, chunk_size=1000)
+
+        assert (counts["success"], counts["failure"]) == (1500, 500)
+        # Two chunks, each with one UPDATE per model and outcome group present in it
+        assert len(queries) <= 2 * 2 * 3
+
+    def test_management_command(self, issue, capsys):
+        article = ArticleFactory(issue=issue, doi_suffix="article.log.004")
+
+        call_command("apply_crossref_submission_log", str(DATA_DIR / "submission_log_journal.xml"))
+
+        article.refresh_from_db()
+        assert article.crossref_deposit_status == RecordDepositStatus.FAILURE
+        assert "neuspešnih 1, ažurirano zapisa 1" in capsys.readouterr().out
@@ -1164,3 +1164,179 @@ class TestPreValidationServiceFreeToRead:
             w for w in result.warnings if w.field_name == "free_to_read"
         ]
         assert len(free_warnings) == 0
+
+
+@pytest.mark.django_db
+class TestPreValidationQueryBudget:
+    """Validation runs a fixed number of queries regardless of record counts."""
+
+    @pytest.fixture
+    def issue(self, journal_with_issn):
+        return IssueFactory(publication=journal_with_issn, doi_suffix="budget.issue")
+
+    @staticmethod
+    def _add_articles(issue, count, offset=0):
+        from doi_portal.articles.tests.factories import ArticleRelationFactory
+
+        for n in range(offset, offset + count):
+            article = ArticleFactory(
+                issue=issue,
+                doi_suffix=f"budget.{n:03d}",
+                status=ArticleStatus.PUBLISHED,
+            )
+            AuthorFactory(article=article, sequence=AuthorSequence.FIRST, order=1)
+            AuthorFactory(article=article, sequence=AuthorSequence.ADDITIONAL, order=2)
+            ArticleRelationFactory(article=article)
+
+    @staticmethod
+    def _count_queries(callback):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as queries:
+            callback()
+        return len(queries)
+
+    def test_issue_query_count_is_constant(self, issue, site_settings_configured):
+        from doi_portal.crossref.services import PreValidationService
+        from doi_portal.issues.models import Issue
+
+        def validate():
+            PreValidationService().validate_issue(Issue.objects.get(pk=issue.pk))
+
+        self._add_articles(issue, 2)
+        small = self._count_queries(validate)
+        self._add_articles(issue, 40, offset=2)
+        large = self._count_queries(validate)
+
+        assert large == small
+        assert small <= 9
+
+    def test_component_group_query_count_is_constant(self, site_settings_configured, publisher):
+        from doi_portal.components.tests.factories import ComponentContributorFactory
+        from doi_portal.components.tests.factories import ComponentFactory
+        from doi_portal.components.tests.factories import ComponentGroupFactory
+        from doi_portal.crossref.services import PreValidationService
+
+        group = ComponentGroupFactory(publisher=publisher, parent_doi="10.12345/budget.parent")
+
+        def add_components(count):
+            for _ in range(count):
+                ComponentContributorFactory(component=ComponentFactory(component_group=group))
+
+        add_components(2)
+        small = self._count_queries(lambda: PreValidationService().validate_component_group(group))
+        add_components(30)
+        large = self._count_queries(lambda: PreValidationService().validate_component_group(group))
+
+        assert large == small
+
+    def test_monograph_query_count_is_constant(self, site_settings_configured, publisher):
+        from doi_portal.crossref.services import PreValidationService
+        from doi_portal.monographs.models import MonographStatus
+        from doi_portal.monographs.tests.factories import ChapterContributorFactory
+        from doi_portal.monographs.tests.factories import MonographChapterFactory
+        from doi_portal.monographs.tests.factories import MonographContributorFactory
+        from doi_portal.monographs.tests.factories import MonographFactory
+
+        monograph = MonographFactory(publisher=publisher)
+        MonographContributorFactory(monograph=monograph, sequence=AuthorSequence.FIRST)
+
+        def add_chapters(count):
+            for _ in range(count):
+                chapter = MonographChapterFactory(monograph=monograph, status=MonographStatus.PUBLISHED)
+                ChapterContributorFactory(chapter=chapter, sequence=AuthorSequence.FIRST)
+
+        add_chapters(2)
+        small = self._count_queries(lambda: PreValidationService().validate_monograph(monograph))
+        add_chapters(30)
+        large = self._count_queries(lambda: PreValidationService().validate_monograph(monograph))
+
+        assert large == small
+
+    def test_article_suffix_used_in_other_issue_is_error(self, issue, site_settings_configured):
+        from doi_portal.crossref.services import PreValidationService
+
+        self._add_articles(issue, 1)
+        self._add_articles(IssueFactory(publication=issue.publication), 1)
+
+        result = PreValidationService().validate_issue(issue)
+
+        duplicate_errors = [e for e in result.errors if e.field_name == "doi_suffix"]
+        assert len(duplicate_errors) == 1
+        assert "budget.000" in duplicate_errors[0].message
+
+
+@pytest.mark.django_db
+class TestPersistedValidationState:
+    """Stored per-record results are reused until the record or its children change."""
+
+    @pytest.fixture
+    def article(self, journal_with_issn, site_settings_configured):
+        issue = IssueFactory(publication=journal_with_issn)
+        article = ArticleFactory(issue=issue, doi_suffix="state.001", status=ArticleStatus.PUBLISHED)
+        AuthorFactory(article=article, sequence=AuthorSequence.FIRST, given_name="", order=1)
+        return article
+
+    def _validate(self, article):
+        from doi_portal.crossref.services import PreValidationService
+
+        return PreValidationService().validate_issue(article.issue)
+
+    def test_results_are_stored_and_reused(self, article, django_assert_max_num_queries):
+        first = self._validate(article)
+
+        article.refresh_from_db()
+        assert article.validation_dirty is False
+        assert article.validated_at is not None
+        assert article.validation_warning_count == 1
+        assert article.validation_issues[0]["field_name"] == "given_name"
+
+        # Clean run: settings, issue relations, articles and the suffix check only
+        with django_assert_max_num_queries(5):
+            second = self._validate(article)
+        assert [i.message for i in second.issues] == [i.message for i in first.issues]
+
+    def test_child_changes_mark_article_dirty(self, article):
+        from doi_portal.articles.tests.factories import ArticleRelationFactory
+
+        self._validate(article)
+        author = article.authors.get()
+        author.given_name = "Ana"
+        author.save()
+
+        article.refresh_from_db()
+        assert article.validation_dirty is True
+        assert not any(w.field_name == "given_name" for w in self._validate(article).warnings)
+
+        ArticleRelationFactory(article=article, target_identifier="")
+        article.refresh_from_db()
+        assert article.validation_dirty is True
+        assert any(e.field_name == "target_identifier" for e in self._validate(article).errors)
+
+        article.authors.get().delete()
+        assert any(e.field_name == "authors" for e in self._validate(article).errors)
+
+    def test_article_save_marks_dirty(self, article):
+        self._validate(article)
+        article.refresh_from_db()
+        article.title = ""
+        article.save()
+
+        assert any(e.field_name == "title" for e in self._validate(article).errors)
+
+    def test_chapter_numbers_follow_current_order(self, site_settings_configured, publisher):
+        from doi_portal.crossref.services import PreValidationService
+        from doi_portal.monographs.models import MonographStatus
+        from doi_portal.monographs.tests.factories import MonographChapterFactory
+        from doi_portal.monographs.tests.factories import MonographFactory
+
+        monograph = MonographFactory(publisher=publisher)
+        first = MonographChapterFactory(monograph=monograph, status=MonographStatus.PUBLISHED, order=1)
+        MonographChapterFactory(monograph=monograph, status=MonographStatus.PUBLISHED, order=2, title="")
+        PreValidationService().validate_monograph(monograph)
+
+        first.soft_delete()
+        result = PreValidationService().validate_monograph(monograph)
+
+        assert "Poglavlje 1: nedostaje naslov" in [e.message for e in result.errors]
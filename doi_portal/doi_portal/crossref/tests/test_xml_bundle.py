@@ -0,0 +1,184 @@
+"""
+Tests for streamed ZIP bundle exports.
+
+Covers archive contents, single-entry export history, selection by
+volume and ids, permissions and the deposit summary.
+"""
+
+import io
+import zipfile
+
+import pytest
+from django.contrib.auth.models import Group
+from django.urls import reverse
+
+from doi_portal.crossref.bundle import collect_bundle_entries
+from doi_portal.crossref.bundle import stream_xml_bundle
+from doi_portal.crossref.deposit_status import get_deposit_summary
+from doi_portal.crossref.models import CrossrefExport
+from doi_portal.crossref.models import CrossrefExportBundle
+from doi_portal.crossref.models import ExportType
+from doi_portal.issues.models import Issue
+from doi_portal.issues.tests.factories import IssueFactory
+from doi_portal.monographs.tests.factories import MonographFactory
+from doi_portal.publications.tests.factories import JournalFactory
+from doi_portal.publications.tests.factories import PublisherFactory
+from doi_portal.users.tests.factories import UserFactory
+
+
+@pytest.fixture
+def user(db):
+    admin_group, _ = Group.objects.get_or_create(name="Administrator")
+    user = UserFactory()
+    user.groups.add(admin_group)
+    return user
+
+
+@pytest.fixture
+def publisher(db):
+    return PublisherFactory(doi_prefix="10.13579")
+
+
+@pytest.fixture
+def journal(publisher):
+    return JournalFactory(publisher=publisher, title="Zbornik Radova")
+
+
+@pytest.fixture
+def issues(journal):
+    return [
+        IssueFactory(publication=journal, volume="5", issue_number="1", year=2025, crossref_xml="<doi_batch>5-1</doi_batch>"),
+        IssueFactory(publication=journal, volume="5", issue_number="2", year=2025, crossref_xml="<doi_batch>5-2</doi_batch>"),
+        IssueFactory(publication=journal, volume="6", issue_number="1", year=2026, crossref_xml="<doi_batch>6-1</doi_batch>"),
+        IssueFactory(publication=journal, volume="6", issue_number="2", year=2026, crossref_xml=""),
+    ]
+
+
+def _archive(response):
+    return zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content)))
+
+
+@pytest.mark.django_db
+class TestStreamXMLBundle:
+    """Tests for collect_bundle_entries and stream_xml_bundle."""
+
+    def test_streams_valid_archive_in_chunks(self, issues):
+        big = "<doi_batch>" + "ž" * 300_000 + "</doi_batch>"
+        Issue.objects.filter(pk=issues[0].pk).update(crossref_xml=big)
+        entries = collect_bundle_entries(ExportType.ISSUE, Issue.objects.filter(pk__in=[i.pk for i in issues]))
+
+        chunks = list(stream_xml_bundle(ExportType.ISSUE, entries))
+
+        assert len([chunk for chunk in chunks if chunk]) > 2
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+        assert archive.testzip() is None
+        assert archive.read("zbornik-radova_5_1.xml").decode() == big
+        assert len(archive.namelist()) == 3
+
+    def test_duplicate_names_get_id(self, publisher):
+        first = MonographFactory(publisher=publisher, title="Ista", crossref_xml="<a/>")
+        second = MonographFactory(publisher=publisher, title="Ista", crossref_xml="<b/>")
+
+        entries = collect_bundle_entries(ExportType.MONOGRAPH, first.__class__.objects.order_by("pk"))
+
+        assert [entry.filename for entry in entries] == ["monograph_ista.xml", f"monograph_ista_{second.pk}.xml"]
+
+    def test_on_complete_gets_written_entries_with_streamed_metadata(self, issues):
+        from django.utils import timezone
+
+        entries = collect_bundle_entries(ExportType.ISSUE, Issue.objects.filter(pk__in=[i.pk for i in issues]))
+        regenerated_at = timezone.now()
+        Issue.objects.filter(pk=issues[0].pk).update(xml_generated_at=regenerated_at, xsd_valid=True)
+        Issue.objects.filter(pk=issues[1].pk).update(crossref_xml="")
+        completed = []
+
+        archive = zipfile.ZipFile(
+            io.BytesIO(b"".join(stream_xml_bundle(ExportType.ISSUE, entries, on_complete=completed.append))),
+        )
+
+        (written,) = completed
+        by_id = {entry.object_id: entry for entry in written}
+        assert set(by_id) == {issues[0].pk, issues[2].pk}
+        assert sorted(entry.filename for entry in written) == sorted(archive.namelist())
+        assert (by_id[issues[0].pk].xml_generated_at, by_id[issues[0].pk].xsd_valid) == (regenerated_at, True)
+
+    def test_abandoned_stream_is_not_completed(self, issues):
+        entries = collect_bundle_entries(ExportType.ISSUE, Issue.objects.filter(pk__in=[i.pk for i in issues]))
+        completed = []
+
+        stream = stream_xml_bundle(ExportType.ISSUE, entries, on_complete=completed.append)
+        next(stream)
+        stream.close()
+
+        assert completed == []
+
+
+@pytest.mark.django_db
+class TestBundleViews:
+    """Tests for the bundle download endpoints."""
+
+    def test_volume_bundle_records_single_entry(self, client, user, journal, issues):
+        client.force_login(user)
+
+        response = client.get(reverse("crossref:issue-xml-bundle", args=[journal.pk]), {"volume": "5"})
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/zip"
+        assert response["Content-Disposition"].startswith('attachment; filename="zbornik-radova_5_')
+        assert sorted(_archive(response).namelist()) == ["zbornik-radova_5_1.xml", "zbornik-radova_5_2.xml"]
+        bundle = CrossrefExportBundle.objects.get()
+        assert bundle.entity_count == 2
+        assert bundle.exported_by == user
+        assert sorted(bundle.items.values_list("object_id", flat=True)) == [issues[0].pk, issues[1].pk]
+        assert not CrossrefExport.objects.exists()
+
+    def test_export_is_recorded_after_streaming(self, client, user, journal, issues):
+        client.force_login(user)
+
+        response = client.get(reverse("crossref:issue-xml-bundle", args=[journal.pk]), {"volume": "5"})
+
+        assert not CrossrefExportBundle.objects.exists()
+        _archive(response)
+        assert CrossrefExportBundle.objects.get().entity_count == 2
+
+    def test_ids_limit_bundle(self, client, user, journal, issues):
+        client.force_login(user)
+
+        response = client.get(reverse("crossref:issue-xml-bundle", args=[journal.pk]), {"ids": [issues[2].pk, "x"]})
+
+        assert _archive(response).namelist() == ["zbornik-radova_6_1.xml"]
+
+    def test_no_xml_is_404(self, client, user, journal, issues):
+        client.force_login(user)
+
+        response = client.get(reverse("crossref:issue-xml-bundle", args=[journal.pk]), {"ids": [issues[3].pk]})
+
+        assert response.status_code == 404
+        assert not CrossrefExportBundle.objects.exists()
+
+    def test_denied_without_publisher_access(self, client, journal, issues):
+        client.force_login(UserFactory())
+
+        response = client.get(reverse("crossref:issue-xml-bundle", args=[journal.pk]))
+
+        assert response.status_code == 403
+
+    def test_monograph_bundle(self, client, user, publisher):
+        MonographFactory(publisher=publisher, title="Prva", crossref_xml="<a/>")
+        MonographFactory(publisher=PublisherFactory(doi_prefix="10.97531"), title="Tuđa", crossref_xml="<b/>")
+        client.force_login(user)
+
+        response = client.get(reverse("crossref:monograph-xml-bundle", args=[publisher.pk]))
+
+        assert _archive(response).namelist() == ["monograph_prva.xml"]
+        assert CrossrefExportBundle.objects.get().export_type == ExportType.MONOGRAPH
+
+    def test_bundle_counts_as_export_in_summary(self, client, user, journal, issues):
+        assert get_deposit_summary(ExportType.ISSUE, issues[0]).has_exports is False
+        client.force_login(user)
+
+        _archive(client.get(reverse("crossref:issue-xml-bundle", args=[journal.pk])))
+
+        summary = get_deposit_summary(ExportType.ISSUE, issues[0])
+        assert summary.export_count == 1
+        assert summary.last_export_at == CrossrefExportBundle.objects.get().exported_at
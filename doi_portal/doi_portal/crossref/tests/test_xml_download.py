@@ -507,7 +507,7 @@ class TestExportHistory:
         response = client.get(url)
 
         assert response.status_code == 200
-        assert response.content.decode() == export_record.xml_content
+        assert response.getvalue().decode() == export_record.xml_content
         assert export_record.filename in response["Content-Disposition"]
 
     def test_redownload_requires_permission(self, client, publisher, journal_publication, admin_user):
@@ -575,7 +575,7 @@ class TestXMLDeclaration:
         url = reverse("crossref:xml-download", args=[issue_with_xml.pk])
         response = client.get(url)
 
-        content = response.content.decode("utf-8")
+        content = response.getvalue().decode("utf-8")
         assert content.strip().startswith('<?xml version="1.0" encoding="UTF-8"?>')
 
     def test_response_utf8_charset(self, client, admin_user, issue_with_xml):
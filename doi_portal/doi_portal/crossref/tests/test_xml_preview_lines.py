@@ -0,0 +1,219 @@
+"""
+Tests for line-indexed XML preview.
+
+Covers the line-offset index, range reads, re-indexing of stale rows and
+the line-window endpoints for issues, component groups and monographs.
+"""
+
+import pytest
+from django.contrib.auth.models import Group
+from django.urls import reverse
+
+from doi_portal.components.tests.factories import ComponentGroupFactory
+from doi_portal.crossref.xml_preview import build_line_index
+from doi_portal.crossref.xml_preview import load_line_index
+from doi_portal.crossref.xml_preview import read_line_window
+from doi_portal.issues.models import Issue
+from doi_portal.issues.tests.factories import IssueFactory
+from doi_portal.monographs.tests.factories import MonographFactory
+from doi_portal.publications.tests.factories import JournalFactory
+from doi_portal.publications.tests.factories import PublisherFactory
+from doi_portal.users.tests.factories import UserFactory
+
+LINE_COUNT = 1200
+
+
+def _xml(lines=LINE_COUNT):
+    return "\n".join(f"<line n=\"{n}\">č{n}</line>" for n in range(1, lines + 1))
+
+
+@pytest.fixture
+def user(db):
+    admin_group, _ = Group.objects.get_or_create(name="Administrator")
+    user = UserFactory()
+    user.groups.add(admin_group)
+    return user
+
+
+@pytest.fixture
+def publisher(db):
+    return PublisherFactory(doi_prefix="10.24680")
+
+
+@pytest.fixture
+def issue(publisher):
+    xml = _xml()
+    return IssueFactory(
+        publication=JournalFactory(publisher=publisher),
+        crossref_xml=xml,
+        crossref_xml_line_index=build_line_index(xml),
+        xsd_valid=False,
+        xsd_errors=[{"message": "Greška", "line": 900}, {"message": "Bez linije"}, {"message": "Druga", "line": 3}],
+    )
+
+
+class TestBuildLineIndex:
+    """Tests for build_line_index."""
+
+    def test_offsets_point_at_line_starts(self):
+        xml = _xml(10)
+
+        index = build_line_index(xml, step=4)
+
+        assert index["lines"] == 10
+        assert index["length"] == len(xml)
+        assert index["bytes"] == len(xml.encode("utf-8"))
+        assert [xml[offset:].split("\n", 1)[0] for offset in index["offsets"]] == [
+            '<line n="1">č1</line>',
+            '<line n="5">č5</line>',
+            '<line n="9">č9</line>',
+        ]
+
+    def test_trailing_newline_and_empty(self):
+        assert build_line_index("<a/>\n")["lines"] == 1
+        assert build_line_index("")["lines"] == 0
+
+
+@pytest.mark.django_db
+class TestReadLineWindow:
+    """Tests for load_line_index and read_line_window."""
+
+    def test_window_matches_full_text(self, issue):
+        index = load_line_index(Issue, issue.pk)
+        expected = issue.crossref_xml.split("\n")
+
+        for start, count in [(1, 10), (250, 20), (256, 2), (257, 300), (1190, 50)]:
+            window = read_line_window(Issue, issue.pk, index, start=start, count=count)
+            assert window.lines == expected[start - 1:start - 1 + count]
+            assert window.total_lines == LINE_COUNT
+
+    def test_window_edges(self, issue):
+        index = load_line_index(Issue, issue.pk)
+
+        window = read_line_window(Issue, issue.pk, index, start=1151, count=100)
+
+        assert window.end == LINE_COUNT
+        assert window.next_start is None
+        assert (window.previous_start, window.previous_count) == (1101, 50)
+
+    def test_window_reports_error_lines(self, issue):
+        index = load_line_index(Issue, issue.pk)
+
+        window = read_line_window(Issue, issue.pk, index, start=1, count=500, xsd_errors=issue.xsd_errors)
+
+        assert window.error_lines == [3]
+
+    def test_window_reads_one_query(self, issue, django_assert_num_queries):
+        index = load_line_index(Issue, issue.pk)
+
+        with django_assert_num_queries(1):
+            read_line_window(Issue, issue.pk, index, start=700, count=100)
+
+    def test_stale_index_is_rebuilt(self, issue):
+        Issue.objects.filter(pk=issue.pk).update(crossref_xml="<a/>\n<b/>", crossref_xml_line_index={})
+
+        index = load_line_index(Issue, issue.pk)
+
+        assert index["lines"] == 2
+        issue.refresh_from_db()
+        assert issue.crossref_xml_line_index == index
+
+    def test_regenerated_xml_of_same_length_is_reindexed(self, issue):
+        from django.utils import timezone
+
+        xml = _xml().replace("\n", " ", 1)
+        assert len(xml) == len(issue.crossref_xml)
+        Issue.objects.filter(pk=issue.pk).update(crossref_xml=xml, xml_generated_at=timezone.now())
+
+        index = load_line_index(Issue, issue.pk)
+
+        assert index["lines"] == LINE_COUNT - 1
+        window = read_line_window(Issue, issue.pk, index, start=1, count=2)
+        assert window.lines == xml.split("\n")[:2]
+
+
+@pytest.mark.django_db
+class TestPreviewLinesViews:
+    """Tests for the line-window endpoints and the windowed modal."""
+
+    def test_modal_renders_first_window_only(self, client, user, issue, settings):
+        settings.CROSSREF_XML_PREVIEW_WINDOW_LINES = 100
+        client.force_login(user)
+
+        content = client.get(reverse("crossref:xml-preview", args=[issue.pk])).content.decode()
+
+        assert "č100&lt;" in content
+        assert "č101&lt;" not in content
+        assert 'data-line="3"' in content
+        assert reverse("crossref:xml-preview-lines", args=[issue.pk]) + "?start=101" in content
+
+    def test_lines_endpoint_returns_range(self, client, user, issue):
+        client.force_login(user)
+        url = reverse("crossref:xml-preview-lines", args=[issue.pk])
+
+        response = client.get(url, {"start": 600, "count": 50})
+
+        content = response.content.decode()
+        assert response.status_code == 200
+        assert 'data-start="600"' in content
+        assert "č600&lt;" in content and "č649&lt;" in content
+        assert "č650&lt;" not in content
+        assert "?start=650" in content
+        assert "Prethodne linije" not in content
+
+    def test_jump_to_error_line(self, client, user, issue):
+        client.force_login(user)
+        url = reverse("crossref:xml-preview-lines", args=[issue.pk])
+
+        content = client.get(url, {"line": 900}).content.decode()
+
+        assert 'data-start="880"' in content
+        assert 'data-line="900"' in content
+        assert "Prethodne linije" in content
+
+    def test_count_is_capped(self, client, user, issue, settings):
+        settings.CROSSREF_XML_PREVIEW_MAX_WINDOW_LINES = 10
+        client.force_login(user)
+        url = reverse("crossref:xml-preview-lines", args=[issue.pk])
+
+        response = client.get(url, {"start": "x", "count": 5000})
+
+        assert len(response.context["window"].lines) == 10
+
+    def test_text_format_returns_full_document(self, client, user, issue):
+        client.force_login(user)
+        url = reverse("crossref:xml-preview-lines", args=[issue.pk])
+
+        response = client.get(url, {"format": "text"})
+
+        assert b"".join(response.streaming_content).decode() == issue.crossref_xml
+
+    def test_lines_without_xml_is_404(self, client, user, publisher):
+        client.force_login(user)
+        issue = IssueFactory(publication=JournalFactory(publisher=publisher), crossref_xml="")
+
+        response = client.get(reverse("crossref:xml-preview-lines", args=[issue.pk]))
+
+        assert response.status_code == 404
+
+    def test_lines_denied_without_publisher_access(self, client, issue):
+        client.force_login(UserFactory())
+
+        response = client.get(reverse("crossref:xml-preview-lines", args=[issue.pk]))
+
+        assert response.status_code == 403
+
+    def test_component_and_monograph_endpoints(self, client, user, publisher):
+        client.force_login(user)
+        xml = _xml(30)
+        group = ComponentGroupFactory(publisher=publisher, crossref_xml=xml)
+        monograph = MonographFactory(publisher=publisher, crossref_xml=xml)
+
+        for name, obj in [("component-xml-preview", group), ("monograph-xml-preview", monograph)]:
+            preview = client.get(reverse(f"crossref:{name}", args=[obj.pk])).content.decode()
+            lines = client.get(reverse(f"crossref:{name}-lines", args=[obj.pk]), {"start": 20}).content.decode()
+
+            assert "č30&lt;" in preview
+            assert reverse(f"crossref:{name.replace('preview', 'download')}", args=[obj.pk]) in preview
+            assert 'data-start="20"' in lines
+            assert "č19&lt;" not in lines
@@ -7,6 +7,7 @@ Tests for XSDValidationResult, XSDValidationError, and validate_xml function.
 
 from __future__ import annotations
 
+import multiprocessing
 from datetime import date
 from pathlib import Path
 from unittest.mock import patch
@@ -345,6 +346,309 @@ class TestXSDValidation:
         assert before <= result.validated_at <= after
 
 
+class TestValidateXmlChunks:
+    """Tests for validate_xml_chunks single-parse validation."""
+
+    VALID_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<doi_batch version="5.4.0" xmlns="http://www.crossref.org/schema/5.4.0">
+    <head>
+        <doi_batch_id>test_batch_001</doi_batch_id>
+        <timestamp>20260203120000</timestamp>
+        <depositor>
+            <depositor_name>Test Depositor</depositor_name>
+            <email_address>test@example.com</email_address>
+        </depositor>
+        <registrant>Test Publisher</registrant>
+    </head>
+    <body>
+        <journal>
+            <journal_metadata language="en">
+                <full_title>Časopis Test</full_title>
+            </journal_metadata>
+        </journal>
+    </body>
+</doi_batch>"""
+
+    @staticmethod
+    def _chunks(xml, size=37):
+        return [xml[i:i + size] for i in range(0, len(xml), size)]
+
+    def test_assembles_chunks_and_matches_validate_xml(self):
+        """Chunked validation returns the joined XML and the same verdict."""
+        from doi_portal.crossref.validators import validate_xml
+        from doi_portal.crossref.validators import validate_xml_chunks
+
+        xml, result = validate_xml_chunks(self._chunks(self.VALID_XML))
+        expected = validate_xml(self.VALID_XML)
+
+        assert xml == self.VALID_XML
+        assert result.is_valid == expected.is_valid
+        assert [e.message for e in result.errors] == [e.message for e in expected.errors]
+
+    def test_does_not_reparse_assembled_string(self):
+        """The document is parsed incrementally, never via etree.fromstring."""
+        from unittest.mock import patch
+
+        from doi_portal.crossref.validators import validate_xml_chunks
+
+        with patch("doi_portal.crossref.validators.etree.fromstring") as fromstring:
+            validate_xml_chunks(self._chunks(self.VALID_XML))
+
+        fromstring.assert_not_called()
+
+    def test_syntax_error_reports_line(self):
+        """Malformed chunks produce a syntax error with a line number."""
+        from doi_portal.crossref.validators import validate_xml_chunks
+
+        malformed = '<?xml version="1.0"?>\n<doi_batch>\n<head>\n<unclosed>\n</head>\n</doi_batch>'
+
+        xml, result = validate_xml_chunks(self._chunks(malformed, size=5))
+
+        assert xml == malformed
+        assert result.is_valid is False
+        assert "sintaksna" in result.errors[0].message.lower()
+        assert result.errors[0].line is not None
+
+    def test_truncated_document_is_syntax_error(self):
+        """A document that ends early fails when the parser is closed."""
+        from doi_portal.crossref.validators import validate_xml_chunks
+
+        _, result = validate_xml_chunks(["<doi_batch>", "<head>"])
+
+        assert result.is_valid is False
+        assert "sintaksna" in result.errors[0].message.lower()
+
+    def test_empty_chunks(self):
+        """No content yields the empty-content error."""
+        from doi_portal.crossref.validators import validate_xml_chunks
+
+        xml, result = validate_xml_chunks(["", "  \n"])
+
+        assert result.is_valid is False
+        assert "prazan" in result.errors[0].message.lower()
+
+
+class TestValidationCache:
+    """Tests for XSD validation outcome caching."""
+
+    XML_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<doi_batch version="5.4.0" xmlns="http://www.crossref.org/schema/5.4.0">
+    <head>
+        <doi_batch_id>{batch_id}</doi_batch_id>
+        <timestamp>{timestamp}</timestamp>
+    </head>
+    <body/>
+</doi_batch>"""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        yield
+        cache.clear()
+
+    def _xml(self, batch_id="a1b2c3d4_20260203123045", timestamp="20260203123045"):
+        return self.XML_TEMPLATE.format(batch_id=batch_id, timestamp=timestamp)
+
+    def test_repeated_validation_is_a_cache_hit(self):
+        """Validating identical XML twice runs the schema once."""
+        from unittest.mock import patch
+
+        from doi_portal.crossref import validators
+
+        with patch.object(validators, "validate_xml_tree", wraps=validators.validate_xml_tree) as spy:
+            first = validators.validate_xml(self._xml())
+            second = validators.validate_xml(self._xml())
+
+        assert spy.call_count == 1
+        assert second.is_valid == first.is_valid
+        assert [e.to_dict() for e in second.errors] == [e.to_dict() for e in first.errors]
+        assert second.validated_at >= first.validated_at
+
+    def test_regenerated_head_values_share_cache_key(self):
+        """New doi_batch_id/timestamp from regeneration do not change the key."""
+        from doi_portal.crossref.validators import validation_cache_key
+
+        assert validation_cache_key(self._xml()) == validation_cache_key(
+            self._xml(batch_id="ffffffff_20270101000000", timestamp="20270101000000"),
+        )
+
+    def test_non_generated_head_values_are_hashed(self):
+        """Values not in the generator's format are part of the key."""
+        from doi_portal.crossref.validators import validation_cache_key
+
+        assert validation_cache_key(self._xml()) != validation_cache_key(
+            self._xml(batch_id="not a batch id"),
+        )
+
+    def test_body_change_changes_key(self):
+        from doi_portal.crossref.validators import validation_cache_key
+
+        assert validation_cache_key(self._xml()) != validation_cache_key(self._xml() + " ")
+
+    def test_key_includes_schema_version(self):
+        from doi_portal.crossref.validators import SCHEMA_VERSION
+        from doi_portal.crossref.validators import validation_cache_key
+
+        assert f":{SCHEMA_VERSION}:" in validation_cache_key(self._xml())
+
+    def test_chunked_validation_uses_cache(self):
+        """validate_xml_chunks reuses outcomes stored by validate_xml."""
+        from unittest.mock import patch
+
+        from doi_portal.crossref import validators
+
+        validators.validate_xml(self._xml())
+        with patch.object(validators, "validate_xml_tree") as spy:
+            _, result = validators.validate_xml_chunks([self._xml(batch_id="00000000_20990101000000")])
+
+        spy.assert_not_called()
+        assert result.is_valid is False
+
+    def test_schema_load_failure_is_not_cached(self):
+        """Errors from a missing schema are never memoized."""
+        from unittest.mock import patch
+
+        from django.core.cache import cache
+
+        from doi_portal.crossref import validators
+
+        with (
+            patch.object(validators, "_SCHEMA_CACHE", None),
+            patch.object(validators, "_get_schema", side_effect=RuntimeError("no schema")),
+        ):
+            validators.validate_xml(self._xml())
+
+        assert cache.get(validators.validation_cache_key(self._xml())) is None
+
+
+def _validate_in_child(documents, queue):
+    """Body of a daemonic child process: report schema state and validity."""
+    from doi_portal.crossref import validators
+
+    preloaded = validators._SCHEMA_CACHE is not None
+    results = validators.XSDValidationService().validate_many(documents)
+    queue.put((preloaded, [result.is_valid for result in results], [len(r.errors) for r in results]))
+
+
+class TestXMLValidationSink:
+    """Tests for the validating storage sink used by generate_and_store_*."""
+
+    VALID_XML = TestValidateXmlChunks.VALID_XML
+
+    def test_multibyte_characters_split_across_writes(self):
+        """Writes may split a UTF-8 sequence; the assembled text is intact."""
+        from doi_portal.crossref.validators import XMLValidationSink
+        from doi_portal.crossref.validators import validate_xml
+
+        data = self.VALID_XML.encode("utf-8")
+        split = data.index("Č".encode()) + 1
+        sink = XMLValidationSink()
+        sink.write(data[:split])
+        sink.write(data[split:])
+        xml, result = sink.finish()
+
+        assert xml == self.VALID_XML
+        assert result.is_valid == validate_xml(self.VALID_XML).is_valid
+
+    def test_syntax_error_is_reported(self):
+        from doi_portal.crossref.validators import XMLValidationSink
+
+        sink = XMLValidationSink()
+        sink.write(b"<doi_batch><unclosed></doi_batch>")
+        _, result = sink.finish()
+
+        assert result.is_valid is False
+        assert "sintaksna" in result.errors[0].message
+
+
+class TestXSDValidationService:
+    """Tests for batch validation."""
+
+    VALID_XML = TestValidateXmlChunks.VALID_XML
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        yield
+        cache.clear()
+
+    def _documents(self):
+        return [
+            self.VALID_XML,
+            "",
+            "<doi_batch><unclosed></doi_batch>",
+            self.VALID_XML.replace("<registrant>", "<unexpected/><registrant>"),
+        ]
+
+    def test_validate_many_preserves_order(self):
+        """Results match validate_xml() per document in order."""
+        from doi_portal.crossref.validators import XSDValidationService
+        from doi_portal.crossref.validators import validate_xml
+
+        documents = self._documents()
+        results = XSDValidationService().validate_many(documents)
+        expected = [validate_xml(doc) for doc in documents]
+
+        assert [r.is_valid for r in results] == [e.is_valid for e in expected]
+        assert [[x.message for x in r.errors] for r in results] == [
+            [x.message for x in e.errors] for e in expected
+        ]
+
+    def test_validate_many_returns_structured_errors(self):
+        """Each document gets its own structured XSDValidationError list."""
+        from doi_portal.crossref.validators import XSDValidationError
+        from doi_portal.crossref.validators import XSDValidationService
+
+        results = XSDValidationService().validate_many(self._documents())
+
+        assert results[0].is_valid is True
+        assert "prazan" in results[1].errors[0].message
+        assert "sintaksna" in results[2].errors[0].message
+        assert results[3].is_valid is False
+        assert all(isinstance(e, XSDValidationError) for e in results[3].errors)
+        assert any(e.line for e in results[3].errors)
+        assert all(r.validated_at is not None for r in results)
+
+    def test_results_are_cached(self):
+        """A second batch is served from the cache without parsing."""
+        from unittest.mock import patch
+
+        from doi_portal.crossref.validators import XSDValidationService
+
+        service = XSDValidationService()
+        service.validate_many([self.VALID_XML])
+
+        with patch("doi_portal.crossref.validators._validate_document") as run:
+            service.validate_many([self.VALID_XML])
+
+        run.assert_not_called()
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(),
+        reason="Celery prefork children are forked",
+    )
+    def test_daemonic_forked_worker_validates_with_preloaded_schema(self):
+        """A daemonic forked child (as in Celery prefork) inherits the schema and validates."""
+        from doi_portal.crossref.validators import preload_schema
+
+        preload_schema()
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        child = context.Process(target=_validate_in_child, args=(self._documents(), queue), daemon=True)
+        child.start()
+        preloaded, validity, error_counts = queue.get(timeout=60)
+        child.join(timeout=60)
+
+        assert child.exitcode == 0
+        assert preloaded is True
+        assert validity == [True, False, False, False]
+        assert all(error_counts[1:])
+
+
 # =============================================================================
 # Task 4: Tests for integration with generation workflow
 # =============================================================================
@@ -477,7 +781,10 @@ class TestXSDIntegration:
             validated_at=timezone.now(),
         )
 
-        with patch("doi_portal.crossref.validators.validate_xml", return_value=mock_result):
+        from django.core.cache import cache
+
+        cache.clear()  # Ensure no cached outcome bypasses the mocked validator
+        with patch("doi_portal.crossref.validators.validate_xml_tree", return_value=mock_result):
             service = CrossrefService()
             service.generate_and_store_xml(issue_with_article)
 
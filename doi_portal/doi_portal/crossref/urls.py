@@ -8,6 +8,7 @@ Story 5.5: XML Preview with Syntax Highlighting.
 Story 5.6: XML Download - Export History Tracking.
 Story 5.7: Crossref Deposit Workflow Page.
 Component support: sa_component workflow routes.
+Live deposits: submit XML directly to Crossref or queue it.
 """
 
 from django.urls import path
@@ -21,6 +22,8 @@ from doi_portal.crossref.views import GenerateXMLView
 from doi_portal.crossref.views import IssueValidationView
 from doi_portal.crossref.views import MonographDepositView
 from doi_portal.crossref.views import MonographValidationView
+from doi_portal.crossref.views import component_deposit_enqueue
+from doi_portal.crossref.views import component_deposit_submit
 from doi_portal.crossref.views import component_download_warning
 from doi_portal.crossref.views import component_export_history
 from doi_portal.crossref.views import component_export_redownload
@@ -28,20 +31,30 @@ from doi_portal.crossref.views import component_mark_deposited
 from doi_portal.crossref.views import component_xml_download
 from doi_portal.crossref.views import component_xml_download_force
 from doi_portal.crossref.views import component_xml_preview
+from doi_portal.crossref.views import component_xml_preview_lines
+from doi_portal.crossref.views import deposit_submit
 from doi_portal.crossref.views import download_warning
 from doi_portal.crossref.views import export_history
 from doi_portal.crossref.views import export_redownload
+from doi_portal.crossref.views import issue_xml_bundle
 from doi_portal.crossref.views import mark_deposited
+from doi_portal.crossref.views import monograph_deposit_enqueue
+from doi_portal.crossref.views import monograph_deposit_submit
 from doi_portal.crossref.views import monograph_download_warning
 from doi_portal.crossref.views import monograph_export_history
 from doi_portal.crossref.views import monograph_export_redownload
 from doi_portal.crossref.views import monograph_mark_deposited
+from doi_portal.crossref.views import monograph_xml_bundle
 from doi_portal.crossref.views import monograph_xml_download
+from doi_portal.crossref.views import monograph_xml_download_delta
 from doi_portal.crossref.views import monograph_xml_download_force
 from doi_portal.crossref.views import monograph_xml_preview
+from doi_portal.crossref.views import monograph_xml_preview_lines
 from doi_portal.crossref.views import xml_download
+from doi_portal.crossref.views import xml_download_delta
 from doi_portal.crossref.views import xml_download_force
 from doi_portal.crossref.views import xml_preview
+from doi_portal.crossref.views import xml_preview_lines
 
 app_name = "crossref"
 
@@ -64,6 +77,11 @@ urlpatterns = [
         xml_preview,
         name="xml-preview",
     ),
+    path(
+        "issues/<int:pk>/preview/lines/",
+        xml_preview_lines,
+        name="xml-preview-lines",
+    ),
     path(
         "issues/<int:pk>/download/",
         xml_download,
@@ -80,6 +98,16 @@ urlpatterns = [
         xml_download_force,
         name="xml-download-force",
     ),
+    path(
+        "issues/<int:pk>/download-delta/",
+        xml_download_delta,
+        name="xml-download-delta",
+    ),
+    path(
+        "publications/<int:pk>/bundle/",
+        issue_xml_bundle,
+        name="issue-xml-bundle",
+    ),
     path(
         "exports/<int:pk>/redownload/",
         export_redownload,
@@ -101,6 +129,11 @@ urlpatterns = [
         mark_deposited,
         name="mark-deposited",
     ),
+    path(
+        "issues/<int:pk>/deposit-submit/",
+        deposit_submit,
+        name="deposit-submit",
+    ),
     # Component workflow routes
     path(
         "component-groups/<int:pk>/validate/",
@@ -117,6 +150,11 @@ urlpatterns = [
         component_xml_preview,
         name="component-xml-preview",
     ),
+    path(
+        "component-groups/<int:pk>/preview/lines/",
+        component_xml_preview_lines,
+        name="component-xml-preview-lines",
+    ),
     path(
         "component-groups/<int:pk>/download/",
         component_xml_download,
@@ -147,6 +185,16 @@ urlpatterns = [
         component_mark_deposited,
         name="component-mark-deposited",
     ),
+    path(
+        "component-groups/<int:pk>/deposit-submit/",
+        component_deposit_submit,
+        name="component-deposit-submit",
+    ),
+    path(
+        "component-groups/<int:pk>/deposit-enqueue/",
+        component_deposit_enqueue,
+        name="component-deposit-enqueue",
+    ),
     path(
         "component-exports/<int:pk>/redownload/",
         component_export_redownload,
@@ -168,6 +216,11 @@ urlpatterns = [
         monograph_xml_preview,
         name="monograph-xml-preview",
     ),
+    path(
+        "monographs/<int:pk>/preview/lines/",
+        monograph_xml_preview_lines,
+        name="monograph-xml-preview-lines",
+    ),
     path(
         "monographs/<int:pk>/download/",
         monograph_xml_download,
@@ -183,6 +236,16 @@ urlpatterns = [
         monograph_xml_download_force,
         name="monograph-xml-download-force",
     ),
+    path(
+        "monographs/<int:pk>/download-delta/",
+        monograph_xml_download_delta,
+        name="monograph-xml-download-delta",
+    ),
+    path(
+        "publishers/<int:pk>/monographs/bundle/",
+        monograph_xml_bundle,
+        name="monograph-xml-bundle",
+    ),
     path(
         "monographs/<int:pk>/export-history/",
         monograph_export_history,
@@ -198,6 +261,16 @@ urlpatterns = [
         monograph_mark_deposited,
         name="monograph-mark-deposited",
     ),
+    path(
+        "monographs/<int:pk>/deposit-submit/",
+        monograph_deposit_submit,
+        name="monograph-deposit-submit",
+    ),
+    path(
+        "monographs/<int:pk>/deposit-enqueue/",
+        monograph_deposit_enqueue,
+        name="monograph-deposit-enqueue",
+    ),
     path(
         "monograph-exports/<int:pk>/redownload/",
         monograph_export_redownload,
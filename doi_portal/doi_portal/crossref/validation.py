@@ -45,6 +45,40 @@ class ValidationIssue:
     article_id: Optional[int] = None
     fix_url: Optional[str] = None
 
+    def to_dict(self) -> dict:
+        """
+        Serialize for JSON storage.
+
+        Returns:
+            Dict with severity as its string value
+        """
+        return {
+            "severity": self.severity.value,
+            "message": self.message,
+            "field_name": self.field_name,
+            "article_id": self.article_id,
+            "fix_url": self.fix_url,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ValidationIssue:
+        """
+        Restore an issue serialized by to_dict().
+
+        Args:
+            data: Serialized issue
+
+        Returns:
+            ValidationIssue instance
+        """
+        return cls(
+            severity=ValidationSeverity(data["severity"]),
+            message=data["message"],
+            field_name=data["field_name"],
+            article_id=data.get("article_id"),
+            fix_url=data.get("fix_url"),
+        )
+
 
 @dataclass
 class ValidationResult:
@@ -5,10 +5,19 @@ Story 5.1: Crossref Service Infrastructure.
 Story 5.4: XSD Validation.
 
 Provides XSD validation for generated Crossref XML using lxml.etree.XMLSchema.
+XSDValidationService validates batches of documents in the calling
+process. The schema is compiled once per process, or before workers
+fork (preload_schema()); throughput scales with Celery worker
+concurrency, over which bulk regeneration fans its batches out.
 """
 
 from __future__ import annotations
 
+import codecs
+import hashlib
+import io
+import logging
+import re
 from dataclasses import dataclass
 from dataclasses import field
 from datetime import datetime
@@ -18,9 +27,24 @@ from typing import TYPE_CHECKING
 from lxml import etree
 
 if TYPE_CHECKING:
-    from lxml.etree import _Element  # noqa: F401
+    from collections.abc import Iterable
+    from collections.abc import Sequence
 
-__all__ = ["validate_xml", "XSDValidationResult", "XSDValidationError"]
+    from lxml.etree import _Element
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "XMLValidationSink",
+    "XSDValidationService",
+    "preload_schema",
+    "validate_xml",
+    "validate_xml_chunks",
+    "validate_xml_tree",
+    "validation_cache_key",
+    "XSDValidationResult",
+    "XSDValidationError",
+]
 
 
 @dataclass
@@ -81,6 +105,18 @@ class XSDValidationResult:
 # Schema cache (load once, reuse)
 _SCHEMA_CACHE: etree.XMLSchema | None = None
 
+# Bundled schema version; part of every validation cache key
+SCHEMA_VERSION = "5.4.0"
+VALIDATION_CACHE_PREFIX = "crossref:xsd"
+
+# Per-generation head values written by CrossrefService. Masked before
+# hashing so regenerating unchanged content reuses the cached outcome;
+# only values in the generator's own format are masked, anything else is
+# hashed verbatim and still validated.
+_VOLATILE_HEAD_RE = re.compile(
+    r"(<doi_batch_id>)[0-9a-f]{8}_\d{14}(</doi_batch_id>)|(<timestamp>)\d{14}(</timestamp>)",
+)
+
 
 def _get_schema() -> etree.XMLSchema:
     """
@@ -115,68 +151,118 @@ def _get_schema() -> etree.XMLSchema:
     return _SCHEMA_CACHE
 
 
-def validate_xml(xml_string: str) -> XSDValidationResult:
+def _new_result() -> XSDValidationResult:
+    """Create an (initially invalid) result stamped with the current time."""
+    from django.utils import timezone
+
+    return XSDValidationResult(
+        is_valid=False,
+        validated_at=timezone.now(),
+    )
+
+
+def _empty_content_error() -> XSDValidationError:
+    return XSDValidationError(
+        message="XML sintaksna greška: prazan sadržaj",
+        line=1,
+    )
+
+
+def _syntax_error(error: etree.XMLSyntaxError) -> XSDValidationError:
+    return XSDValidationError(
+        message=f"XML sintaksna greška: {error.msg}",
+        line=error.lineno,
+        column=error.offset,
+    )
+
+
+def validation_cache_key(xml_string: str) -> str:
     """
-    Validate XML against Crossref XSD schema 5.4.0.
+    Return the validation cache key for an XML document.
 
-    Parses the XML string and validates it against the bundled
-    Crossref XSD schema. Returns a structured result with
-    validation status and any errors.
+    Combines the schema version with the SHA-256 of the document, after
+    masking the generated doi_batch_id and timestamp head values.
 
     Args:
-        xml_string: XML string to validate
+        xml_string: XML string
 
     Returns:
-        XSDValidationResult with validation status and any errors
+        Cache key string
     """
-    from django.utils import timezone
+    normalized = _VOLATILE_HEAD_RE.sub(r"\1\2\3\4", xml_string)
+    digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    return f"{VALIDATION_CACHE_PREFIX}:{SCHEMA_VERSION}:{digest}"
 
-    result = XSDValidationResult(
-        is_valid=False,
-        validated_at=timezone.now(),
+
+def _get_cached_result(key: str) -> XSDValidationResult | None:
+    """Return a previously stored validation outcome, re-stamped with the current time."""
+    from django.core.cache import cache
+
+    cached = cache.get(key)
+    if cached is None:
+        return None
+    result = _new_result()
+    result.is_valid = cached["is_valid"]
+    result.errors = [XSDValidationError(**error) for error in cached["errors"]]
+    return result
+
+
+def _store_result(key: str, result: XSDValidationResult) -> None:
+    """Cache a validation outcome."""
+    from django.conf import settings
+    from django.core.cache import cache
+
+    cache.set(
+        key,
+        {"is_valid": result.is_valid, "errors": [e.to_dict() for e in result.errors]},
+        getattr(settings, "CROSSREF_XSD_CACHE_TIMEOUT", 30 * 24 * 60 * 60),
     )
 
-    # Handle empty string
-    if not xml_string or not xml_string.strip():
-        result.errors.append(
-            XSDValidationError(
-                message="XML sintaksna greška: prazan sadržaj",
-                line=1,
-            )
-        )
-        return result
 
-    # Parse XML string
-    try:
-        xml_doc = etree.fromstring(xml_string.encode("utf-8"))
-    except etree.XMLSyntaxError as e:
-        result.errors.append(
-            XSDValidationError(
-                message=f"XML sintaksna greška: {e.msg}",
-                line=e.lineno,
-                column=e.offset,
-            )
-        )
-        return result
+def validate_xml_tree(
+    xml_doc: _Element,
+    result: XSDValidationResult | None = None,
+) -> XSDValidationResult:
+    """
+    Validate an already-parsed XML tree against Crossref XSD schema 5.4.0.
+
+    Args:
+        xml_doc: Root element of the parsed document
+        result: Optional result to fill in (a new one is created otherwise)
+
+    Returns:
+        XSDValidationResult with validation status and any errors
+    """
+    if result is None:
+        result = _new_result()
 
     # Get schema and validate
     try:
-        schema = _get_schema()
+        result.is_valid, result.errors = _schema_errors(xml_doc)
     except RuntimeError as e:
         result.errors.append(
             XSDValidationError(
                 message=str(e),
             )
         )
-        return result
 
-    # Run validation
+    return result
+
+
+def _schema_errors(xml_doc: _Element) -> tuple[bool, list[XSDValidationError]]:
+    """
+    Run the Crossref schema over a parsed tree.
+
+    Raises:
+        RuntimeError: If the schema cannot be loaded
+    """
+    schema = _get_schema()
     is_valid = schema.validate(xml_doc)
-    result.is_valid = is_valid
+    errors = []
 
     if not is_valid:
         for error in schema.error_log:
-            result.errors.append(
+            errors.append(
                 XSDValidationError(
                     message=error.message,
                     line=error.line,
@@ -185,4 +271,232 @@ def validate_xml(xml_string: str) -> XSDValidationResult:
                 )
             )
 
+    return is_valid, errors
+
+
+def _validate_document(xml_string: str) -> tuple[bool, list[XSDValidationError], bool]:
+    """
+    Parse and validate one non-empty document without touching Django.
+
+    Used by XSDValidationService for documents missing from the cache.
+
+    Returns:
+        Tuple of (is_valid, errors, cacheable); outcomes are not cacheable
+        when the schema itself failed to load
+    """
+    try:
+        xml_doc = etree.fromstring(xml_string.encode("utf-8"))
+    except etree.XMLSyntaxError as e:
+        return False, [_syntax_error(e)], True
+
+    try:
+        is_valid, errors = _schema_errors(xml_doc)
+    except RuntimeError as e:
+        return False, [XSDValidationError(message=str(e))], False
+    return is_valid, errors, True
+
+
+def validate_xml(xml_string: str) -> XSDValidationResult:
+    """
+    Validate XML against Crossref XSD schema 5.4.0.
+
+    Parses the XML string and validates it against the bundled
+    Crossref XSD schema. Returns a structured result with
+    validation status and any errors. Outcomes are cached by
+    validation_cache_key(), so unchanged XML is not re-validated.
+
+    Args:
+        xml_string: XML string to validate
+
+    Returns:
+        XSDValidationResult with validation status and any errors
+    """
+    result = _new_result()
+
+    # Handle empty string
+    if not xml_string or not xml_string.strip():
+        result.errors.append(_empty_content_error())
+        return result
+
+    cache_key = validation_cache_key(xml_string)
+    cached = _get_cached_result(cache_key)
+    if cached is not None:
+        return cached
+
+    # Parse XML string
+    try:
+        xml_doc = etree.fromstring(xml_string.encode("utf-8"))
+    except etree.XMLSyntaxError as e:
+        result.errors.append(_syntax_error(e))
+        return result
+
+    result = validate_xml_tree(xml_doc, result)
+    if _SCHEMA_CACHE is not None:
+        _store_result(cache_key, result)
     return result
+
+
+class XMLValidationSink:
+    """
+    Binary file-like sink that assembles and parses XML as it is written.
+
+    Pass it to CrossrefService.write_xml() (or write_component_xml() /
+    write_monograph_xml()): every write is fed to an incremental lxml
+    parser and appended to a single text buffer, so the document is
+    parsed once, while rendering, and no list of chunks is kept and
+    joined afterwards. finish() validates the parsed tree.
+    """
+
+    def __init__(self) -> None:
+        self._parser = etree.XMLParser()
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = io.StringIO()
+        self._syntax_error: etree.XMLSyntaxError | None = None
+
+    def write(self, data: bytes) -> int:
+        """Append UTF-8 encoded XML and feed it to the parser."""
+        self._buffer.write(self._decoder.decode(data))
+        if self._syntax_error is None and data:
+            try:
+                self._parser.feed(data)
+            except etree.XMLSyntaxError as e:
+                self._syntax_error = e
+        return len(data)
+
+    def finish(self) -> tuple[str, XSDValidationResult]:
+        """
+        Validate the written document.
+
+        A cached outcome for the same content skips schema validation.
+
+        Returns:
+            Tuple of (assembled XML string, XSDValidationResult)
+        """
+        self._buffer.write(self._decoder.decode(b"", final=True))
+        xml = self._buffer.getvalue()
+        self._buffer = io.StringIO()
+        result = _new_result()
+        syntax_error = self._syntax_error
+
+        if not xml.strip():
+            result.errors.append(_empty_content_error())
+            return xml, result
+
+        if syntax_error is None:
+            try:
+                xml_doc = self._parser.close()
+            except etree.XMLSyntaxError as e:
+                syntax_error = e
+
+        if syntax_error is not None:
+            result.errors.append(_syntax_error(syntax_error))
+            return xml, result
+
+        cache_key = validation_cache_key(xml)
+        cached = _get_cached_result(cache_key)
+        if cached is not None:
+            return xml, cached
+
+        result = validate_xml_tree(xml_doc, result)
+        if _SCHEMA_CACHE is not None:
+            _store_result(cache_key, result)
+        return xml, result
+
+
+def validate_xml_chunks(chunks: Iterable[str]) -> tuple[str, XSDValidationResult]:
+    """
+    Assemble streamed XML and validate it in a single parse.
+
+    Each rendered chunk is fed to an incremental lxml parser as it is
+    produced (see XMLValidationSink), so the document is parsed once and
+    the resulting tree goes straight to schema validation. There is no
+    separate encode-and-reparse pass over the finished string. A cached
+    outcome for the same content skips schema validation entirely.
+
+    Batches of already rendered documents (bulk regeneration) go through
+    XSDValidationService.validate_many().
+
+    Args:
+        chunks: Iterable of XML text chunks (e.g. CrossrefService.stream_xml())
+
+    Returns:
+        Tuple of (assembled XML string, XSDValidationResult)
+    """
+    sink = XMLValidationSink()
+    for chunk in chunks:
+        sink.write(chunk.encode("utf-8"))
+    return sink.finish()
+
+
+def preload_schema() -> None:
+    """
+    Compile the schema ahead of the first validation.
+
+    Called at app start (with CROSSREF_WARM_TEMPLATES), so forked worker
+    processes inherit the compiled schema instead of compiling it in
+    their first task.
+    """
+    try:
+        _get_schema()
+    except RuntimeError:
+        # Reported per document by _validate_document()
+        logger.exception("Crossref XSD schema could not be preloaded")
+
+
+class XSDValidationService:
+    """
+    Batch XSD validation.
+
+    Documents are first looked up in the validation cache; the remaining
+    ones are parsed and validated in the calling process and their
+    outcomes cached. Results keep input order.
+    """
+
+    def validate(self, xml_string: str) -> XSDValidationResult:
+        """
+        Validate a single document.
+
+        Args:
+            xml_string: XML string to validate
+
+        Returns:
+            XSDValidationResult with validation status and any errors
+        """
+        return self.validate_many([xml_string])[0]
+
+    def validate_many(self, documents: Sequence[str]) -> list[XSDValidationResult]:
+        """
+        Validate a batch of documents.
+
+        Args:
+            documents: XML strings to validate
+
+        Returns:
+            One XSDValidationResult per document, in input order
+        """
+        results: list[XSDValidationResult | None] = [None] * len(documents)
+        pending: list[tuple[int, str, str]] = []
+
+        for index, xml_string in enumerate(documents):
+            if not xml_string or not xml_string.strip():
+                result = _new_result()
+                result.errors.append(_empty_content_error())
+                results[index] = result
+                continue
+            cache_key = validation_cache_key(xml_string)
+            cached = _get_cached_result(cache_key)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append((index, cache_key, xml_string))
+
+        outcomes = [_validate_document(xml_string) for _, _, xml_string in pending]
+        for (index, cache_key, _), (is_valid, errors, cacheable) in zip(pending, outcomes, strict=True):
+            result = _new_result()
+            result.is_valid = is_valid
+            result.errors = errors
+            if cacheable:
+                _store_result(cache_key, result)
+            results[index] = result
+
+        return results
@@ -7,6 +7,10 @@ Story 5.3: XML Generation for All Publication Types.
 Story 5.5: XML Preview with Syntax Highlighting.
 Story 5.6: XML Download - Export History Tracking.
 Story 5.7: Crossref Deposit Workflow Page.
+Live deposits: submit generated XML directly to Crossref or queue it
+for a combined deposit.
+Delta downloads: only records changed since the last export.
+ZIP bundles: XML of many issues or monographs in one streamed archive.
 """
 
 from typing import TYPE_CHECKING
@@ -16,7 +20,9 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import PermissionDenied
 from django.http import Http404
 from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.shortcuts import redirect
 from django.shortcuts import render
 from django.template.response import TemplateResponse
 from django.urls import reverse
@@ -25,6 +31,7 @@ from slugify import slugify
 from django.views import View
 
 from doi_portal.core.permissions import has_publisher_access
+from doi_portal.crossref.deposit_status import get_deposit_summary
 from doi_portal.crossref.models import CrossrefExport
 from doi_portal.crossref.services import CrossrefService
 from doi_portal.crossref.services import PreValidationService
@@ -43,10 +50,14 @@ __all__ = [
     "GenerateXMLView",
     "IssueValidationView",
     "mark_deposited",
+    "deposit_submit",
     "xml_preview",
+    "xml_preview_lines",
     "xml_download",
     "download_warning",
     "xml_download_force",
+    "xml_download_delta",
+    "issue_xml_bundle",
     "export_redownload",
     "export_history",
     # Component workflow
@@ -54,23 +65,31 @@ __all__ = [
     "GenerateComponentXMLView",
     "ComponentGroupDepositView",
     "component_xml_preview",
+    "component_xml_preview_lines",
     "component_xml_download",
     "component_download_warning",
     "component_xml_download_force",
     "component_export_redownload",
     "component_export_history",
     "component_mark_deposited",
+    "component_deposit_submit",
+    "component_deposit_enqueue",
     # Monograph workflow
     "MonographValidationView",
     "GenerateMonographXMLView",
     "MonographDepositView",
     "monograph_xml_preview",
+    "monograph_xml_preview_lines",
     "monograph_xml_download",
     "monograph_download_warning",
     "monograph_xml_download_force",
+    "monograph_xml_download_delta",
+    "monograph_xml_bundle",
     "monograph_export_redownload",
     "monograph_export_history",
     "monograph_mark_deposited",
+    "monograph_deposit_submit",
+    "monograph_deposit_enqueue",
 ]
 
 
@@ -211,7 +230,8 @@ def xml_preview(request: "HttpRequest", pk: int) -> HttpResponse:
     """
     Return XML preview modal for an issue.
 
-    Story 5.5: XML Preview with Syntax Highlighting.
+    Story 5.5: XML Preview with Syntax Highlighting. The modal shows the
+    first window of lines; further windows are loaded from xml_preview_lines.
 
     Args:
         request: HTTP request
@@ -223,37 +243,125 @@ def xml_preview(request: "HttpRequest", pk: int) -> HttpResponse:
     Raises:
         PermissionDenied: If user does not have access to the issue's publisher.
     """
-    issue = get_object_or_404(Issue, pk=pk)
+    issue = get_object_or_404(
+        Issue.objects.select_related("publication__publisher").defer("crossref_xml"),
+        pk=pk,
+    )
 
     # Check publisher-level permission (RBAC model requires row-level access)
     if not has_publisher_access(request.user, issue.publication.publisher):
         raise PermissionDenied
 
-    if not issue.crossref_xml:
+    return _xml_preview_response(
+        request,
+        issue,
+        "issue",
+        download_url=reverse("crossref:xml-download", args=[issue.pk]),
+        lines_url=reverse("crossref:xml-preview-lines", args=[issue.pk]),
+    )
+
+
+@login_required
+def xml_preview_lines(request: "HttpRequest", pk: int) -> HttpResponse:
+    """
+    Return a window of lines of an issue's XML for the preview modal.
+
+    Query parameters: start (first line) or line (XSD error line to jump
+    to), count (window size) and direction (down, up or both: which
+    neighbouring windows get a loader). format=text returns the whole
+    document as plain text for copying.
+
+    Args:
+        request: HTTP request
+        pk: Issue primary key
+
+    Returns:
+        HTML partial with the lines, or the plain-text XML
+
+    Raises:
+        PermissionDenied: If user does not have access to the issue's publisher.
+    """
+    issue = get_object_or_404(
+        Issue.objects.select_related("publication__publisher").defer("crossref_xml"),
+        pk=pk,
+    )
+    if not has_publisher_access(request.user, issue.publication.publisher):
+        raise PermissionDenied
+
+    return _xml_lines_response(
+        request,
+        issue,
+        lines_url=reverse("crossref:xml-preview-lines", args=[issue.pk]),
+    )
+
+
+def _int_param(request: "HttpRequest", name: str) -> int | None:
+    """Read a positive integer query parameter (None if missing or invalid)."""
+    try:
+        value = int(request.GET.get(name, ""))
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def _xml_preview_response(
+    request: "HttpRequest",
+    entity,
+    entity_name: str,
+    *,
+    download_url: str,
+    lines_url: str,
+) -> HttpResponse:
+    """
+    Render the XML preview modal with the first window of lines.
+
+    Only the line index and the first window are read from the database;
+    the size warning is based on the indexed document size.
+
+    Args:
+        request: HTTP request
+        entity: Issue, ComponentGroup or Monograph (crossref_xml may be deferred)
+        entity_name: Context name of the entity
+        download_url: URL of the XML download
+        lines_url: URL of the line-window endpoint
+
+    Returns:
+        Modal partial, or a warning if XML is not generated
+    """
+    from doi_portal.crossref.xml_preview import error_line_numbers
+    from doi_portal.crossref.xml_preview import load_line_index
+    from doi_portal.crossref.xml_preview import read_line_window
+
+    model = type(entity)
+    index = load_line_index(model, entity.pk)
+    if not index["lines"]:
         return HttpResponse(
             '<div class="alert alert-warning">XML nije generisan.</div>',
             status=200,
         )
 
-    # Extract error line numbers for highlighting
-    error_lines = []
-    if issue.xsd_errors:
-        for error in issue.xsd_errors:
-            if error.get("line"):
-                error_lines.append(str(error["line"]))
+    window = read_line_window(model, entity.pk, index, xsd_errors=entity.xsd_errors)
+    error_lines = error_line_numbers(entity.xsd_errors)
 
     # Performance warning for large XML (>100KB as per Task 3)
-    xml_size_kb = len(issue.crossref_xml.encode("utf-8")) / 1024
+    xml_size_kb = index["bytes"] / 1024
     is_large_xml = xml_size_kb > 100
 
     context = {
-        "issue": issue,
-        "xml_content": issue.crossref_xml,
-        "xsd_valid": issue.xsd_valid,
-        "xsd_errors": issue.xsd_errors,
-        "error_lines": ",".join(error_lines),
+        entity_name: entity,
+        "xml_content": "\n".join(window.lines),
+        "window": window,
+        "window_error_lines": ",".join(str(line) for line in window.error_lines),
+        "show_previous": False,
+        "show_next": True,
+        "total_lines": index["lines"],
+        "xsd_valid": entity.xsd_valid,
+        "xsd_errors": entity.xsd_errors,
+        "error_lines": ",".join(str(line) for line in error_lines),
         "is_large_xml": is_large_xml,
         "xml_size_kb": round(xml_size_kb, 1),
+        "download_url": download_url,
+        "lines_url": lines_url,
     }
 
     return TemplateResponse(
@@ -263,6 +371,98 @@ def xml_preview(request: "HttpRequest", pk: int) -> HttpResponse:
     )
 
 
+def _xml_lines_response(request: "HttpRequest", entity, *, lines_url: str) -> HttpResponse:
+    """
+    Render one window of XML lines (see xml_preview_lines).
+
+    Args:
+        request: HTTP request
+        entity: Issue, ComponentGroup or Monograph (crossref_xml may be deferred)
+        lines_url: URL of the line-window endpoint
+
+    Returns:
+        Lines partial, or plain-text XML for format=text
+
+    Raises:
+        Http404: If XML is not generated
+    """
+    from doi_portal.crossref.xml_preview import error_window_start
+    from doi_portal.crossref.xml_preview import load_line_index
+    from doi_portal.crossref.xml_preview import read_line_window
+
+    model = type(entity)
+    if request.GET.get("format") == "text":
+        xml_content = model._base_manager.filter(pk=entity.pk).values_list("crossref_xml", flat=True).get()
+        if not xml_content:
+            raise Http404("XML nije generisan")
+        return StreamingHttpResponse(
+            _iter_xml_chunks(xml_content),
+            content_type="text/plain; charset=utf-8",
+        )
+
+    index = load_line_index(model, entity.pk)
+    if not index["lines"]:
+        raise Http404("XML nije generisan")
+
+    line = _int_param(request, "line")
+    start = error_window_start(line) if line else _int_param(request, "start") or 1
+    direction = "both" if line else request.GET.get("direction", "down")
+    window = read_line_window(
+        model,
+        entity.pk,
+        index,
+        start=start,
+        count=_int_param(request, "count"),
+        xsd_errors=entity.xsd_errors,
+    )
+
+    return TemplateResponse(
+        request,
+        "crossref/partials/_xml_preview_lines.html",
+        {
+            "xml_content": "\n".join(window.lines),
+            "window": window,
+            "window_error_lines": ",".join(str(line) for line in window.error_lines),
+            "show_previous": direction in ("up", "both"),
+            "show_next": direction in ("down", "both"),
+            "lines_url": lines_url,
+        },
+    )
+
+
+# Chunk size for streamed XML downloads (characters per chunk)
+XML_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_xml_chunks(xml_content: str, chunk_size: int = XML_STREAM_CHUNK_SIZE):
+    """Yield successive UTF-8 encoded slices of an XML string for streaming responses."""
+    for start in range(0, len(xml_content), chunk_size):
+        yield xml_content[start:start + chunk_size].encode("utf-8")
+
+
+def _xml_attachment_response(xml_content: str, filename: str) -> StreamingHttpResponse:
+    """
+    Build a streamed XML attachment response.
+
+    Streams the stored XML in fixed-size chunks, encoding one slice at a
+    time, so the full document is never copied into an encoded response
+    body.
+
+    Args:
+        xml_content: XML string to send
+        filename: Attachment filename
+
+    Returns:
+        StreamingHttpResponse with XML attachment headers
+    """
+    response = StreamingHttpResponse(
+        _iter_xml_chunks(xml_content),
+        content_type="application/xml; charset=utf-8",
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
 def _generate_filename(issue: Issue) -> str:
     """
     Generate standardized filename for XML export.
@@ -297,7 +497,7 @@ def _create_xml_download_response(
         issue: The Issue to download XML from
 
     Returns:
-        HttpResponse with XML attachment
+        StreamingHttpResponse with XML attachment
 
     Raises:
         Http404: If XML is not generated for the issue.
@@ -318,14 +518,155 @@ def _create_xml_download_response(
     )
 
     # Return XML with proper headers (AC2: UTF-8 encoding)
-    response = HttpResponse(
-        issue.crossref_xml,
-        content_type="application/xml; charset=utf-8",
+    return _xml_attachment_response(issue.crossref_xml, filename)
+
+
+def _id_params(request: "HttpRequest") -> list[int]:
+    """Read repeated ?ids= query parameters (invalid values are ignored)."""
+    return [int(value) for value in request.GET.getlist("ids") if value.isdigit()]
+
+
+def _xml_bundle_response(
+    request: "HttpRequest",
+    entity_type: str,
+    publisher,
+    queryset,
+    filename: str,
+) -> StreamingHttpResponse:
+    """
+    Stream a ZIP of the XML of many entities and record one bundle export.
+
+    The export is recorded after the archive has been streamed completely,
+    with the files and XML metadata actually sent.
+
+    Args:
+        request: HTTP request (for user tracking)
+        entity_type: ExportType.ISSUE or ExportType.MONOGRAPH
+        publisher: Publisher owning the entities
+        queryset: Entities to include, in archive order
+        filename: Archive filename
+
+    Returns:
+        StreamingHttpResponse with the ZIP attachment
+
+    Raises:
+        Http404: If none of the entities has generated XML.
+    """
+    from doi_portal.crossref.bundle import collect_bundle_entries
+    from doi_portal.crossref.bundle import record_bundle_export
+    from doi_portal.crossref.bundle import stream_xml_bundle
+
+    entries = collect_bundle_entries(entity_type, queryset)
+    if not entries:
+        raise Http404("Nema generisanog XML-a za izabrane zapise.")
+
+    def record(written):
+        return record_bundle_export(entity_type, publisher, written, user=request.user, filename=filename)
+
+    response = StreamingHttpResponse(
+        stream_xml_bundle(entity_type, entries, on_complete=record),
+        content_type="application/zip",
     )
     response["Content-Disposition"] = f'attachment; filename="{filename}"'
     return response
 
 
+@login_required
+def issue_xml_bundle(request: "HttpRequest", pk: int) -> HttpResponse:
+    """
+    Download the XML of a publication's issues as one ZIP archive.
+
+    Query parameters: volume (only issues of one volume) and ids (repeated,
+    only the given issues).
+
+    Args:
+        request: HTTP request
+        pk: Publication primary key
+
+    Returns:
+        Streamed ZIP attachment
+
+    Raises:
+        PermissionDenied: If user does not have access to the publication's publisher.
+        Http404: If no selected issue has generated XML.
+    """
+    from doi_portal.publications.models import Publication
+
+    publication = get_object_or_404(Publication.objects.select_related("publisher"), pk=pk)
+    if not has_publisher_access(request.user, publication.publisher):
+        raise PermissionDenied
+
+    issues = Issue.objects.filter(publication=publication).select_related("publication")
+    volume = request.GET.get("volume", "").strip()
+    if volume:
+        issues = issues.filter(volume=volume)
+    ids = _id_params(request)
+    if ids:
+        issues = issues.filter(pk__in=ids)
+
+    publication_slug = slugify(publication.title)[:30] or "publication"
+    timestamp = timezone.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"{publication_slug}_{slugify(volume) or 'sve'}_{timestamp}.zip"
+    return _xml_bundle_response(
+        request,
+        ExportType.ISSUE,
+        publication.publisher,
+        issues.order_by("year", "volume", "issue_number", "pk"),
+        filename,
+    )
+
+
+def _create_delta_download_response(
+    request: "HttpRequest",
+    entity_type: str,
+    entity,
+    filename: str,
+) -> HttpResponse:
+    """
+    Create a delta XML download with export tracking.
+
+    Regenerates the XML, keeps only records changed since the last export
+    and records the result as a delta export (a full one when there is no
+    previous export). When nothing changed, redirects back to the deposit
+    workflow page with an informational message.
+
+    Args:
+        request: HTTP request (for user tracking)
+        entity_type: ExportType.ISSUE or ExportType.MONOGRAPH
+        entity: Issue or Monograph
+        filename: Filename of a full export
+
+    Returns:
+        StreamingHttpResponse with XML attachment, or a redirect to the
+        workflow page
+    """
+    from django.contrib import messages
+
+    from doi_portal.crossref.delta import generate_delta_xml
+    from doi_portal.crossref.validators import validate_xml_chunks
+
+    delta = generate_delta_xml(entity_type, entity)
+    if not delta.has_changes:
+        messages.info(request, "Nema izmena od poslednjeg eksporta - nema šta da se preuzme.")
+        workflow_url = "crossref:issue-deposit" if entity_type == ExportType.ISSUE else "crossref:monograph-deposit"
+        return redirect(workflow_url, pk=entity.pk)
+
+    _, validation_result = validate_xml_chunks([delta.xml])
+    if delta.base_export is not None:
+        filename = filename.removesuffix(".xml") + "_delta.xml"
+
+    CrossrefExport.objects.create(
+        export_type=entity_type,
+        **{"issue" if entity_type == ExportType.ISSUE else "monograph": entity},
+        xml_content=delta.xml,
+        exported_by=request.user,
+        filename=filename,
+        xsd_valid_at_export=validation_result.is_valid,
+        is_delta=delta.base_export is not None,
+    )
+    return _xml_attachment_response(delta.xml, filename)
+
+
 @login_required
 def xml_download(request: "HttpRequest", pk: int) -> HttpResponse:
     """
@@ -414,6 +755,29 @@ def xml_download_force(request: "HttpRequest", pk: int) -> HttpResponse:
     return _create_xml_download_response(request, issue)
 
 
+@login_required
+def xml_download_delta(request: "HttpRequest", pk: int) -> HttpResponse:
+    """
+    Download only the articles changed since the last export of an issue.
+
+    Args:
+        request: HTTP request
+        pk: Issue primary key
+
+    Returns:
+        XML file download response
+
+    Raises:
+        PermissionDenied: If user does not have access to the issue's publisher.
+    """
+    issue = get_object_or_404(Issue, pk=pk)
+
+    if not has_publisher_access(request.user, issue.publication.publisher):
+        raise PermissionDenied
+
+    return _create_delta_download_response(request, ExportType.ISSUE, issue, _generate_filename(issue))
+
+
 @login_required
 def export_redownload(request: "HttpRequest", pk: int) -> HttpResponse:
     """
@@ -432,7 +796,7 @@ def export_redownload(request: "HttpRequest", pk: int) -> HttpResponse:
     Raises:
         PermissionDenied: If user does not have access to the export's issue publisher.
     """
-    export = get_object_or_404(CrossrefExport, pk=pk)
+    export = get_object_or_404(CrossrefExport.objects.select_related("xml_blob"), pk=pk)
 
     # Permission check — handle both issue and component_group exports
     if export.issue:
@@ -444,12 +808,7 @@ def export_redownload(request: "HttpRequest", pk: int) -> HttpResponse:
     if not has_publisher_access(request.user, publisher):
         raise PermissionDenied
 
-    response = HttpResponse(
-        export.xml_content,
-        content_type="application/xml; charset=utf-8",
-    )
-    response["Content-Disposition"] = f'attachment; filename="{export.filename}"'
-    return response
+    return _xml_attachment_response(export.xml_content, export.filename)
 
 
 @login_required
@@ -511,55 +870,8 @@ class CrossrefDepositView(LoginRequiredMixin, View):
         if not has_publisher_access(request.user, issue.publication.publisher):
             raise PermissionDenied
 
-        # Compute step statuses
-        has_xml = bool(issue.crossref_xml)
-        validator = PreValidationService()
-        validation_result = validator.validate_issue(issue)
-
-        steps = [
-            {
-                "number": 1,
-                "title": "Pre-validacija",
-                "completed": validation_result.is_valid,
-                "active": not validation_result.is_valid,
-                "icon": "clipboard-check",
-            },
-            {
-                "number": 2,
-                "title": "Generisanje XML",
-                "completed": has_xml,
-                "active": validation_result.is_valid and not has_xml,
-                "icon": "file-code",
-            },
-            {
-                "number": 3,
-                "title": "XSD Validacija",
-                "completed": has_xml and issue.xsd_valid is True,
-                "active": has_xml and issue.xsd_valid is not True,
-                "icon": "shield-check",
-            },
-            {
-                "number": 4,
-                "title": "Pregled XML",
-                "completed": False,  # Always available, never "completed"
-                "active": has_xml,
-                "icon": "eye",
-            },
-            {
-                "number": 5,
-                "title": "Preuzimanje XML",
-                "completed": issue.crossref_exports.exists(),
-                "active": has_xml,
-                "icon": "download",
-            },
-        ]
-
-        # Check if all critical steps are complete for "ready for Crossref"
-        all_ready = (
-            has_xml
-            and issue.xsd_valid is True
-            and issue.crossref_exports.exists()
-        )
+        # Step statuses come from the cached deposit summary
+        summary = get_deposit_summary(ExportType.ISSUE, issue)
 
         # Breadcrumbs
         breadcrumbs = [
@@ -582,12 +894,13 @@ class CrossrefDepositView(LoginRequiredMixin, View):
             "crossref/issue_crossref_deposit.html",
             {
                 "issue": issue,
-                "steps": steps,
-                "has_xml": has_xml,
-                "validation_result": validation_result,
-                "is_deposited": issue.is_crossref_deposited,
-                "all_ready": all_ready,
+                "steps": summary.workflow_steps(),
+                "has_xml": summary.has_xml,
+                "deposit_summary": summary,
+                "is_deposited": summary.is_deposited,
+                "all_ready": summary.all_ready,
                 "breadcrumbs": breadcrumbs,
+                **_live_deposit_context(ExportType.ISSUE, issue, issue.publication.publisher, summary),
             },
         )
 
@@ -631,18 +944,111 @@ def mark_deposited(request: "HttpRequest", pk: int) -> HttpResponse:
     )
 
 
+# Deposit-submit and deposit-enqueue URL names per entity type
+_LIVE_DEPOSIT_URLS = {
+    ExportType.ISSUE: ("crossref:deposit-submit", None),
+    ExportType.COMPONENT_GROUP: ("crossref:component-deposit-submit", "crossref:component-deposit-enqueue"),
+    ExportType.MONOGRAPH: ("crossref:monograph-deposit-submit", "crossref:monograph-deposit-enqueue"),
+}
+
+
+def _live_deposit_context(entity_type: str, entity, publisher, summary=None) -> dict:
+    """
+    Context for the live deposit panel of a deposit workflow page.
+
+    Args:
+        entity_type: ExportType value
+        entity: Issue, ComponentGroup or Monograph
+        publisher: Publisher owning the entity
+        summary: Cached DepositSummary; deposit and queue lookups are skipped when it has none
+
+    Returns:
+        Dict with the latest CrossrefDeposit, the pending queue item and the
+        submit/enqueue URLs (empty when the publisher has no Crossref credentials)
+    """
+    from doi_portal.crossref.models import CrossrefDeposit
+    from doi_portal.crossref.models import CrossrefDepositItem
+
+    if not (publisher.crossref_username and publisher.crossref_password):
+        return {"deposit_submit_url": "", "deposit_enqueue_url": ""}
+
+    submit_url_name, enqueue_url_name = _LIVE_DEPOSIT_URLS[entity_type]
+    live_deposit = queued_item = None
+    if summary is None or summary.deposit_status:
+        live_deposit = CrossrefDeposit.objects.filter(entity_type=entity_type, object_id=entity.pk).first()
+    if summary is None or summary.is_queued:
+        queued_item = CrossrefDepositItem.objects.filter(
+            entity_type=entity_type,
+            object_id=entity.pk,
+            deposit__isnull=True,
+        ).first()
+    return {
+        "live_deposit": live_deposit,
+        "queued_item": queued_item,
+        "deposit_submit_url": reverse(submit_url_name, args=[entity.pk]),
+        "deposit_enqueue_url": reverse(enqueue_url_name, args=[entity.pk]) if enqueue_url_name else "",
+    }
+
+
+def _live_deposit_response(request: "HttpRequest", entity_type: str, entity, publisher, action) -> HttpResponse:
+    """Run a deposit action (start_deposit/enqueue_deposit) and render the live deposit panel."""
+    from doi_portal.crossref.deposit import CrossrefDepositError
+
+    error = ""
+    try:
+        action(entity_type, entity, request.user)
+    except CrossrefDepositError as e:
+        error = str(e)
+
+    return render(
+        request,
+        "crossref/partials/_live_deposit.html",
+        {
+            **_live_deposit_context(entity_type, entity, publisher),
+            "deposit_error": error,
+        },
+    )
+
+
+@login_required
+def deposit_submit(request: "HttpRequest", pk: int) -> HttpResponse:
+    """
+    Submit an issue's generated XML directly to Crossref.
+
+    Args:
+        request: HTTP request
+        pk: Issue primary key
+
+    Returns:
+        HTML partial with the live deposit status
+
+    Raises:
+        PermissionDenied: If user does not have access to the issue's publisher.
+    """
+    from doi_portal.crossref.deposit import start_deposit
+
+    if request.method != "POST":
+        return HttpResponse(status=405)
+
+    issue = get_object_or_404(Issue.objects.select_related("publication__publisher"), pk=pk)
+    if not has_publisher_access(request.user, issue.publication.publisher):
+        raise PermissionDenied
+
+    return _live_deposit_response(request, ExportType.ISSUE, issue, issue.publication.publisher, start_deposit)
+
+
 # =============================================================================
 # Component Workflow Views
 # =============================================================================
 
 
-def _get_component_group(pk):
-    """Get ComponentGroup with publisher select_related."""
+def _get_component_group(pk, *, defer_xml: bool = False):
+    """Get ComponentGroup with publisher select_related (optionally without the XML column)."""
     from doi_portal.components.models import ComponentGroup
-    return get_object_or_404(
-        ComponentGroup.objects.select_related("publisher"),
-        pk=pk,
-    )
+    queryset = ComponentGroup.objects.select_related("publisher")
+    if defer_xml:
+        queryset = queryset.defer("crossref_xml")
+    return get_object_or_404(queryset, pk=pk)
 
 
 def _generate_component_filename(component_group) -> str:
@@ -668,12 +1074,7 @@ def _create_component_xml_download_response(request, component_group):
         xsd_valid_at_export=component_group.xsd_valid,
     )
 
-    response = HttpResponse(
-        component_group.crossref_xml,
-        content_type="application/xml; charset=utf-8",
-    )
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
-    return response
+    return _xml_attachment_response(component_group.crossref_xml, filename)
 
 
 class ComponentGroupValidationView(LoginRequiredMixin, View):
@@ -763,37 +1164,30 @@ class GenerateComponentXMLView(LoginRequiredMixin, View):
 @login_required
 def component_xml_preview(request: "HttpRequest", pk: int) -> HttpResponse:
     """Return XML preview modal for a ComponentGroup."""
-    cg = _get_component_group(pk)
+    cg = _get_component_group(pk, defer_xml=True)
     if not has_publisher_access(request.user, cg.publisher):
         raise PermissionDenied
 
-    if not cg.crossref_xml:
-        return HttpResponse(
-            '<div class="alert alert-warning">XML nije generisan.</div>',
-            status=200,
-        )
+    return _xml_preview_response(
+        request,
+        cg,
+        "component_group",
+        download_url=reverse("crossref:component-xml-download", args=[cg.pk]),
+        lines_url=reverse("crossref:component-xml-preview-lines", args=[cg.pk]),
+    )
 
-    error_lines = []
-    if cg.xsd_errors:
-        for error in cg.xsd_errors:
-            if error.get("line"):
-                error_lines.append(str(error["line"]))
 
-    xml_size_kb = len(cg.crossref_xml.encode("utf-8")) / 1024
-    is_large_xml = xml_size_kb > 100
+@login_required
+def component_xml_preview_lines(request: "HttpRequest", pk: int) -> HttpResponse:
+    """Return a window of lines of a ComponentGroup's XML (see xml_preview_lines)."""
+    cg = _get_component_group(pk, defer_xml=True)
+    if not has_publisher_access(request.user, cg.publisher):
+        raise PermissionDenied
 
-    return TemplateResponse(
+    return _xml_lines_response(
         request,
-        "crossref/partials/_xml_preview_modal.html",
-        {
-            "component_group": cg,
-            "xml_content": cg.crossref_xml,
-            "xsd_valid": cg.xsd_valid,
-            "xsd_errors": cg.xsd_errors,
-            "error_lines": ",".join(error_lines),
-            "is_large_xml": is_large_xml,
-            "xml_size_kb": round(xml_size_kb, 1),
-        },
+        cg,
+        lines_url=reverse("crossref:component-xml-preview-lines", args=[cg.pk]),
     )
 
 
@@ -833,7 +1227,7 @@ def component_xml_download_force(request: "HttpRequest", pk: int) -> HttpRespons
 @login_required
 def component_export_redownload(request: "HttpRequest", pk: int) -> HttpResponse:
     """Re-download a previous component export."""
-    export = get_object_or_404(CrossrefExport, pk=pk)
+    export = get_object_or_404(CrossrefExport.objects.select_related("xml_blob"), pk=pk)
 
     if export.component_group:
         publisher = export.component_group.publisher
@@ -845,12 +1239,7 @@ def component_export_redownload(request: "HttpRequest", pk: int) -> HttpResponse
     if not has_publisher_access(request.user, publisher):
         raise PermissionDenied
 
-    response = HttpResponse(
-        export.xml_content,
-        content_type="application/xml; charset=utf-8",
-    )
-    response["Content-Disposition"] = f'attachment; filename="{export.filename}"'
-    return response
+    return _xml_attachment_response(export.xml_content, export.filename)
 
 
 @login_required
@@ -879,53 +1268,7 @@ class ComponentGroupDepositView(LoginRequiredMixin, View):
         if not has_publisher_access(request.user, cg.publisher):
             raise PermissionDenied
 
-        has_xml = bool(cg.crossref_xml)
-        validator = PreValidationService()
-        validation_result = validator.validate_component_group(cg)
-
-        steps = [
-            {
-                "number": 1,
-                "title": "Pre-validacija",
-                "completed": validation_result.is_valid,
-                "active": not validation_result.is_valid,
-                "icon": "clipboard-check",
-            },
-            {
-                "number": 2,
-                "title": "Generisanje XML",
-                "completed": has_xml,
-                "active": validation_result.is_valid and not has_xml,
-                "icon": "file-code",
-            },
-            {
-                "number": 3,
-                "title": "XSD Validacija",
-                "completed": has_xml and cg.xsd_valid is True,
-                "active": has_xml and cg.xsd_valid is not True,
-                "icon": "shield-check",
-            },
-            {
-                "number": 4,
-                "title": "Pregled XML",
-                "completed": False,
-                "active": has_xml,
-                "icon": "eye",
-            },
-            {
-                "number": 5,
-                "title": "Preuzimanje XML",
-                "completed": cg.crossref_exports.exists(),
-                "active": has_xml,
-                "icon": "download",
-            },
-        ]
-
-        all_ready = (
-            has_xml
-            and cg.xsd_valid is True
-            and cg.crossref_exports.exists()
-        )
+        summary = get_deposit_summary(ExportType.COMPONENT_GROUP, cg)
 
         breadcrumbs = [
             {"label": "Komponente", "url": reverse("components:group-list")},
@@ -938,12 +1281,13 @@ class ComponentGroupDepositView(LoginRequiredMixin, View):
             "crossref/component_crossref_deposit.html",
             {
                 "component_group": cg,
-                "steps": steps,
-                "has_xml": has_xml,
-                "validation_result": validation_result,
-                "is_deposited": cg.is_crossref_deposited,
-                "all_ready": all_ready,
+                "steps": summary.workflow_steps(),
+                "has_xml": summary.has_xml,
+                "deposit_summary": summary,
+                "is_deposited": summary.is_deposited,
+                "all_ready": summary.all_ready,
                 "breadcrumbs": breadcrumbs,
+                **_live_deposit_context(ExportType.COMPONENT_GROUP, cg, cg.publisher, summary),
             },
         )
 
@@ -972,16 +1316,86 @@ def component_mark_deposited(request: "HttpRequest", pk: int) -> HttpResponse:
     )
 
 
+@login_required
+def component_deposit_submit(request: "HttpRequest", pk: int) -> HttpResponse:
+    """Submit a ComponentGroup's generated XML directly to Crossref."""
+    from doi_portal.crossref.deposit import start_deposit
+
+    if request.method != "POST":
+        return HttpResponse(status=405)
+
+    cg = _get_component_group(pk)
+    if not has_publisher_access(request.user, cg.publisher):
+        raise PermissionDenied
+
+    return _live_deposit_response(request, ExportType.COMPONENT_GROUP, cg, cg.publisher, start_deposit)
+
+
+@login_required
+def component_deposit_enqueue(request: "HttpRequest", pk: int) -> HttpResponse:
+    """Queue a ComponentGroup for the next combined Crossref deposit."""
+    from doi_portal.crossref.deposit_queue import enqueue_deposit
+
+    if request.method != "POST":
+        return HttpResponse(status=405)
+
+    cg = _get_component_group(pk)
+    if not has_publisher_access(request.user, cg.publisher):
+        raise PermissionDenied
+
+    return _live_deposit_response(request, ExportType.COMPONENT_GROUP, cg, cg.publisher, enqueue_deposit)
+
+
 # =============================================================================
 # Monograph Workflow Views
 # =============================================================================
 
 
-def _get_monograph(pk):
-    """Get Monograph with publisher select_related."""
-    return get_object_or_404(
-        Monograph.objects.select_related("publisher"),
-        pk=pk,
+def _get_monograph(pk, *, defer_xml: bool = False):
+    """Get Monograph with publisher select_related (optionally without the XML column)."""
+    queryset = Monograph.objects.select_related("publisher")
+    if defer_xml:
+        queryset = queryset.defer("crossref_xml")
+    return get_object_or_404(queryset, pk=pk)
+
+
+@login_required
+def monograph_xml_bundle(request: "HttpRequest", pk: int) -> HttpResponse:
+    """
+    Download the XML of a publisher's monographs as one ZIP archive.
+
+    Query parameter ids (repeated) limits the archive to the given monographs.
+
+    Args:
+        request: HTTP request
+        pk: Publisher primary key
+
+    Returns:
+        Streamed ZIP attachment
+
+    Raises:
+        PermissionDenied: If user does not have access to the publisher.
+        Http404: If no selected monograph has generated XML.
+    """
+    from doi_portal.publishers.models import Publisher
+
+    publisher = get_object_or_404(Publisher, pk=pk)
+    if not has_publisher_access(request.user, publisher):
+        raise PermissionDenied
+
+    monographs = Monograph.objects.filter(publisher=publisher)
+    ids = _id_params(request)
+    if ids:
+        monographs = monographs.filter(pk__in=ids)
+
+    publisher_slug = slugify(publisher.name)[:30] or "publisher"
+    timestamp = timezone.now().strftime("%Y%m%d_%H%M%S")
+    return _xml_bundle_response(
+        request,
+        ExportType.MONOGRAPH,
+        publisher,
+        monographs.order_by("year", "title", "pk"),
+        f"monographs_{publisher_slug}_{timestamp}.zip",
     )
 
 
@@ -1008,12 +1422,7 @@ def _create_monograph_xml_download_response(request, monograph):
         xsd_valid_at_export=monograph.xsd_valid,
     )
 
-    response = HttpResponse(
-        monograph.crossref_xml,
-        content_type="application/xml; charset=utf-8",
-    )
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
-    return response
+    return _xml_attachment_response(monograph.crossref_xml, filename)
 
 
 class MonographValidationView(LoginRequiredMixin, View):
@@ -1087,37 +1496,30 @@ class GenerateMonographXMLView(LoginRequiredMixin, View):
 @login_required
 def monograph_xml_preview(request: "HttpRequest", pk: int) -> HttpResponse:
     """Return XML preview modal for a Monograph."""
-    monograph = _get_monograph(pk)
+    monograph = _get_monograph(pk, defer_xml=True)
     if not has_publisher_access(request.user, monograph.publisher):
         raise PermissionDenied
 
-    if not monograph.crossref_xml:
-        return HttpResponse(
-            '<div class="alert alert-warning">XML nije generisan.</div>',
-            status=200,
-        )
+    return _xml_preview_response(
+        request,
+        monograph,
+        "monograph",
+        download_url=reverse("crossref:monograph-xml-download", args=[monograph.pk]),
+        lines_url=reverse("crossref:monograph-xml-preview-lines", args=[monograph.pk]),
+    )
 
-    error_lines = []
-    if monograph.xsd_errors:
-        for error in monograph.xsd_errors:
-            if error.get("line"):
-                error_lines.append(str(error["line"]))
 
-    xml_size_kb = len(monograph.crossref_xml.encode("utf-8")) / 1024
-    is_large_xml = xml_size_kb > 100
+@login_required
+def monograph_xml_preview_lines(request: "HttpRequest", pk: int) -> HttpResponse:
+    """Return a window of lines of a Monograph's XML (see xml_preview_lines)."""
+    monograph = _get_monograph(pk, defer_xml=True)
+    if not has_publisher_access(request.user, monograph.publisher):
+        raise PermissionDenied
 
-    return TemplateResponse(
+    return _xml_lines_response(
         request,
-        "crossref/partials/_xml_preview_modal.html",
-        {
-            "monograph": monograph,
-            "xml_content": monograph.crossref_xml,
-            "xsd_valid": monograph.xsd_valid,
-            "xsd_errors": monograph.xsd_errors,
-            "error_lines": ",".join(error_lines),
-            "is_large_xml": is_large_xml,
-            "xml_size_kb": round(xml_size_kb, 1),
-        },
+        monograph,
+        lines_url=reverse("crossref:monograph-xml-preview-lines", args=[monograph.pk]),
     )
 
 
@@ -1154,10 +1556,24 @@ def monograph_xml_download_force(request: "HttpRequest", pk: int) -> HttpRespons
     return _create_monograph_xml_download_response(request, monograph)
 
 
+@login_required
+def monograph_xml_download_delta(request: "HttpRequest", pk: int) -> HttpResponse:
+    """Download only the chapters changed since the last monograph export."""
+    monograph = _get_monograph(pk)
+    if not has_publisher_access(request.user, monograph.publisher):
+        raise PermissionDenied
+    return _create_delta_download_response(
+        request,
+        ExportType.MONOGRAPH,
+        monograph,
+        _generate_monograph_filename(monograph),
+    )
+
+
 @login_required
 def monograph_export_redownload(request: "HttpRequest", pk: int) -> HttpResponse:
     """Re-download a previous monograph export."""
-    export = get_object_or_404(CrossrefExport, pk=pk)
+    export = get_object_or_404(CrossrefExport.objects.select_related("xml_blob"), pk=pk)
 
     if export.monograph:
         publisher = export.monograph.publisher
@@ -1171,12 +1587,7 @@ def monograph_export_redownload(request: "HttpRequest", pk: int) -> HttpResponse
     if not has_publisher_access(request.user, publisher):
         raise PermissionDenied
 
-    response = HttpResponse(
-        export.xml_content,
-        content_type="application/xml; charset=utf-8",
-    )
-    response["Content-Disposition"] = f'attachment; filename="{export.filename}"'
-    return response
+    return _xml_attachment_response(export.xml_content, export.filename)
 
 
 @login_required
@@ -1205,53 +1616,7 @@ class MonographDepositView(LoginRequiredMixin, View):
         if not has_publisher_access(request.user, monograph.publisher):
             raise PermissionDenied
 
-        has_xml = bool(monograph.crossref_xml)
-        validator = PreValidationService()
-        validation_result = validator.validate_monograph(monograph)
-
-        steps = [
-            {
-                "number": 1,
-                "title": "Pre-validacija",
-                "completed": validation_result.is_valid,
-                "active": not validation_result.is_valid,
-                "icon": "clipboard-check",
-            },
-            {
-                "number": 2,
-                "title": "Generisanje XML",
-                "completed": has_xml,
-                "active": validation_result.is_valid and not has_xml,
-                "icon": "file-code",
-            },
-            {
-                "number": 3,
-                "title": "XSD Validacija",
-                "completed": has_xml and monograph.xsd_valid is True,
-                "active": has_xml and monograph.xsd_valid is not True,
-                "icon": "shield-check",
-            },
-            {
-                "number": 4,
-                "title": "Pregled XML",
-                "completed": False,
-                "active": has_xml,
-                "icon": "eye",
-            },
-            {
-                "number": 5,
-                "title": "Preuzimanje XML",
-                "completed": monograph.crossref_exports.exists(),
-                "active": has_xml,
-                "icon": "download",
-            },
-        ]
-
-        all_ready = (
-            has_xml
-            and monograph.xsd_valid is True
-            and monograph.crossref_exports.exists()
-        )
+        summary = get_deposit_summary(ExportType.MONOGRAPH, monograph)
 
         breadcrumbs = [
             {"label": "Monografije", "url": reverse("monographs:list")},
@@ -1264,12 +1629,13 @@ class MonographDepositView(LoginRequiredMixin, View):
             "crossref/monograph_crossref_deposit.html",
             {
                 "monograph": monograph,
-                "steps": steps,
-                "has_xml": has_xml,
-                "validation_result": validation_result,
-                "is_deposited": monograph.is_crossref_deposited,
-                "all_ready": all_ready,
+                "steps": summary.workflow_steps(),
+                "has_xml": summary.has_xml,
+                "deposit_summary": summary,
+                "is_deposited": summary.is_deposited,
+                "all_ready": summary.all_ready,
                 "breadcrumbs": breadcrumbs,
+                **_live_deposit_context(ExportType.MONOGRAPH, monograph, monograph.publisher, summary),
             },
         )
 
@@ -1296,3 +1662,33 @@ def monograph_mark_deposited(request: "HttpRequest", pk: int) -> HttpResponse:
             "is_deposited": True,
         },
     )
+
+
+@login_required
+def monograph_deposit_submit(request: "HttpRequest", pk: int) -> HttpResponse:
+    """Submit a Monograph's generated XML directly to Crossref."""
+    from doi_portal.crossref.deposit import start_deposit
+
+    if request.method != "POST":
+        return HttpResponse(status=405)
+
+    monograph = _get_monograph(pk)
+    if not has_publisher_access(request.user, monograph.publisher):
+        raise PermissionDenied
+
+    return _live_deposit_response(request, ExportType.MONOGRAPH, monograph, monograph.publisher, start_deposit)
+
+
+@login_required
+def monograph_deposit_enqueue(request: "HttpRequest", pk: int) -> HttpResponse:
+    """Queue a Monograph for the next combined Crossref deposit."""
+    from doi_portal.crossref.deposit_queue import enqueue_deposit
+
+    if request.method != "POST":
+        return HttpResponse(status=405)
+
+    monograph = _get_monograph(pk)
+    if not has_publisher_access(request.user, monograph.publisher):
+        raise PermissionDenied
+
+    return _live_deposit_response(request, ExportType.MONOGRAPH, monograph, monograph.publisher, enqueue_deposit)
@@ -0,0 +1,235 @@
+"""
+Line-range access to stored Crossref XML for the preview modal.
+
+Multi-megabyte proceedings are too large to ship to the browser (and to
+load into a worker) in one piece. Next to crossref_xml every issue,
+component group and monograph stores a sparse line-offset index in
+crossref_xml_line_index: the character offset of every LINE_INDEX_STEP-th
+line start, plus the document length, line count and the xml_generated_at
+of the document it was built from. A window of lines
+is then read with a single SUBSTR on the database column, starting at
+the nearest indexed line, without loading the rest of the document.
+
+The index is written whenever XML is generated; rows whose index is
+missing or whose generation time or length does not match the stored XML
+are re-indexed on first access.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models.functions import Length
+from django.db.models.functions import Substr
+
+__all__ = [
+    "LINE_INDEX_STEP",
+    "XMLLineWindow",
+    "build_line_index",
+    "error_line_numbers",
+    "error_window_start",
+    "load_line_index",
+    "read_line_window",
+]
+
+# Lines between two stored offsets
+LINE_INDEX_STEP = 256
+
+# Lines shown above an XSD error line when jumping to it
+ERROR_CONTEXT_LINES = 20
+
+
+@dataclass
+class XMLLineWindow:
+    """
+    Consecutive lines of a stored XML document.
+
+    Attributes:
+        start: 1-based number of the first line
+        lines: Line texts (without newlines)
+        total_lines: Number of lines in the document
+        error_lines: XSD error line numbers inside the window, in error order
+    """
+
+    start: int
+    lines: list[str] = field(default_factory=list)
+    total_lines: int = 0
+    error_lines: list[int] = field(default_factory=list)
+
+    @property
+    def end(self) -> int:
+        """Number of the last line in the window (start - 1 if empty)."""
+        return self.start + len(self.lines) - 1
+
+    @property
+    def next_start(self) -> int | None:
+        """First line of the following window (None at the end of the document)."""
+        return self.end + 1 if self.end < self.total_lines else None
+
+    @property
+    def previous_start(self) -> int | None:
+        """First line of the preceding window of the same size (None at the top)."""
+        if self.start <= 1:
+            return None
+        return max(1, self.start - max(len(self.lines), 1))
+
+    @property
+    def previous_count(self) -> int:
+        """Number of lines in the preceding window (up to this window's first line)."""
+        return self.start - (self.previous_start or self.start)
+
+
+def _generation_stamp(generated_at: datetime | None) -> str | None:
+    """JSON-safe form of xml_generated_at stored in the index."""
+    return generated_at.isoformat() if generated_at else None
+
+
+def build_line_index(
+    xml: str,
+    step: int = LINE_INDEX_STEP,
+    *,
+    generated_at: datetime | None = None,
+) -> dict:
+    """
+    Index the line starts of an XML document.
+
+    Args:
+        xml: XML document
+        step: Store the offset of every step-th line
+        generated_at: xml_generated_at of the document, identifying the
+            version the index belongs to
+
+    Returns:
+        Dict with step, length (characters), bytes (UTF-8 size), lines
+        (line count), offsets (character offset of lines 1, step + 1, ...)
+        and generated_at (ISO timestamp or None)
+    """
+    offsets = [0] if xml else []
+    lines = 1 if xml else 0
+    position = xml.find("\n")
+    while position != -1 and position + 1 < len(xml):
+        if lines % step == 0:
+            offsets.append(position + 1)
+        lines += 1
+        position = xml.find("\n", position + 1)
+    return {
+        "step": step,
+        "length": len(xml),
+        "bytes": len(xml.encode("utf-8")),
+        "lines": lines,
+        "offsets": offsets,
+        "generated_at": _generation_stamp(generated_at),
+    }
+
+
+def load_line_index(model, pk: int) -> dict:
+    """
+    Return the line index of a stored document, rebuilding it if stale.
+
+    The index is checked against the stored xml_generated_at and XML length
+    in one query; only a missing or mismatched index loads the document to
+    re-index it. The generation time catches regenerated XML of the same
+    length.
+
+    Args:
+        model: Issue, ComponentGroup or Monograph class
+        pk: Primary key of the entity
+
+    Returns:
+        Line index (see build_line_index)
+    """
+    rows = model._base_manager.filter(pk=pk)
+    index, length, generated_at = rows.annotate(xml_length=Length("crossref_xml")).values_list(
+        "crossref_xml_line_index",
+        "xml_length",
+        "xml_generated_at",
+    ).get()
+    if (
+        index
+        and index.get("step") == LINE_INDEX_STEP
+        and index.get("length") == (length or 0)
+        and index.get("generated_at") == _generation_stamp(generated_at)
+    ):
+        return index
+
+    xml, generated_at = rows.values_list("crossref_xml", "xml_generated_at").get()
+    index = build_line_index(xml, generated_at=generated_at)
+    rows.update(crossref_xml_line_index=index)
+    return index
+
+
+def _window_size(count: int | None) -> int:
+    """Clamp a requested window size to the configured limits."""
+    default = getattr(settings, "CROSSREF_XML_PREVIEW_WINDOW_LINES", 500)
+    maximum = getattr(settings, "CROSSREF_XML_PREVIEW_MAX_WINDOW_LINES", 2000)
+    return min(max(count or default, 1), maximum)
+
+
+def read_line_window(
+    model,
+    pk: int,
+    index: dict,
+    start: int = 1,
+    count: int | None = None,
+    xsd_errors: list[dict] | None = None,
+) -> XMLLineWindow:
+    """
+    Read a window of lines with one SUBSTR query.
+
+    Args:
+        model: Issue, ComponentGroup or Monograph class
+        pk: Primary key of the entity
+        index: Line index of the stored document (load_line_index)
+        start: 1-based first line (clamped to the document)
+        count: Lines to read (CROSSREF_XML_PREVIEW_WINDOW_LINES by default)
+        xsd_errors: Stored XSD errors; lines of errors inside the window are reported
+
+    Returns:
+        XMLLineWindow
+    """
+    total = index["lines"]
+    count = _window_size(count)
+    start = min(max(start, 1), max(total, 1))
+    window = XMLLineWindow(start=start, total_lines=total)
+    if not total:
+        return window
+
+    step, offsets = index["step"], index["offsets"]
+    first_block = (start - 1) // step
+    end_block = (start - 1 + count) // step + 1
+    char_from = offsets[first_block]
+    char_to = offsets[end_block] if end_block < len(offsets) else index["length"]
+
+    text = (
+        model._base_manager.filter(pk=pk)
+        .annotate(xml_window=Substr("crossref_xml", char_from + 1, max(char_to - char_from, 1)))
+        .values_list("xml_window", flat=True)
+        .get()
+    )
+    skip = start - 1 - first_block * step
+    window.lines = text.split("\n")[skip:skip + count]
+    window.error_lines = [
+        line for line in error_line_numbers(xsd_errors) if window.start <= line <= window.end
+    ]
+    return window
+
+
+def error_line_numbers(xsd_errors: list[dict] | None) -> list[int]:
+    """
+    Extract XSD error line numbers in error order.
+
+    Args:
+        xsd_errors: Stored XSD error dicts
+
+    Returns:
+        Line numbers of errors that have one
+    """
+    return [int(error["line"]) for error in xsd_errors or [] if error.get("line")]
+
+
+def error_window_start(line: int) -> int:
+    """First line of a window that shows an error line with some context above it."""
+    return max(1, line - ERROR_CONTEXT_LINES)
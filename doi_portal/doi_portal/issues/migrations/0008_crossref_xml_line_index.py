@@ -0,0 +1,18 @@
+# Generated by Django 5.2.10 on 2026-10-17 07:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('issues', '0007_add_doi_suffix_pdf_to_issue'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issue',
+            name='crossref_xml_line_index',
+            field=models.JSONField(blank=True, default=dict, help_text='Pozicije početaka linija za pregled XML-a po opsezima', verbose_name='Indeks linija XML-a'),
+        ),
+    ]
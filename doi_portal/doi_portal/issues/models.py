@@ -140,6 +140,12 @@ class Issue(SoftDeleteMixin, models.Model):
         verbose_name=_("Crossref XML"),
         help_text=_("Generisani Crossref XML sadržaj"),
     )
+    crossref_xml_line_index = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name=_("Indeks linija XML-a"),
+        help_text=_("Pozicije početaka linija za pregled XML-a po opsezima"),
+    )
     xml_generated_at = models.DateTimeField(
         null=True,
         blank=True,
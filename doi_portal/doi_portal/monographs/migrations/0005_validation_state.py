@@ -0,0 +1,28 @@
+# Generated by Django 5.2.10 on 2026-10-17 07:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monographs', '0004_crossref_deposit_result'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='monographchapter',
+            name='validated_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Vreme validacije'),
+        ),
+        migrations.AddField(
+            model_name='monographchapter',
+            name='validation_dirty',
+            field=models.BooleanField(default=True, verbose_name='Validacija zastarela'),
+        ),
+        migrations.AddField(
+            model_name='monographchapter',
+            name='validation_issues',
+            field=models.JSONField(blank=True, default=list, verbose_name='Rezultat validacije'),
+        ),
+    ]
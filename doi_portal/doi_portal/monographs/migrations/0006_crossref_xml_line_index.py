@@ -0,0 +1,18 @@
+# Generated by Django 5.2.10 on 2026-10-17 07:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monographs', '0005_validation_state'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='monograph',
+            name='crossref_xml_line_index',
+            field=models.JSONField(blank=True, default=dict, help_text='Pozicije početaka linija za pregled XML-a po opsezima', verbose_name='Indeks linija XML-a'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.10 on 2026-10-17 08:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monographs', '0006_crossref_xml_line_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='monograph',
+            name='rendered_markup',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Renderovan markup'),
+        ),
+        migrations.AddField(
+            model_name='monographchapter',
+            name='rendered_markup',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Renderovan markup'),
+        ),
+    ]
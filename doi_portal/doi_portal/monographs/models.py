@@ -25,10 +25,11 @@ from doi_portal.articles.models import (
     ContributorRole,
     IdentifierType,
     PdfStatus,
+    RecordDepositStatus,
     RelationScope,
 )
 from doi_portal.articles.validators import validate_orcid
-from doi_portal.core.mixins import SoftDeleteManager, SoftDeleteMixin
+from doi_portal.core.mixins import RenderedMarkupMixin, SoftDeleteManager, SoftDeleteMixin, ValidationStateMixin
 from doi_portal.publications.validators import validate_isbn
 
 __all__ = [
@@ -268,7 +269,7 @@ class BaseRelation(models.Model):
 # =============================================================================
 
 
-class Monograph(SoftDeleteMixin, models.Model):
+class Monograph(SoftDeleteMixin, RenderedMarkupMixin, models.Model):
     """
     Monograph (book) model for Crossref DOI registration.
 
@@ -276,6 +277,12 @@ class Monograph(SoftDeleteMixin, models.Model):
     Crossref: <book book_type="monograph"> with <book_metadata>.
     """
 
+    MARKUP_FIELDS = {
+        "title": ("html", "crossref", "plain"),
+        "subtitle": ("html", "crossref", "plain"),
+        "abstract": ("html", "jats"),
+    }
+
     # Core metadata
     title = models.CharField(
         _("Naslov"),
@@ -424,6 +431,12 @@ class Monograph(SoftDeleteMixin, models.Model):
         _("Crossref XML"),
         blank=True,
     )
+    crossref_xml_line_index = models.JSONField(
+        _("Indeks linija XML-a"),
+        default=dict,
+        blank=True,
+        help_text=_("Pozicije početaka linija za pregled XML-a po opsezima"),
+    )
     xml_generated_at = models.DateTimeField(
         _("XML generisan"),
         null=True,
@@ -515,21 +528,33 @@ class Monograph(SoftDeleteMixin, models.Model):
         super().save(*args, **kwargs)
 
     def soft_delete(self, user=None):
-        """Cascade soft-delete to chapters and contributors."""
+        """Cascade soft-delete to chapters and contributors, releasing chapter DOIs."""
+        from doi_portal.crossref.doi_registry import unregister_entity
+        from doi_portal.crossref.models import DOIEntityType
+
         now = timezone.now()
+        chapter_ids = list(self.chapters.values_list("pk", flat=True))
         self.chapters.update(is_deleted=True, deleted_at=now, deleted_by=user)
         self.contributors.update(is_deleted=True, deleted_at=now, deleted_by=user)
         super().soft_delete(user=user)
+        # QuerySet.update() sends no signals, so the registry is updated here
+        for chapter_id in chapter_ids:
+            unregister_entity(DOIEntityType.CHAPTER, chapter_id)
 
     def restore(self):
-        """Cascade restore chapters and contributors."""
-        MonographChapter.all_objects.filter(monograph=self, is_deleted=True).update(
-            is_deleted=False, deleted_at=None, deleted_by=None,
-        )
+        """Cascade restore chapters and contributors, re-registering chapter DOIs."""
+        from doi_portal.crossref.doi_registry import register_entity
+        from doi_portal.crossref.models import DOIEntityType
+
+        chapters = MonographChapter.all_objects.filter(monograph=self, is_deleted=True)
+        chapter_ids = list(chapters.values_list("pk", flat=True))
+        chapters.update(is_deleted=False, deleted_at=None, deleted_by=None)
         MonographContributor.all_objects.filter(monograph=self, is_deleted=True).update(
             is_deleted=False, deleted_at=None, deleted_by=None,
         )
         super().restore()
+        for chapter_id in chapter_ids:
+            register_entity(DOIEntityType.CHAPTER, chapter_id)
 
     @property
     def full_doi(self) -> str:
@@ -560,7 +585,7 @@ class Monograph(SoftDeleteMixin, models.Model):
 # =============================================================================
 
 
-class MonographChapter(SoftDeleteMixin, models.Model):
+class MonographChapter(SoftDeleteMixin, ValidationStateMixin, RenderedMarkupMixin, models.Model):
     """
     Chapter within a monograph.
 
@@ -568,6 +593,12 @@ class MonographChapter(SoftDeleteMixin, models.Model):
     Each chapter has its own DOI.
     """
 
+    MARKUP_FIELDS = {
+        "title": ("html", "crossref", "plain"),
+        "subtitle": ("html", "crossref", "plain"),
+        "abstract": ("html", "jats"),
+    }
+
     monograph = models.ForeignKey(
         Monograph,
         on_delete=models.PROTECT,
@@ -651,6 +682,25 @@ class MonographChapter(SoftDeleteMixin, models.Model):
         blank=True,
     )
 
+    # Crossref deposit result (per-DOI submission log)
+    crossref_deposit_status = models.CharField(
+        _("Status Crossref depozita"),
+        max_length=10,
+        choices=RecordDepositStatus.choices,
+        blank=True,
+    )
+    crossref_deposit_errors = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name=_("Crossref greške"),
+        help_text=_("Poruke iz Crossref izveštaja o obradi depozita"),
+    )
+    crossref_deposit_checked_at = models.DateTimeField(
+        _("Crossref izveštaj obrađen"),
+        null=True,
+        blank=True,
+    )
+
     # Timestamps
     created_at = models.DateTimeField(_("Kreirano"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Ažurirano"), auto_now=True)
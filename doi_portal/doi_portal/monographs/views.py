@@ -1028,6 +1028,8 @@ def chapter_contributor_add(request, chapter_pk):
 @require_POST
 def chapter_contributor_delete(request, pk):
     """Delete chapter contributor via HTMX POST, reorder remaining."""
+    from doi_portal.crossref.signals import mark_validation_dirty
+
     contributor = get_object_or_404(
         ChapterContributor.objects.select_related(
             "chapter", "chapter__monograph", "chapter__monograph__publisher"
@@ -1045,6 +1047,7 @@ def chapter_contributor_delete(request, pk):
             order=index,
             sequence=AuthorSequence.FIRST if index == 1 else AuthorSequence.ADDITIONAL,
         )
+    mark_validation_dirty(chapter)
 
     return _render_chapter_contributor_list(request, chapter)
 
@@ -1053,6 +1056,8 @@ def chapter_contributor_delete(request, pk):
 @require_POST
 def chapter_contributor_reorder(request, chapter_pk):
     """Reorder chapter contributors via HTMX POST."""
+    from doi_portal.crossref.signals import mark_validation_dirty
+
     chapter = get_object_or_404(
         MonographChapter.objects.select_related("monograph", "monograph__publisher"),
         pk=chapter_pk,
@@ -1076,6 +1081,8 @@ def chapter_contributor_reorder(request, chapter_pk):
             order=index,
             sequence=AuthorSequence.FIRST if index == 1 else AuthorSequence.ADDITIONAL,
         )
+    # Queryset updates send no signals; sequence="first" feeds pre-validation
+    mark_validation_dirty(chapter)
 
     return _render_chapter_contributor_list(request, chapter)
 
@@ -13,3 +13,7 @@ class PortalConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "doi_portal.portal"
     verbose_name = "Portal"
+
+    def ready(self):
+        """Connect search document signal handlers."""
+        import doi_portal.portal.signals  # noqa: F401, PLC0415
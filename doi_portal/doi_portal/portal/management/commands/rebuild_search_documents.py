@@ -0,0 +1,35 @@
+"""
+Rebuild the full-text search documents of all articles.
+
+Run once after migrating to fill documents of existing articles, and
+after changing the search configuration.
+
+Examples:
+    manage.py rebuild_search_documents
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from doi_portal.portal.search import full_text_search_available
+from doi_portal.portal.search import rebuild_search_documents
+
+
+class Command(BaseCommand):
+    help = "Recreate Article.search_document for every article (PostgreSQL only)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="Articles whose authors are loaded per query (default: 200)",
+        )
+
+    def handle(self, *args, **options):
+        if not full_text_search_available():
+            self.stdout.write(self.style.WARNING("Pretraga punog teksta zahteva PostgreSQL; ništa nije ažurirano."))
+            return
+        count = rebuild_search_documents(batch_size=options["batch_size"])
+        self.stdout.write(f"Ažurirano dokumenata za pretragu: {count}")
@@ -0,0 +1,199 @@
+"""
+PostgreSQL full-text search for published articles.
+
+Each article stores a weighted tsvector (Article.search_document):
+- A: title, subtitle and original-language title/subtitle
+- B: keywords and author names
+- C: abstract
+
+Documents are built from plain text (markup stripped) folded from Serbian
+Cyrillic to Latin, and the doi_portal_sr text search configuration
+(articles migration 0015) removes diacritics with unaccent, so "Петровић",
+"Petrović" and "Petrovic" all match. Queries are folded the same way and
+results are ordered by ts_rank. Documents are kept current by
+doi_portal.portal.signals; rebuild_search_documents fills existing rows.
+
+On other database backends (SQLite in tests) search_articles falls back
+to icontains matching.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import connections
+from django.db.models import TextField
+from django.db.models import Value
+
+if TYPE_CHECKING:
+    from django.contrib.postgres.search import SearchQuery
+
+    from doi_portal.articles.models import Article
+
+__all__ = [
+    "SEARCH_CONFIG",
+    "article_search_text",
+    "full_text_search_available",
+    "rebuild_search_documents",
+    "search_query",
+    "to_latin",
+    "update_search_document",
+]
+
+# Text search configuration created by articles migration 0015
+SEARCH_CONFIG = "doi_portal_sr"
+
+# Article fields a search document is built from
+SEARCH_FIELDS = (
+    "title",
+    "subtitle",
+    "original_language_title",
+    "original_language_subtitle",
+    "keywords",
+    "abstract",
+)
+
+_CYRILLIC = "абвгдђежзијклљмнњопрстћуфхцчџшАБВГДЂЕЖЗИЈКЛЉМНЊОПРСТЋУФХЦЧЏШ"
+_LATIN = [
+    "a", "b", "v", "g", "d", "đ", "e", "ž", "z", "i", "j", "k", "l", "lj", "m",
+    "n", "nj", "o", "p", "r", "s", "t", "ć", "u", "f", "h", "c", "č", "dž", "š",
+    "A", "B", "V", "G", "D", "Đ", "E", "Ž", "Z", "I", "J", "K", "L", "Lj", "M",
+    "N", "Nj", "O", "P", "R", "S", "T", "Ć", "U", "F", "H", "C", "Č", "Dž", "Š",
+]
+_TO_LATIN = str.maketrans(dict(zip(_CYRILLIC, _LATIN, strict=True)))
+
+
+def to_latin(text: str) -> str:
+    """Transliterate Serbian Cyrillic to Latin; other characters are kept."""
+    return text.translate(_TO_LATIN)
+
+
+def full_text_search_available(using: str = "default") -> bool:
+    """Whether the database supports the tsvector search (PostgreSQL)."""
+    return connections[using].vendor == "postgresql"
+
+
+def article_search_text(article: Article, author_names: list[str]) -> dict[str, str]:
+    """
+    Build the plain, Latin text of an article per search weight.
+
+    Args:
+        article: Article instance with SEARCH_FIELDS loaded
+        author_names: "Given Surname" of each non-deleted author
+
+    Returns:
+        Dict of weight ("A", "B", "C") -> text
+    """
+    titles = [
+        article.rendered_value(field, "plain")
+        for field in ("title", "subtitle", "original_language_title", "original_language_subtitle")
+    ]
+    keywords = [str(keyword) for keyword in article.keywords or []]
+    return {
+        "A": to_latin(" ".join(filter(None, titles))),
+        "B": to_latin(" ".join(keywords + author_names)),
+        "C": to_latin(article.rendered_value("abstract", "plain")),
+    }
+
+
+def _search_vector(parts: dict[str, str]):
+    """Weighted SearchVector expression over constant texts."""
+    from django.contrib.postgres.search import SearchVector
+
+    vector = None
+    for weight, text in parts.items():
+        part = SearchVector(Value(text, output_field=TextField()), config=SEARCH_CONFIG, weight=weight)
+        vector = part if vector is None else vector + part
+    return vector
+
+
+def _author_names(article_ids: list[int]) -> dict[int, list[str]]:
+    """Author names per article, in author order."""
+    from doi_portal.articles.models import Author
+
+    names: dict[int, list[str]] = {pk: [] for pk in article_ids}
+    for article_id, given_name, surname in Author.objects.filter(article_id__in=article_ids).order_by(
+        "article_id",
+        "order",
+        "pk",
+    ).values_list("article_id", "given_name", "surname"):
+        names[article_id].append(f"{given_name} {surname}".strip())
+    return names
+
+
+def update_search_document(article_id: int | None) -> bool:
+    """
+    Rebuild the search document of one article.
+
+    Args:
+        article_id: Article primary key
+
+    Returns:
+        True if the document was written, False on backends without
+        full-text search or for a missing article
+    """
+    from doi_portal.articles.models import Article
+
+    if article_id is None or not full_text_search_available():
+        return False
+    article = (
+        Article._base_manager.filter(pk=article_id).only("pk", "rendered_markup", *SEARCH_FIELDS).first()
+    )
+    if article is None:
+        return False
+    parts = article_search_text(article, _author_names([article_id])[article_id])
+    Article._base_manager.filter(pk=article_id).update(search_document=_search_vector(parts))
+    return True
+
+
+def rebuild_search_documents(*, batch_size: int = 200) -> int:
+    """
+    Rebuild the search documents of all articles.
+
+    Args:
+        batch_size: Articles whose authors are loaded per query
+
+    Returns:
+        Number of documents written (0 without full-text search)
+    """
+    from doi_portal.articles.models import Article
+
+    if not full_text_search_available():
+        return 0
+    queryset = Article._base_manager.only("pk", "rendered_markup", *SEARCH_FIELDS).order_by("pk")
+    count = 0
+    batch: list[Article] = []
+    for article in queryset.iterator(chunk_size=batch_size):
+        batch.append(article)
+        if len(batch) >= batch_size:
+            count += _write_documents(batch)
+            batch = []
+    if batch:
+        count += _write_documents(batch)
+    return count
+
+
+def _write_documents(articles: list[Article]) -> int:
+    """Write the search documents of a batch of articles."""
+    from doi_portal.articles.models import Article
+
+    names = _author_names([article.pk for article in articles])
+    for article in articles:
+        parts = article_search_text(article, names[article.pk])
+        Article._base_manager.filter(pk=article.pk).update(search_document=_search_vector(parts))
+    return len(articles)
+
+
+def search_query(query: str) -> SearchQuery:
+    """
+    Build a web-search style query (quoted phrases, "or", -exclusion).
+
+    Args:
+        query: User input
+
+    Returns:
+        SearchQuery in the portal search configuration
+    """
+    from django.contrib.postgres.search import SearchQuery
+
+    return SearchQuery(to_latin(query), search_type="websearch", config=SEARCH_CONFIG)
@@ -12,7 +12,7 @@ All business logic for portal data retrieval is centralized here.
 
 from __future__ import annotations
 
-from django.db.models import Count, Q, QuerySet
+from django.db.models import Count, F, Q, QuerySet
 from slugify import slugify
 
 from doi_portal.articles.models import Article, ArticleStatus, Author
@@ -101,6 +101,10 @@ def search_articles(
     Only PUBLISHED articles are searched.
     SoftDeleteManager already excludes is_deleted=True records.
 
+    On PostgreSQL the weighted search document (doi_portal.portal.search)
+    is matched and results are ordered by ts_rank; other backends fall
+    back to icontains matching ordered by publication date.
+
     Args:
         query: Search term (minimum 3 characters expected, caller validates).
         filters: Optional dict with filter criteria:
@@ -114,33 +118,50 @@ def search_articles(
     Returns:
         QuerySet of matching Article objects with related data pre-fetched.
     """
+    from django.contrib.postgres.search import SearchRank
+
+    from doi_portal.portal.search import full_text_search_available
+    from doi_portal.portal.search import search_query
+
     if not query or len(query.strip()) < 3:
         return Article.objects.none()
 
     q = query.strip()[:200]  # Cap query length to prevent oversized SQL
 
-    # Find author IDs matching the search query
-    matching_author_article_ids = (
-        Author.objects.filter(
-            Q(given_name__icontains=q) | Q(surname__icontains=q)
+    if full_text_search_available():
+        # GIN-indexed tsvector match, best matches first
+        search = search_query(q)
+        queryset = (
+            Article.objects.filter(status=ArticleStatus.PUBLISHED, search_document=search)
+            .annotate(rank=SearchRank(F("search_document"), search))
+            .defer("search_document")
+            .select_related("issue__publication__publisher")
+            .prefetch_related("authors")
+            .order_by("-rank", "-published_at", "-created_at")
+        )
+    else:
+        # Find author IDs matching the search query
+        matching_author_article_ids = (
+            Author.objects.filter(
+                Q(given_name__icontains=q) | Q(surname__icontains=q)
+            )
+            .values_list("article_id", flat=True)
+            .distinct()
         )
-        .values_list("article_id", flat=True)
-        .distinct()
-    )
 
-    queryset = (
-        Article.objects.filter(
-            Q(status=ArticleStatus.PUBLISHED),
-            Q(title__icontains=q)
-            | Q(abstract__icontains=q)
-            | Q(keywords__icontains=q)
-            | Q(id__in=matching_author_article_ids),
+        queryset = (
+            Article.objects.filter(
+                Q(status=ArticleStatus.PUBLISHED),
+                Q(title__icontains=q)
+                | Q(abstract__icontains=q)
+                | Q(keywords__icontains=q)
+                | Q(id__in=matching_author_article_ids),
+            )
+            .select_related("issue__publication__publisher")
+            .prefetch_related("authors")
+            .order_by("-published_at", "-created_at")
+            .distinct()
         )
-        .select_related("issue__publication__publisher")
-        .prefetch_related("authors")
-        .order_by("-published_at", "-created_at")
-        .distinct()
-    )
 
     # Apply filters (AND logic - all must be satisfied)
     if filters:
@@ -0,0 +1,38 @@
+"""
+Signal handlers keeping article search documents current.
+
+Saving an article (including publishing it) rebuilds its search document
+when a searched field or its status changes; saving or deleting an
+author rebuilds the document of the author's article. On database
+backends without full-text search the handlers do nothing.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from doi_portal.articles.models import Article
+from doi_portal.articles.models import Author
+from doi_portal.portal.search import SEARCH_FIELDS
+from doi_portal.portal.search import update_search_document
+
+# Article fields whose change requires a new search document
+_SEARCH_DEPENDENCIES = {*SEARCH_FIELDS, "status", "is_deleted"}
+
+
+@receiver(post_save, sender=Article)
+def update_article_search_document(sender: type, instance: Article, update_fields=None, **kwargs: Any) -> None:
+    """Rebuild the search document of a saved article."""
+    if update_fields is None or _SEARCH_DEPENDENCIES & set(update_fields):
+        update_search_document(instance.pk)
+
+
+@receiver(post_save, sender=Author)
+@receiver(post_delete, sender=Author)
+def update_author_article_search_document(sender: type, instance: Author, **kwargs: Any) -> None:
+    """Rebuild the search document of the article owning a saved or deleted author."""
+    update_search_document(instance.article_id)
@@ -0,0 +1,171 @@
+"""
+Typeahead suggestions for portal search.
+
+Suggests published article titles, authors of published articles and
+publication titles containing the typed text. On PostgreSQL the
+__icontains lookups (UPPER(column) LIKE UPPER(pattern)) are served by
+GIN trigram indexes on UPPER(column) (articles migration 0017,
+publications migration 0007), matches are ordered by
+word_similarity and the queries run under a short statement timeout, so
+a slow suggestion is dropped instead of holding up typing. Results are
+cached per normalized prefix.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.db import connection
+from django.db import transaction
+from django.urls import reverse
+from django.utils.http import urlencode
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "SUGGEST_MIN_LENGTH",
+    "get_search_suggestions",
+    "normalize_prefix",
+]
+
+CACHE_PREFIX = "portal:suggest"
+
+# Shortest prefix suggestions are looked up for (trigram indexes need 3 characters)
+SUGGEST_MIN_LENGTH = 3
+
+# Longest prefix used for lookups and cache keys
+SUGGEST_MAX_LENGTH = 100
+
+
+def normalize_prefix(prefix: str) -> str:
+    """Lowercase a prefix and collapse whitespace, as used for cache keys."""
+    return " ".join(prefix.lower().split())[:SUGGEST_MAX_LENGTH]
+
+
+def _ordered(queryset, prefix: str, field: str):
+    """Order matches by trigram word similarity on PostgreSQL, else alphabetically."""
+    if connection.vendor == "postgresql":
+        from django.contrib.postgres.search import TrigramWordSimilarity
+
+        return queryset.annotate(similarity=TrigramWordSimilarity(prefix, field)).order_by("-similarity", field)
+    return queryset.order_by(field)
+
+
+def _article_suggestions(prefix: str, limit: int) -> list[dict[str, str]]:
+    """Published articles whose title contains the prefix."""
+    from doi_portal.articles.models import Article
+    from doi_portal.articles.models import ArticleStatus
+
+    queryset = Article.objects.filter(status=ArticleStatus.PUBLISHED, title__icontains=prefix).only(
+        "pk",
+        "title",
+        "rendered_markup",
+    )
+    return [
+        {
+            "type": "article",
+            "label": article.rendered_value("title", "plain"),
+            "url": reverse("portal-articles:article-detail", args=[article.pk]),
+        }
+        for article in _ordered(queryset, prefix, "title")[:limit]
+    ]
+
+
+def _author_suggestions(prefix: str, limit: int) -> list[dict[str, str]]:
+    """Authors of published articles whose surname contains the prefix; links run a search."""
+    from doi_portal.articles.models import ArticleStatus
+    from doi_portal.articles.models import Author
+
+    queryset = Author.objects.filter(
+        surname__icontains=prefix,
+        article__status=ArticleStatus.PUBLISHED,
+        article__is_deleted=False,
+    )
+    names = _ordered(queryset, prefix, "surname").values_list("given_name", "surname")
+    suggestions = []
+    seen: set[tuple[str, str]] = set()
+    # Over-fetch: the same author usually appears on several articles
+    for given_name, surname in names[: limit * 4]:
+        if (given_name, surname) in seen:
+            continue
+        seen.add((given_name, surname))
+        suggestions.append(
+            {
+                "type": "author",
+                "label": f"{given_name} {surname}".strip(),
+                "url": f"{reverse('article-search')}?{urlencode({'q': surname})}",
+            },
+        )
+        if len(suggestions) >= limit:
+            break
+    return suggestions
+
+
+def _publication_suggestions(prefix: str, limit: int) -> list[dict[str, str]]:
+    """Publications whose title contains the prefix."""
+    from doi_portal.publications.models import Publication
+
+    queryset = Publication.objects.filter(title__icontains=prefix).only("pk", "title", "slug")
+    return [
+        {
+            "type": "publication",
+            "label": publication.title,
+            "url": reverse("portal-publications:publication-detail", kwargs={"slug": publication.slug}),
+        }
+        for publication in _ordered(queryset, prefix, "title")[:limit]
+    ]
+
+
+def _lookup(prefix: str, limit: int) -> list[dict[str, str]]:
+    """Run the suggestion queries, under a statement timeout on PostgreSQL."""
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            timeout_ms = getattr(settings, "PORTAL_SEARCH_SUGGEST_TIMEOUT_MS", 300)
+            with connection.cursor() as cursor:
+                cursor.execute(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+        return (
+            _article_suggestions(prefix, limit)
+            + _author_suggestions(prefix, limit)
+            + _publication_suggestions(prefix, limit)
+        )
+
+
+def get_search_suggestions(prefix: str, limit: int | None = None) -> list[dict[str, str]]:
+    """
+    Suggest articles, authors and publications matching a typed prefix.
+
+    Args:
+        prefix: Text typed into the search field
+        limit: Suggestions per type (default: PORTAL_SEARCH_SUGGEST_LIMIT)
+
+    Returns:
+        List of {"type", "label", "url"} dicts: articles, then authors,
+        then publications; empty for short prefixes or when the lookup
+        exceeds its time budget
+    """
+    prefix = normalize_prefix(prefix)
+    if len(prefix) < SUGGEST_MIN_LENGTH:
+        return []
+    if limit is None:
+        limit = getattr(settings, "PORTAL_SEARCH_SUGGEST_LIMIT", 5)
+
+    digest = hashlib.sha256(prefix.encode("utf-8")).hexdigest()
+    key = f"{CACHE_PREFIX}:{limit}:{digest}"
+    suggestions = cache.get(key)
+    if suggestions is not None:
+        return suggestions
+
+    try:
+        suggestions = _lookup(prefix, limit)
+    except DatabaseError:
+        # Statement timeout: skip suggestions for this keystroke, do not cache
+        logger.warning("Search suggestions for %r exceeded the time budget", prefix)
+        return []
+
+    timeout = getattr(settings, "PORTAL_SEARCH_SUGGEST_CACHE_TIMEOUT", 5 * 60)
+    cache.set(key, suggestions, timeout)
+    return suggestions
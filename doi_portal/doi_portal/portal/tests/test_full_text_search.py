@@ -0,0 +1,162 @@
+"""
+Tests for the PostgreSQL full-text article search.
+
+Covers search document text, transliteration, signal-driven updates,
+query construction and the rebuild command. Tests that need a real
+tsvector index run only against PostgreSQL.
+"""
+
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+
+from doi_portal.articles.models import Article
+from doi_portal.articles.models import ArticleStatus
+from doi_portal.articles.tests.factories import ArticleFactory
+from doi_portal.articles.tests.factories import AuthorFactory
+from doi_portal.portal.search import article_search_text
+from doi_portal.portal.search import full_text_search_available
+from doi_portal.portal.search import to_latin
+from doi_portal.portal.search import update_search_document
+from doi_portal.portal.services import search_articles
+
+requires_postgresql = pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="Full-text search needs PostgreSQL",
+)
+
+
+class TestToLatin:
+    """Tests for Serbian Cyrillic transliteration."""
+
+    def test_transliterates_serbian_cyrillic(self):
+        assert to_latin("Љубав и њушка џеп Ђорђе Ћуприја") == "Ljubav i njuška džep Đorđe Ćuprija"
+
+    def test_keeps_latin_and_other_text(self):
+        assert to_latin("Petrović 2024 – α") == "Petrović 2024 – α"
+
+
+@pytest.mark.django_db
+class TestArticleSearchText:
+    """Tests for article_search_text."""
+
+    def test_weights_and_plain_text(self):
+        article = ArticleFactory(
+            title="Синтеза **TiO~2~**",
+            subtitle="_in vitro_",
+            original_language_title="Synthesis",
+            keywords=["наука", "DOI"],
+            abstract="Апстракт са H~2~O",
+        )
+
+        parts = article_search_text(article, ["Петар Петровић"])
+
+        assert parts == {
+            "A": "Sinteza TiO2 in vitro Synthesis",
+            "B": "nauka DOI Petar Petrović",
+            "C": "Apstrakt sa H2O",
+        }
+
+
+@pytest.mark.django_db
+class TestSearchDocumentSignals:
+    """Tests for the handlers keeping search documents current."""
+
+    def test_no_op_without_postgresql(self):
+        article = ArticleFactory()
+
+        assert full_text_search_available() is (connection.vendor == "postgresql")
+        if connection.vendor != "postgresql":
+            assert update_search_document(article.pk) is False
+
+    @patch("doi_portal.portal.signals.update_search_document")
+    def test_article_save_updates_document(self, update):
+        article = ArticleFactory()
+        update.assert_called_with(article.pk)
+        update.reset_mock()
+
+        article.status = ArticleStatus.PUBLISHED
+        article.save(update_fields=["status"])
+        update.assert_called_once_with(article.pk)
+        update.reset_mock()
+
+        article.save(update_fields=["first_page"])
+        update.assert_not_called()
+
+    @patch("doi_portal.portal.signals.update_search_document")
+    def test_author_changes_update_document(self, update):
+        article = ArticleFactory()
+        author = AuthorFactory(article=article)
+        update.assert_called_with(article.pk)
+        update.reset_mock()
+
+        author.delete()
+
+        update.assert_called_once_with(article.pk)
+
+
+@pytest.mark.django_db
+class TestSearchArticlesQuery:
+    """Tests for the query search_articles builds."""
+
+    def test_full_text_query_is_ranked(self):
+        with patch("doi_portal.portal.search.full_text_search_available", return_value=True):
+            queryset = search_articles("Петровић kvantni")
+
+        sql = str(queryset.query)
+        assert "websearch_to_tsquery" in sql
+        assert "ts_rank" in sql
+        assert "Petrović kvantni" in sql
+        assert "LIKE" not in sql
+        assert queryset.query.order_by[0] == "-rank"
+
+    def test_falls_back_to_icontains(self):
+        if connection.vendor == "postgresql":
+            pytest.skip("Fallback is used on other backends only")
+        article = ArticleFactory(title="Kvantna mehanika", status=ArticleStatus.PUBLISHED)
+
+        assert list(search_articles("kvantna")) == [article]
+
+
+@pytest.mark.django_db
+class TestRebuildCommand:
+    """Tests for the rebuild_search_documents command."""
+
+    def test_reports_unsupported_backend(self):
+        if connection.vendor == "postgresql":
+            pytest.skip("Backend supports full-text search")
+        out = StringIO()
+
+        call_command("rebuild_search_documents", stdout=out)
+
+        assert "PostgreSQL" in out.getvalue()
+
+
+@requires_postgresql
+@pytest.mark.django_db
+class TestFullTextSearchPostgreSQL:
+    """End-to-end search against a tsvector index."""
+
+    def test_matches_across_scripts_and_ranks_title_first(self):
+        in_abstract = ArticleFactory(
+            title="Druga tema",
+            abstract="Pominje se kvantna mehanika.",
+            status=ArticleStatus.PUBLISHED,
+        )
+        in_title = ArticleFactory(title="Квантна механика", status=ArticleStatus.PUBLISHED)
+        by_author = ArticleFactory(title="Treća tema", status=ArticleStatus.PUBLISHED)
+        AuthorFactory(article=by_author, given_name="Petar", surname="Петровић")
+
+        assert list(search_articles("kvantna mehanika")) == [in_title, in_abstract]
+        assert list(search_articles("Petrovic")) == [by_author]
+
+    def test_rebuild_command_fills_documents(self):
+        article = ArticleFactory(title="Kvantna teorija", status=ArticleStatus.PUBLISHED)
+        Article.objects.filter(pk=article.pk).update(search_document=None)
+
+        call_command("rebuild_search_documents", stdout=StringIO())
+
+        assert list(search_articles("kvantna")) == [article]
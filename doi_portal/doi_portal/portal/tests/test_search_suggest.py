@@ -0,0 +1,153 @@
+"""
+Tests for portal search typeahead suggestions.
+
+Covers suggestion lookup per type, caching per prefix, the time-budget
+fallback, trigram index use on PostgreSQL and the public JSON endpoint.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db import OperationalError
+from django.db import connection
+from django.urls import reverse
+
+from doi_portal.articles.models import Article
+from doi_portal.articles.models import ArticleStatus
+from doi_portal.articles.models import Author
+from doi_portal.articles.tests.factories import ArticleFactory
+from doi_portal.articles.tests.factories import AuthorFactory
+from doi_portal.portal.suggest import get_search_suggestions
+from doi_portal.portal.suggest import normalize_prefix
+from doi_portal.publications.models import Publication
+from doi_portal.publications.tests.factories import PublicationFactory
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class TestNormalizePrefix:
+    """Tests for normalize_prefix."""
+
+    def test_lowercases_and_collapses_whitespace(self):
+        assert normalize_prefix("  Kvantna   MEHANIKA ") == "kvantna mehanika"
+
+
+@pytest.mark.django_db
+class TestGetSearchSuggestions:
+    """Tests for get_search_suggestions."""
+
+    def test_suggests_published_articles_authors_and_publications(self):
+        article = ArticleFactory(title="Kvantna **mehanika**", status=ArticleStatus.PUBLISHED)
+        ArticleFactory(title="Kvantna optika", status=ArticleStatus.DRAFT)
+        AuthorFactory(article=article, given_name="Petar", surname="Kvantić")
+        publication = PublicationFactory(title="Kvantni zbornik")
+
+        suggestions = get_search_suggestions("kvant")
+
+        assert suggestions == [
+            {
+                "type": "article",
+                "label": "Kvantna mehanika",
+                "url": reverse("portal-articles:article-detail", args=[article.pk]),
+            },
+            {
+                "type": "author",
+                "label": "Petar Kvantić",
+                "url": f"{reverse('article-search')}?q=Kvanti%C4%87",
+            },
+            {
+                "type": "publication",
+                "label": "Kvantni zbornik",
+                "url": reverse("portal-publications:publication-detail", kwargs={"slug": publication.slug}),
+            },
+        ]
+
+    def test_short_prefix_returns_nothing(self, django_assert_num_queries):
+        ArticleFactory(title="Kvantna mehanika", status=ArticleStatus.PUBLISHED)
+
+        with django_assert_num_queries(0):
+            assert get_search_suggestions(" kv ") == []
+
+    def test_authors_deduplicated_and_limited(self):
+        for title in ("Prvi rad", "Drugi rad"):
+            AuthorFactory(
+                article=ArticleFactory(title=title, status=ArticleStatus.PUBLISHED),
+                given_name="Ana",
+                surname="Marković",
+            )
+        AuthorFactory(
+            article=ArticleFactory(status=ArticleStatus.PUBLISHED),
+            given_name="Ivan",
+            surname="Marković",
+        )
+
+        suggestions = get_search_suggestions("markov", limit=2)
+
+        assert [item["label"] for item in suggestions] == ["Ana Marković", "Ivan Marković"]
+        assert len(get_search_suggestions("markov", limit=1)) == 1
+
+    def test_results_are_cached_per_prefix(self, django_assert_num_queries):
+        ArticleFactory(title="Kvantna mehanika", status=ArticleStatus.PUBLISHED)
+        first = get_search_suggestions("Kvantna")
+
+        with django_assert_num_queries(0):
+            assert get_search_suggestions("  kvantna ") == first
+
+    def test_database_error_returns_nothing_uncached(self):
+        ArticleFactory(title="Kvantna mehanika", status=ArticleStatus.PUBLISHED)
+
+        with patch("doi_portal.portal.suggest._lookup", side_effect=OperationalError("canceling statement")):
+            assert get_search_suggestions("kvantna") == []
+
+        assert len(get_search_suggestions("kvantna")) == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="Trigram indexes exist only on PostgreSQL")
+class TestTrigramIndexUse:
+    """The icontains lookups of the suggestions are planned on the trigram indexes."""
+
+    @pytest.mark.parametrize(
+        ("queryset", "index_name"),
+        [
+            (lambda: Article.objects.filter(title__icontains="kvant"), "articles_article_title_trgm"),
+            (lambda: Author.objects.filter(surname__icontains="kvant"), "articles_author_surname_trgm"),
+            (lambda: Publication.objects.filter(title__icontains="kvant"), "publications_publication_title_trgm"),
+        ],
+    )
+    def test_icontains_uses_trigram_index(self, queryset, index_name):
+        with connection.cursor() as cursor:
+            # Small test tables would otherwise always be scanned sequentially
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        assert index_name in queryset().explain()
+
+
+@pytest.mark.django_db
+class TestSearchSuggestView:
+    """Tests for the article-search-suggest endpoint."""
+
+    def test_returns_json_without_login(self, client):
+        ArticleFactory(title="Kvantna mehanika", status=ArticleStatus.PUBLISHED)
+
+        response = client.get(reverse("article-search-suggest"), {"q": "kvantna"})
+
+        assert response.status_code == 200
+        assert [item["label"] for item in response.json()["items"]] == ["Kvantna mehanika"]
+
+    def test_rejects_post(self, client):
+        response = client.post(reverse("article-search-suggest"), {"q": "kvantna"})
+
+        assert response.status_code == 405
+
+    def test_search_page_has_typeahead(self, client):
+        content = client.get(reverse("article-search")).content.decode()
+
+        assert "searchSuggest(" in content
+        assert reverse("article-search-suggest") in content
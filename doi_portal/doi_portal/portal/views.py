@@ -25,8 +25,9 @@ from django.conf import settings
 from django.contrib import messages
 from django.core.mail import send_mail
 from django.db import models
+from django.db import transaction
 from django.db.models.functions import Cast
-from django.http import FileResponse, Http404, HttpResponse, HttpResponseBadRequest
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseBadRequest, JsonResponse
 from django.shortcuts import get_object_or_404, render
 from django.urls import reverse, reverse_lazy
 from django.views.decorators.http import require_GET
@@ -36,7 +37,6 @@ from django.views.generic import ListView
 from django.views.generic import TemplateView
 
 from doi_portal.articles.models import Article, ArticleStatus, PdfStatus
-from doi_portal.core.markup import strip_markup
 from doi_portal.portal.services import generate_chapter_citation
 from doi_portal.portal.services import generate_citation
 from doi_portal.portal.services import generate_monograph_citation
@@ -46,6 +46,7 @@ from doi_portal.portal.services import get_pdf_download_filename
 from doi_portal.portal.services import get_portal_statistics
 from doi_portal.portal.services import get_recent_publications
 from doi_portal.portal.services import search_articles
+from doi_portal.portal.suggest import get_search_suggestions
 
 from doi_portal.issues.models import Issue
 from doi_portal.issues.models import IssueStatus
@@ -514,6 +515,19 @@ class ArticleSearchView(ListView):
         return context
 
 
+@require_GET
+@transaction.non_atomic_requests
+def article_search_suggest(request):
+    """
+    Return typeahead suggestions for the search field as JSON.
+
+    Response: {"items": [{"type", "label", "url"}, ...]} with article,
+    author and publication matches for the typed text (q).
+    Public view - no authentication required.
+    """
+    return JsonResponse({"items": get_search_suggestions(request.GET.get("q", ""))})
+
+
 # =============================================================================
 # Story 4.4: Article Landing Page
 # =============================================================================
@@ -571,7 +585,7 @@ class ArticleLandingView(DetailView):
                     kwargs={"slug": publication.slug, "pk": issue.pk},
                 ),
             },
-            {"label": strip_markup(article.title)[:80], "url": None},
+            {"label": article.rendered_value("title", "plain")[:80], "url": None},
         ]
 
         context["is_withdrawn"] = article.status == ArticleStatus.WITHDRAWN
@@ -610,7 +624,7 @@ class ArticleLandingView(DetailView):
         context["fab_cite_label"] = get_term("cite_article", publication.publication_type)
         context["fab_share_label"] = get_term("share_article", publication.publication_type)
         context["fab_actions_label"] = get_term("article_actions", publication.publication_type)
-        context["citation_item_title"] = strip_markup(article.title)
+        context["citation_item_title"] = article.rendered_value("title", "plain")
 
         return context
 
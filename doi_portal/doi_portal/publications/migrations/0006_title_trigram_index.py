@@ -0,0 +1,33 @@
+# Generated by Django 5.2.10 on 2026-10-17 08:40
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+def create_trigram_index(apps, schema_editor):
+    """Create a GIN trigram index on publication titles (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS publications_publication_title_trgm "
+        "ON publications_publication USING gin (title gin_trgm_ops);"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    """Drop the publication title trigram index (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS publications_publication_title_trgm;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('publications', '0005_remove_book_type_edition_series_title'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.10 on 2026-10-17 14:05
+
+from django.db import migrations
+
+
+def create_upper_trigram_index(apps, schema_editor):
+    """Recreate the publication title trigram index on UPPER(title) (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    # __icontains compiles to UPPER("title"::text) LIKE UPPER(%s)
+    schema_editor.execute("DROP INDEX IF EXISTS publications_publication_title_trgm;")
+    schema_editor.execute(
+        "CREATE INDEX publications_publication_title_trgm "
+        "ON publications_publication USING gin ((UPPER(title::text)) gin_trgm_ops);"
+    )
+
+
+def create_column_trigram_index(apps, schema_editor):
+    """Restore the publication title trigram index on the bare column (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS publications_publication_title_trgm;")
+    schema_editor.execute(
+        "CREATE INDEX publications_publication_title_trgm "
+        "ON publications_publication USING gin (title gin_trgm_ops);"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('publications', '0006_title_trigram_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_upper_trigram_index, create_column_trigram_index),
+    ]
@@ -501,17 +501,15 @@ def wizard_validate_issue(issue):
     # Standard validations (depositor, type-specific fields)
     result.merge(service._validate_depositor_settings())
     result.merge(service._validate_conference_fields(issue))
-    result.merge(service._validate_issue_doi_suffix(issue))
 
     # Validate ALL articles (not just PUBLISHED) - this is the key difference
-    articles = issue.articles.filter(is_deleted=False)
-    if not articles.exists():
+    articles_result, articles = service.validate_articles(issue, issue.articles.filter(is_deleted=False))
+    if not articles:
         result.add_error(
             message="Nema radova za generisanje XML-a.",
             field_name="articles",
         )
-    for article in articles:
-        result.merge(service._validate_article(article))
+    result.merge(articles_result)
 
     return result
 